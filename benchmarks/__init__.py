@@ -0,0 +1,17 @@
+"""
+Micro-benchmarks for turn-pipeline hot paths.
+
+Each case exercises one hot path in isolation against synthetic graphs of
+10, 100, 1k and 10k nodes. Results are written as JSON and compared with
+a stored baseline to catch regressions and to verify performance claims
+locally.
+
+Usage:
+    python -m benchmarks                                  # run, compare to baseline
+    python -m benchmarks --sizes 10,100 --cases graph_repo.find_similar_nodes
+    python -m benchmarks --save-baseline                  # refresh the baseline
+
+See benchmarks/cases.py for the covered functions. The committed baseline
+is machine-specific: refresh it with --save-baseline on the machine you
+compare from before trusting ratios.
+"""
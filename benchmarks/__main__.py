@@ -0,0 +1,88 @@
+"""
+CLI: python -m benchmarks [--cases a,b] [--sizes 10,100] [--save-baseline]
+
+Writes results to benchmarks/results/<timestamp>.json and prints a
+comparison against benchmarks/baselines/baseline.json. Exits 1 when any
+result regresses beyond --threshold.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from benchmarks.cases import CASES
+from benchmarks.runner import (
+    BASELINE_PATH,
+    DEFAULT_SIZES,
+    RESULTS_DIR,
+    BenchmarkResult,
+    BenchmarkRun,
+    compare,
+    format_report,
+    quiet_logging,
+    run_benchmarks,
+)
+
+
+def _csv(value: str) -> list[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def _print_result(result: BenchmarkResult) -> None:
+    print(
+        f"  {result.case:<42} n={result.size:<6} median={result.median_ms:.4f}ms "
+        f"p95={result.p95_ms:.4f}ms ({result.iterations} iters)",
+        flush=True,
+    )
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description="Turn-pipeline micro-benchmarks")
+    parser.add_argument("--cases", type=_csv, default=None, help=", ".join(CASES))
+    parser.add_argument(
+        "--sizes",
+        type=lambda v: [int(s) for s in _csv(v)],
+        default=list(DEFAULT_SIZES),
+    )
+    parser.add_argument("--min-time", type=float, default=0.5, help="Seconds per pair")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--threshold", type=float, default=0.25)
+    parser.add_argument("--save-baseline", action="store_true", help="Merge results into baseline")
+    args = parser.parse_args()
+
+    quiet_logging()
+    run = await run_benchmarks(
+        args.cases, args.sizes, min_time_s=args.min_time, on_result=_print_result
+    )
+
+    output = args.output or RESULTS_DIR / f"{datetime.now():%Y%m%d_%H%M%S}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(run.to_dict(), indent=2))
+    print(f"\nResults written to {output}")
+
+    baseline = (
+        BenchmarkRun.from_dict(json.loads(args.baseline.read_text()))
+        if args.baseline.exists()
+        else BenchmarkRun(results=[])
+    )
+
+    if args.save_baseline:
+        merged = {**baseline.index(), **run.index()}
+        baseline = BenchmarkRun(results=list(merged.values()), meta=run.meta)
+        args.baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.baseline.write_text(json.dumps(baseline.to_dict(), indent=2))
+        print(f"Baseline updated: {args.baseline}")
+        return 0
+
+    comparisons = compare(run, baseline, threshold=args.threshold)
+    print()
+    print(format_report(comparisons))
+    return 1 if any(c.regression for c in comparisons) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
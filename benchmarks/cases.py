@@ -0,0 +1,252 @@
+"""
+Benchmark cases: one per hot path.
+
+Each case is an async builder `(size, workdir) -> Bench` registered with
+@case. Builders do all setup (graph generation, database seeding) outside
+the timed region; Bench.run is the only thing timed, and
+Bench.before_each restores any state the run consumes.
+"""
+
+import inspect
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import aiosqlite
+
+from benchmarks.fixtures import (
+    SyntheticGraph,
+    build_graph,
+    build_node_signals,
+    build_node_tracker,
+    seed_database,
+)
+
+BenchBuilder = Callable[[int, Path], Awaitable["Bench"]]
+
+
+@dataclass
+class Bench:
+    """A prepared benchmark: run() is timed, hooks are not."""
+
+    run: Callable[[], Any]
+    before_each: Optional[Callable[[], Any]] = None
+    teardown: Optional[Callable[[], Any]] = None
+
+
+async def call(fn: Optional[Callable[[], Any]]) -> None:
+    """Call a sync or async hook."""
+    if fn is None:
+        return
+    result = fn()
+    if inspect.isawaitable(result):
+        await result
+
+
+CASES: Dict[str, BenchBuilder] = {}
+
+
+def case(name: str) -> Callable[[BenchBuilder], BenchBuilder]:
+    """Register a benchmark builder under a stable name (used in baselines)."""
+
+    def register(builder: BenchBuilder) -> BenchBuilder:
+        CASES[name] = builder
+        return builder
+
+    return register
+
+
+def _global_signals() -> Dict[str, Any]:
+    return {
+        "graph.node_count": 40,
+        "graph.max_depth": 0.6,
+        "graph.orphan_count": 3,
+        "graph.chain_completion": 0.4,
+        "llm.response_depth": "moderate",
+        "llm.engagement": 0.75,
+        "llm.specificity": 0.5,
+        "llm.certainty": 0.5,
+        "llm.valence": 0.5,
+        "temporal.strategy_repetition_count": 1,
+        "temporal.turns_since_strategy_change": 2,
+        "meta.interview.phase": "mid",
+        "meta.conversation.saturation": 0.3,
+    }
+
+
+def _graph_state(graph: SyntheticGraph):
+    from src.domain.models.knowledge_graph import DepthMetrics, GraphState
+
+    return GraphState(
+        node_count=len(graph.nodes),
+        edge_count=len(graph.edges),
+        nodes_by_type={"attribute": len(graph.nodes)},
+        depth_metrics=DepthMetrics(max_depth=4, avg_depth=1.5),
+        turn_count=20,
+    )
+
+
+def _pipeline_context(graph: SyntheticGraph):
+    """PipelineContext as it looks after ContextLoadingStage (Stage 1)."""
+    from src.domain.models.pipeline_contracts import ContextLoadingOutput
+    from src.services.turn_pipeline.context import PipelineContext
+
+    context = PipelineContext(session_id=graph.session_id, user_input="benchmark")
+    context.context_loading_output = ContextLoadingOutput(
+        methodology="means_end_chain",
+        concept_id="bench",
+        concept_name="Benchmark",
+        turn_number=20,
+        mode="exploratory",
+        max_turns=30,
+    )
+    return context
+
+
+@case("rank_strategy_node_pairs")
+async def _rank_strategy_node_pairs(size: int, workdir: Path) -> Bench:
+    from src.methodologies import get_registry
+    from src.methodologies.scoring import rank_strategy_node_pairs_with_stats
+
+    strategies = get_registry().get_methodology("means_end_chain").strategies
+    node_signals = build_node_signals(build_graph(size))
+    global_signals = _global_signals()
+
+    return Bench(
+        run=lambda: rank_strategy_node_pairs_with_stats(
+            strategies, global_signals, node_signals
+        )
+    )
+
+
+@case("node_signal_detection.detect")
+async def _node_signal_detection(size: int, workdir: Path) -> Bench:
+    from src.services.node_signal_detection_service import (
+        NodeSignalDetectionService,
+    )
+
+    graph = build_graph(size)
+    tracker = build_node_tracker(graph)
+    graph_state = _graph_state(graph)
+    context = _pipeline_context(graph)
+    context.node_tracker = tracker
+    service = NodeSignalDetectionService()
+
+    def reset() -> None:
+        # Every node dirty: the full recompute a cold tracker pays
+        tracker.signal_cache = {}
+        tracker.dirty_nodes = set(tracker.states)
+
+    return Bench(
+        run=lambda: service.detect(context, graph_state, "benchmark", tracker),
+        before_each=reset,
+    )
+
+
+async def _seeded_connection(size: int, workdir: Path):
+    graph = build_graph(size)
+    db_path = workdir / f"bench_{size}.db"
+    if not db_path.exists():
+        await seed_database(graph, db_path)
+    db = await aiosqlite.connect(db_path)
+    db.row_factory = aiosqlite.Row
+    return graph, db_path, db
+
+
+@case("graph_repo.get_graph_state")
+async def _get_graph_state(size: int, workdir: Path) -> Bench:
+    from src.persistence.repositories.graph_repo import GraphRepository
+
+    graph, _, db = await _seeded_connection(size, workdir)
+    repo = GraphRepository(db)
+    return Bench(run=lambda: repo.get_graph_state(graph.session_id), teardown=db.close)
+
+
+@case("graph_repo.find_similar_nodes")
+async def _find_similar_nodes(size: int, workdir: Path) -> Bench:
+    from src.persistence.repositories.graph_repo import GraphRepository
+
+    graph, _, db = await _seeded_connection(size, workdir)
+    repo = GraphRepository(db)
+    query = graph.embeddings[0]
+    node_type = graph.nodes[0].node_type
+    return Bench(
+        run=lambda: repo.find_similar_nodes(graph.session_id, node_type, query),
+        teardown=db.close,
+    )
+
+
+@case("canonical_graph.compute_canonical_state")
+async def _compute_canonical_state(size: int, workdir: Path) -> Bench:
+    from src.persistence.repositories.canonical_slot_repo import (
+        CanonicalSlotRepository,
+    )
+    from src.services.canonical_graph_service import CanonicalGraphService
+
+    graph, db_path, db = await _seeded_connection(size, workdir)
+    await db.close()
+    service = CanonicalGraphService(CanonicalSlotRepository(str(db_path)))
+    return Bench(run=lambda: service.compute_canonical_state(graph.session_id))
+
+
+@case("node_state_tracker.to_dict")
+async def _tracker_to_dict(size: int, workdir: Path) -> Bench:
+    tracker = build_node_tracker(build_graph(size))
+    tracker.signal_cache = {"graph.node.novelty": {n: 0.5 for n in tracker.states}}
+    return Bench(run=tracker.to_dict)
+
+
+@case("node_state_tracker.from_dict")
+async def _tracker_from_dict(size: int, workdir: Path) -> Bench:
+    from src.services.node_state_tracker import NodeStateTracker
+
+    tracker = build_node_tracker(build_graph(size))
+    tracker.signal_cache = {"graph.node.novelty": {n: 0.5 for n in tracker.states}}
+    data = tracker.to_dict()
+    return Bench(run=lambda: NodeStateTracker.from_dict(data))
+
+
+@case("turn_pipeline._build_result")
+async def _build_result(size: int, workdir: Path) -> Bench:
+    from datetime import datetime, timezone
+
+    from src.domain.models.canonical_graph import CanonicalGraphState
+    from src.domain.models.pipeline_contracts import (
+        GraphUpdateOutput,
+        StateComputationOutput,
+        StrategySelectionOutput,
+    )
+    from src.services.turn_pipeline.pipeline import TurnPipeline
+
+    graph = build_graph(size)
+    node_signals = build_node_signals(graph)
+    context = _pipeline_context(graph)
+    context.graph_update_output = GraphUpdateOutput(
+        nodes_added=graph.nodes[-5:],
+        edges_added=[
+            {"source_node_id": s, "target_node_id": t, "edge_type": e}
+            for s, t, e in graph.edges[-5:]
+        ],
+    )
+    context.state_computation_output = StateComputationOutput(
+        graph_state=_graph_state(graph),
+        computed_at=datetime.now(timezone.utc),
+        canonical_graph_state=CanonicalGraphState(
+            concept_count=graph.slot_count,
+            edge_count=len(graph.edges) // 2,
+            orphan_count=0,
+            max_depth=4,
+            avg_support=3.0,
+        ),
+    )
+    context.strategy_selection_output = StrategySelectionOutput(
+        strategy="deepen",
+        focus={"focus_node_id": graph.nodes[0].id},
+        signals=_global_signals(),
+        node_signals=node_signals,
+        strategy_alternatives=[
+            ("deepen", node.id, 1.0 / (i + 1)) for i, node in enumerate(graph.nodes[:10])
+        ],
+    )
+    pipeline = TurnPipeline(stages=[])
+    return Bench(run=lambda: pipeline._build_result(context, latency_ms=0))
@@ -0,0 +1,233 @@
+"""
+Synthetic graph fixtures for the micro-benchmarks.
+
+Graphs are seeded and shaped like interview graphs: a forest of
+means-end chains (each node links to an earlier node of the previous
+type level) plus a sprinkling of cross links, 384-dim embeddings, a
+NodeStateTracker with engagement history, and canonical slots at roughly
+one slot per three surface nodes. Database fixtures are bulk-inserted
+with executemany so 10k-node graphs seed in well under a second.
+"""
+
+import json
+import random
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import aiosqlite
+import numpy as np
+
+from src.domain.models.knowledge_graph import KGNode
+from src.domain.models.node_state import NodeState
+from src.persistence.database import init_database
+from src.services.node_state_tracker import NodeStateTracker
+
+NODE_TYPES = [
+    "attribute",
+    "functional_consequence",
+    "psychosocial_consequence",
+    "instrumental_value",
+    "terminal_value",
+]
+EMBEDDING_DIM = 384
+STRATEGIES = ["deepen", "clarify", "explore", "reflect", "revitalize"]
+
+
+@dataclass
+class SyntheticGraph:
+    """In-memory synthetic graph (no database)."""
+
+    session_id: str
+    nodes: List[KGNode]
+    edges: List[Tuple[str, str, str]]  # (source_id, target_id, edge_type)
+    embeddings: np.ndarray  # (n, EMBEDDING_DIM) float32, unit rows
+    slot_of: List[int] = field(default_factory=list)  # node index -> slot index
+
+    @property
+    def slot_count(self) -> int:
+        return max(self.slot_of) + 1 if self.slot_of else 0
+
+
+def build_graph(size: int, seed: int = 0) -> SyntheticGraph:
+    """Build a synthetic interview graph with `size` surface nodes."""
+    rng = random.Random(seed)
+    np_rng = np.random.default_rng(seed)
+    session_id = f"bench-{size}"
+
+    nodes: List[KGNode] = []
+    edges: List[Tuple[str, str, str]] = []
+    by_level: Dict[int, List[str]] = {level: [] for level in range(len(NODE_TYPES))}
+    for i in range(size):
+        level = min(int(rng.expovariate(0.8)), len(NODE_TYPES) - 1)
+        node = KGNode(
+            id=str(uuid.UUID(int=rng.getrandbits(128))),
+            session_id=session_id,
+            label=f"concept {i}",
+            node_type=NODE_TYPES[level],
+            properties={"level": level},
+            source_utterance_ids=[f"utt-{i // 3}"],
+        )
+        nodes.append(node)
+        parents = by_level[level - 1] if level > 0 else []
+        if parents:
+            edges.append((rng.choice(parents), node.id, "leads_to"))
+        by_level[level].append(node.id)
+
+    # Cross links (~20% of nodes) between existing nodes, no duplicates
+    seen = {(source, target) for source, target, _ in edges}
+    for _ in range(size // 5):
+        source, target = (n.id for n in rng.sample(nodes, 2))
+        if (source, target) not in seen:
+            seen.add((source, target))
+            edges.append((source, target, "leads_to"))
+
+    embeddings = np_rng.standard_normal((size, EMBEDDING_DIM)).astype(np.float32)
+    embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+
+    slot_count = max(1, size // 3)
+    slot_of = [rng.randrange(slot_count) for _ in range(size)]
+    return SyntheticGraph(session_id, nodes, edges, embeddings, slot_of)
+
+
+def build_node_tracker(graph: SyntheticGraph, turns: int = 20) -> NodeStateTracker:
+    """NodeStateTracker with one NodeState per node and some engagement history."""
+    rng = random.Random(len(graph.nodes))
+    tracker = NodeStateTracker()
+    for node in graph.nodes:
+        created = rng.randint(1, turns)
+        focus_count = rng.choice([0, 0, 0, 1, 2, 3])
+        state = NodeState(
+            node_id=node.id,
+            label=node.label,
+            created_at_turn=created,
+            depth=node.properties["level"],
+            node_type=node.node_type,
+            level=node.properties["level"],
+            focus_count=focus_count,
+            last_focus_turn=created if focus_count else None,
+            turns_since_last_focus=turns - created,
+            yield_count=rng.randint(0, focus_count),
+            all_response_depths=rng.choices(
+                ["surface", "shallow", "moderate", "deep"], k=focus_count
+            ),
+        )
+        if focus_count:
+            strategy = rng.choice(STRATEGIES)
+            state.strategy_usage_count = {strategy: focus_count}
+            state.last_strategy_used = strategy
+        tracker.states[node.id] = state
+
+    for source, target, _ in graph.edges:
+        tracker.states[source].edge_count_outgoing += 1
+        tracker.states[source].connected_node_ids.add(target)
+        tracker.states[target].edge_count_incoming += 1
+        tracker.states[target].connected_node_ids.add(source)
+
+    tracker.previous_focus = graph.nodes[-1].id
+    tracker.dirty_nodes = set(tracker.states)
+    return tracker
+
+
+def build_node_signals(graph: SyntheticGraph) -> Dict[str, Dict[str, Any]]:
+    """Per-node signal dicts with the shape NodeSignalDetectionService returns."""
+    rng = random.Random(len(graph.nodes) + 1)
+    return {
+        node.id: {
+            "graph.node.exhausted": rng.random() < 0.1,
+            "graph.node.exhaustion_score": round(rng.random(), 3),
+            "graph.node.yield_stagnation": rng.random() < 0.2,
+            "graph.node.focus_streak": rng.choice(["none", "low", "medium"]),
+            "graph.node.is_current_focus": False,
+            "graph.node.recency_score": round(rng.random(), 3),
+            "graph.node.is_orphan": rng.random() < 0.15,
+            "graph.node.edge_count": rng.randint(0, 6),
+            "graph.node.has_outgoing": rng.random() < 0.5,
+            "graph.node.novelty": round(rng.random(), 3),
+            "graph.node.focus_count": rng.randint(0, 3),
+            "technique.node.strategy_repetition": rng.choice(["none", "low", "high"]),
+            "meta.node.opportunity": rng.choice(["fresh", "probe_deeper", "exhausted"]),
+        }
+        for node in graph.nodes
+    }
+
+
+async def seed_database(graph: SyntheticGraph, db_path: Path) -> None:
+    """Create a database holding the graph's session, nodes, edges and slots."""
+    await init_database(db_path)
+    session_id = graph.session_id
+    async with aiosqlite.connect(db_path) as db:
+        await db.execute(
+            "INSERT INTO sessions (id, methodology, concept_id, concept_name) "
+            "VALUES (?, 'means_end_chain', 'bench', 'Benchmark')",
+            (session_id,),
+        )
+        await db.executemany(
+            "INSERT INTO kg_nodes (id, session_id, label, node_type, properties, "
+            "source_utterance_ids, embedding) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    node.id,
+                    session_id,
+                    node.label,
+                    node.node_type,
+                    json.dumps(node.properties),
+                    json.dumps(node.source_utterance_ids),
+                    graph.embeddings[i].tobytes(),
+                )
+                for i, node in enumerate(graph.nodes)
+            ],
+        )
+        await db.executemany(
+            "INSERT INTO kg_edges (id, session_id, source_node_id, target_node_id, "
+            "edge_type, source_utterance_ids) VALUES (?, ?, ?, ?, ?, '[]')",
+            [
+                (f"edge-{i}", session_id, source, target, edge_type)
+                for i, (source, target, edge_type) in enumerate(graph.edges)
+            ],
+        )
+
+        slot_ids = [f"slot-{i}" for i in range(graph.slot_count)]
+        slot_types = {slot: graph.nodes[i].node_type for i, slot in enumerate(graph.slot_of)}
+        await db.executemany(
+            "INSERT INTO canonical_slots (id, session_id, slot_name, node_type, "
+            "status, support_count, first_seen_turn, embedding) "
+            "VALUES (?, ?, ?, ?, 'active', ?, 1, ?)",
+            [
+                (
+                    slot_ids[s],
+                    session_id,
+                    f"slot_{s}",
+                    slot_types.get(s, NODE_TYPES[0]),
+                    graph.slot_of.count(s) or 1,
+                    graph.embeddings[s % len(graph.nodes)].tobytes(),
+                )
+                for s in range(graph.slot_count)
+            ],
+        )
+        await db.executemany(
+            "INSERT INTO surface_to_slot_mapping (surface_node_id, canonical_slot_id, "
+            "similarity_score, assigned_turn) VALUES (?, ?, 0.9, 1)",
+            [(node.id, slot_ids[graph.slot_of[i]]) for i, node in enumerate(graph.nodes)],
+        )
+
+        index = {node.id: i for i, node in enumerate(graph.nodes)}
+        canonical_edges: Dict[Tuple[str, str], List[str]] = {}
+        for i, (source, target, _) in enumerate(graph.edges):
+            key = (
+                slot_ids[graph.slot_of[index[source]]],
+                slot_ids[graph.slot_of[index[target]]],
+            )
+            if key[0] != key[1]:
+                canonical_edges.setdefault(key, []).append(f"edge-{i}")
+        await db.executemany(
+            "INSERT INTO canonical_edges (id, session_id, source_slot_id, "
+            "target_slot_id, edge_type, support_count, surface_edge_ids) "
+            "VALUES (?, ?, ?, ?, 'leads_to', ?, ?)",
+            [
+                (f"cedge-{i}", session_id, source, target, len(ids), json.dumps(ids))
+                for i, ((source, target), ids) in enumerate(canonical_edges.items())
+            ],
+        )
+        await db.commit()
@@ -0,0 +1,222 @@
+"""
+Benchmark runner, JSON results and baseline comparison.
+
+Timing: each (case, size) pair gets warmup calls, then is repeated until
+both min_iterations and min_time_s are reached (capped at max_iterations).
+Median, p95 and min wall time per call are recorded in milliseconds.
+
+A result regresses when its median is more than `threshold` slower than
+the baseline median and the absolute slowdown exceeds `noise_floor_ms`
+(sub-10µs cases jitter by more than 25% on a busy laptop).
+"""
+
+import logging
+import math
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+import structlog
+
+from benchmarks.cases import CASES, call
+
+DEFAULT_SIZES = (10, 100, 1000, 10000)
+BASELINE_PATH = Path(__file__).parent / "baselines" / "baseline.json"
+RESULTS_DIR = Path("benchmarks") / "results"
+
+
+@dataclass
+class BenchmarkResult:
+    """Timing for one (case, size) pair; times in milliseconds."""
+
+    case: str
+    size: int
+    iterations: int
+    median_ms: float
+    p95_ms: float
+    min_ms: float
+
+
+@dataclass
+class BenchmarkRun:
+    """A full benchmark run with environment metadata."""
+
+    results: List[BenchmarkResult]
+    meta: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"meta": self.meta, "results": [asdict(r) for r in self.results]}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BenchmarkRun":
+        return cls(
+            results=[BenchmarkResult(**r) for r in data.get("results", [])],
+            meta=data.get("meta", {}),
+        )
+
+    def index(self) -> Dict[tuple, BenchmarkResult]:
+        return {(r.case, r.size): r for r in self.results}
+
+
+@dataclass
+class Comparison:
+    """A result compared against its baseline."""
+
+    case: str
+    size: int
+    baseline_ms: Optional[float]
+    current_ms: float
+    ratio: Optional[float]
+    regression: bool
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _environment() -> Dict[str, Any]:
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git_commit": _git_commit(),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def quiet_logging() -> None:
+    """Drop info/debug logs: per-call log formatting would dominate timings."""
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger().setLevel(logging.WARNING)
+    structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+
+
+async def time_case(
+    name: str,
+    size: int,
+    workdir: Path,
+    warmup: int = 2,
+    min_iterations: int = 5,
+    max_iterations: int = 1000,
+    min_time_s: float = 0.5,
+) -> BenchmarkResult:
+    """Build and time one (case, size) pair."""
+    bench = await CASES[name](size, workdir)
+    timings: List[float] = []
+    try:
+        for _ in range(warmup):
+            await call(bench.before_each)
+            await call(bench.run)
+
+        started = time.perf_counter()
+        while len(timings) < max_iterations and (
+            len(timings) < min_iterations or time.perf_counter() - started < min_time_s
+        ):
+            await call(bench.before_each)
+            start = time.perf_counter()
+            await call(bench.run)
+            timings.append((time.perf_counter() - start) * 1000)
+    finally:
+        await call(bench.teardown)
+
+    timings.sort()
+    return BenchmarkResult(
+        case=name,
+        size=size,
+        iterations=len(timings),
+        median_ms=round(timings[len(timings) // 2], 4),
+        p95_ms=round(timings[max(0, math.ceil(0.95 * len(timings)) - 1)], 4),
+        min_ms=round(timings[0], 4),
+    )
+
+
+async def run_benchmarks(
+    cases: Optional[Iterable[str]] = None,
+    sizes: Iterable[int] = DEFAULT_SIZES,
+    min_time_s: float = 0.5,
+    on_result=None,
+) -> BenchmarkRun:
+    """Run the selected cases at each size.
+
+    Raises:
+        KeyError: If a case name is not registered
+    """
+    names = list(cases) if cases else list(CASES)
+    unknown = [n for n in names if n not in CASES]
+    if unknown:
+        raise KeyError(f"Unknown benchmark cases: {unknown}")
+
+    results = []
+    with tempfile.TemporaryDirectory(prefix="bench_") as tmp:
+        workdir = Path(tmp)
+        for name in names:
+            for size in sizes:
+                result = await time_case(name, size, workdir, min_time_s=min_time_s)
+                results.append(result)
+                if on_result:
+                    on_result(result)
+    return BenchmarkRun(results=results, meta=_environment())
+
+
+def compare(
+    current: BenchmarkRun,
+    baseline: BenchmarkRun,
+    threshold: float = 0.25,
+    noise_floor_ms: float = 0.01,
+) -> List[Comparison]:
+    """Compare medians with the baseline (missing baseline entries never regress)."""
+    baseline_index = baseline.index()
+    comparisons = []
+    for result in current.results:
+        base = baseline_index.get((result.case, result.size))
+        ratio = result.median_ms / base.median_ms if base and base.median_ms else None
+        regression = bool(
+            base
+            and ratio is not None
+            and ratio > 1 + threshold
+            and result.median_ms - base.median_ms > noise_floor_ms
+        )
+        comparisons.append(
+            Comparison(
+                case=result.case,
+                size=result.size,
+                baseline_ms=base.median_ms if base else None,
+                current_ms=result.median_ms,
+                ratio=round(ratio, 3) if ratio is not None else None,
+                regression=regression,
+            )
+        )
+    return comparisons
+
+
+def format_report(comparisons: List[Comparison]) -> str:
+    """Markdown table of current vs baseline medians."""
+    lines = [
+        "| case | size | baseline ms | current ms | ratio | |",
+        "|---|---:|---:|---:|---:|---|",
+    ]
+    for c in comparisons:
+        baseline = f"{c.baseline_ms:.4f}" if c.baseline_ms is not None else "-"
+        ratio = f"{c.ratio:.2f}x" if c.ratio is not None else "new"
+        flag = "REGRESSION" if c.regression else ""
+        lines.append(
+            f"| {c.case} | {c.size} | {baseline} | {c.current_ms:.4f} " f"| {ratio} | {flag} |"
+        )
+    regressions = sum(c.regression for c in comparisons)
+    lines.append("")
+    lines.append(f"{regressions} regression(s) in {len(comparisons)} results")
+    return "\n".join(lines)
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Load-test the API with M concurrent, human-paced interview sessions.
+
+Usage:
+    # Server backed by the fake provider or a replay cassette, e.g.
+    #   python scripts/run_fake_llm_server.py &
+    #   uvicorn src.main:app
+    python scripts/load_test.py --sessions 50 --turns 8 --think-time 5 --ramp-up 30
+
+    # Machine-readable report
+    python scripts/load_test.py --sessions 20 --json reports/load_20.json
+
+Reports throughput, p50/p95/p99 turn latency (client and server side), the
+per-stage breakdown from stage_timings and SQLite lock errors.
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from ui.load_generator import LoadTestConfig, RequestSample, run_load_test
+
+
+def _print_sample(sample: RequestSample) -> None:
+    if not sample.ok:
+        print(f"  session {sample.session_index} {sample.kind} failed: {sample.error}")
+
+
+async def main() -> int:
+    defaults = LoadTestConfig()
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--base-url", default=defaults.base_url)
+    parser.add_argument("--concept", default=defaults.concept_id)
+    parser.add_argument("--methodology", default=defaults.methodology)
+    parser.add_argument("--sessions", type=int, default=defaults.sessions)
+    parser.add_argument("--turns", type=int, default=defaults.turns_per_session)
+    parser.add_argument(
+        "--think-time", type=float, default=defaults.think_time_s, help="Median (s)"
+    )
+    parser.add_argument("--think-sigma", type=float, default=defaults.think_time_sigma)
+    parser.add_argument("--ramp-up", type=float, default=defaults.ramp_up_s)
+    parser.add_argument("--timeout", type=float, default=defaults.timeout_s)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--json", type=Path, default=None, help="Write report JSON")
+    args = parser.parse_args()
+
+    config = LoadTestConfig(
+        base_url=args.base_url,
+        concept_id=args.concept,
+        methodology=args.methodology,
+        sessions=args.sessions,
+        turns_per_session=args.turns,
+        think_time_s=args.think_time,
+        think_time_sigma=args.think_sigma,
+        ramp_up_s=args.ramp_up,
+        timeout_s=args.timeout,
+        seed=args.seed,
+    )
+    print(
+        f"Running {config.sessions} sessions x {config.turns_per_session} turns "
+        f"against {config.base_url}"
+    )
+
+    report = await run_load_test(config, on_sample=_print_sample)
+
+    print(f"\n{'=' * 60}")
+    print(report.format())
+    if args.json:
+        args.json.parent.mkdir(parents=True, exist_ok=True)
+        args.json.write_text(json.dumps(report.to_dict(), indent=2))
+        print(f"\nReport written to {args.json}")
+    return 1 if report.to_dict()["errors"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
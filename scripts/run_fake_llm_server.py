@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Run the local fake LLM provider (Anthropic Messages + OpenAI chat shapes).
+
+Usage:
+    python scripts/run_fake_llm_server.py --port 8900 --latency lognormal:600,0.4
+
+    # Inject faults: 5% HTTP 429 (retry-after 2s), 1% HTTP 500
+    python scripts/run_fake_llm_server.py --rate-limit-rate 0.05 \\
+        --retry-after 2 --error-rate 0.01
+
+Then set base_url: http://127.0.0.1:8900/v1 on each llm call type in
+config/interview_config.yaml. The clients still require an API key to be
+set; any value is accepted. Counters are served at GET /stats.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import uvicorn
+
+from src.llm.fake_provider import FakeProviderConfig, create_fake_provider_app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--latency", default=FakeProviderConfig.latency)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=1.0)
+    parser.add_argument("--stream-chunk-ms", type=float, default=FakeProviderConfig.stream_chunk_ms)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    config = FakeProviderConfig(
+        latency=args.latency,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        retry_after_s=args.retry_after,
+        stream_chunk_ms=args.stream_chunk_ms,
+        seed=args.seed,
+    )
+    uvicorn.run(
+        create_fake_provider_app(config),
+        host=args.host,
+        port=args.port,
+        log_level="warning",
+    )
+
+
+if __name__ == "__main__":
+    main()
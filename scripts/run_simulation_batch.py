@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Run a batch of synthetic interview simulations (concepts × personas × seeds).
+
+Usage:
+    python scripts/run_simulation_batch.py --concepts headphones_mec,meal_planning_jtbd \\
+        --personas baseline_cooperative,brief_responder --seeds 3 --concurrency 4
+
+    # Resume an interrupted batch (completed runs are skipped)
+    python scripts/run_simulation_batch.py --concepts headphones_mec \\
+        --personas baseline_cooperative --seeds 3 --batch-id 20260301_120000
+
+Results are appended to synthetic_interviews/batches/<batch_id>.jsonl as each
+run finishes; full transcripts are saved to synthetic_interviews/ as usual.
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# Configure logging first (before importing other modules)
+from src.core.logging import configure_logging
+
+configure_logging()
+
+from src.services.simulation_batch_service import (
+    DEFAULT_BATCH_CONCURRENCY,
+    BatchProgress,
+    build_run_matrix,
+    run_simulation_batch,
+)
+
+
+def _csv(value: str) -> list[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def _print_progress(progress: BatchProgress) -> None:
+    summary = progress.to_dict()
+    print(
+        f"[{progress.done}/{progress.total}] "
+        f"completed={progress.completed} failed={progress.failed} "
+        f"skipped={progress.skipped} running={progress.running} "
+        f"mean_run_ms={summary['mean_run_ms']}",
+        flush=True,
+    )
+
+
+async def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--concepts", type=_csv, required=True)
+    parser.add_argument("--personas", type=_csv, default=["baseline_cooperative"])
+    parser.add_argument("--seeds", type=int, default=1, help="Runs per pair")
+    parser.add_argument("--max-turns", type=int, default=10)
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_BATCH_CONCURRENCY)
+    parser.add_argument("--batch-id", default=None, help="Reuse to resume a batch")
+    args = parser.parse_args()
+
+    specs = build_run_matrix(
+        args.concepts, args.personas, seeds=args.seeds, max_turns=args.max_turns
+    )
+    print(f"Running {len(specs)} simulations (concurrency {args.concurrency})")
+
+    records = await run_simulation_batch(
+        specs,
+        batch_id=args.batch_id,
+        concurrency=args.concurrency,
+        on_progress=_print_progress,
+        runner_ready=lambda runner: print(f"Batch {runner.batch_id} -> {runner.results_path}"),
+    )
+
+    failed = [r for r in records if r.status == "failed"]
+    print(f"\n{'=' * 60}")
+    print("BATCH COMPLETE")
+    print(f"{'=' * 60}")
+    print(f"Ran: {len(records)}  Failed: {len(failed)}")
+    for record in failed:
+        print(f"  {record.run_id}: {record.error}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -8,6 +8,7 @@ from fastapi.responses import JSONResponse
 import structlog
 
 from src.core.exceptions import (
+    AdmissionRejectedError,
     InterviewSystemError,
     ConfigurationError,
     LLMTimeoutError,
@@ -45,6 +46,7 @@ def setup_exception_handlers(app: FastAPI):
         )
 
         status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+        headers = None
 
         if isinstance(exc, SessionNotFoundError):
             status_code = status.HTTP_404_NOT_FOUND
@@ -56,6 +58,9 @@ def setup_exception_handlers(app: FastAPI):
             status_code = status.HTTP_504_GATEWAY_TIMEOUT
         elif isinstance(exc, LLMRateLimitError):
             status_code = status.HTTP_429_TOO_MANY_REQUESTS
+        elif isinstance(exc, AdmissionRejectedError):
+            status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+            headers = {"Retry-After": str(exc.retry_after_s)}
 
         log_ctx.warning(
             "request_error",
@@ -71,6 +76,7 @@ def setup_exception_handlers(app: FastAPI):
                     "message": exc.message,
                 }
             },
+            headers=headers,
         )
 
     @app.exception_handler(ConfigurationError)
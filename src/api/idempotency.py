@@ -0,0 +1,136 @@
+"""
+Idempotency-Key support for turn submission.
+
+A client that times out on POST /sessions/{id}/turns and retries would
+otherwise run the whole pipeline again (LLM calls, graph writes, a second
+system utterance). IdempotencyStore runs the work for a (session, key) pair
+once: a request arriving while the first is still running awaits the same
+task, and a completed response is replayed until it expires after
+settings.idempotency_ttl_seconds. Failed runs are not cached, so a retry
+after an error runs the turn again.
+
+The work runs as its own task, shielded from the requests awaiting it, so a
+client disconnecting mid-turn neither cancels the turn nor loses its result
+for the retry. The store is process-local, like the per-session workers.
+"""
+
+import asyncio
+import hashlib
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import structlog
+
+from src.core.config import settings
+
+log = structlog.get_logger(__name__)
+
+
+class IdempotencyKeyConflictError(Exception):
+    """The idempotency key was already used for a different request body."""
+
+
+@dataclass
+class _Entry:
+    fingerprint: str
+    task: "asyncio.Task[Any]"
+    expires_at: Optional[float] = None  # Set once the task succeeds
+
+
+def request_fingerprint(*parts: str) -> str:
+    """Hash the request fields that must match for a key to be replayed."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class IdempotencyStore:
+    """Deduplicate concurrent and repeated requests by idempotency key."""
+
+    def __init__(self, ttl_s: float, max_entries: int = 10_000):
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+        self._entries: Dict[Tuple[str, str], _Entry] = {}
+
+    async def run(
+        self,
+        scope: str,
+        key: str,
+        fingerprint: str,
+        work: Callable[[], Awaitable[Any]],
+    ) -> Tuple[Any, bool]:
+        """Run work once per (scope, key) and share its result.
+
+        Args:
+            scope: Namespace for the key (the session ID)
+            key: Client-supplied Idempotency-Key
+            fingerprint: request_fingerprint() of the request body
+            work: Zero-argument coroutine function performing the request
+
+        Returns:
+            (result, replayed) where replayed is True when the result came
+            from an earlier or concurrent request with the same key
+
+        Raises:
+            IdempotencyKeyConflictError: If the key was used with another body
+            Exception: Whatever work raised (shared by concurrent waiters)
+        """
+        self._evict()
+        entry = self._entries.get((scope, key))
+
+        if entry is not None:
+            if entry.fingerprint != fingerprint:
+                raise IdempotencyKeyConflictError(
+                    f"Idempotency-Key {key!r} was already used with a different request"
+                )
+            log.info(
+                "idempotent_request_replayed",
+                scope=scope,
+                in_flight=not entry.task.done(),
+            )
+            return await asyncio.shield(entry.task), True
+
+        task = asyncio.create_task(work())
+        self._entries[(scope, key)] = _Entry(fingerprint=fingerprint, task=task)
+        task.add_done_callback(lambda t: self._on_done((scope, key), t))
+        return await asyncio.shield(task), False
+
+    def _on_done(self, entry_key: Tuple[str, str], task: "asyncio.Task[Any]") -> None:
+        entry = self._entries.get(entry_key)
+        if entry is None or entry.task is not task:
+            return
+        if task.cancelled() or task.exception() is not None:
+            # Errors are not cached: the client's retry should run again
+            del self._entries[entry_key]
+        else:
+            entry.expires_at = time.monotonic() + self.ttl_s
+
+    def _evict(self) -> None:
+        now = time.monotonic()
+        expired = [
+            k for k, e in self._entries.items() if e.expires_at is not None and e.expires_at <= now
+        ]
+        for k in expired:
+            del self._entries[k]
+
+        # Over capacity: drop the oldest completed entries (dicts keep
+        # insertion order); in-flight entries are never dropped
+        excess = len(self._entries) - self.max_entries
+        if excess > 0:
+            completed = [k for k, e in self._entries.items() if e.expires_at][:excess]
+            for k in completed:
+                del self._entries[k]
+
+
+_store: Optional[IdempotencyStore] = None
+
+
+def get_idempotency_store() -> IdempotencyStore:
+    """Return the process-wide store for turn submissions."""
+    global _store
+    if _store is None:
+        _store = IdempotencyStore(ttl_s=settings.idempotency_ttl_seconds)
+    return _store
@@ -0,0 +1,60 @@
+"""
+Admin routes for per-turn profiles.
+
+GET /admin/profiles/{session_id} - List a session's turn profiles
+GET /admin/profiles/{session_id}/turns/{turn_number} - Collapsed stacks for a turn
+"""
+
+from typing import List
+
+import structlog
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import PlainTextResponse
+from pydantic import BaseModel
+
+from src.services.turn_profiler import list_profiles, profile_path
+
+log = structlog.get_logger(__name__)
+router = APIRouter(prefix="/admin", tags=["admin"])
+
+
+class TurnProfileInfo(BaseModel):
+    """A stored turn profile (turn_number is None for a turn that failed)."""
+
+    turn_number: int | None
+    file: str
+    samples: int
+    size_bytes: int
+
+
+@router.get("/profiles/{session_id}", response_model=List[TurnProfileInfo])
+async def list_turn_profiles(session_id: str) -> List[TurnProfileInfo]:
+    """List the profiled turns of a session, oldest first."""
+    try:
+        return [TurnProfileInfo(**p) for p in list_profiles(session_id)]
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.get(
+    "/profiles/{session_id}/turns/{turn_number}",
+    response_class=PlainTextResponse,
+)
+async def get_turn_profile(session_id: str, turn_number: int) -> PlainTextResponse:
+    """
+    Return a turn's profile as collapsed stacks.
+
+    Each line is "frame;frame;...;frame sample_count" (outermost frame
+    first), ready for flamegraph.pl or speedscope.
+    """
+    try:
+        path = profile_path(session_id, turn_number)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    if not path.is_file():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No profile for session {session_id} turn {turn_number}",
+        )
+    return PlainTextResponse(path.read_text(encoding="utf-8"))
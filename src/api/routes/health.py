@@ -9,6 +9,7 @@ import structlog
 
 from src.core.config import settings
 from src.persistence.database import check_database_health
+from src.services.admission_controller import get_admission_controller
 
 log = structlog.get_logger(__name__)
 
@@ -21,7 +22,8 @@ async def health_check():
     Health check endpoint.
 
     Returns:
-        System health status including database connectivity.
+        System health status including database connectivity and
+        turn admission queue statistics.
     """
     db_health = await check_database_health()
 
@@ -31,7 +33,10 @@ async def health_check():
         "status": overall_status,
         "version": "0.1.0",
         "debug": settings.debug,
-        "components": {"database": db_health},
+        "components": {
+            "database": db_health,
+            "admission": get_admission_controller().stats(),
+        },
     }
 
 
@@ -0,0 +1,48 @@
+"""
+Prometheus metrics endpoint.
+
+Serves the process registry from src.core.metrics in the Prometheus text
+format. Gauges for queue depths are read at scrape time; the active
+session count is refreshed from the database on each scrape.
+"""
+
+import structlog
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+from src.api.dependencies import get_session_repository
+from src.core.metrics import (
+    ACTIVE_SESSIONS,
+    CANONICALIZATION_QUEUE_DEPTH,
+    CONTENT_TYPE,
+    REGISTRY,
+    TURNS_IN_FLIGHT,
+    TURNS_QUEUED,
+)
+from src.services.admission_controller import get_admission_controller
+from src.services.canonicalization_worker import canonicalization_queue_depth
+
+log = structlog.get_logger(__name__)
+
+router = APIRouter()
+
+TURNS_QUEUED.set_function(lambda: get_admission_controller().queued)
+TURNS_IN_FLIGHT.set_function(lambda: get_admission_controller().in_flight)
+CANONICALIZATION_QUEUE_DEPTH.set_function(canonicalization_queue_depth)
+
+
+@router.get("/metrics")
+async def metrics() -> Response:
+    """
+    Prometheus scrape endpoint.
+
+    Returns:
+        All registered metrics in text exposition format 0.0.4
+    """
+    try:
+        ACTIVE_SESSIONS.set(await get_session_repository().count_active())
+    except Exception as e:
+        # Keep serving the other metrics; the gauge holds its last value
+        log.warning("active_sessions_count_failed", error=str(e))
+
+    return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE)
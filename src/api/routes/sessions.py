@@ -4,12 +4,14 @@ Session API routes.
 Endpoints for session management and turn processing.
 """
 
+import asyncio
+import json
 import uuid
 from datetime import datetime, timezone
-from typing import Annotated
+from typing import Annotated, Any, AsyncIterator, Dict, Optional, Set
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from fastapi.responses import Response
+from fastapi import APIRouter, Depends, Header, HTTPException, status, Query
+from fastapi.responses import Response, StreamingResponse
 import aiosqlite
 import structlog
 
@@ -34,13 +36,29 @@ from src.api.dependencies import (
     get_shared_extraction_client,
     get_shared_generation_client,
 )
+from src.api.idempotency import (
+    IdempotencyKeyConflictError,
+    get_idempotency_store,
+    request_fingerprint,
+)
 from src.core.config import settings
-from src.core.exceptions import SessionNotFoundError, SessionCompletedError
+from src.core.exceptions import (
+    AdmissionRejectedError,
+    SessionCompletedError,
+    SessionNotFoundError,
+)
 from src.domain.models.session import Session, SessionState
 from src.persistence.database import get_db
 from src.persistence.repositories.session_repo import SessionRepository
 from src.persistence.repositories.graph_repo import GraphRepository
+from src.services.admission_controller import get_admission_controller
+from src.services.post_turn_writer import drain_post_turn_writes
 from src.services.session_service import SessionService
+from src.services.turn_pipeline import (
+    TurnEvent,
+    TurnEventSink,
+    TurnResult as PipelineTurnResult,
+)
 from src.services.export_service import ExportService
 
 log = structlog.get_logger(__name__)
@@ -209,6 +227,8 @@ async def get_session(
     Returns the full session configuration including methodology, concept,
     current state, turn count, and timestamps. Returns 404 if session not found.
     """
+    # Read-your-writes: include the last turn's write-behind state
+    await drain_post_turn_writes(session_id)
     session = await session_repo.get(session_id)
 
     if not session:
@@ -344,6 +364,42 @@ async def start_session(
         )
 
 
+def _build_turn_response(result: PipelineTurnResult) -> TurnResponse:
+    """Convert a pipeline TurnResult to the TurnResponse API schema."""
+    return TurnResponse(
+        turn_number=result.turn_number,
+        extracted=ExtractionSchema(
+            concepts=[
+                ExtractedConceptSchema(**c) for c in result.extracted["concepts"]
+            ],
+            relationships=[
+                ExtractedRelationshipSchema(**r)
+                for r in result.extracted["relationships"]
+            ],
+        ),
+        graph_state=GraphStateSchema(
+            node_count=result.graph_state["node_count"],
+            edge_count=result.graph_state["edge_count"],
+            depth_achieved=result.graph_state.get("depth_achieved", {}),
+        ),
+        scoring=ScoringSchema(
+            depth=result.scoring["depth"],
+            saturation=result.scoring["saturation"],
+        ),
+        strategy_selected=result.strategy_selected,
+        focus_node_id=result.focus_node_id,
+        next_question=result.next_question,
+        should_continue=result.should_continue,
+        latency_ms=result.latency_ms,
+        signals=result.signals,
+        strategy_alternatives=result.strategy_alternatives,
+        stage_timings=result.stage_timings,
+        signal_timings=result.signal_timings,
+        pipeline_profile=result.pipeline_profile,
+        budget_overruns=result.budget_overruns,
+    )
+
+
 @router.post(
     "/{session_id}/turns",
     response_model=TurnResponse,
@@ -351,56 +407,72 @@ async def start_session(
 async def process_turn(
     session_id: str,
     request: TurnRequest,
+    response: Response,
     service: SessionService = Depends(get_session_service),
+    idempotency_key: Optional[str] = Header(default=None, max_length=255),
+    profile_turn: bool = Header(default=False, alias="X-Profile-Turn"),
 ):
     """
     Process a respondent turn.
 
     Takes user input text, extracts concepts, updates graph,
     and returns next question.
+
+    With an Idempotency-Key header, the turn runs once per key: a retry
+    while the turn is running waits for it, and a retry after it completes
+    gets the cached response (marked with Idempotent-Replayed: true).
+    Reusing a key with different text returns 422.
+
+    Turns pass through admission control: over capacity the endpoint
+    returns 503 with a Retry-After header.
+
+    With X-Profile-Turn: true the turn is profiled; the profile is served by
+    GET /admin/profiles/{session_id}/turns/{turn_number}.
     """
     log.info(
         "processing_turn_request",
         session_id=session_id,
         text_length=len(request.text),
+        idempotency_key=idempotency_key,
+        profile_turn=profile_turn,
     )
 
     try:
-        result = await service.process_turn(
-            session_id=session_id,
-            user_input=request.text,
-        )
+        if idempotency_key:
+
+            async def run_turn() -> TurnResponse:
+                return _build_turn_response(
+                    await _run_detached_turn(
+                        session_id, request.text, profile=profile_turn, service=service
+                    )
+                )
+
+            turn_response, replayed = await get_idempotency_store().run(
+                scope=session_id,
+                key=idempotency_key,
+                fingerprint=request_fingerprint(request.text),
+                work=run_turn,
+            )
+            if replayed:
+                response.headers["Idempotent-Replayed"] = "true"
+            return turn_response
+
+        async with get_admission_controller().admit(session_id):
+            result = await service.process_turn(
+                session_id=session_id,
+                user_input=request.text,
+                profile=profile_turn,
+            )
 
-        # Convert to response schema
-        return TurnResponse(
-            turn_number=result.turn_number,
-            extracted=ExtractionSchema(
-                concepts=[
-                    ExtractedConceptSchema(**c) for c in result.extracted["concepts"]
-                ],
-                relationships=[
-                    ExtractedRelationshipSchema(**r)
-                    for r in result.extracted["relationships"]
-                ],
-            ),
-            graph_state=GraphStateSchema(
-                node_count=result.graph_state["node_count"],
-                edge_count=result.graph_state["edge_count"],
-                depth_achieved=result.graph_state.get("depth_achieved", {}),
-            ),
-            scoring=ScoringSchema(
-                depth=result.scoring["depth"],
-                saturation=result.scoring["saturation"],
-            ),
-            strategy_selected=result.strategy_selected,
-            focus_node_id=result.focus_node_id,
-            next_question=result.next_question,
-            should_continue=result.should_continue,
-            latency_ms=result.latency_ms,
-            signals=result.signals,
-            strategy_alternatives=result.strategy_alternatives,
-        )
+        return _build_turn_response(result)
 
+    except AdmissionRejectedError as e:
+        raise _overloaded(e)
+    except IdempotencyKeyConflictError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail=str(e),
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -424,6 +496,187 @@ async def process_turn(
         )
 
 
+def _overloaded(error: AdmissionRejectedError) -> HTTPException:
+    """503 response for a turn rejected by admission control."""
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=error.message,
+        headers={"Retry-After": str(error.retry_after_s)},
+    )
+
+
+# Streamed turns run as their own tasks so a client disconnect never leaves a
+# turn half-applied; keep references until they finish
+_streamed_turns: Set[asyncio.Task] = set()
+
+
+def _sse(event: str, data: Dict[str, Any]) -> str:
+    """Format one Server-Sent Events frame."""
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+async def _run_detached_turn(
+    session_id: str,
+    user_input: str,
+    event_sink: Optional[TurnEventSink] = None,
+    profile: bool = False,
+    service: Optional[SessionService] = None,
+) -> PipelineTurnResult:
+    """Process a turn on a dedicated connection, outliving the request.
+
+    When the request's injected SessionService is given, the detached
+    service reuses its session repository and LLM clients; only the graph
+    repository is rebound to the dedicated connection.
+    """
+    from src.persistence.database import get_db_connection
+
+    # Not the request-scoped get_db connection: it may be closed as soon as
+    # the response starts or the client disconnects
+    db = await get_db_connection()
+    try:
+        service = SessionService(
+            session_repo=(
+                service.session_repo
+                if service
+                else SessionRepository(str(settings.database_path))
+            ),
+            graph_repo=GraphRepository(db),
+            extraction_llm_client=(
+                service.extraction_llm_client if service else get_shared_extraction_client()
+            ),
+            generation_llm_client=(
+                service.generation_llm_client if service else get_shared_generation_client()
+            ),
+        )
+        async with get_admission_controller().admit(session_id):
+            return await service.process_turn(
+                session_id=session_id,
+                user_input=user_input,
+                event_sink=event_sink,
+                profile=profile,
+            )
+    finally:
+        # The shared :memory: connection must stay open for the process
+        if str(settings.database_path) != ":memory:":
+            await db.close()
+
+
+async def _run_streamed_turn(
+    session_id: str,
+    user_input: str,
+    queue: "asyncio.Queue[Optional[TurnEvent]]",
+    profile: bool = False,
+) -> PipelineTurnResult:
+    """Process a turn on a dedicated connection, pushing events to `queue`."""
+    return await _run_detached_turn(
+        session_id, user_input, event_sink=queue.put, profile=profile
+    )
+
+
+async def _stream_turn_events(
+    session_id: str, user_input: str, profile: bool = False
+) -> AsyncIterator[str]:
+    """Yield stage, token, and final result/error SSE frames for one turn."""
+    queue: "asyncio.Queue[Optional[TurnEvent]]" = asyncio.Queue()
+    task = asyncio.create_task(
+        _run_streamed_turn(session_id, user_input, queue, profile=profile)
+    )
+    _streamed_turns.add(task)
+    task.add_done_callback(_streamed_turns.discard)
+    task.add_done_callback(lambda _: queue.put_nowait(None))
+
+    while (event := await queue.get()) is not None:
+        name = "stage" if event.event == "stage_completed" else "token"
+        yield _sse(name, event.data)
+
+    try:
+        result = task.result()
+    except ValueError as e:
+        yield _sse("error", {"status": status.HTTP_404_NOT_FOUND, "detail": str(e)})
+        return
+    except SessionCompletedError:
+        yield _sse(
+            "error",
+            {
+                "status": status.HTTP_400_BAD_REQUEST,
+                "detail": "Session has already completed",
+            },
+        )
+        return
+    except AdmissionRejectedError as e:
+        yield _sse(
+            "error",
+            {
+                "status": status.HTTP_503_SERVICE_UNAVAILABLE,
+                "detail": e.message,
+                "retry_after": e.retry_after_s,
+            },
+        )
+        return
+    except Exception as e:
+        log.error(
+            "process_turn_stream_failed",
+            session_id=session_id,
+            error=str(e),
+            error_type=type(e).__name__,
+        )
+        yield _sse(
+            "error",
+            {
+                "status": status.HTTP_500_INTERNAL_SERVER_ERROR,
+                "detail": f"Turn processing failed: {e}",
+            },
+        )
+        return
+
+    yield _sse("result", _build_turn_response(result).model_dump(mode="json"))
+
+
+@router.post("/{session_id}/turns/stream")
+async def process_turn_stream(
+    session_id: str,
+    request: TurnRequest,
+    session_repo: SessionRepoDep,
+    profile_turn: bool = Header(default=False, alias="X-Profile-Turn"),
+):
+    """
+    Process a respondent turn, streaming progress as Server-Sent Events.
+
+    Emits `stage` events ({stage, index, total, duration_ms}) as each
+    pipeline stage completes, `token` events ({text}) as the next question
+    streams from the LLM, then one `result` event carrying the same
+    TurnResponse as POST /turns. Failures after the stream has started are
+    reported as an `error` event ({status, detail}). Streamed tokens are the
+    raw LLM text; clients should replace them with result.next_question.
+
+    Returns 503 with Retry-After when the admission queue is already full;
+    a turn that later times out waiting for a slot gets a 503 `error` event.
+    X-Profile-Turn works as for POST /turns.
+    """
+    if not await session_repo.get(session_id):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Session {session_id} not found",
+        )
+
+    try:
+        get_admission_controller().check_capacity(session_id)
+    except AdmissionRejectedError as e:
+        raise _overloaded(e)
+
+    log.info(
+        "processing_turn_stream_request",
+        session_id=session_id,
+        text_length=len(request.text),
+    )
+
+    return StreamingResponse(
+        _stream_turn_events(session_id, request.text, profile=profile_turn),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 # ============ EXPORT ============
 
 
@@ -475,6 +728,7 @@ async def export_session(
     log_ctx.info("export_session_requested")
 
     try:
+        await drain_post_turn_writes(session_id)
         data = await service.export_session(session_id, format)
 
         # Set content-type based on format
@@ -11,6 +11,8 @@ import aiosqlite
 import structlog
 
 from src.api.schemas import (
+    SimulationBatchRequest,
+    SimulationBatchStatus,
     SimulationRequest,
     SimulationResponse,
     SimulationTurnSchema,
@@ -24,6 +26,11 @@ from src.persistence.database import get_db
 from src.persistence.repositories.session_repo import SessionRepository
 from src.persistence.repositories.graph_repo import GraphRepository
 from src.services.session_service import SessionService
+from src.services.simulation_batch_service import (
+    build_run_matrix,
+    get_batch_status,
+    start_simulation_batch,
+)
 from src.services.simulation_service import SimulationService
 
 log = structlog.get_logger(__name__)
@@ -161,3 +168,49 @@ async def simulate_interview(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Simulation failed: {str(e)}",
         )
+
+
+@router.post(
+    "/batch",
+    response_model=SimulationBatchStatus,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def start_batch(request: SimulationBatchRequest):
+    """
+    Start a batch of simulations as a background job.
+
+    Runs every concept × persona × seed combination with bounded concurrency,
+    sharing models, LLM clients and the database connection across runs.
+    Results are appended to `synthetic_interviews/batches/{batch_id}.jsonl`
+    as runs finish. Re-submitting an existing batch_id resumes it, skipping
+    runs already recorded as completed.
+
+    Poll `GET /simulation/batch/{batch_id}` for progress.
+    """
+    specs = build_run_matrix(
+        request.concept_ids,
+        request.persona_ids,
+        seeds=request.seeds,
+        max_turns=request.max_turns,
+    )
+    try:
+        batch_id = start_simulation_batch(
+            specs, batch_id=request.batch_id, concurrency=request.concurrency
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+    log.info("simulation_batch_submitted", batch_id=batch_id, runs=len(specs))
+    return SimulationBatchStatus(batch_id=batch_id, total=len(specs))
+
+
+@router.get("/batch/{batch_id}", response_model=SimulationBatchStatus)
+async def get_batch(batch_id: str):
+    """Get progress and per-run latency summary for a simulation batch."""
+    batch_status = get_batch_status(batch_id)
+    if batch_status is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Batch not found: {batch_id}",
+        )
+    return SimulationBatchStatus(**batch_status)
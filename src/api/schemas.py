@@ -120,6 +120,24 @@ class TurnResponse(BaseModel):
         default=None,
         description="Alternative strategies with scores (including node_id for joint scoring)",
     )
+    stage_timings: Optional[Dict[str, float]] = Field(
+        default=None,
+        description="Per-stage pipeline durations in milliseconds",
+    )
+    signal_timings: Optional[Dict[str, float]] = Field(
+        default=None,
+        description="Per-signal-detector durations in milliseconds "
+        "(overlapping, within StrategySelectionStage)",
+    )
+    pipeline_profile: Optional[str] = Field(
+        default=None,
+        description="Pipeline profile the turn ran with ('lean' when degraded under load)",
+    )
+    budget_overruns: Optional[Dict[str, Dict[str, Any]]] = Field(
+        default=None,
+        description="Stages that exceeded their latency budget: "
+        "{stage: {budget_ms, elapsed_ms, fallback}}",
+    )
 
     class Config:
         json_schema_extra = {
@@ -332,3 +350,38 @@ class SimulationResponse(BaseModel):
     # Graph diagnostics (nodes and edges for diagnostic visibility)
     nodes: List[Dict[str, Any]] = Field(default_factory=list)
     edges: List[Dict[str, Any]] = Field(default_factory=list)
+
+
+class SimulationBatchRequest(BaseModel):
+    """Request to run a matrix of simulations (concepts × personas × seeds)."""
+
+    concept_ids: List[str] = Field(..., min_length=1, description="Concept IDs")
+    persona_ids: List[str] = Field(
+        default_factory=lambda: ["baseline_cooperative"], min_length=1
+    )
+    seeds: int = Field(default=1, ge=1, description="Runs per concept/persona pair")
+    max_turns: int = Field(default=10, description="Maximum turns per run")
+    concurrency: int = Field(
+        default=4, ge=1, le=32, description="Maximum simulations in flight"
+    )
+    batch_id: Optional[str] = Field(
+        default=None,
+        description="Batch ID; reuse an earlier one to resume it (completed runs are skipped)",
+    )
+
+
+class SimulationBatchStatus(BaseModel):
+    """Progress of a simulation batch."""
+
+    batch_id: str
+    state: str = "running"  # running, finished, failed, cancelled
+    total: int = 0
+    completed: int = 0
+    failed: int = 0
+    skipped: int = 0
+    running: int = 0
+    finished: bool = False
+    mean_run_ms: Optional[float] = None
+    p95_run_ms: Optional[float] = None
+    results_path: Optional[str] = None
+    error: Optional[str] = None
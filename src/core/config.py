@@ -6,7 +6,7 @@ All configuration is validated using Pydantic.
 """
 
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Literal, Optional
 
 import yaml
 from pydantic import BaseModel, Field, model_validator
@@ -67,6 +67,22 @@ class Settings(BaseSettings):
         default=None, description="xAI API key (for Grok models)"
     )
 
+    # Record/replay cassettes for deterministic offline runs (src/llm/cassette.py)
+    llm_cassette_mode: Literal["off", "record", "replay"] = Field(
+        default="off",
+        description="'record' saves every LLM request/response to the cassette; "
+        "'replay' serves responses from it without network or API keys",
+    )
+    llm_cassette_path: Path = Field(
+        default=Path("data/llm_cassette.jsonl"),
+        description="Cassette file (JSONL, one recorded response per line)",
+    )
+    llm_cassette_latency: str = Field(
+        default="recorded",
+        description="Replay latency: 'recorded', 'none', 'fixed:<ms>', "
+        "'normal:<mean_ms>,<std_ms>' or 'lognormal:<median_ms>,<sigma>'",
+    )
+
     # ==========================================================================
     # LLM Pricing (per million tokens)
     # ==========================================================================
@@ -122,6 +138,26 @@ class Settings(BaseSettings):
     host: str = Field(default="127.0.0.1", description="Server host address")
     port: int = Field(default=8000, ge=1, le=65535, description="Server port")
     debug: bool = Field(default=False, description="Enable debug mode")
+    idempotency_ttl_seconds: int = Field(
+        default=600,
+        ge=1,
+        description="How long turn responses are replayed for a repeated Idempotency-Key",
+    )
+
+    # Admission control for turn processing (src/services/admission_controller.py)
+    max_concurrent_turns: int = Field(
+        default=8, ge=1, description="Turns processed concurrently per worker"
+    )
+    max_queued_turns: int = Field(
+        default=32,
+        ge=0,
+        description="Turns allowed to wait for a slot; beyond this requests get 503",
+    )
+    admission_max_wait_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        description="Longest a queued turn waits for a slot before getting 503",
+    )
 
     # ==========================================================================
     # UI Client Configuration
@@ -148,11 +184,77 @@ class Settings(BaseSettings):
         description="Enable canonical slot discovery for deduplication (dual-graph architecture)",
     )
 
+    canonicalization_mode: Literal["inline", "background"] = Field(
+        default="inline",
+        description=(
+            "Where canonical slot discovery runs: 'inline' in the turn pipeline, or "
+            "'background' in a per-session worker (strategy selection then uses the "
+            "latest completed canonical snapshot, which may lag one turn)"
+        ),
+    )
+
+    enable_streaming_extraction: bool = Field(
+        default=True,
+        description="Stream the extraction response and compute concept embeddings as each concept arrives (graph result is unchanged)",
+    )
+
+    enable_write_behind: bool = Field(
+        default=True,
+        description="Persist system utterance, scoring, signals, session state and usage after the response via a journaled per-session queue",
+    )
+
     enable_question_self_selection: bool = Field(
         default=True,
         description="Enable self-selection prompt for question generation (generates 3 candidates, scores internally, outputs best)",
     )
 
+    # ==========================================================================
+    # Observability
+    # ==========================================================================
+
+    score_decomposition_top_k: int = Field(
+        default=10,
+        ge=1,
+        description="Number of top-ranked node candidates kept with full per-signal score decomposition",
+    )
+
+    full_score_decomposition: bool = Field(
+        default=False,
+        description="Debug: materialize per-signal score decomposition for every node candidate (large payloads)",
+    )
+
+    tracing_exporter: Literal["off", "file", "otlp"] = Field(
+        default="off",
+        description="Export tracing spans (turn, stages, LLM attempts, repository "
+        "queries, embedding batches): 'file' appends OTLP/JSON to tracing_file_path, "
+        "'otlp' POSTs to an OTLP/HTTP collector",
+    )
+    tracing_file_path: Path = Field(
+        default=Path("logs/traces.jsonl"),
+        description="Span file for tracing_exporter='file' (one OTLP/JSON batch per line)",
+    )
+    tracing_otlp_endpoint: str = Field(
+        default="http://localhost:4318",
+        description="OTLP/HTTP collector base URL for tracing_exporter='otlp'",
+    )
+
+    enable_turn_profiling: bool = Field(
+        default=False,
+        description="Allow opt-in turn profiling (X-Profile-Turn header or session "
+        "config profile_turns). Off by default; deployments must enable it "
+        "explicitly because profiles are served by the unauthenticated "
+        "/admin/profiles routes",
+    )
+    turn_profile_interval_ms: float = Field(
+        default=5.0,
+        gt=0,
+        description="Stack sampling interval for profiled turns (milliseconds)",
+    )
+    turn_profile_dir: Path = Field(
+        default=Path("data/profiles"),
+        description="Directory for per-turn profiles (<session_id>/turn_<NNNN>.collapsed)",
+    )
+
     # ==========================================================================
     # Cloud Storage
     # ==========================================================================
@@ -279,6 +381,20 @@ class DeduplicationConfig(BaseModel):
         ge=1,
         description="Minimum surface nodes mapped before candidate slot is promoted to active",
     )
+    slot_fast_path_threshold: float = Field(
+        default=0.85,
+        ge=0.0,
+        le=1.0,
+        description=(
+            "Cosine similarity at which a surface node is assigned directly to an "
+            "existing active slot of its node_type, bypassing the slot-discovery LLM "
+            "call (1.0 effectively disables the fast path)"
+        ),
+    )
+    slot_fast_path_thresholds: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Per-node_type overrides of slot_fast_path_threshold",
+    )
 
 
 class LLMCallConfig(BaseModel):
@@ -292,6 +408,22 @@ class LLMCallConfig(BaseModel):
     effort: Optional[str] = Field(
         default=None, description="Anthropic extended thinking effort (low/medium/high)"
     )
+    base_url: Optional[str] = Field(
+        default=None,
+        description="Override the provider API base URL, e.g. the local fake "
+        "provider (src/llm/fake_provider.py) for capacity tests",
+    )
+
+
+class RateLimitConfig(BaseModel):
+    """Client-side rate limit for one provider or provider/model.
+
+    Unset limits start unbounded and are learned from the provider's
+    rate-limit response headers.
+    """
+
+    requests_per_minute: Optional[int] = Field(default=None, ge=1)
+    tokens_per_minute: Optional[int] = Field(default=None, ge=1)
 
 
 class LLMConfig(BaseModel):
@@ -342,6 +474,124 @@ class LLMConfig(BaseModel):
             effort="low",
         )
     )
+    rate_limits: Dict[str, RateLimitConfig] = Field(
+        default_factory=dict,
+        description="Rate limits keyed by provider ('kimi') or provider/model "
+        "('anthropic/claude-haiku-4-5'); the provider/model entry wins",
+    )
+
+
+class PipelineProfileConfig(BaseModel):
+    """Which optional turn-pipeline work a profile performs."""
+
+    skip_srl: bool = Field(
+        default=False, description="Skip SRLPreprocessingStage (no SRL hints)"
+    )
+    defer_slot_discovery: bool = Field(
+        default=False,
+        description="Hand slot discovery to the session's background "
+        "canonicalization worker instead of running it inline",
+    )
+    llm_signals: Literal["live", "cached"] = Field(
+        default="live",
+        description="'live' calls the signal-scoring LLM; 'cached' reuses the "
+        "session's last live LLM signals (neutral defaults if none)",
+    )
+
+
+class ProfileSwitchingConfig(BaseModel):
+    """Load thresholds for switching sessions to the degraded profile.
+
+    A session enters the degraded profile as soon as either enter threshold
+    is reached, and returns to the default profile only once both exit
+    thresholds hold and it has spent min_dwell_turns turns degraded. The
+    gap between enter and exit thresholds keeps profiles from flapping.
+    """
+
+    enter_queued_turns: int = Field(
+        default=4, ge=1, description="Admission queue length that triggers degrading"
+    )
+    exit_queued_turns: int = Field(
+        default=0, ge=0, description="Admission queue length at or below which to recover"
+    )
+    enter_latency_ratio: float = Field(
+        default=2.0,
+        gt=1.0,
+        description="Recent/baseline provider latency ratio that triggers degrading",
+    )
+    exit_latency_ratio: float = Field(
+        default=1.3,
+        ge=1.0,
+        description="Recent/baseline provider latency ratio at or below which to recover",
+    )
+    min_dwell_turns: int = Field(
+        default=3, ge=1, description="Minimum turns a session stays degraded"
+    )
+
+    @model_validator(mode="after")
+    def check_hysteresis(self) -> "ProfileSwitchingConfig":
+        """Exit thresholds must sit below enter thresholds."""
+        if self.exit_queued_turns >= self.enter_queued_turns:
+            raise ValueError("exit_queued_turns must be below enter_queued_turns")
+        if self.exit_latency_ratio >= self.enter_latency_ratio:
+            raise ValueError("exit_latency_ratio must be below enter_latency_ratio")
+        return self
+
+
+class PipelineProfilesConfig(BaseModel):
+    """Turn-pipeline profiles and the load-based switching between them."""
+
+    adaptive: bool = Field(
+        default=True,
+        description="Switch sessions to the degraded profile under load; "
+        "when false every turn uses the default profile",
+    )
+    default: str = Field(default="full", description="Profile used under normal load")
+    degraded: str = Field(default="lean", description="Profile used under load")
+    profiles: Dict[str, PipelineProfileConfig] = Field(
+        default_factory=lambda: {
+            "full": PipelineProfileConfig(),
+            "lean": PipelineProfileConfig(
+                skip_srl=True, defer_slot_discovery=True, llm_signals="cached"
+            ),
+        }
+    )
+    switching: ProfileSwitchingConfig = Field(default_factory=ProfileSwitchingConfig)
+
+    @model_validator(mode="after")
+    def check_profiles_exist(self) -> "PipelineProfilesConfig":
+        """The default and degraded profiles must be declared."""
+        for name in (self.default, self.degraded):
+            if name not in self.profiles:
+                raise ValueError(f"Pipeline profile '{name}' is not declared")
+        return self
+
+
+class TurnBudgetsConfig(BaseModel):
+    """Latency budgets for the turn pipeline.
+
+    The turn deadline bounds every LLM call in the turn. A stage budget
+    cuts the stage short if it declares a fallback (TurnStage.fallback) and
+    is otherwise only reported when exceeded.
+    """
+
+    turn_deadline_ms: Optional[float] = Field(
+        default=None,
+        gt=0,
+        description="Deadline for the whole turn, measured from pipeline start "
+        "(None = no deadline)",
+    )
+    stages: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Budget in ms per stage, keyed by stage class name "
+        "(e.g. 'SlotDiscoveryStage'); unlisted stages are unbounded",
+    )
+    fallback_ms: float = Field(
+        default=2000,
+        gt=0,
+        description="Upper bound in ms on a stage's fallback() after its budget "
+        "ran out (fallbacks must not call an LLM)",
+    )
 
 
 class InterviewConfig(BaseModel):
@@ -357,6 +607,10 @@ class InterviewConfig(BaseModel):
     session_service: SessionServiceConfig = Field(default_factory=SessionServiceConfig)
     deduplication: DeduplicationConfig = Field(default_factory=DeduplicationConfig)
     llm: LLMConfig = Field(default_factory=LLMConfig)
+    pipeline_profiles: PipelineProfilesConfig = Field(
+        default_factory=PipelineProfilesConfig
+    )
+    turn_budgets: TurnBudgetsConfig = Field(default_factory=TurnBudgetsConfig)
 
     @model_validator(mode="after")
     def sync_max_turns_with_phases(self) -> "InterviewConfig":
@@ -47,6 +47,12 @@ class LLMRateLimitError(LLMError):
     pass
 
 
+class LLMCassetteMissError(LLMError):
+    """No recorded response for a request in LLM replay mode."""
+
+    pass
+
+
 class LLMContentFilterError(LLMError):
     """Content filtered by LLM provider."""
 
@@ -94,6 +100,12 @@ class SessionAbandonedError(SessionError):
     pass
 
 
+class PostTurnWriteError(SessionError):
+    """A previous turn's deferred (write-behind) writes could not be applied."""
+
+    pass
+
+
 # =============================================================================
 # Extraction Errors
 # =============================================================================
@@ -154,3 +166,19 @@ class ScorerFailureError(ScoringError):
     """
 
     pass
+
+
+# =============================================================================
+# Capacity Errors
+# =============================================================================
+
+
+class AdmissionRejectedError(InterviewSystemError):
+    """Turn not admitted because the server is at capacity.
+
+    retry_after_s is the suggested client back-off (sent as Retry-After).
+    """
+
+    def __init__(self, message: str, retry_after_s: int):
+        self.retry_after_s = retry_after_s
+        super().__init__(message)
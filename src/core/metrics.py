@@ -0,0 +1,305 @@
+"""
+Prometheus metrics for the interview system.
+
+Exposes turn, stage, LLM, database and embedding measurements in the
+Prometheus text exposition format (version 0.0.4), served by GET /metrics.
+
+Recording is built for the turn hot path: every labelled child is created
+once (callers resolve it at construction time with .labels() and keep the
+reference), and Histogram.observe() only bisects a preallocated bucket
+list and bumps counters. All work that builds strings happens at scrape
+time in MetricsRegistry.render().
+
+The app runs on a single event loop, so plain attribute updates are safe;
+no locks are taken on the recording path.
+"""
+
+from bisect import bisect_left
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+
+class _HistogramChild:
+    """Bucket counts for one label combination."""
+
+    __slots__ = ("_bounds", "_counts", "sum", "count")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self._bounds = bounds
+        self._counts = [0] * (len(bounds) + 1)  # Last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self._counts[bisect_left(self._bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative_counts(self) -> List[int]:
+        total, cumulative = 0, []
+        for count in self._counts:
+            total += count
+            cumulative.append(total)
+        return cumulative
+
+
+class _CounterChild:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+
+class _GaugeChild:
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+
+class _Metric:
+    """Common naming and label bookkeeping for all metric types."""
+
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+
+    def labels(self, *values: str):
+        """Return the child for these label values, creating it once.
+
+        Resolve children outside the hot path and keep the reference.
+        """
+        if len(values) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {values}")
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            child = self._children[key] = self._new_child()
+        return child
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def _label_str(self, key: Tuple[str, ...], extra: str = "") -> str:
+        pairs = [f'{name}="{_escape(value)}"' for name, value in zip(self.labelnames, key)]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Histogram(_Metric):
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_child(self) -> _HistogramChild:
+        return _HistogramChild(self.buckets)
+
+    def samples(self) -> List[str]:
+        lines = []
+        for key, child in self._children.items():
+            bounds = [_format_value(b) for b in self.buckets] + ["+Inf"]
+            for bound, count in zip(bounds, child.cumulative_counts()):
+                labels = self._label_str(key, f'le="{bound}"')
+                lines.append(f"{self.name}_bucket{labels} {count}")
+            labels = self._label_str(key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(child.sum)}")
+            lines.append(f"{self.name}_count{labels} {child.count}")
+        return lines
+
+
+class Counter(_Metric):
+    type_name = "counter"
+
+    def _new_child(self) -> _CounterChild:
+        return _CounterChild()
+
+    def samples(self) -> List[str]:
+        return [
+            f"{self.name}{self._label_str(key)} {_format_value(child.value)}"
+            for key, child in self._children.items()
+        ]
+
+
+class Gauge(_Metric):
+    """Gauge set directly, or read from a callback at scrape time."""
+
+    type_name = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._function: Optional[Callable[[], float]] = None
+
+    def _new_child(self) -> _GaugeChild:
+        return _GaugeChild()
+
+    def set(self, value: float) -> None:
+        self.labels().set(value)
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        """Read the (unlabelled) gauge from function on every scrape."""
+        self._function = function
+        self.labels()
+
+    def samples(self) -> List[str]:
+        if self._function is not None:
+            self.labels().set(self._function())
+        return [
+            f"{self.name}{self._label_str(key)} {_format_value(child.value)}"
+            for key, child in self._children.items()
+        ]
+
+
+class MetricsRegistry:
+    """Ordered collection of metrics rendered together."""
+
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        """Render all metrics in the Prometheus text format."""
+        lines = []
+        for metric in self._metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+REGISTRY = MetricsRegistry()
+
+TURN_DURATION = REGISTRY.register(
+    Histogram(
+        "interview_turn_duration_seconds",
+        "End-to-end turn pipeline latency.",
+    )
+)
+STAGE_DURATION = REGISTRY.register(
+    Histogram(
+        "interview_stage_duration_seconds",
+        "Turn pipeline stage latency.",
+        ["stage"],
+    )
+)
+LLM_REQUEST_DURATION = REGISTRY.register(
+    Histogram(
+        "llm_request_duration_seconds",
+        "Completed LLM request latency (non-streaming and streamed).",
+        ["provider", "client_type"],
+    )
+)
+LLM_TOKENS = REGISTRY.register(
+    Counter(
+        "llm_tokens_total",
+        "LLM tokens consumed, by direction (input or output).",
+        ["provider", "client_type", "direction"],
+    )
+)
+DB_CONNECTION_OPEN = REGISTRY.register(
+    Histogram(
+        "db_connection_open_seconds",
+        "Database connection open latency (get_db, get_db_connection and "
+        "repository connections, including setup pragmas where applied); "
+        "connections are not pooled.",
+    )
+)
+EMBEDDING_BATCH_SIZE = REGISTRY.register(
+    Histogram(
+        "embedding_batch_size",
+        "Texts sent to the embedding model per call (cache misses only).",
+        buckets=SIZE_BUCKETS,
+    )
+)
+CANONICALIZATION_QUEUE_DEPTH = REGISTRY.register(
+    Gauge(
+        "canonicalization_queue_depth",
+        "Slot canonicalization (embedding) jobs waiting in background workers.",
+    )
+)
+TURNS_QUEUED = REGISTRY.register(
+    Gauge(
+        "interview_turns_queued",
+        "Turns waiting for admission.",
+    )
+)
+TURNS_IN_FLIGHT = REGISTRY.register(
+    Gauge(
+        "interview_turns_in_flight",
+        "Turns currently running the pipeline.",
+    )
+)
+ACTIVE_SESSIONS = REGISTRY.register(
+    Gauge(
+        "interview_active_sessions",
+        "Sessions with status 'active'.",
+    )
+)
+
+
+class LLMCallMetrics:
+    """Pre-resolved LLM metric children for one provider/client_type pair."""
+
+    __slots__ = ("duration", "input_tokens", "output_tokens")
+
+    def __init__(self, provider: str, client_type: str):
+        self.duration = LLM_REQUEST_DURATION.labels(provider, client_type)
+        self.input_tokens = LLM_TOKENS.labels(provider, client_type, "input")
+        self.output_tokens = LLM_TOKENS.labels(provider, client_type, "output")
+
+    def observe(self, latency_ms: float, input_tokens: int, output_tokens: int) -> None:
+        self.duration.observe(latency_ms / 1000)
+        self.input_tokens.inc(input_tokens)
+        self.output_tokens.inc(output_tokens)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    return str(value) if isinstance(value, int) else repr(float(value))
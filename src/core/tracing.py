@@ -0,0 +1,314 @@
+"""
+Tracing spans for turns, pipeline stages, LLM attempts, repository queries
+and embedding batches.
+
+Spans follow the OpenTelemetry data model (128-bit trace id, 64-bit span
+id, parent span id, start/end in Unix nanoseconds, attributes, status) and
+are exported as OTLP/JSON, either appended to a local JSONL file or POSTed
+to an OTLP/HTTP collector at <endpoint>/v1/traces. The current span lives
+in a ContextVar, so spans opened in concurrently running tasks nest under
+the span that was current when the task was created, and overlap shows up
+directly in the exported timings.
+
+Tracing is off unless settings.tracing_exporter is "file" or "otlp"; with
+it off, span() yields None without creating anything. Ended spans are
+buffered and flushed by a background task started from the application
+lifespan (start_tracing / shutdown_tracing).
+
+    with span("embedding.encode_batch", batch_size=len(texts)) as s:
+        ...
+"""
+
+import asyncio
+import functools
+import inspect
+import json
+import secrets
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+import httpx
+import structlog
+
+from src.core.config import settings
+
+log = structlog.get_logger(__name__)
+
+SERVICE_NAME = "interview-system-v2"
+
+_current_span: ContextVar[Optional["Span"]] = ContextVar("current_span", default=None)
+
+
+class Span:
+    """One timed operation in a trace."""
+
+    __slots__ = (
+        "name",
+        "trace_id",
+        "span_id",
+        "parent_span_id",
+        "start_ns",
+        "end_ns",
+        "attributes",
+        "status",
+        "status_message",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        parent: Optional["Span"] = None,
+        attributes: Optional[Dict[str, Any]] = None,
+    ):
+        self.name = name
+        self.trace_id = parent.trace_id if parent else secrets.token_hex(16)
+        self.span_id = secrets.token_hex(8)
+        self.parent_span_id = parent.span_id if parent else None
+        self.start_ns = time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes: Dict[str, Any] = attributes or {}
+        self.status = "UNSET"
+        self.status_message = ""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def set_error(self, error: BaseException) -> None:
+        self.status = "ERROR"
+        self.status_message = f"{type(error).__name__}: {error}"
+
+    def end(self) -> None:
+        self.end_ns = time.time_ns()
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """Serialize as an OTLP/JSON span."""
+        otlp: Dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,  # SPAN_KIND_INTERNAL
+            "startTimeUnixNano": str(self.start_ns),
+            "endTimeUnixNano": str(self.end_ns or self.start_ns),
+            "attributes": [
+                {"key": key, "value": _otlp_value(value)}
+                for key, value in self.attributes.items()
+                if value is not None
+            ],
+            "status": {"code": {"UNSET": 0, "OK": 1, "ERROR": 2}[self.status]},
+        }
+        if self.parent_span_id:
+            otlp["parentSpanId"] = self.parent_span_id
+        if self.status_message:
+            otlp["status"]["message"] = self.status_message
+        return otlp
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_payload(spans: List[Span]) -> Dict[str, Any]:
+    return {
+        "resourceSpans": [
+            {
+                "resource": {
+                    "attributes": [{"key": "service.name", "value": {"stringValue": SERVICE_NAME}}]
+                },
+                "scopeSpans": [
+                    {
+                        "scope": {"name": "src.core.tracing"},
+                        "spans": [s.to_otlp() for s in spans],
+                    }
+                ],
+            }
+        ]
+    }
+
+
+class FileSpanExporter:
+    """Append each batch as one OTLP/JSON line (the collector file format)."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+
+    async def export(self, spans: List[Span]) -> None:
+        line = json.dumps(_otlp_payload(spans)) + "\n"
+        await asyncio.to_thread(self._append, line)
+
+    def _append(self, line: str) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line)
+
+
+class OTLPHttpSpanExporter:
+    """POST batches to an OTLP/HTTP collector (JSON encoding)."""
+
+    def __init__(self, endpoint: str, timeout: float = 5.0):
+        self.url = endpoint.rstrip("/") + "/v1/traces"
+        self.timeout = timeout
+
+    async def export(self, spans: List[Span]) -> None:
+        async with httpx.AsyncClient(timeout=self.timeout) as http:
+            response = await http.post(self.url, json=_otlp_payload(spans))
+            response.raise_for_status()
+
+
+class Tracer:
+    """Creates spans and buffers ended spans for batched export.
+
+    Spans are dropped (and counted) rather than blocking when the buffer is
+    full, e.g. when the collector is unreachable.
+    """
+
+    def __init__(
+        self,
+        exporter: Any = None,
+        max_batch_size: int = 256,
+        max_buffered: int = 4096,
+        flush_interval_s: float = 2.0,
+    ):
+        self.exporter = exporter
+        self.max_batch_size = max_batch_size
+        self.max_buffered = max_buffered
+        self.flush_interval_s = flush_interval_s
+        self.dropped = 0
+        self._buffer: List[Span] = []
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    def on_end(self, ended: Span) -> None:
+        if len(self._buffer) >= self.max_buffered:
+            self.dropped += 1
+            return
+        self._buffer.append(ended)
+
+    async def flush(self) -> None:
+        """Export everything buffered so far."""
+        while self._buffer:
+            batch = self._buffer[: self.max_batch_size]
+            del self._buffer[: self.max_batch_size]
+            try:
+                await self.exporter.export(batch)
+            except Exception as e:
+                self.dropped += len(batch)
+                log.warning("trace_export_failed", spans=len(batch), error=str(e))
+
+    def start(self) -> None:
+        """Start the periodic flush task (no-op when disabled)."""
+        if self.enabled and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def shutdown(self) -> None:
+        """Stop the flush task and export remaining spans."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self.enabled:
+            await self.flush()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval_s)
+            await self.flush()
+
+
+_tracer: Optional[Tracer] = None
+
+
+def get_tracer() -> Tracer:
+    """Return the process-wide tracer configured from settings."""
+    global _tracer
+    if _tracer is None:
+        exporter: Any = None
+        if settings.tracing_exporter == "file":
+            exporter = FileSpanExporter(settings.tracing_file_path)
+        elif settings.tracing_exporter == "otlp":
+            exporter = OTLPHttpSpanExporter(settings.tracing_otlp_endpoint)
+        _tracer = Tracer(exporter)
+    return _tracer
+
+
+def start_tracing() -> None:
+    """Start exporting spans (application startup)."""
+    tracer = get_tracer()
+    tracer.start()
+    if tracer.enabled:
+        log.info("tracing_started", exporter=settings.tracing_exporter)
+
+
+async def shutdown_tracing() -> None:
+    """Flush buffered spans (application shutdown)."""
+    if _tracer is not None:
+        await _tracer.shutdown()
+
+
+def current_span() -> Optional[Span]:
+    """Return the span active in this context, if any."""
+    return _current_span.get()
+
+
+@contextmanager
+def span(name: str, activate: bool = True, **attributes: Any) -> Iterator[Optional[Span]]:
+    """Time the enclosed block as a child of the current span.
+
+    Exceptions mark the span as failed and propagate; cancellation (task
+    cancel or a generator closed early) is recorded as cancelled=True.
+    With activate=False the span is not made current, which async
+    generators need because they yield to the consumer mid-span. Yields
+    None when tracing is disabled.
+    """
+    tracer = get_tracer()
+    if not tracer.enabled:
+        yield None
+        return
+
+    current = Span(name, parent=_current_span.get(), attributes=attributes)
+    token = _current_span.set(current) if activate else None
+    try:
+        yield current
+    except (GeneratorExit, asyncio.CancelledError):
+        current.set_attribute("cancelled", True)
+        raise
+    except BaseException as e:
+        current.set_error(e)
+        raise
+    finally:
+        if token is not None:
+            _current_span.reset(token)
+        current.end()
+        tracer.on_end(current)
+
+
+def trace_repository(cls: type) -> type:
+    """Class decorator: wrap each public async method in a "db.<Class>.<method>" span."""
+    for attr, method in list(vars(cls).items()):
+        if attr.startswith("_") or not inspect.iscoroutinefunction(method):
+            continue
+        setattr(cls, attr, _traced_method(f"db.{cls.__name__}.{attr}", method))
+    return cls
+
+
+def _traced_method(name: str, method: Any) -> Any:
+    @functools.wraps(method)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        with span(name):
+            return await method(*args, **kwargs)
+
+    return wrapper
@@ -148,6 +148,11 @@ class StateComputationOutput(BaseModel):
         default=None,
         description="Canonical graph state (deduplicated concepts)",
     )
+    canonical_state_turn: Optional[int] = Field(
+        default=None,
+        description="Turn the canonical graph state reflects (lags the current "
+        "turn in background canonicalization mode)",
+    )
 
     @model_validator(mode="after")
     def set_computed_at_if_missing(self) -> "StateComputationOutput":
@@ -264,7 +269,8 @@ class StrategySelectionOutput(BaseModel):
             "and Stage 2 (node-level) decompositions. Each entry has strategy, node_id, "
             "signal_contributions (name/value/weight/contribution), base_score, "
             "phase_multiplier, phase_bonus, final_score, rank, selected. "
-            "Populated during simulation; None in live API."
+            "Stage 2 entries cover only the top-k ranked nodes "
+            "(settings.score_decomposition_top_k) unless full_score_decomposition is set."
         ),
     )
 
@@ -347,6 +353,17 @@ class SlotDiscoveryOutput(BaseModel):
     mappings_created: int = Field(
         default=0, ge=0, description="Surface nodes mapped to canonical slots"
     )
+    fast_path_hit_rate: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=1.0,
+        description="Session share of surface nodes mapped by the embedding fast path",
+    )
+    llm_calls_saved: int = Field(
+        default=0,
+        ge=0,
+        description="Session slot-discovery LLM calls skipped by the fast path",
+    )
     timestamp: datetime = Field(
         default_factory=lambda: datetime.now(timezone.utc),
         description="When slot discovery was performed",
@@ -0,0 +1,319 @@
+"""
+Record/replay cassettes for LLM calls.
+
+Enables deterministic, offline runs of the full pipeline
+(SessionService.process_turn, SimulationService) for regression and
+performance benchmarking without provider latency or network access.
+
+Modes (settings.llm_cassette_mode, applied by get_llm_client):
+- record: RecordingLLMClient wraps the real provider client and appends every
+  request/response pair to the cassette file
+- replay: ReplayLLMClient serves recorded responses with a configurable
+  simulated latency; no network, no API keys
+
+Requests are keyed by client_type, model and a hash of the normalized
+prompt: whitespace is collapsed and UUIDs (node IDs, session IDs) are
+masked, so a re-run with fresh IDs hits the same entries. Identical keys
+recorded several times replay in recorded order, then cycle.
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import re
+import threading
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import structlog
+
+from src.core.config import settings
+from src.core.exceptions import LLMCassetteMissError
+from src.llm.client import LLMClient, LLMResponse, get_llm_session_id
+
+log = structlog.get_logger(__name__)
+
+_UUID_RE = re.compile(r"\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b", re.I)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _normalize(text: Optional[str]) -> str:
+    if not text:
+        return ""
+    return _WHITESPACE_RE.sub(" ", _UUID_RE.sub("<uuid>", text)).strip()
+
+
+def cassette_key(
+    client_type: str,
+    model: str,
+    prompt: str,
+    system: Optional[str] = None,
+    response_format: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Stable key for a request: client_type, model and normalized prompt hash."""
+    digest = hashlib.sha256(
+        json.dumps(
+            [_normalize(system), _normalize(prompt), response_format],
+            sort_keys=True,
+        ).encode()
+    ).hexdigest()[:24]
+    return f"{client_type}:{model}:{digest}"
+
+
+@dataclass
+class CassetteEntry:
+    """One recorded response (one JSONL line)."""
+
+    key: str
+    client_type: str
+    model: str
+    content: str
+    usage: Dict[str, int] = field(default_factory=dict)
+    latency_ms: float = 0.0
+    recorded_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+
+
+class CassetteStore:
+    """Append-only JSONL store of recorded LLM responses."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._entries: Dict[str, List[CassetteEntry]] = defaultdict(list)
+        self._cursors: Dict[str, int] = defaultdict(int)
+        self._write_lock = threading.Lock()
+        self._load()
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        with open(self.path) as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    entry = CassetteEntry(**json.loads(line))
+                except (json.JSONDecodeError, TypeError):
+                    continue  # partial line from an interrupted recording
+                self._entries[entry.key].append(entry)
+        log.info(
+            "llm_cassette_loaded",
+            path=str(self.path),
+            keys=len(self._entries),
+            entries=sum(len(e) for e in self._entries.values()),
+        )
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._entries.values())
+
+    def append(self, entry: CassetteEntry) -> None:
+        """Record an entry in memory and on disk."""
+        self._entries[entry.key].append(entry)
+        with self._write_lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a") as f:
+                f.write(json.dumps(asdict(entry), separators=(",", ":")) + "\n")
+
+    def next(self, key: str) -> Optional[CassetteEntry]:
+        """Next recorded entry for a key, cycling once all have been served."""
+        entries = self._entries.get(key)
+        if not entries:
+            return None
+        index = self._cursors[key] % len(entries)
+        self._cursors[key] += 1
+        return entries[index]
+
+
+class LatencyModel:
+    """Simulated replay latency, parsed from settings.llm_cassette_latency.
+
+    Specs: "recorded" (replay the recorded latency), "none", "fixed:<ms>",
+    "normal:<mean_ms>,<std_ms>", "lognormal:<median_ms>,<sigma>". Sampling
+    is seeded so replays are repeatable.
+    """
+
+    def __init__(self, spec: str = "recorded", seed: int = 0):
+        self.spec = spec
+        kind, _, args = spec.partition(":")
+        self.kind = kind.strip().lower()
+        self.params = [float(a) for a in args.split(",") if a.strip()]
+        expected = {
+            "recorded": 0,
+            "none": 0,
+            "fixed": 1,
+            "normal": 2,
+            "lognormal": 2,
+        }
+        if self.kind not in expected or len(self.params) != expected[self.kind]:
+            raise ValueError(f"Invalid LLM cassette latency spec: {spec!r}")
+        self._rng = random.Random(seed)
+
+    def sample_ms(self, recorded_ms: float) -> float:
+        if self.kind == "recorded":
+            return recorded_ms
+        if self.kind == "none":
+            return 0.0
+        if self.kind == "fixed":
+            return self.params[0]
+        if self.kind == "normal":
+            return max(0.0, self._rng.gauss(self.params[0], self.params[1]))
+        # lognormal: median * exp(N(0, sigma))
+        return self.params[0] * self._rng.lognormvariate(0.0, self.params[1])
+
+
+# Process-level stores: path -> store (shared by all wrapped clients)
+_stores: Dict[Path, CassetteStore] = {}
+
+
+def get_cassette_store(path: Optional[Path] = None) -> CassetteStore:
+    """Return the shared store for a cassette file, loading it on first use."""
+    path = Path(path or settings.llm_cassette_path)
+    store = _stores.get(path)
+    if store is None:
+        store = CassetteStore(path)
+        _stores[path] = store
+    return store
+
+
+def _record_token_usage(
+    session_id: Optional[str], model: str, usage: Dict[str, int], client_type: str
+) -> None:
+    """Mirror the provider clients' token accounting for replayed calls."""
+    effective_session_id = session_id or get_llm_session_id()
+    if not effective_session_id:
+        return
+    from src.services.token_usage_service import get_token_usage_service
+
+    get_token_usage_service().record_llm_call(
+        session_id=effective_session_id,
+        model=model,
+        input_tokens=usage.get("input_tokens", 0),
+        output_tokens=usage.get("output_tokens", 0),
+        client_type=client_type,
+    )
+
+
+class RecordingLLMClient(LLMClient):
+    """Wraps a provider client and records every response to the cassette."""
+
+    def __init__(
+        self,
+        inner: LLMClient,
+        client_type: str,
+        model: str,
+        store: Optional[CassetteStore] = None,
+    ):
+        self.inner = inner
+        self.client_type = client_type
+        self.model = model
+        self.store = store if store is not None else get_cassette_store()
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose provider attributes (temperature, max_tokens, ...) unchanged
+        return getattr(self.inner, name)
+
+    async def complete(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        effort: Optional[str] = None,
+        timeout: Optional[float] = None,
+        session_id: Optional[str] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> LLMResponse:
+        response = await self.inner.complete(
+            prompt=prompt,
+            system=system,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            effort=effort,
+            timeout=timeout,
+            session_id=session_id,
+            response_format=response_format,
+        )
+        self.store.append(
+            CassetteEntry(
+                key=cassette_key(self.client_type, self.model, prompt, system, response_format),
+                client_type=self.client_type,
+                model=self.model,
+                content=response.content,
+                usage=dict(response.usage),
+                latency_ms=round(response.latency_ms, 1),
+            )
+        )
+        return response
+
+
+class ReplayLLMClient(LLMClient):
+    """Serves recorded responses from the cassette without network access."""
+
+    def __init__(
+        self,
+        client_type: str,
+        model: str,
+        store: Optional[CassetteStore] = None,
+        latency: Optional[LatencyModel] = None,
+        temperature: float = 0.3,
+        max_tokens: int = 1024,
+    ):
+        self.client_type = client_type
+        self.model = model
+        self.temperature = temperature
+        self.max_tokens = max_tokens
+        self.store = store if store is not None else get_cassette_store()
+        self.latency = latency or LatencyModel(settings.llm_cassette_latency)
+
+    async def complete(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        effort: Optional[str] = None,
+        timeout: Optional[float] = None,
+        session_id: Optional[str] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> LLMResponse:
+        """Return the next recorded response for this request.
+
+        Raises:
+            LLMCassetteMissError: If the request was never recorded
+        """
+        key = cassette_key(self.client_type, self.model, prompt, system, response_format)
+        entry = self.store.next(key)
+        if entry is None:
+            log.error(
+                "llm_cassette_miss",
+                client_type=self.client_type,
+                model=self.model,
+                key=key,
+                prompt_length=len(prompt),
+            )
+            raise LLMCassetteMissError(
+                f"No recorded {self.client_type} response for key {key} " f"in {self.store.path}"
+            )
+
+        latency_ms = self.latency.sample_ms(entry.latency_ms)
+        if latency_ms > 0:
+            await asyncio.sleep(latency_ms / 1000)
+
+        log.debug(
+            "llm_cassette_replay",
+            client_type=self.client_type,
+            model=self.model,
+            key=key,
+            latency_ms=round(latency_ms, 1),
+        )
+        _record_token_usage(session_id, self.model, entry.usage, self.client_type)
+
+        return LLMResponse(
+            content=entry.content,
+            model=entry.model,
+            usage=dict(entry.usage),
+            latency_ms=latency_ms,
+        )
@@ -5,6 +5,7 @@ Provides async interface for LLM calls with:
 - Structured logging of requests/responses
 - Timeout handling
 - Usage tracking (tokens)
+- Shared per-provider/model rate limiting (requests/min, tokens/min)
 - Three-client architecture (extraction, scoring, generation)
 
 Supported providers:
@@ -15,16 +16,22 @@ Supported providers:
 """
 
 from abc import ABC, abstractmethod
-from contextvars import ContextVar
+from contextlib import aclosing
+from contextvars import ContextVar, Token
 from dataclasses import dataclass, field
-from typing import Optional, Dict, Any, Literal
+from datetime import datetime
+from typing import Optional, Dict, Any, AsyncIterator, Callable, List, Literal, Tuple
+import asyncio
 import json
+import re
 import time
 
 import httpx
 import structlog
 
 from src.core.config import settings
+from src.core.metrics import LLMCallMetrics
+from src.core.tracing import span
 
 log = structlog.get_logger(__name__)
 
@@ -47,6 +54,41 @@ def get_llm_session_id() -> Optional[str]:
     return _session_id_ctx.get()
 
 
+# Context variable carrying the current turn/stage deadline (time.monotonic())
+_deadline_ctx: ContextVar[Optional[float]] = ContextVar("_deadline_ctx", default=None)
+
+
+def set_llm_deadline(deadline: Optional[float]) -> Token:
+    """Bound LLM calls in this context by a time.monotonic() deadline.
+
+    Returns:
+        Token for restoring the previous deadline via reset_llm_deadline()
+    """
+    return _deadline_ctx.set(deadline)
+
+
+def reset_llm_deadline(token: Token) -> None:
+    """Restore the deadline that was current before set_llm_deadline()."""
+    _deadline_ctx.reset(token)
+
+
+def _deadline_timeout(timeout: float) -> float:
+    """Clamp a request timeout to the time left before the context deadline.
+
+    Raises:
+        LLMTimeoutError: If the deadline has already passed
+    """
+    deadline = _deadline_ctx.get()
+    if deadline is None:
+        return timeout
+    remaining = deadline - time.monotonic()
+    if remaining <= 0:
+        from src.core.exceptions import LLMTimeoutError
+
+        raise LLMTimeoutError("Turn deadline passed before the LLM call was sent")
+    return min(timeout, remaining)
+
+
 # =============================================================================
 # LLM configuration is loaded from config/interview_config.yaml (llm: section)
 # =============================================================================
@@ -66,6 +108,7 @@ class LLMResponse:
     usage: Dict[str, int] = field(default_factory=dict)
     latency_ms: float = 0.0
     raw_response: Optional[Dict[str, Any]] = None
+    queue_delay_ms: float = 0.0  # Time spent waiting on the rate limiter
 
 
 class LLMClient(ABC):
@@ -104,6 +147,547 @@ class LLMClient(ABC):
         """
         pass
 
+    async def stream(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        effort: Optional[str] = None,
+        timeout: Optional[float] = None,
+        session_id: Optional[str] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Generate a completion as a stream of text chunks.
+
+        Takes the same arguments as complete(). The default implementation
+        yields the full completion as a single chunk, so every client can be
+        streamed from; providers with native streaming override it to yield
+        deltas as they arrive.
+
+        Yields:
+            Text chunks whose concatenation is the completion content (for
+            response_format calls, the JSON text)
+        """
+        response = await self.complete(
+            prompt=prompt,
+            system=system,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            effort=effort,
+            timeout=timeout,
+            session_id=session_id,
+            response_format=response_format,
+        )
+        yield response.content
+
+
+# =============================================================================
+# Rate Limiting
+# =============================================================================
+
+
+class _TokenBucket:
+    """Continuously refilling bucket; capacity is one minute's allowance."""
+
+    def __init__(self, per_minute: Optional[float] = None):
+        self.per_minute = per_minute
+        self.available = per_minute or 0.0
+        self.updated = time.monotonic()
+
+    def configure(self, per_minute: float) -> None:
+        if self.per_minute is None:
+            self.available = per_minute
+        self.per_minute = per_minute
+        self.available = min(self.available, per_minute)
+
+    def refill(self, now: float) -> None:
+        if self.per_minute is not None:
+            elapsed = now - self.updated
+            self.available = min(
+                self.per_minute, self.available + elapsed * self.per_minute / 60
+            )
+        self.updated = now
+
+    def wait_time(self, amount: float) -> float:
+        """Seconds until `amount` is available (0 if unlimited or available)."""
+        if self.per_minute is None:
+            return 0.0
+        # A request larger than the bucket only needs a full bucket
+        amount = min(amount, self.per_minute)
+        if self.available >= amount:
+            return 0.0
+        return (amount - self.available) * 60 / self.per_minute
+
+
+def _parse_reset_seconds(value: Optional[str]) -> Optional[float]:
+    """Parse a rate-limit reset header into seconds from now.
+
+    Accepts RFC 3339 timestamps (Anthropic), Go-style durations such as
+    "1m30s" or "250ms" (OpenAI-compatible), and plain seconds.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    parts = re.findall(r"(\d+(?:\.\d+)?)(ms|s|m|h)", value)
+    if parts and "".join(n + u for n, u in parts) == value:
+        scale = {"ms": 0.001, "s": 1, "m": 60, "h": 3600}
+        return sum(float(n) * scale[u] for n, u in parts)
+
+    try:
+        reset_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return max(0.0, reset_at.timestamp() - time.time())
+
+
+# Smoothing for the recent and baseline provider latency averages
+_LATENCY_FAST_ALPHA = 0.2
+_LATENCY_BASELINE_ALPHA = 0.02
+# Calls needed before the baseline is trusted for latency_ratio()
+_LATENCY_MIN_SAMPLES = 10
+
+
+class ProviderRateLimiter:
+    """Requests-per-minute and tokens-per-minute limiter for one provider/model.
+
+    Shared by every client instance targeting the same provider/model (see
+    get_rate_limiter), so concurrent sessions and simulations draw from one
+    budget. Waiters are served in FIFO order. Limits come from
+    interview_config.llm.rate_limits when set and are otherwise learned from
+    rate-limit response headers; a 429 retry-after pauses the limiter.
+    """
+
+    REQUEST_HEADERS = (
+        # (limit, remaining, reset) per provider convention
+        (
+            "anthropic-ratelimit-requests-limit",
+            "anthropic-ratelimit-requests-remaining",
+            "anthropic-ratelimit-requests-reset",
+        ),
+        (
+            "x-ratelimit-limit-requests",
+            "x-ratelimit-remaining-requests",
+            "x-ratelimit-reset-requests",
+        ),
+    )
+    TOKEN_HEADERS = (
+        (
+            "anthropic-ratelimit-tokens-limit",
+            "anthropic-ratelimit-tokens-remaining",
+            "anthropic-ratelimit-tokens-reset",
+        ),
+        (
+            "x-ratelimit-limit-tokens",
+            "x-ratelimit-remaining-tokens",
+            "x-ratelimit-reset-tokens",
+        ),
+    )
+
+    def __init__(
+        self,
+        key: str,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+    ):
+        self.key = key
+        self.requests = _TokenBucket(requests_per_minute)
+        self.tokens = _TokenBucket(tokens_per_minute)
+        self.paused_until = 0.0
+        self.total_queue_delay_s = 0.0
+        self.acquired = 0
+        # Recent and long-run call latency, for spotting provider slowdowns
+        self.latency_ms: Optional[float] = None
+        self.baseline_latency_ms: Optional[float] = None
+        self.latency_samples = 0
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def acquire(self, estimated_tokens: int = 0) -> float:
+        """Wait for capacity for one request, returning the queueing delay (s)."""
+        # Created lazily so the limiter can be built outside an event loop
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        start = time.monotonic()
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.requests.refill(now)
+                self.tokens.refill(now)
+                wait = max(
+                    self.paused_until - now,
+                    self.requests.wait_time(1),
+                    self.tokens.wait_time(estimated_tokens),
+                )
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+
+            if self.requests.per_minute is not None:
+                self.requests.available -= 1
+            if self.tokens.per_minute is not None:
+                self.tokens.available -= min(estimated_tokens, self.tokens.per_minute)
+
+        delay = time.monotonic() - start
+        self.acquired += 1
+        self.total_queue_delay_s += delay
+        if delay > 0.01:
+            log.info(
+                "llm_rate_limit_queued",
+                limiter=self.key,
+                queue_delay_ms=round(delay * 1000, 1),
+            )
+        return delay
+
+    def record_usage(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """Correct the token bucket once the real usage is known."""
+        if self.tokens.per_minute is not None:
+            self.tokens.available = min(
+                self.tokens.per_minute,
+                self.tokens.available + estimated_tokens - actual_tokens,
+            )
+
+    def record_latency(self, latency_ms: float) -> None:
+        """Fold a successful call's latency into the recent and baseline averages."""
+        self.latency_samples += 1
+        if self.latency_ms is None or self.baseline_latency_ms is None:
+            self.latency_ms = self.baseline_latency_ms = latency_ms
+            return
+        self.latency_ms += _LATENCY_FAST_ALPHA * (latency_ms - self.latency_ms)
+        self.baseline_latency_ms += _LATENCY_BASELINE_ALPHA * (
+            latency_ms - self.baseline_latency_ms
+        )
+
+    def latency_ratio(self) -> Optional[float]:
+        """Recent over baseline latency, or None until enough calls were seen."""
+        if (
+            self.latency_samples < _LATENCY_MIN_SAMPLES
+            or not self.latency_ms
+            or not self.baseline_latency_ms
+        ):
+            return None
+        return self.latency_ms / self.baseline_latency_ms
+
+    def pause(self, seconds: float) -> None:
+        """Hold all requests for `seconds` (e.g. from a 429 retry-after)."""
+        self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+
+    def update_from_headers(self, headers: Any) -> None:
+        """Adapt limits and remaining budget from rate-limit response headers."""
+        now = time.monotonic()
+        for bucket, header_sets in (
+            (self.requests, self.REQUEST_HEADERS),
+            (self.tokens, self.TOKEN_HEADERS),
+        ):
+            for limit_h, remaining_h, reset_h in header_sets:
+                limit = headers.get(limit_h)
+                remaining = headers.get(remaining_h)
+                if limit is None and remaining is None:
+                    continue
+                bucket.refill(now)
+                if limit is not None and limit.isdigit() and int(limit) > 0:
+                    bucket.configure(float(limit))
+                if remaining is not None and remaining.isdigit():
+                    bucket.available = min(bucket.available, float(remaining))
+                    if int(remaining) == 0:
+                        reset = _parse_reset_seconds(headers.get(reset_h))
+                        if reset:
+                            self.pause(reset)
+                break
+
+    def stats(self) -> Dict[str, Any]:
+        """Queueing statistics for observability."""
+        return {
+            "acquired": self.acquired,
+            "total_queue_delay_ms": round(self.total_queue_delay_s * 1000, 1),
+            "requests_per_minute": self.requests.per_minute,
+            "tokens_per_minute": self.tokens.per_minute,
+            "latency_ms": (
+                round(self.latency_ms, 1) if self.latency_ms is not None else None
+            ),
+            "baseline_latency_ms": (
+                round(self.baseline_latency_ms, 1)
+                if self.baseline_latency_ms is not None
+                else None
+            ),
+        }
+
+
+# Process-level limiters: "provider/model" -> limiter
+_rate_limiters: Dict[str, ProviderRateLimiter] = {}
+
+
+def get_rate_limiter(provider: str, model: str) -> ProviderRateLimiter:
+    """Return the shared limiter for a provider/model, creating it on first use.
+
+    Configured limits are looked up as "provider/model" first, then "provider".
+    """
+    key = f"{provider}/{model}"
+    limiter = _rate_limiters.get(key)
+    if limiter is None:
+        from src.core.config import interview_config
+
+        rate_limits = interview_config.llm.rate_limits
+        config = rate_limits.get(key) or rate_limits.get(provider)
+        limiter = ProviderRateLimiter(
+            key,
+            requests_per_minute=config.requests_per_minute if config else None,
+            tokens_per_minute=config.tokens_per_minute if config else None,
+        )
+        _rate_limiters[key] = limiter
+    return limiter
+
+
+def provider_latency_ratio() -> Optional[float]:
+    """Worst recent/baseline latency ratio across providers, None if unknown."""
+    ratios = [
+        ratio
+        for ratio in (limiter.latency_ratio() for limiter in _rate_limiters.values())
+        if ratio is not None
+    ]
+    return max(ratios, default=None)
+
+
+def _estimate_tokens(prompt: str, system: Optional[str], max_tokens: int) -> int:
+    """Rough request token cost: ~4 chars per input token plus the output cap."""
+    return (len(prompt) + len(system or "")) // 4 + max_tokens
+
+
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    """Seconds from a retry-after header, if present."""
+    return _parse_reset_seconds(response.headers.get("retry-after"))
+
+
+async def _iter_sse_data(response: httpx.Response) -> AsyncIterator[str]:
+    """Yield the data payload of each Server-Sent Event in a streamed response."""
+    data_lines: List[str] = []
+    async for line in response.aiter_lines():
+        if line.startswith("data:"):
+            data_lines.append(line[len("data:") :].lstrip())
+        elif not line and data_lines:
+            yield "\n".join(data_lines)
+            data_lines = []
+    if data_lines:
+        yield "\n".join(data_lines)
+
+
+# Parses one SSE data payload: updates usage in place, returns the text delta
+StreamEventParser = Callable[[str, Dict[str, int]], Optional[str]]
+
+
+async def _stream_with_retries(
+    client: Any,
+    provider: str,
+    url: str,
+    headers: Dict[str, str],
+    payload: Dict[str, Any],
+    parse_event: StreamEventParser,
+    prompt_tokens: int,
+    max_tokens: int,
+    timeout: float,
+    session_id: Optional[str],
+) -> AsyncIterator[str]:
+    """
+    Stream a provider call with the retry semantics of complete().
+
+    Timeouts and 429s are retried (once, sharing the provider rate limiter)
+    only until the first delta has been yielded; after that a failure is
+    raised, since emitted text cannot be taken back. Usage is recorded with
+    the rate limiter and TokenUsageService when the stream ends, including
+    when the consumer stops early (mid-stream cancellation closes the HTTP
+    response); token counts the provider never reported (usage usually
+    arrives last) fall back to the prompt_tokens estimate and the streamed
+    text length.
+
+    Raises:
+        LLMTimeoutError: On timeout after retries, or any mid-stream timeout
+        LLMRateLimitError: After all retries exhausted on rate limit (429)
+        LLMInvalidResponseError: If the provider reports an error mid-stream
+        httpx.HTTPStatusError: On other API errors (no retry)
+    """
+    from src.core.exceptions import LLMTimeoutError, LLMRateLimitError
+
+    max_retries = 1  # 2 total attempts
+    base_delay = 1.0  # seconds
+    estimated_tokens = prompt_tokens + max_tokens
+    queue_delay_ms = 0.0
+
+    for attempt in range(max_retries + 1):
+        queue_delay_ms += await client.rate_limiter.acquire(estimated_tokens) * 1000
+        start = time.perf_counter()
+        usage = {"input_tokens": 0, "output_tokens": 0}
+        streamed_chars = 0
+        first_delta_ms: Optional[float] = None
+        opened = False
+        outcome = "cancelled"
+
+        log.debug(
+            "llm_stream_start",
+            provider=provider,
+            client_type=client.client_type,
+            model=client.model,
+            attempt=attempt + 1,
+            max_retries=max_retries,
+        )
+
+        try:
+            # Never wait past the turn/stage deadline (see TurnPipeline)
+            attempt_timeout = _deadline_timeout(timeout)
+            # Not made current: the generator yields to the consumer mid-span
+            with span(
+                "llm.attempt",
+                activate=False,
+                provider=provider,
+                client_type=client.client_type,
+                model=client.model,
+                attempt=attempt + 1,
+                streaming=True,
+            ):
+                async with httpx.AsyncClient(timeout=attempt_timeout) as http:
+                    async with http.stream(
+                        "POST", url, headers=headers, json=payload
+                    ) as response:
+                        client.rate_limiter.update_from_headers(response.headers)
+                        if response.is_error:
+                            await response.aread()
+                        response.raise_for_status()
+                        opened = True
+
+                        async for data in _iter_sse_data(response):
+                            delta = parse_event(data, usage)
+                            if not delta:
+                                continue
+                            if first_delta_ms is None:
+                                first_delta_ms = (time.perf_counter() - start) * 1000
+                            streamed_chars += len(delta)
+                            yield delta
+            outcome = "complete"
+            return
+
+        except httpx.TimeoutException as e:
+            outcome = "failed"
+            log.warning(
+                "llm_timeout",
+                provider=provider,
+                attempt=attempt + 1,
+                max_retries=max_retries,
+                timeout_seconds=client.timeout,
+                streamed=first_delta_ms is not None,
+            )
+            if first_delta_ms is not None or attempt >= max_retries:
+                raise LLMTimeoutError(
+                    f"LLM stream timed out after {attempt + 1} attempts "
+                    f"(timeout={client.timeout}s)"
+                ) from e
+            delay = base_delay * (2**attempt)
+            log.info(
+                "llm_retry_after_timeout", delay_seconds=delay, next_attempt=attempt + 2
+            )
+            await asyncio.sleep(delay)
+
+        except httpx.HTTPStatusError as e:
+            outcome = "failed"
+            status_code = e.response.status_code
+            if status_code != 429:
+                # Don't retry other 4xx/5xx errors
+                log.error("llm_http_error", provider=provider, status_code=status_code)
+                raise
+            log.warning(
+                "llm_rate_limit",
+                provider=provider,
+                attempt=attempt + 1,
+                max_retries=max_retries,
+            )
+            # Pause the shared limiter so every caller of this provider/model
+            # backs off; the retry waits in acquire()
+            retry_after = _retry_after_seconds(e.response)
+            delay = (
+                retry_after if retry_after is not None else base_delay * (2**attempt)
+            )
+            client.rate_limiter.pause(delay)
+            if attempt >= max_retries:
+                raise LLMRateLimitError(
+                    f"Rate limit exceeded after {max_retries + 1} attempts"
+                ) from e
+            log.info(
+                "llm_retry_after_rate_limit",
+                delay_seconds=delay,
+                retry_after_header=retry_after is not None,
+                next_attempt=attempt + 2,
+            )
+
+        except Exception:
+            outcome = "failed"
+            raise
+
+        finally:
+            if opened:
+                if not usage["input_tokens"]:
+                    usage["input_tokens"] = prompt_tokens
+                if not usage["output_tokens"] and streamed_chars:
+                    usage["output_tokens"] = max(1, streamed_chars // 4)
+                _record_stream_usage(
+                    client,
+                    provider,
+                    usage,
+                    estimated_tokens,
+                    session_id,
+                    outcome=outcome,
+                    latency_ms=(time.perf_counter() - start) * 1000,
+                    first_delta_ms=first_delta_ms,
+                    queue_delay_ms=queue_delay_ms,
+                )
+
+
+def _record_stream_usage(
+    client: Any,
+    provider: str,
+    usage: Dict[str, int],
+    estimated_tokens: int,
+    session_id: Optional[str],
+    outcome: str,
+    latency_ms: float,
+    first_delta_ms: Optional[float],
+    queue_delay_ms: float,
+) -> None:
+    """Record a finished (or abandoned) stream's token usage."""
+    client.rate_limiter.record_usage(
+        estimated_tokens, usage["input_tokens"] + usage["output_tokens"]
+    )
+    if outcome == "complete":
+        client.rate_limiter.record_latency(latency_ms)
+        client.metrics.observe(
+            latency_ms, usage["input_tokens"], usage["output_tokens"]
+        )
+
+    log.info(
+        "llm_stream_complete" if outcome == "complete" else f"llm_stream_{outcome}",
+        provider=provider,
+        client_type=client.client_type,
+        model=client.model,
+        latency_ms=round(latency_ms, 2),
+        first_delta_ms=round(first_delta_ms, 2) if first_delta_ms else None,
+        queue_delay_ms=round(queue_delay_ms, 2),
+        input_tokens=usage["input_tokens"],
+        output_tokens=usage["output_tokens"],
+    )
+
+    if session_id:
+        from src.services.token_usage_service import get_token_usage_service
+
+        get_token_usage_service().record_llm_call(
+            session_id=session_id,
+            model=client.model,
+            input_tokens=usage["input_tokens"],
+            output_tokens=usage["output_tokens"],
+            client_type=client.client_type,
+        )
+
 
 # =============================================================================
 # Anthropic Client
@@ -125,6 +709,7 @@ class AnthropicClient(LLMClient):
         client_type: LLMClientType,
         api_key: Optional[str] = None,
         effort: Optional[str] = None,
+        base_url: Optional[str] = None,
     ):
         """
         Initialize Anthropic client.
@@ -137,6 +722,7 @@ class AnthropicClient(LLMClient):
             client_type: Client type for logging
             api_key: API key (defaults to settings.anthropic_api_key)
             effort: Default effort level ("low", "medium", "high")
+            base_url: API base URL override (defaults to api.anthropic.com)
 
         Raises:
             ValueError: If API key is not configured
@@ -148,7 +734,9 @@ class AnthropicClient(LLMClient):
         self.timeout = timeout
         self.client_type = client_type
         self.effort = effort
-        self.base_url = "https://api.anthropic.com/v1"
+        self.base_url = base_url or "https://api.anthropic.com/v1"
+        self.rate_limiter = get_rate_limiter("anthropic", model)
+        self.metrics = LLMCallMetrics("anthropic", client_type)
 
         if not self.api_key:
             raise ValueError("ANTHROPIC_API_KEY not configured. Set it in .env.")
@@ -191,7 +779,6 @@ class AnthropicClient(LLMClient):
             LLMRateLimitError: After all retries exhausted on rate limit (429)
             httpx.HTTPStatusError: On other API errors (no retry)
         """
-        import asyncio
         from src.core.exceptions import LLMTimeoutError, LLMRateLimitError
 
         max_retries = 1  # 2 total attempts
@@ -210,59 +797,16 @@ class AnthropicClient(LLMClient):
         # Get session_id from parameter or context
         effective_session_id = session_id or get_llm_session_id()
 
-        headers = {
-            "x-api-key": self.api_key,
-            "content-type": "application/json",
-            "anthropic-version": "2023-06-01",
-        }
-
-        payload: Dict[str, Any] = {
-            "model": self.model,
-            "max_tokens": max_tokens,
-            "messages": [{"role": "user", "content": prompt}],
-            "temperature": temperature,
-        }
-
-        if system:
-            payload["system"] = system
-
-        if response_format is not None:
-            # Determine JSON schema for tool_use
-            if "schema" in response_format:
-                # Caller provided explicit schema
-                schema = response_format["schema"]
-            else:
-                # Generic JSON mode (e.g. {"type": "json_object"}) —
-                # use permissive schema since Anthropic requires tool_use
-                schema = {
-                    "type": "object",
-                    "additionalProperties": True,
-                }
-            payload["tools"] = [
-                {
-                    "name": "structured_output",
-                    "description": "Return structured data as JSON",
-                    "input_schema": schema,
-                }
-            ]
-            payload["tool_choice"] = {"type": "any"}
+        headers, payload = self._build_request(
+            prompt, system, temperature, max_tokens, effort, response_format
+        )
 
-        # Add effort parameter for Sonnet 4.6 (controls output token budget)
-        # See: https://platform.claude.com/docs/en/about-claude/models/migration-guide
-        if effort is not None:
-            # Validate effort values
-            valid_efforts = {"low", "medium", "high"}
-            if effort not in valid_efforts:
-                log.warning(
-                    "invalid_effort_value",
-                    effort=effort,
-                    valid_efforts=valid_efforts,
-                    defaulting_to="medium",
-                )
-                effort = "medium"
-            payload["output_config"] = {"effort": effort}
+        estimated_tokens = _estimate_tokens(prompt, system, max_tokens)
+        queue_delay_ms = 0.0
 
         for attempt in range(max_retries + 1):
+            # Wait for the shared provider/model budget (not counted in latency)
+            queue_delay_ms += await self.rate_limiter.acquire(estimated_tokens) * 1000
             start = time.perf_counter()
 
             log.debug(
@@ -280,14 +824,24 @@ class AnthropicClient(LLMClient):
             )
 
             try:
-                async with httpx.AsyncClient(timeout=timeout) as client:
-                    response = await client.post(
-                        f"{self.base_url}/messages",
-                        headers=headers,
-                        json=payload,
-                    )
-                    response.raise_for_status()
-                    data = response.json()
+                # Never wait past the turn/stage deadline (see TurnPipeline)
+                attempt_timeout = _deadline_timeout(timeout)
+                with span(
+                    "llm.attempt",
+                    provider="anthropic",
+                    client_type=self.client_type,
+                    model=self.model,
+                    attempt=attempt + 1,
+                ):
+                    async with httpx.AsyncClient(timeout=attempt_timeout) as client:
+                        response = await client.post(
+                            f"{self.base_url}/messages",
+                            headers=headers,
+                            json=payload,
+                        )
+                        self.rate_limiter.update_from_headers(response.headers)
+                        response.raise_for_status()
+                        data = response.json()
 
                 latency_ms = (time.perf_counter() - start) * 1000
 
@@ -305,12 +859,21 @@ class AnthropicClient(LLMClient):
                     "output_tokens": data.get("usage", {}).get("output_tokens", 0),
                 }
 
+                self.rate_limiter.record_usage(
+                    estimated_tokens, usage["input_tokens"] + usage["output_tokens"]
+                )
+                self.rate_limiter.record_latency(latency_ms)
+                self.metrics.observe(
+                    latency_ms, usage["input_tokens"], usage["output_tokens"]
+                )
+
                 log.info(
                     "llm_call_complete",
                     provider="anthropic",
                     client_type=self.client_type,
                     model=self.model,
                     latency_ms=round(latency_ms, 2),
+                    queue_delay_ms=round(queue_delay_ms, 2),
                     input_tokens=usage["input_tokens"],
                     output_tokens=usage["output_tokens"],
                     attempt=attempt + 1,
@@ -337,6 +900,7 @@ class AnthropicClient(LLMClient):
                     usage=usage,
                     latency_ms=latency_ms,
                     raw_response=data,
+                    queue_delay_ms=queue_delay_ms,
                 )
 
             except httpx.TimeoutException as e:
@@ -370,14 +934,22 @@ class AnthropicClient(LLMClient):
                         attempt=attempt + 1,
                         max_retries=max_retries,
                     )
+                    # Pause the shared limiter so every caller of this
+                    # provider/model backs off; the retry waits in acquire()
+                    retry_after = _retry_after_seconds(e.response)
+                    delay = (
+                        retry_after
+                        if retry_after is not None
+                        else base_delay * (2**attempt)
+                    )
+                    self.rate_limiter.pause(delay)
                     if attempt < max_retries:
-                        delay = base_delay * (2**attempt)
                         log.info(
                             "llm_retry_after_rate_limit",
                             delay_seconds=delay,
+                            retry_after_header=retry_after is not None,
                             next_attempt=attempt + 2,
                         )
-                        await asyncio.sleep(delay)
                     else:
                         raise LLMRateLimitError(
                             f"Rate limit exceeded after {max_retries + 1} attempts"
@@ -394,6 +966,145 @@ class AnthropicClient(LLMClient):
         # Unreachable: loop either returns LLMResponse or raises an exception
         assert False, "unreachable"
 
+    def _build_request(
+        self,
+        prompt: str,
+        system: Optional[str],
+        temperature: float,
+        max_tokens: int,
+        effort: Optional[str],
+        response_format: Optional[Dict[str, Any]],
+    ) -> Tuple[Dict[str, str], Dict[str, Any]]:
+        """Build Messages API headers and payload (shared by complete/stream)."""
+        headers = {
+            "x-api-key": self.api_key,
+            "content-type": "application/json",
+            "anthropic-version": "2023-06-01",
+        }
+
+        payload: Dict[str, Any] = {
+            "model": self.model,
+            "max_tokens": max_tokens,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": temperature,
+        }
+
+        if system:
+            payload["system"] = system
+
+        if response_format is not None:
+            # Determine JSON schema for tool_use
+            if "schema" in response_format:
+                # Caller provided explicit schema
+                schema = response_format["schema"]
+            else:
+                # Generic JSON mode (e.g. {"type": "json_object"}) —
+                # use permissive schema since Anthropic requires tool_use
+                schema = {
+                    "type": "object",
+                    "additionalProperties": True,
+                }
+            payload["tools"] = [
+                {
+                    "name": "structured_output",
+                    "description": "Return structured data as JSON",
+                    "input_schema": schema,
+                }
+            ]
+            payload["tool_choice"] = {"type": "any"}
+
+        # Add effort parameter for Sonnet 4.6 (controls output token budget)
+        # See: https://platform.claude.com/docs/en/about-claude/models/migration-guide
+        if effort is not None:
+            # Validate effort values
+            valid_efforts = {"low", "medium", "high"}
+            if effort not in valid_efforts:
+                log.warning(
+                    "invalid_effort_value",
+                    effort=effort,
+                    valid_efforts=valid_efforts,
+                    defaulting_to="medium",
+                )
+                effort = "medium"
+            payload["output_config"] = {"effort": effort}
+
+        return headers, payload
+
+    async def stream(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        effort: Optional[str] = None,
+        timeout: Optional[float] = None,
+        session_id: Optional[str] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a Messages API call, yielding text or tool-input JSON deltas.
+
+        Deltas of the first content block are yielded (the block complete()
+        returns); with response_format they are the tool input's partial JSON.
+        Retries, rate limiting and usage recording follow complete(); see
+        _stream_with_retries.
+        """
+        if max_tokens is None:
+            max_tokens = self.max_tokens
+        if temperature is None:
+            temperature = self.temperature
+        if effort is None:
+            effort = getattr(self, "effort", None)
+        if timeout is None:
+            timeout = self.timeout
+
+        headers, payload = self._build_request(
+            prompt, system, temperature, max_tokens, effort, response_format
+        )
+        payload["stream"] = True
+
+        deltas = _stream_with_retries(
+            self,
+            "anthropic",
+            f"{self.base_url}/messages",
+            headers,
+            payload,
+            self._parse_stream_event,
+            _estimate_tokens(prompt, system, 0),
+            max_tokens,
+            timeout,
+            session_id or get_llm_session_id(),
+        )
+        # aclosing: stopping this stream early must close the HTTP response now
+        async with aclosing(deltas):
+            async for delta in deltas:
+                yield delta
+
+    @staticmethod
+    def _parse_stream_event(data: str, usage: Dict[str, int]) -> Optional[str]:
+        """Parse one Messages API stream event; return its first-block delta."""
+        from src.core.exceptions import LLMInvalidResponseError
+
+        event = json.loads(data)
+        event_type = event.get("type")
+        if event_type == "message_start":
+            message_usage = event.get("message", {}).get("usage", {})
+            usage["input_tokens"] = message_usage.get("input_tokens", 0)
+            usage["output_tokens"] = message_usage.get("output_tokens", 0)
+        elif event_type == "message_delta":
+            usage["output_tokens"] = event.get("usage", {}).get(
+                "output_tokens", usage["output_tokens"]
+            )
+        elif event_type == "content_block_delta" and event.get("index", 0) == 0:
+            delta = event.get("delta", {})
+            if delta.get("type") == "text_delta":
+                return delta.get("text")
+            if delta.get("type") == "input_json_delta":
+                return delta.get("partial_json")
+        elif event_type == "error":
+            raise LLMInvalidResponseError(f"Stream error: {event.get('error')}")
+        return None
+
 
 # =============================================================================
 # OpenAI-Compatible Client Base
@@ -441,6 +1152,8 @@ class OpenAICompatibleClient(LLMClient):
         self.base_url = base_url
         self.provider_name = provider_name
         self.api_key = api_key
+        self.rate_limiter = get_rate_limiter(provider_name, model)
+        self.metrics = LLMCallMetrics(provider_name, client_type)
 
         log.info(
             "openai_compatible_client_initialized",
@@ -481,7 +1194,6 @@ class OpenAICompatibleClient(LLMClient):
             LLMRateLimitError: After all retries exhausted on rate limit (429)
             httpx.HTTPStatusError: On other API errors (no retry)
         """
-        import asyncio
         from src.core.exceptions import LLMTimeoutError, LLMRateLimitError
 
         max_retries = 1  # 2 total attempts
@@ -507,23 +1219,16 @@ class OpenAICompatibleClient(LLMClient):
                 reason="OpenAI-compatible APIs do not support effort parameter",
             )
 
-        # Build messages array
-        messages = []
-        if system:
-            messages.append({"role": "system", "content": system})
-        messages.append({"role": "user", "content": prompt})
-
-        payload: Dict[str, Any] = {
-            "model": self.model,
-            "messages": messages,
-            "temperature": temperature,
-            "max_tokens": max_tokens,
-        }
+        payload = self._build_payload(
+            prompt, system, temperature, max_tokens, response_format
+        )
 
-        if response_format is not None:
-            payload["response_format"] = response_format
+        estimated_tokens = _estimate_tokens(prompt, system, max_tokens)
+        queue_delay_ms = 0.0
 
         for attempt in range(max_retries + 1):
+            # Wait for the shared provider/model budget (not counted in latency)
+            queue_delay_ms += await self.rate_limiter.acquire(estimated_tokens) * 1000
             start = time.perf_counter()
 
             headers = {
@@ -545,14 +1250,24 @@ class OpenAICompatibleClient(LLMClient):
             )
 
             try:
-                async with httpx.AsyncClient(timeout=timeout) as client:
-                    response = await client.post(
-                        f"{self.base_url}/chat/completions",
-                        headers=headers,
-                        json=payload,
-                    )
-                    response.raise_for_status()
-                    data = response.json()
+                # Never wait past the turn/stage deadline (see TurnPipeline)
+                attempt_timeout = _deadline_timeout(timeout)
+                with span(
+                    "llm.attempt",
+                    provider=self.provider_name,
+                    client_type=self.client_type,
+                    model=self.model,
+                    attempt=attempt + 1,
+                ):
+                    async with httpx.AsyncClient(timeout=attempt_timeout) as client:
+                        response = await client.post(
+                            f"{self.base_url}/chat/completions",
+                            headers=headers,
+                            json=payload,
+                        )
+                        self.rate_limiter.update_from_headers(response.headers)
+                        response.raise_for_status()
+                        data = response.json()
 
                 latency_ms = (time.perf_counter() - start) * 1000
 
@@ -566,12 +1281,21 @@ class OpenAICompatibleClient(LLMClient):
                     "output_tokens": data.get("usage", {}).get("completion_tokens", 0),
                 }
 
+                self.rate_limiter.record_usage(
+                    estimated_tokens, usage["input_tokens"] + usage["output_tokens"]
+                )
+                self.rate_limiter.record_latency(latency_ms)
+                self.metrics.observe(
+                    latency_ms, usage["input_tokens"], usage["output_tokens"]
+                )
+
                 log.info(
                     "llm_call_complete",
                     provider=self.provider_name,
                     client_type=self.client_type,
                     model=self.model,
                     latency_ms=round(latency_ms, 2),
+                    queue_delay_ms=round(queue_delay_ms, 2),
                     input_tokens=usage["input_tokens"],
                     output_tokens=usage["output_tokens"],
                     attempt=attempt + 1,
@@ -598,6 +1322,7 @@ class OpenAICompatibleClient(LLMClient):
                     usage=usage,
                     latency_ms=latency_ms,
                     raw_response=data,
+                    queue_delay_ms=queue_delay_ms,
                 )
 
             except httpx.TimeoutException as e:
@@ -631,14 +1356,22 @@ class OpenAICompatibleClient(LLMClient):
                         attempt=attempt + 1,
                         max_retries=max_retries,
                     )
+                    # Pause the shared limiter so every caller of this
+                    # provider/model backs off; the retry waits in acquire()
+                    retry_after = _retry_after_seconds(e.response)
+                    delay = (
+                        retry_after
+                        if retry_after is not None
+                        else base_delay * (2**attempt)
+                    )
+                    self.rate_limiter.pause(delay)
                     if attempt < max_retries:
-                        delay = base_delay * (2**attempt)
                         log.info(
                             "llm_retry_after_rate_limit",
                             delay_seconds=delay,
+                            retry_after_header=retry_after is not None,
                             next_attempt=attempt + 2,
                         )
-                        await asyncio.sleep(delay)
                     else:
                         raise LLMRateLimitError(
                             f"Rate limit exceeded after {max_retries + 1} attempts"
@@ -655,6 +1388,104 @@ class OpenAICompatibleClient(LLMClient):
         # Unreachable: loop either returns LLMResponse or raises an exception
         assert False, "unreachable"
 
+    def _build_payload(
+        self,
+        prompt: str,
+        system: Optional[str],
+        temperature: float,
+        max_tokens: int,
+        response_format: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Build the chat completions payload (shared by complete/stream)."""
+        # Build messages array
+        messages = []
+        if system:
+            messages.append({"role": "system", "content": system})
+        messages.append({"role": "user", "content": prompt})
+
+        payload: Dict[str, Any] = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+
+        if response_format is not None:
+            payload["response_format"] = response_format
+
+        return payload
+
+    async def stream(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        effort: Optional[str] = None,  # Ignored for OpenAI-compatible APIs
+        timeout: Optional[float] = None,
+        session_id: Optional[str] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a chat completion, yielding content deltas.
+
+        Requests usage in the final chunk (stream_options.include_usage);
+        providers that report it per choice are handled too. Retries, rate
+        limiting and usage recording follow complete(); see
+        _stream_with_retries.
+        """
+        if max_tokens is None:
+            max_tokens = self.max_tokens
+        if temperature is None:
+            temperature = self.temperature
+        if timeout is None:
+            timeout = self.timeout
+
+        payload = self._build_payload(
+            prompt, system, temperature, max_tokens, response_format
+        )
+        payload["stream"] = True
+        payload["stream_options"] = {"include_usage": True}
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+
+        deltas = _stream_with_retries(
+            self,
+            self.provider_name,
+            f"{self.base_url}/chat/completions",
+            headers,
+            payload,
+            self._parse_stream_event,
+            _estimate_tokens(prompt, system, 0),
+            max_tokens,
+            timeout,
+            session_id or get_llm_session_id(),
+        )
+        # aclosing: stopping this stream early must close the HTTP response now
+        async with aclosing(deltas):
+            async for delta in deltas:
+                yield delta
+
+    @staticmethod
+    def _parse_stream_event(data: str, usage: Dict[str, int]) -> Optional[str]:
+        """Parse one chat completion chunk; return its content delta."""
+        if data == "[DONE]":
+            return None
+        chunk = json.loads(data)
+        choices = chunk.get("choices") or []
+        # Usage arrives in the final chunk (Kimi reports it on the choice)
+        chunk_usage = chunk.get("usage")
+        if not chunk_usage and choices:
+            chunk_usage = choices[0].get("usage")
+        if chunk_usage:
+            usage["input_tokens"] = chunk_usage.get("prompt_tokens", 0)
+            usage["output_tokens"] = chunk_usage.get("completion_tokens", 0)
+        if choices:
+            return choices[0].get("delta", {}).get("content")
+        return None
+
 
 # =============================================================================
 # Kimi Client
@@ -682,10 +1513,11 @@ class KimiClient(OpenAICompatibleClient):
         timeout: float,
         client_type: LLMClientType,
         api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
     ):
         """Initialize Kimi client."""
         api_key = api_key or settings.kimi_api_key
-        base_url = "https://api.moonshot.ai/v1"
+        base_url = base_url or "https://api.moonshot.ai/v1"
 
         if not api_key:
             raise ValueError("KIMI_API_KEY not configured. Set it in .env.")
@@ -727,10 +1559,11 @@ class DeepSeekClient(OpenAICompatibleClient):
         timeout: float,
         client_type: LLMClientType,
         api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
     ):
         """Initialize DeepSeek client."""
         api_key = api_key or settings.deepseek_api_key
-        base_url = "https://api.deepseek.com"
+        base_url = base_url or "https://api.deepseek.com"
 
         if not api_key:
             raise ValueError("DEEPSEEK_API_KEY not configured. Set it in .env.")
@@ -772,10 +1605,11 @@ class GrokClient(OpenAICompatibleClient):
         timeout: float,
         client_type: LLMClientType,
         api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
     ):
         """Initialize Grok client."""
         api_key = api_key or settings.xai_api_key
-        base_url = "https://api.x.ai/v1"
+        base_url = base_url or "https://api.x.ai/v1"
 
         if not api_key:
             raise ValueError("XAI_API_KEY not configured. Set it in .env.")
@@ -809,6 +1643,9 @@ def get_llm_client(client_type: LLMClientType) -> LLMClient:
     Returns:
         LLMClient instance configured for the specified client type
 
+    With settings.llm_cassette_mode set, the client records to or replays
+    from the LLM cassette (see src/llm/cassette.py); replay needs no API key.
+
     Raises:
         ValueError: If unknown provider configured or API key missing
     """
@@ -821,43 +1658,64 @@ def get_llm_client(client_type: LLMClientType) -> LLMClient:
     max_tokens = call_config.max_tokens
     timeout = call_config.timeout
     effort = call_config.effort
+    base_url = call_config.base_url
+
+    if settings.llm_cassette_mode == "replay":
+        from src.llm.cassette import ReplayLLMClient
+
+        return ReplayLLMClient(
+            client_type=client_type,
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
 
     # Create client based on provider
     if provider == "anthropic":
-        return AnthropicClient(
+        client = AnthropicClient(
             model=model,
             temperature=temperature,
             max_tokens=max_tokens,
             timeout=timeout,
             client_type=client_type,
             effort=effort,
+            base_url=base_url,
         )
     elif provider == "kimi":
-        return KimiClient(
+        client = KimiClient(
             model=model,
             temperature=temperature,
             max_tokens=max_tokens,
             timeout=timeout,
             client_type=client_type,
+            base_url=base_url,
         )
     elif provider == "deepseek":
-        return DeepSeekClient(
+        client = DeepSeekClient(
             model=model,
             temperature=temperature,
             max_tokens=max_tokens,
             timeout=timeout,
             client_type=client_type,
+            base_url=base_url,
         )
     elif provider == "grok":
-        return GrokClient(
+        client = GrokClient(
             model=model,
             temperature=temperature,
             max_tokens=max_tokens,
             timeout=timeout,
             client_type=client_type,
+            base_url=base_url,
         )
     else:
         raise ValueError(
             f"Unknown LLM provider '{provider}' for {client_type}. "
             f"Supported providers: anthropic, kimi, deepseek, grok"
         )
+
+    if settings.llm_cassette_mode == "record":
+        from src.llm.cassette import RecordingLLMClient
+
+        return RecordingLLMClient(client, client_type=client_type, model=model)
+    return client
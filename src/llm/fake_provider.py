@@ -0,0 +1,485 @@
+"""
+Local fake LLM provider for capacity and load testing.
+
+A small FastAPI app implementing the two wire formats the real clients
+speak, so the full HTTP path (client, rate limiter, retries, pipeline)
+is exercised without a provider:
+- POST /v1/messages          Anthropic Messages API (text or tool_use)
+- POST /v1/chat/completions  OpenAI-compatible chat completions
+
+Both honour "stream": true with the providers' SSE event shapes; the
+sampled latency becomes time-to-first-token and the content then arrives
+word by word, stream_chunk_ms apart.
+
+Responses are schema-valid for every pipeline call, recognised from the
+prompt: extraction (concepts/relationships), slot discovery (groupings),
+LLM signal scoring (score/rationale per rubric key), question generation
+and synthetic respondent answers. Content is derived deterministically
+from the prompt; latency, 5xx errors and 429s are injected per
+FakeProviderConfig.
+
+Point a call type at it in interview_config.yaml:
+
+    llm:
+      extraction:
+        provider: anthropic
+        model: claude-sonnet-4-6
+        base_url: http://127.0.0.1:8900/v1
+
+Run with: python scripts/run_fake_llm_server.py --port 8900
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import re
+import time
+from collections import Counter
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import structlog
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from src.llm.cassette import LatencyModel
+
+log = structlog.get_logger(__name__)
+
+
+@dataclass
+class FakeProviderConfig:
+    """Fault and latency injection for the fake provider.
+
+    Attributes:
+        latency: LatencyModel spec ("none", "fixed:<ms>", "normal:<mean>,<std>",
+            "lognormal:<median_ms>,<sigma>")
+        error_rate: Fraction of requests answered with HTTP 500
+        rate_limit_rate: Fraction of requests answered with HTTP 429
+        retry_after_s: retry-after header value sent with injected 429s
+        stream_chunk_ms: Delay between streamed chunks ("stream": true)
+        seed: Seed for latency and fault sampling
+    """
+
+    latency: str = "lognormal:600,0.4"
+    error_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    retry_after_s: float = 1.0
+    stream_chunk_ms: float = 20.0
+    seed: int = 0
+
+    def __post_init__(self):
+        for name in ("error_rate", "rate_limit_rate"):
+            if not 0.0 <= getattr(self, name) <= 1.0:
+                raise ValueError(f"{name} must be between 0 and 1")
+        if self.latency == "recorded":
+            raise ValueError("'recorded' latency needs a cassette; use fixed/normal")
+
+
+# =============================================================================
+# Response synthesis
+# =============================================================================
+
+_STOPWORDS = {
+    "about", "also", "and", "are", "because", "but", "can", "did", "does",
+    "for", "from", "get", "had", "has", "have", "how", "its", "just", "like",
+    "more", "not", "really", "that", "the", "them", "then", "there", "they",
+    "this", "very", "was", "what", "when", "why", "with", "you", "your",
+}  # fmt: skip
+
+_RESPONDENT_TEMPLATES = [
+    "I mostly care about {a} because it gives me {b}.",
+    "Honestly, {a} matters to me. It means {b} and less hassle day to day.",
+    "For me it's about {a}. That leads to {b}, which I value a lot.",
+    "I guess {a}? It helps with {b}.",
+    "Okay, I see.",
+]
+_RESPONDENT_VOCAB = [
+    "comfort", "reliability", "saving time", "peace of mind", "good value",
+    "feeling in control", "easy setup", "better focus", "less stress",
+    "sound quality", "long battery life", "healthy routine", "planning ahead",
+]  # fmt: skip
+_QUESTIONS = [
+    "Why does {topic} matter to you?",
+    "What does {topic} give you in your day to day?",
+    "Can you tell me more about {topic}?",
+    "How do you feel when {topic} doesn't work out?",
+]
+
+
+def _prompt_rng(system: str, prompt: str, seed: int) -> random.Random:
+    digest = hashlib.sha256(f"{seed}\n{system}\n{prompt}".encode()).digest()
+    return random.Random(int.from_bytes(digest[:8], "big"))
+
+
+def _content_phrases(text: str, limit: int) -> List[str]:
+    """Two-word labels built from the content words of a text."""
+    words = [
+        w.lower()
+        for w in re.findall(r"[A-Za-z][A-Za-z'-]+", text)
+        if len(w) > 2 and w.lower() not in _STOPWORDS
+    ]
+    phrases = [" ".join(words[i : i + 2]) for i in range(0, len(words), 2)]
+    return list(dict.fromkeys(phrases))[:limit]
+
+
+def _quoted_text(prompt: str) -> str:
+    """Respondent text from an extraction user prompt (last quoted block)."""
+    match = re.search(r'"([^"]*)"\s*$', prompt.strip(), re.S)
+    return match.group(1) if match else prompt
+
+
+def _extraction(system: str, prompt: str, rng: random.Random) -> Dict[str, Any]:
+    section = system.split("## Valid Node Types", 1)[-1].split("## Valid Edge", 1)[0]
+    node_types = re.findall(r"^\s+- (\w+):", section, re.M) or ["attribute"]
+    edge_match = re.search(r'"relationship_type": "one of: ([^"]+)"', system)
+    edge_types = edge_match.group(1).split(", ") if edge_match else []
+    edge_type = next((e for e in edge_types if e != "revises"), "leads_to")
+
+    text = _quoted_text(prompt)
+    labels = _content_phrases(text, limit=rng.randint(1, 3))
+    concepts = [
+        {
+            "text": label,
+            "node_type": node_types[min(i, len(node_types) - 1)],
+            "confidence": round(rng.uniform(0.7, 0.95), 2),
+            "source_quote": text[:200],
+            "linked_elements": [],
+        }
+        for i, label in enumerate(labels)
+    ]
+    relationships = [
+        {
+            "source_text": source["text"],
+            "target_text": target["text"],
+            "relationship_type": edge_type,
+            "confidence": round(rng.uniform(0.7, 0.9), 2),
+            "source_quote": text[:200],
+        }
+        for source, target in zip(concepts, concepts[1:])
+    ]
+    return {"concepts": concepts, "relationships": relationships}
+
+
+def _slot_groupings(prompt: str) -> Dict[str, Any]:
+    concepts_section = prompt.split("## Concepts by Type:", 1)[-1]
+    concepts_section = re.split(r"\n## (?:Existing|Task)", concepts_section)[0]
+
+    groupings: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    node_type = None
+    for line in concepts_section.splitlines():
+        header = re.match(r"### (\w+) \(", line)
+        if header:
+            node_type = header.group(1)
+            groupings.setdefault(node_type, {})
+            continue
+        node = re.match(r"- (\S+): (.+)", line)
+        if node and node_type:
+            node_id, label = node.groups()
+            words = re.findall(r"[a-z0-9]+", label.lower())[:2] or ["misc"]
+            slot_name = "_".join(words)
+            slot = groupings[node_type].setdefault(
+                slot_name,
+                {
+                    "slot_name": slot_name,
+                    "description": f"Concepts about {' '.join(words)}",
+                    "surface_node_ids": [],
+                },
+            )
+            slot["surface_node_ids"].append(node_id)
+
+    return {
+        "groupings": {
+            nt: {"proposed_slots": list(slots.values())} for nt, slots in groupings.items()
+        }
+    }
+
+
+def _signal_scores(prompt: str, rng: random.Random) -> Dict[str, Any]:
+    keys = re.findall(r'"(\w+)": \{"score": <integer 1-5>', prompt)
+    return {
+        key: {"score": rng.randint(1, 5), "rationale": "Synthetic fake-provider score."}
+        for key in dict.fromkeys(keys)
+    }
+
+
+def _question(prompt: str, rng: random.Random) -> str:
+    topic = (_content_phrases(prompt[-400:], limit=3) or ["that"])[-1]
+    return rng.choice(_QUESTIONS).format(topic=topic)
+
+
+def _respondent_answer(rng: random.Random) -> str:
+    a, b = rng.sample(_RESPONDENT_VOCAB, 2)
+    return rng.choice(_RESPONDENT_TEMPLATES).format(a=a, b=b)
+
+
+def fake_completion(system: str, prompt: str, structured: bool, seed: int = 0) -> Tuple[str, str]:
+    """Build a schema-valid response for a pipeline prompt.
+
+    Args:
+        system: System prompt ("" if none)
+        prompt: User prompt
+        structured: Whether JSON output was requested
+        seed: Seed mixed into the per-prompt RNG
+
+    Returns:
+        (kind, content) where kind names the recognised call type and content
+        is a JSON string for structured calls, plain text otherwise
+    """
+    rng = _prompt_rng(system, prompt, seed)
+    if '"groupings"' in prompt:
+        return "slot_discovery", json.dumps(_slot_groupings(prompt))
+    if "## Valid Node Types" in system:
+        return "extraction", json.dumps(_extraction(system, prompt, rng))
+    if '{"score": <integer 1-5>' in prompt:
+        return "signal_scoring", json.dumps(_signal_scores(prompt, rng))
+    if '"extractable"' in system:
+        payload = {"extractable": True, "reason": "Contains substantive content."}
+        return "extractability", json.dumps(payload)
+    if structured:
+        return "json", "{}"
+    if "synthetic respondent" in system:
+        return "synthetic_response", _respondent_answer(rng)
+    return "question", _question(prompt, rng)
+
+
+# =============================================================================
+# HTTP app
+# =============================================================================
+
+
+def _token_count(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+def _stream_chunks(content: str) -> List[str]:
+    """Split content into word-sized chunks, like a token stream."""
+    return re.findall(r"\s*\S+", content) or [content]
+
+
+def _sse(data: Dict[str, Any], event: Optional[str] = None) -> str:
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(data)}\n\n"
+
+
+def _message_text(content: Any) -> str:
+    """Flatten a message content (string or list of text blocks)."""
+    if isinstance(content, str):
+        return content
+    return "".join(b.get("text", "") for b in content if isinstance(b, dict))
+
+
+def create_fake_provider_app(config: Optional[FakeProviderConfig] = None) -> FastAPI:
+    """Create the fake provider app.
+
+    Args:
+        config: Latency and fault injection settings (defaults if omitted)
+
+    Returns:
+        FastAPI app serving /v1/messages, /v1/chat/completions and /stats
+    """
+    config = config or FakeProviderConfig()
+    latency = LatencyModel(config.latency, seed=config.seed)
+    fault_rng = random.Random(config.seed)
+    stats: Counter = Counter()
+    in_flight = {"current": 0, "max": 0}
+
+    app = FastAPI(title="Fake LLM Provider")
+    app.state.config = config
+    app.state.stats = stats
+
+    async def _respond(
+        api: str, system: str, prompt: str, structured: bool
+    ) -> Tuple[Optional[JSONResponse], str, str]:
+        """Apply latency and faults; return (error_response, kind, content)."""
+        stats[f"requests.{api}"] += 1
+        in_flight["current"] += 1
+        in_flight["max"] = max(in_flight["max"], in_flight["current"])
+        try:
+            delay_ms = latency.sample_ms(0.0)
+            if delay_ms > 0:
+                await asyncio.sleep(delay_ms / 1000)
+        finally:
+            in_flight["current"] -= 1
+
+        roll = fault_rng.random()
+        if roll < config.rate_limit_rate:
+            stats["rate_limited"] += 1
+            return (
+                JSONResponse(
+                    status_code=429,
+                    content={"error": {"type": "rate_limit_error"}},
+                    headers={"retry-after": str(config.retry_after_s)},
+                ),
+                "",
+                "",
+            )
+        if roll < config.rate_limit_rate + config.error_rate:
+            stats["errors"] += 1
+            return (
+                JSONResponse(status_code=500, content={"error": {"type": "api_error"}}),
+                "",
+                "",
+            )
+
+        kind, content = fake_completion(system, prompt, structured, seed=config.seed)
+        stats[f"kind.{kind}"] += 1
+        return None, kind, content
+
+    @app.post("/v1/messages")
+    async def messages(request: Request):
+        body = await request.json()
+        system = _message_text(body.get("system") or "")
+        prompt = "\n".join(_message_text(m["content"]) for m in body["messages"])
+        structured = bool(body.get("tools"))
+
+        error, kind, content = await _respond("anthropic", system, prompt, structured)
+        if error:
+            return error
+
+        usage = {
+            "input_tokens": _token_count(system + prompt),
+            "output_tokens": _token_count(content),
+        }
+        if body.get("stream"):
+            return StreamingResponse(
+                _anthropic_stream(body, structured, content, usage),
+                media_type="text/event-stream",
+            )
+
+        if structured:
+            block = {
+                "type": "tool_use",
+                "id": f"toolu_fake_{stats['requests.anthropic']}",
+                "name": body["tools"][0]["name"],
+                "input": json.loads(content),
+            }
+        else:
+            block = {"type": "text", "text": content}
+        return {
+            "id": f"msg_fake_{stats['requests.anthropic']}",
+            "type": "message",
+            "role": "assistant",
+            "model": body.get("model", "fake"),
+            "content": [block],
+            "stop_reason": "tool_use" if structured else "end_turn",
+            "usage": usage,
+        }
+
+    async def _anthropic_stream(body, structured, content, usage):
+        number = stats["requests.anthropic"]
+        message = {
+            "id": f"msg_fake_{number}",
+            "type": "message",
+            "role": "assistant",
+            "model": body.get("model", "fake"),
+            "content": [],
+            "usage": {"input_tokens": usage["input_tokens"], "output_tokens": 1},
+        }
+        yield _sse({"type": "message_start", "message": message}, "message_start")
+        if structured:
+            block = {
+                "type": "tool_use",
+                "id": f"toolu_fake_{number}",
+                "name": body["tools"][0]["name"],
+                "input": {},
+            }
+        else:
+            block = {"type": "text", "text": ""}
+        yield _sse(
+            {"type": "content_block_start", "index": 0, "content_block": block},
+            "content_block_start",
+        )
+        for chunk in _stream_chunks(content):
+            await _pace()
+            delta = (
+                {"type": "input_json_delta", "partial_json": chunk}
+                if structured
+                else {"type": "text_delta", "text": chunk}
+            )
+            yield _sse(
+                {"type": "content_block_delta", "index": 0, "delta": delta},
+                "content_block_delta",
+            )
+        yield _sse({"type": "content_block_stop", "index": 0}, "content_block_stop")
+        yield _sse(
+            {
+                "type": "message_delta",
+                "delta": {"stop_reason": "tool_use" if structured else "end_turn"},
+                "usage": {"output_tokens": usage["output_tokens"]},
+            },
+            "message_delta",
+        )
+        yield _sse({"type": "message_stop"}, "message_stop")
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request):
+        body = await request.json()
+        messages = body["messages"]
+        system = "\n".join(_message_text(m["content"]) for m in messages if m["role"] == "system")
+        prompt = "\n".join(_message_text(m["content"]) for m in messages if m["role"] != "system")
+        structured = bool(body.get("response_format"))
+
+        error, kind, content = await _respond("openai", system, prompt, structured)
+        if error:
+            return error
+
+        prompt_tokens = _token_count(system + prompt)
+        completion_tokens = _token_count(content)
+        if body.get("stream"):
+            return StreamingResponse(
+                _openai_stream(body, content, prompt_tokens, completion_tokens),
+                media_type="text/event-stream",
+            )
+        return {
+            "id": f"chatcmpl-fake-{stats['requests.openai']}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": body.get("model", "fake"),
+            "choices": [
+                {
+                    "index": 0,
+                    "message": {"role": "assistant", "content": content},
+                    "finish_reason": "stop",
+                }
+            ],
+            "usage": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        }
+
+    async def _openai_stream(body, content, prompt_tokens, completion_tokens):
+        base = {
+            "id": f"chatcmpl-fake-{stats['requests.openai']}",
+            "object": "chat.completion.chunk",
+            "created": int(time.time()),
+            "model": body.get("model", "fake"),
+        }
+        first = {"role": "assistant", "content": ""}
+        yield _sse({**base, "choices": [{"index": 0, "delta": first}]})
+        for chunk in _stream_chunks(content):
+            await _pace()
+            yield _sse({**base, "choices": [{"index": 0, "delta": {"content": chunk}}]})
+        yield _sse({**base, "choices": [{"index": 0, "delta": {}, "finish_reason": "stop"}]})
+        if (body.get("stream_options") or {}).get("include_usage"):
+            usage = {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            }
+            yield _sse({**base, "choices": [], "usage": usage})
+        yield "data: [DONE]\n\n"
+
+    async def _pace():
+        stats["stream_chunks"] += 1
+        if config.stream_chunk_ms > 0:
+            await asyncio.sleep(config.stream_chunk_ms / 1000)
+
+    @app.get("/stats")
+    async def get_stats():
+        return {**stats, "max_in_flight": in_flight["max"]}
+
+    return app
@@ -0,0 +1,99 @@
+"""
+Incremental parser for streamed JSON extraction responses.
+
+Extraction responses are a single JSON object whose top-level keys hold
+arrays of objects ({"concepts": [...], "relationships": [...]}). While the
+response streams, JSONArrayStreamParser tracks string/escape state and
+nesting depth character by character and returns each array element as soon
+as its closing brace arrives, so downstream work can start before the full
+response is available.
+
+The parser is a best-effort accelerator: elements that fail to decode are
+skipped, and callers must still parse the complete response for the
+authoritative result.
+"""
+
+import json
+from typing import Any, Iterable, List, Optional, Tuple
+
+import structlog
+
+log = structlog.get_logger(__name__)
+
+
+class JSONArrayStreamParser:
+    """Emit completed objects from top-level arrays of a streamed JSON object.
+
+    Only object elements are emitted; scalar or nested-array elements are
+    ignored. Keys not listed in ``keys`` are skipped (all keys when None).
+    """
+
+    def __init__(self, keys: Optional[Iterable[str]] = None):
+        self.keys = set(keys) if keys is not None else None
+        self._text = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._string_start: Optional[int] = None
+        self._last_string: Optional[str] = None
+        self._current_key: Optional[str] = None
+        self._array_key: Optional[str] = None
+        self._element_start: Optional[int] = None
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """Consume a chunk and return (key, element) for each newly closed element."""
+        self._text += chunk
+        completed: List[Tuple[str, Any]] = []
+
+        text = self._text
+        for i in range(self._pos, len(text)):
+            char = text[i]
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._string_start is not None:
+                        self._last_string = self._decode(text[self._string_start : i + 1])
+                        self._string_start = None
+                continue
+
+            if char == '"':
+                self._in_string = True
+                # Only key strings of the top-level object are needed
+                self._string_start = i if self._depth == 1 else None
+            elif char == ":" and self._depth == 1:
+                self._current_key = self._last_string
+            elif char in "{[":
+                if self._depth == 1 and char == "[":
+                    self._array_key = self._current_key
+                elif self._depth == 2 and char == "{" and self._tracking():
+                    self._element_start = i
+                self._depth += 1
+            elif char in "}]":
+                self._depth -= 1
+                if self._depth == 2 and self._element_start is not None:
+                    element = self._decode(text[self._element_start : i + 1])
+                    self._element_start = None
+                    if element is not None:
+                        completed.append((self._array_key, element))
+                elif self._depth == 1:
+                    self._array_key = None
+
+        self._pos = len(text)
+        return completed
+
+    def _tracking(self) -> bool:
+        return self._array_key is not None and (self.keys is None or self._array_key in self.keys)
+
+    @staticmethod
+    def _decode(fragment: str) -> Any:
+        try:
+            return json.loads(fragment)
+        except json.JSONDecodeError as e:
+            log.debug("json_stream_fragment_invalid", error=str(e))
+            return None
@@ -14,11 +14,17 @@ from starlette.requests import Request
 
 from src.core.config import settings
 from src.core.logging import configure_logging, get_logger, bind_context, clear_context
+from src.core.tracing import shutdown_tracing, span, start_tracing
 from src.persistence.database import init_database, close_shared_connection
-from src.api.routes import health, sessions, synthetic
+from src.api.routes import admin, health, metrics, sessions, synthetic
 from src.api.routes.concepts import router as concepts_router
 from src.api.routes.simulation import router as simulation_router
 from src.api.exception_handlers import setup_exception_handlers
+from src.services.canonicalization_worker import shutdown_canonicalization_workers
+from src.services.post_turn_writer import (
+    recover_post_turn_journal,
+    shutdown_post_turn_writers,
+)
 
 # Configure logging before anything else
 configure_logging()
@@ -37,6 +43,7 @@ class CorrelationIDMiddleware(BaseHTTPMiddleware):
     - Generates a UUID4 request_id for each incoming request
     - Binds it to structlog context for all logs in that request
     - Adds X-Request-ID header to responses
+    - Opens the root tracing span for the request (when tracing is enabled)
 
     This allows tracing all log entries for a specific request.
     """
@@ -50,8 +57,21 @@ class CorrelationIDMiddleware(BaseHTTPMiddleware):
         bind_context(request_id=request_id)
 
         try:
-            # Call next middleware/endpoint
-            response = await call_next(request)
+            # Root span for the request; pipeline, LLM and DB spans nest under it
+            with span(
+                "http.request",
+                request_id=request_id,
+                method=request.method,
+                path=request.url.path,
+            ) as root:
+                if root is not None:
+                    bind_context(trace_id=root.trace_id)
+
+                # Call next middleware/endpoint
+                response = await call_next(request)
+
+                if root is not None:
+                    root.set_attribute("status_code", response.status_code)
 
             # Add request ID to response headers
             response.headers["X-Request-ID"] = request_id
@@ -154,13 +174,21 @@ async def lifespan(app: FastAPI):
     # Initialize database
     await init_database()
 
+    # Apply post-response writes journaled but not applied before a crash
+    await recover_post_turn_journal()
+
+    start_tracing()
+
     log.info("application_started")
 
     yield
 
     # Shutdown
     log.info("application_shutting_down")
+    await shutdown_post_turn_writers()
+    await shutdown_canonicalization_workers()
     await close_shared_connection()
+    await shutdown_tracing()
 
 
 # Create FastAPI application
@@ -190,6 +218,8 @@ setup_exception_handlers(app)
 
 # Include routers
 app.include_router(health.router, tags=["system"])
+app.include_router(metrics.router, tags=["system"])
+app.include_router(admin.router)
 app.include_router(sessions.router)
 app.include_router(synthetic.router)
 
@@ -10,7 +10,7 @@ Usage:
     from src.methodologies.registry import MethodologyRegistry
     registry = MethodologyRegistry()
     config = registry.get_methodology("means_end_chain")
-    detector = registry.create_signal_detector(config)
+    detector = registry.get_signal_detector(config)
 """
 
 from src.methodologies.registry import (
@@ -85,6 +85,9 @@ class StrategyConfig:
     generates_closing_question: bool = False
     focus_mode: str = "recent_node"
     node_binding: str = "required"
+    # Template question ("{focus}" = focus concept) used when question
+    # generation runs out of its latency budget
+    fallback_question: str | None = None
 
 
 class MethodologyRegistry:
@@ -96,7 +99,7 @@ class MethodologyRegistry:
     Example:
         registry = MethodologyRegistry()
         config = registry.get_methodology("means_end_chain")
-        signal_detector = registry.create_signal_detector(config)
+        signal_detector = registry.get_signal_detector(config)
     """
 
     def __init__(self, config_dir: str | Path | None = None):
@@ -113,6 +116,9 @@ class MethodologyRegistry:
 
         self.config_dir = Path(config_dir)
         self._cache: dict[str, MethodologyConfig] = {}
+        # Composed detectors are stateless across turns, so one per methodology
+        # is reused for the process lifetime (dropped by invalidate()).
+        self._detector_cache: dict[str, "ComposedSignalDetector"] = {}
 
     def get_methodology(self, name: str) -> MethodologyConfig:
         """Get methodology configuration by name.
@@ -164,6 +170,7 @@ class MethodologyRegistry:
                     ),
                     focus_mode=s.get("focus_mode", "recent_node"),
                     node_binding=s.get("node_binding", "required"),
+                    fallback_question=s.get("fallback_question"),
                 )
                 for s in data.get("strategies", [])
             ],
@@ -249,6 +256,25 @@ class MethodologyRegistry:
                 f"Methodology config validation failed for '{config_path.name}':\n  - {error_list}"
             )
 
+    def invalidate(self, name: str | None = None) -> None:
+        """Drop cached configs and signal detectors after a config reload.
+
+        Also clears the LLM signal prompt cache so rebuilt detectors re-read
+        their prompt files.
+
+        Args:
+            name: Methodology to invalidate, or None to invalidate all
+        """
+        from src.signals.llm.batch_detector import LLMBatchDetector
+
+        if name is None:
+            self._cache.clear()
+            self._detector_cache.clear()
+        else:
+            self._cache.pop(name, None)
+            self._detector_cache.pop(name, None)
+        LLMBatchDetector.clear_prompt_cache()
+
     def list_methodologies(self) -> list[str]:
         """List all available methodology names."""
         yaml_files = list(self.config_dir.glob("*.yaml"))
@@ -275,3 +301,23 @@ class MethodologyRegistry:
             signal_names.extend(pool_signals)
 
         return ComposedSignalDetector(signal_names)
+
+    def get_signal_detector(
+        self, config: MethodologyConfig
+    ) -> "ComposedSignalDetector":
+        """Get the cached composed signal detector for a methodology.
+
+        Creates the detector on first use via create_signal_detector() and
+        reuses it on later turns, avoiding per-turn detector construction.
+
+        Args:
+            config: MethodologyConfig loaded from YAML
+
+        Returns:
+            Shared ComposedSignalDetector for config.name
+        """
+        detector = self._detector_cache.get(config.name)
+        if detector is None:
+            detector = self.create_signal_detector(config)
+            self._detector_cache[config.name] = detector
+        return detector
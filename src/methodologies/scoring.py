@@ -5,9 +5,10 @@ defined in methodology YAML configs. All signals are expected to be
 normalized at source to [0, 1] or bool.
 """
 
+import heapq
 import structlog
 from dataclasses import dataclass, field
-from typing import List, Tuple, Dict, Any, Optional, Union
+from typing import List, Tuple, Dict, Any, Iterable, Optional, Union
 from src.methodologies.registry import StrategyConfig
 
 log = structlog.get_logger(__name__)
@@ -15,6 +16,10 @@ log = structlog.get_logger(__name__)
 # Prefixes that indicate node-scoped signals
 NODE_SIGNAL_PREFIXES = ("graph.node.", "technique.node.", "meta.node.")
 
+# Default number of top-ranked candidates kept (and decomposed) by node ranking.
+# Pass top_k=None to keep the full ranking.
+DEFAULT_TOP_K = 10
+
 
 def partition_signal_weights(
     signal_weights: Dict[str, float],
@@ -75,6 +80,75 @@ class ScoredCandidate:
     selected: bool = False
 
 
+@dataclass
+class RankingStats:
+    """Aggregate statistics over every candidate scored in a ranking pass.
+
+    Computed in a single streaming pass so callers can observe the full score
+    distribution without materializing a ScoredCandidate per candidate.
+    """
+
+    candidate_count: int = 0
+    decomposed_count: int = 0
+    max_score: float = 0.0
+    min_score: float = 0.0
+    mean_score: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize to a JSON-compatible dict (scores rounded for logs)."""
+        return {
+            "candidate_count": self.candidate_count,
+            "decomposed_count": self.decomposed_count,
+            "max_score": round(self.max_score, 4),
+            "min_score": round(self.min_score, 4),
+            "mean_score": round(self.mean_score, 4),
+        }
+
+
+def _top_k_with_stats(
+    scored: Iterable[Tuple[float, Any]],
+    top_k: Optional[int],
+) -> tuple[List[Tuple[float, Any]], RankingStats]:
+    """Select the top-k (score, payload) entries and aggregate stats in one pass.
+
+    Ordering matches a stable descending sort: ties keep their input order.
+    Uses a bounded heap when top_k is set, so memory is O(k) rather than O(n).
+
+    Args:
+        scored: Iterable of (final_score, payload) tuples in scoring order
+        top_k: Number of entries to keep, or None to keep all
+
+    Returns:
+        Tuple of (top entries sorted by score descending, RankingStats)
+    """
+    stats = RankingStats()
+    total = 0.0
+
+    def _observe() -> Iterable[Tuple[float, int, Any]]:
+        nonlocal total
+        for seq, (score, payload) in enumerate(scored):
+            if stats.candidate_count == 0:
+                stats.max_score = stats.min_score = score
+            elif score > stats.max_score:
+                stats.max_score = score
+            elif score < stats.min_score:
+                stats.min_score = score
+            stats.candidate_count += 1
+            total += score
+            # Negated sequence number keeps earlier entries ahead on ties
+            yield score, -seq, payload
+
+    if top_k is None:
+        top = sorted(_observe(), key=lambda e: (e[0], e[1]), reverse=True)
+    else:
+        top = heapq.nlargest(top_k, _observe(), key=lambda e: (e[0], e[1]))
+
+    if stats.candidate_count:
+        stats.mean_score = total / stats.candidate_count
+
+    return [(score, payload) for score, _, payload in top], stats
+
+
 def score_strategy(
     strategy_config: StrategyConfig,
     signals: Dict[str, Any],
@@ -90,15 +164,42 @@ def score_strategy(
         Weighted score (can be negative or > 1 depending on weights)
     """
     weights = strategy_config.signal_weights
+    score, signals_used = _weighted_score(weights, signals)
+
+    # Log if no signals were applicable (potential config mismatch)
+    if signals_used == 0 and weights:
+        log.debug(
+            "strategy_scoring_no_signals_matched",
+            strategy=strategy_config.name,
+            configured_weights=list(weights.keys()),
+            available_signals=list(signals.keys()) if signals else None,
+        )
+
+    return score
+
+
+def _weighted_score(
+    weights: Dict[str, float],
+    signals: Dict[str, Any],
+) -> tuple[float, int]:
+    """Sum weight * signal value over configured weights without allocating.
+
+    Hot-path scorer shared by score_strategy and the ranking functions.
+
+    Args:
+        weights: signal_key -> weight mapping
+        signals: Detected signals
+
+    Returns:
+        Tuple of (score, number of weighted signals that were present)
+    """
     score = 0.0
     signals_used = 0
-    signals_missing = 0
 
     for signal_key, weight in weights.items():
         signal_value = _get_signal_value(signal_key, signals)
 
         if signal_value is None:
-            signals_missing += 1
             continue
 
         signals_used += 1
@@ -111,16 +212,7 @@ def score_strategy(
 
         score += contribution
 
-    # Log if no signals were applicable (potential config mismatch)
-    if signals_used == 0 and weights:
-        log.debug(
-            "strategy_scoring_no_signals_matched",
-            strategy=strategy_config.name,
-            configured_weights=list(weights.keys()),
-            available_signals=list(signals.keys()) if signals else None,
-        )
-
-    return score
+    return score, signals_used
 
 
 def score_strategy_with_decomposition(
@@ -339,14 +431,52 @@ def rank_strategy_node_pairs(
     node_tracker=None,
     phase_weights: Optional[Dict[str, float]] = None,
     phase_bonuses: Optional[Dict[str, float]] = None,
+    top_k: Optional[int] = DEFAULT_TOP_K,
+    full_decomposition: bool = False,
 ) -> tuple[List[Tuple[StrategyConfig, str, float]], List[ScoredCandidate]]:
     """
     Rank (strategy, node) pairs by joint score.
 
+    Same as rank_strategy_node_pairs_with_stats without the RankingStats.
+
+    Returns:
+        Tuple of (ranked_pairs, decomposition)
+    """
+    ranked, candidates, _ = rank_strategy_node_pairs_with_stats(
+        strategies,
+        global_signals,
+        node_signals,
+        node_tracker=node_tracker,
+        phase_weights=phase_weights,
+        phase_bonuses=phase_bonuses,
+        top_k=top_k,
+        full_decomposition=full_decomposition,
+    )
+    return ranked, candidates
+
+
+def rank_strategy_node_pairs_with_stats(
+    strategies: List[StrategyConfig],
+    global_signals: Dict[str, Any],
+    node_signals: Dict[str, Dict[str, Any]],
+    node_tracker=None,
+    phase_weights: Optional[Dict[str, float]] = None,
+    phase_bonuses: Optional[Dict[str, float]] = None,
+    top_k: Optional[int] = DEFAULT_TOP_K,
+    full_decomposition: bool = False,
+) -> tuple[List[Tuple[StrategyConfig, str, float]], List[ScoredCandidate], RankingStats]:
+    """
+    Rank (strategy, node) pairs by joint score.
+
     This function implements the D1 architecture for joint strategy-node
     scoring. It scores each strategy for each node, combining global signals
     with node-specific signals.
 
+    Scoring is lazy: every pair is scored without building a decomposition,
+    only the top_k pairs are kept (bounded heap), and per-signal
+    ScoredCandidate decomposition is materialized for those top_k pairs only.
+    Aggregate stats cover every scored pair.
+
     Args:
         strategies: List of strategy configs from YAML
         global_signals: Dict of global detected signals
@@ -358,74 +488,51 @@ def rank_strategy_node_pairs(
         phase_bonuses: Optional dict of phase-based additive bonuses
                       {strategy_name: bonus}
                       Applied additively: final_score = (base_score * multiplier) + bonus
+        top_k: Number of top-ranked pairs to keep and decompose (None = all)
+        full_decomposition: Debug flag; keep and decompose every pair regardless
+                           of top_k
 
     Returns:
-        Tuple of (ranked_pairs, decomposition) where:
-        - ranked_pairs: List of (strategy_config, node_id, score) sorted descending
-        - decomposition: List of ScoredCandidate with per-signal contribution breakdown
+        Tuple of (ranked_pairs, decomposition, stats) where:
+        - ranked_pairs: Top (strategy_config, node_id, score) sorted descending
+        - decomposition: ScoredCandidate list for the ranked pairs, in rank order
+        - stats: RankingStats covering every scored pair
     """
     current_phase = global_signals.get("meta.interview.phase", "unknown")
+    keep = None if full_decomposition else top_k
 
-    scored_pairs: List[Tuple[StrategyConfig, str, float]] = []
-    candidates: List[ScoredCandidate] = []
-
-    for strategy in strategies:
-        for node_id, node_signal_dict in node_signals.items():
-            # Merge global + node signals
-            # Node signals take precedence when keys overlap
-            combined_signals = {**global_signals, **node_signal_dict}
-
-            # Score strategy for this specific node (with decomposition)
-            base_score, contributions = score_strategy_with_decomposition(
-                strategy, combined_signals
-            )
-
-            # Apply phase weight multiplier if available
-            multiplier = 1.0
-            if phase_weights and strategy.name in phase_weights:
-                multiplier = phase_weights[strategy.name]
-
-            # Apply phase bonus additively if available
-            bonus = 0.0
-            if phase_bonuses and strategy.name in phase_bonuses:
-                bonus = phase_bonuses[strategy.name]
+    # Merge global + node signals once per node (node signals take precedence)
+    combined_by_node = [
+        (node_id, {**global_signals, **node_signal_dict})
+        for node_id, node_signal_dict in node_signals.items()
+    ]
 
-            # Final score: (base_score * multiplier) + bonus
-            final_score = (base_score * multiplier) + bonus
+    def _score_pairs() -> Iterable[Tuple[float, Any]]:
+        for strategy in strategies:
+            multiplier, bonus = _phase_modifiers(strategy.name, phase_weights, phase_bonuses)
+            for node_id, combined_signals in combined_by_node:
+                base_score, _ = _weighted_score(strategy.signal_weights, combined_signals)
+                final_score = (base_score * multiplier) + bonus
+                yield final_score, (strategy, node_id, combined_signals)
 
-            scored_pairs.append((strategy, node_id, final_score))
-            candidates.append(
-                ScoredCandidate(
-                    strategy=strategy.name,
-                    node_id=node_id,
-                    signal_contributions=contributions,
-                    base_score=base_score,
-                    phase_multiplier=multiplier,
-                    phase_bonus=bonus,
-                    final_score=final_score,
-                )
-            )
+    top, stats = _top_k_with_stats(_score_pairs(), keep)
 
-            log.debug(
-                "strategy_node_pair_scored",
-                strategy=strategy.name,
-                node_id=node_id,
-                base_score=round(base_score, 4),
-                phase_multiplier=multiplier,
-                phase_bonus=bonus,
-                final_score=round(final_score, 4),
-                phase=current_phase,
+    ranked: List[Tuple[StrategyConfig, str, float]] = []
+    candidates: List[ScoredCandidate] = []
+    for rank, (final_score, (strategy, node_id, combined_signals)) in enumerate(top):
+        ranked.append((strategy, node_id, final_score))
+        candidates.append(
+            _materialize_candidate(
+                strategy,
+                node_id,
+                combined_signals,
+                final_score,
+                rank,
+                phase_weights,
+                phase_bonuses,
             )
-
-    # Sort by score descending
-    ranked = sorted(scored_pairs, key=lambda x: x[2], reverse=True)
-
-    # Assign rank and selected flag to each candidate
-    ranked_order = {(s.name, nid): i for i, (s, nid, _) in enumerate(ranked)}
-    for candidate in candidates:
-        rank = ranked_order.get((candidate.strategy, candidate.node_id), len(ranked))
-        candidate.rank = rank + 1  # 1-indexed
-        candidate.selected = rank == 0
+        )
+    stats.decomposed_count = len(candidates)
 
     log.info(
         "joint_scoring_top5",
@@ -436,9 +543,10 @@ def rank_strategy_node_pairs(
             {"strategy": s.name, "node_id": nid, "score": round(sc, 4)}
             for s, nid, sc in ranked[:5]
         ],
+        stats=stats.to_dict(),
     )
 
-    return ranked, candidates
+    return ranked, candidates, stats
 
 
 def rank_nodes_for_strategy(
@@ -446,23 +554,56 @@ def rank_nodes_for_strategy(
     node_signals: Dict[str, Dict[str, Any]],
     phase_weights: Optional[Dict[str, float]] = None,
     phase_bonuses: Optional[Dict[str, float]] = None,
+    top_k: Optional[int] = DEFAULT_TOP_K,
+    full_decomposition: bool = False,
 ) -> tuple[List[Tuple[str, float]], List[ScoredCandidate]]:
     """Rank nodes for a specific strategy using only node-scoped signal weights.
 
+    Same as rank_nodes_for_strategy_with_stats without the RankingStats.
+
+    Returns:
+        Tuple of (ranked_nodes, candidates)
+    """
+    ranked, candidates, _ = rank_nodes_for_strategy_with_stats(
+        strategy_config,
+        node_signals,
+        phase_weights=phase_weights,
+        phase_bonuses=phase_bonuses,
+        top_k=top_k,
+        full_decomposition=full_decomposition,
+    )
+    return ranked, candidates
+
+
+def rank_nodes_for_strategy_with_stats(
+    strategy_config: StrategyConfig,
+    node_signals: Dict[str, Dict[str, Any]],
+    phase_weights: Optional[Dict[str, float]] = None,
+    phase_bonuses: Optional[Dict[str, float]] = None,
+    top_k: Optional[int] = DEFAULT_TOP_K,
+    full_decomposition: bool = False,
+) -> tuple[List[Tuple[str, float]], List[ScoredCandidate], RankingStats]:
+    """Rank nodes for a specific strategy using only node-scoped signal weights.
+
     Auto-partitions the strategy's signal_weights to extract only node-scoped
     weights (graph.node.*, technique.node.*, meta.node.*), then scores each
     node against those weights. Applies phase multiplier and bonus to final scores.
 
+    Only the top_k nodes are kept and decomposed; see rank_strategy_node_pairs.
+
     Args:
         strategy_config: Strategy config (node weights extracted automatically)
         node_signals: Dict mapping node_id to per-node signal dict
         phase_weights: Optional phase multipliers by strategy name
         phase_bonuses: Optional phase bonuses by strategy name
+        top_k: Number of top-ranked nodes to keep and decompose (None = all)
+        full_decomposition: Debug flag; keep and decompose every node
 
     Returns:
-        Tuple of (ranked_nodes, candidates) where:
-        - ranked_nodes: List of (node_id, score) sorted descending
-        - candidates: List of ScoredCandidate with per-signal breakdown
+        Tuple of (ranked_nodes, candidates, stats) where:
+        - ranked_nodes: Top (node_id, score) sorted descending
+        - candidates: ScoredCandidate list for the ranked nodes, in rank order
+        - stats: RankingStats covering every scored node
     """
     _, node_weights = partition_signal_weights(strategy_config.signal_weights)
 
@@ -472,7 +613,7 @@ def rank_nodes_for_strategy(
             strategy=strategy_config.name,
             reason="node_signals_empty",
         )
-        return [], []
+        return [], [], RankingStats()
 
     if not node_weights:
         log.warning(
@@ -481,7 +622,7 @@ def rank_nodes_for_strategy(
             reason="no_node_scoped_weights_in_config",
             available_weights=list(strategy_config.signal_weights.keys()),
         )
-        return [], []
+        return [], [], RankingStats()
 
     node_strategy = StrategyConfig(
         name=strategy_config.name,
@@ -490,45 +631,90 @@ def rank_nodes_for_strategy(
     )
 
     # Phase multiplier and bonus for this strategy
-    multiplier = 1.0
-    if phase_weights and strategy_config.name in phase_weights:
-        multiplier = phase_weights[strategy_config.name]
-    bonus = 0.0
-    if phase_bonuses and strategy_config.name in phase_bonuses:
-        bonus = phase_bonuses[strategy_config.name]
+    multiplier, bonus = _phase_modifiers(strategy_config.name, phase_weights, phase_bonuses)
 
-    scored: List[Tuple[str, float]] = []
-    candidates: List[ScoredCandidate] = []
+    def _score_nodes() -> Iterable[Tuple[float, Any]]:
+        for node_id, signals in node_signals.items():
+            score, _ = _weighted_score(node_weights, signals)
+            yield (score * multiplier) + bonus, (node_id, signals)
+
+    top, stats = _top_k_with_stats(
+        _score_nodes(), None if full_decomposition else top_k
+    )
 
-    for node_id, signals in node_signals.items():
-        score, contributions = score_strategy_with_decomposition(node_strategy, signals)
-        final_score = (score * multiplier) + bonus
-        scored.append((node_id, final_score))
+    ranked: List[Tuple[str, float]] = []
+    candidates: List[ScoredCandidate] = []
+    for rank, (final_score, (node_id, signals)) in enumerate(top):
+        ranked.append((node_id, final_score))
         candidates.append(
-            ScoredCandidate(
-                strategy=strategy_config.name,
-                node_id=node_id,
-                signal_contributions=contributions,
-                base_score=score,
-                phase_multiplier=multiplier,
-                phase_bonus=bonus,
-                final_score=final_score,
+            _materialize_candidate(
+                node_strategy,
+                node_id,
+                signals,
+                final_score,
+                rank,
+                phase_weights,
+                phase_bonuses,
             )
         )
-
-    ranked = sorted(scored, key=lambda x: x[1], reverse=True)
-
-    ranked_order = {node_id: i for i, (node_id, _) in enumerate(ranked)}
-    for candidate in candidates:
-        rank = ranked_order.get(candidate.node_id, len(ranked))
-        candidate.rank = rank + 1
-        candidate.selected = rank == 0
+    stats.decomposed_count = len(candidates)
 
     log.debug(
         "nodes_ranked_for_strategy",
         strategy=strategy_config.name,
-        node_count=len(ranked),
+        node_count=stats.candidate_count,
         top3=[(nid, round(sc, 4)) for nid, sc in ranked[:3]] if ranked else None,
+        stats=stats.to_dict(),
     )
 
-    return ranked, candidates
+    return ranked, candidates, stats
+
+
+def _phase_modifiers(
+    strategy_name: str,
+    phase_weights: Optional[Dict[str, float]],
+    phase_bonuses: Optional[Dict[str, float]],
+) -> tuple[float, float]:
+    """Return (multiplier, bonus) for a strategy in the current phase."""
+    multiplier = 1.0
+    if phase_weights and strategy_name in phase_weights:
+        multiplier = phase_weights[strategy_name]
+    bonus = 0.0
+    if phase_bonuses and strategy_name in phase_bonuses:
+        bonus = phase_bonuses[strategy_name]
+    return multiplier, bonus
+
+
+def _materialize_candidate(
+    strategy: StrategyConfig,
+    node_id: str,
+    signals: Dict[str, Any],
+    final_score: float,
+    rank: int,
+    phase_weights: Optional[Dict[str, float]],
+    phase_bonuses: Optional[Dict[str, float]],
+) -> ScoredCandidate:
+    """Build the full per-signal decomposition for one ranked candidate.
+
+    Args:
+        strategy: Strategy config whose weights were used for scoring
+        node_id: Node the candidate targets
+        signals: Signals the candidate was scored against
+        final_score: Final score computed during ranking
+        rank: 0-indexed rank position
+        phase_weights: Phase multipliers by strategy name
+        phase_bonuses: Phase bonuses by strategy name
+    """
+    base_score, contributions = score_strategy_with_decomposition(strategy, signals)
+    multiplier, bonus = _phase_modifiers(strategy.name, phase_weights, phase_bonuses)
+    return ScoredCandidate(
+        strategy=strategy.name,
+        node_id=node_id,
+        signal_contributions=contributions,
+        base_score=base_score,
+        phase_multiplier=multiplier,
+        phase_bonus=bonus,
+        final_score=final_score,
+        rank=rank + 1,  # 1-indexed
+        selected=rank == 0,
+    )
@@ -12,12 +12,16 @@ all requests see the same in-memory database. Call close_shared_connection()
 during application shutdown.
 """
 
+import time
+from contextlib import asynccontextmanager
+
 import aiosqlite
 from pathlib import Path
-from typing import AsyncGenerator, Optional
+from typing import AsyncGenerator, AsyncIterator, Optional, Union
 import structlog
 
 from src.core.config import settings
+from src.core.metrics import DB_CONNECTION_OPEN
 
 log = structlog.get_logger(__name__)
 
@@ -27,6 +31,8 @@ SCHEMA_FILE = Path(__file__).parent / "schema.sql"
 # Shared connection for :memory: mode (None in file-based mode)
 _shared_connection: Optional[aiosqlite.Connection] = None
 
+_connection_open = DB_CONNECTION_OPEN.labels()
+
 
 def _is_memory_path(db_path: Path) -> bool:
     """Return True if the given path represents an in-memory SQLite database."""
@@ -181,15 +187,8 @@ async def get_db() -> AsyncGenerator[aiosqlite.Connection, None]:
         yield _shared_connection
         return
 
-    db = await aiosqlite.connect(settings.database_path)
-
+    db = await _open_connection()
     try:
-        # Enable foreign keys for this connection
-        await db.execute("PRAGMA foreign_keys = ON")
-
-        # Use Row factory for dict-like access
-        db.row_factory = aiosqlite.Row
-
         yield db
     finally:
         await db.close()
@@ -218,12 +217,38 @@ async def get_db_connection() -> aiosqlite.Connection:
             )
         return _shared_connection
 
+    return await _open_connection()
+
+
+async def _open_connection() -> aiosqlite.Connection:
+    """Open a file-based connection, recording the wait in db_connection_open."""
+    start = time.perf_counter()
     db = await aiosqlite.connect(settings.database_path)
+    # Enable foreign keys and Row factory for dict-like access
     await db.execute("PRAGMA foreign_keys = ON")
     db.row_factory = aiosqlite.Row
+    _connection_open.observe(time.perf_counter() - start)
     return db
 
 
+@asynccontextmanager
+async def connect(db_path: Union[str, Path]) -> AsyncIterator[aiosqlite.Connection]:
+    """
+    Open a connection to db_path for the enclosed block, then close it.
+
+    Drop-in for "async with aiosqlite.connect(path)" used by the
+    repositories, so their connection opens are recorded in
+    db_connection_open alongside get_db() / get_db_connection().
+    """
+    start = time.perf_counter()
+    db = await aiosqlite.connect(db_path)
+    _connection_open.observe(time.perf_counter() - start)
+    try:
+        yield db
+    finally:
+        await db.close()
+
+
 async def check_database_health() -> dict:
     """
     Check database health for health endpoint.
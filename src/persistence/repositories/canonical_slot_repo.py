@@ -2,7 +2,7 @@
 Repository for canonical graph persistence (dual-graph architecture).
 
 Handles CRUD operations on canonical_slots, surface_to_slot_mapping,
-and canonical_edges tables. Uses aiosqlite for async SQLite access.
+slot_discovery_queue and canonical_edges tables. Uses aiosqlite for async SQLite access.
 
 IMPLEMENTATION NOTES:
 - Follows SessionRepository pattern: accepts db_path and manages its own connections
@@ -11,7 +11,7 @@ IMPLEMENTATION NOTES:
 """
 
 import json
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 from uuid import uuid4
 
 import aiosqlite
@@ -19,15 +19,19 @@ import numpy as np
 import structlog
 
 from src.core.config import interview_config
+from src.core.tracing import trace_repository
 from src.domain.models.canonical_graph import (
     CanonicalSlot,
     SlotMapping,
     CanonicalEdge,
 )
+from src.domain.models.knowledge_graph import KGNode
+from src.persistence.database import connect
 
 log = structlog.get_logger(__name__)
 
 
+@trace_repository
 class CanonicalSlotRepository:
     """
     Repository for canonical slots and mappings.
@@ -35,6 +39,7 @@ class CanonicalSlotRepository:
     Provides CRUD operations on SQLite tables:
     - canonical_slots: Abstract concept slots (candidate → active lifecycle)
     - surface_to_slot_mapping: Maps surface kg_nodes to canonical slots
+    - slot_discovery_queue: Surface nodes still awaiting slot discovery
     - canonical_edges: Aggregated edges between canonical slots
 
     Follows SessionRepository pattern: accepts db_path and manages its own
@@ -82,7 +87,7 @@ class CanonicalSlotRepository:
         # Serialize embedding if provided
         embedding_blob = embedding.tobytes() if embedding is not None else None
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect(self.db_path) as db:
             await db.execute(
                 """
                 INSERT INTO canonical_slots (
@@ -130,7 +135,7 @@ class CanonicalSlotRepository:
         Returns:
             CanonicalSlot or None if not found
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect(self.db_path) as db:
             db.row_factory = aiosqlite.Row
             cursor = await db.execute(
                 "SELECT * FROM canonical_slots WHERE id = ?",
@@ -156,7 +161,7 @@ class CanonicalSlotRepository:
         Returns:
             List of active CanonicalSlot objects
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect(self.db_path) as db:
             db.row_factory = aiosqlite.Row
 
             if node_type:
@@ -182,6 +187,38 @@ class CanonicalSlotRepository:
 
         return [self._row_to_slot(row) for row in rows]
 
+    async def get_matchable_slots(
+        self, session_id: str, node_type: str
+    ) -> List[CanonicalSlot]:
+        """
+        Get active and candidate slots of a node_type that have embeddings.
+
+        Loaded once per slot discovery run to build an in-memory similarity
+        matrix. Active slots come first so ties resolve the same way as
+        find_similar_slots (active matches before candidates).
+
+        Args:
+            session_id: Session ID
+            node_type: Node type filter
+
+        Returns:
+            List of CanonicalSlot objects, active first
+        """
+        async with connect(self.db_path) as db:
+            db.row_factory = aiosqlite.Row
+            cursor = await db.execute(
+                """
+                SELECT * FROM canonical_slots
+                WHERE session_id = ? AND node_type = ?
+                  AND status IN ('active', 'candidate') AND embedding IS NOT NULL
+                ORDER BY status = 'candidate', rowid
+                """,
+                (session_id, node_type),
+            )
+            rows = await cursor.fetchall()
+
+        return [self._row_to_slot(row) for row in rows]
+
     async def find_slot_by_name_and_type(
         self, session_id: str, slot_name: str, node_type: str
     ) -> Optional[CanonicalSlot]:
@@ -205,7 +242,7 @@ class CanonicalSlotRepository:
             Deduplication check prevents UNIQUE constraint violations.
             Pattern follows GraphRepository.find_node_by_label_and_type().
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect(self.db_path) as db:
             db.row_factory = aiosqlite.Row
             cursor = await db.execute(
                 """
@@ -251,7 +288,7 @@ class CanonicalSlotRepository:
             # Read from config, NOT hardcoded (AMBIGUITY RESOLUTION 2026-02-07)
             threshold = interview_config.deduplication.canonical_similarity_threshold
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect(self.db_path) as db:
             db.row_factory = aiosqlite.Row
             cursor = await db.execute(
                 """
@@ -287,17 +324,37 @@ class CanonicalSlotRepository:
         slot_id: str,
         similarity_score: float,
         assigned_turn: int,
-    ) -> None:
+    ) -> bool:
         """
         Map a surface node to a canonical slot, incrementing support_count.
 
+        Idempotent: a node already mapped to slot_id is left as is, so
+        re-running discovery for it (budget fallback, worker retry) does not
+        count its support twice.
+
         Args:
             surface_node_id: ID of the surface node (from kg_nodes table)
             slot_id: ID of the canonical slot (from canonical_slots table)
             similarity_score: Cosine similarity score (0.0-1.0)
             assigned_turn: Turn when this mapping was created
+
+        Returns:
+            True if the mapping was created or changed, False if it existed
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect(self.db_path) as db:
+            cursor = await db.execute(
+                "SELECT canonical_slot_id FROM surface_to_slot_mapping WHERE surface_node_id = ?",
+                (surface_node_id,),
+            )
+            existing = await cursor.fetchone()
+            if existing is not None and existing[0] == slot_id:
+                log.debug(
+                    "surface_node_already_mapped",
+                    surface_node_id=surface_node_id,
+                    slot_id=slot_id,
+                )
+                return False
+
             # Insert mapping (INSERT OR REPLACE handles re-mapping if needed)
             await db.execute(
                 """
@@ -321,6 +378,7 @@ class CanonicalSlotRepository:
             slot_id=slot_id,
             similarity=round(similarity_score, 3),
         )
+        return True
 
     async def promote_slot(self, slot_id: str, turn_number: int) -> None:
         """
@@ -330,7 +388,7 @@ class CanonicalSlotRepository:
             slot_id: Slot ID to promote
             turn_number: Current turn number (recorded as promoted_turn)
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect(self.db_path) as db:
             await db.execute(
                 """
                 UPDATE canonical_slots
@@ -355,7 +413,7 @@ class CanonicalSlotRepository:
         Returns:
             SlotMapping or None if not mapped
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect(self.db_path) as db:
             db.row_factory = aiosqlite.Row
             cursor = await db.execute(
                 """
@@ -375,6 +433,151 @@ class CanonicalSlotRepository:
             assigned_turn=row["assigned_turn"],
         )
 
+    async def get_mapped_node_ids(self, surface_node_ids: List[str]) -> Set[str]:
+        """
+        Return which of the given surface nodes already have a slot mapping.
+
+        Args:
+            surface_node_ids: Surface node IDs to check
+
+        Returns:
+            Subset of surface_node_ids that are mapped
+        """
+        if not surface_node_ids:
+            return set()
+        placeholders = ",".join("?" for _ in surface_node_ids)
+        async with connect(self.db_path) as db:
+            cursor = await db.execute(
+                f"SELECT surface_node_id FROM surface_to_slot_mapping "
+                f"WHERE surface_node_id IN ({placeholders})",
+                surface_node_ids,
+            )
+            rows = await cursor.fetchall()
+        return {row[0] for row in rows}
+
+    # ==================== SLOT DISCOVERY QUEUE ====================
+
+    async def enqueue_pending_nodes(
+        self, session_id: str, nodes: List[KGNode], turn_number: int
+    ) -> None:
+        """
+        Record surface nodes whose slot discovery did not complete.
+
+        Re-enqueuing a node keeps its original enqueued_turn and increments
+        attempts.
+
+        Args:
+            session_id: Session ID
+            nodes: Surface nodes to retry in a later slot discovery
+            turn_number: Turn in which discovery was attempted
+        """
+        if not nodes:
+            return
+
+        async with connect(self.db_path) as db:
+            await db.executemany(
+                """
+                INSERT INTO slot_discovery_queue
+                (surface_node_id, session_id, label, node_type, enqueued_turn)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(surface_node_id) DO UPDATE SET attempts = attempts + 1
+                """,
+                [(n.id, session_id, n.label, n.node_type, turn_number) for n in nodes],
+            )
+            await db.commit()
+
+        log.info(
+            "slot_discovery_nodes_enqueued",
+            session_id=session_id,
+            count=len(nodes),
+            turn=turn_number,
+        )
+
+    async def get_pending_nodes(self, session_id: str) -> List[KGNode]:
+        """
+        Get queued surface nodes for a session, oldest first.
+
+        Args:
+            session_id: Session ID
+
+        Returns:
+            Minimal KGNodes (id, label, node_type) awaiting slot discovery
+        """
+        async with connect(self.db_path) as db:
+            db.row_factory = aiosqlite.Row
+            cursor = await db.execute(
+                """
+                SELECT surface_node_id, label, node_type FROM slot_discovery_queue
+                WHERE session_id = ?
+                ORDER BY enqueued_turn, created_at, surface_node_id
+                """,
+                (session_id,),
+            )
+            rows = await cursor.fetchall()
+
+        return [
+            KGNode(
+                id=row["surface_node_id"],
+                session_id=session_id,
+                label=row["label"],
+                node_type=row["node_type"],
+            )
+            for row in rows
+        ]
+
+    async def remove_pending_nodes(self, surface_node_ids: List[str]) -> None:
+        """
+        Remove surface nodes from the slot discovery queue.
+
+        Args:
+            surface_node_ids: Surface node IDs whose discovery completed
+        """
+        if not surface_node_ids:
+            return
+
+        async with connect(self.db_path) as db:
+            await db.executemany(
+                "DELETE FROM slot_discovery_queue WHERE surface_node_id = ?",
+                [(node_id,) for node_id in surface_node_ids],
+            )
+            await db.commit()
+
+    async def drop_exhausted_pending_nodes(
+        self, session_id: str, max_attempts: int
+    ) -> List[str]:
+        """
+        Drop queued surface nodes that reached the slot discovery attempt limit.
+
+        Args:
+            session_id: Session ID
+            max_attempts: Attempts after which a node is no longer retried
+
+        Returns:
+            Surface node IDs removed from the queue
+        """
+        async with connect(self.db_path) as db:
+            cursor = await db.execute(
+                """
+                DELETE FROM slot_discovery_queue
+                WHERE session_id = ? AND attempts >= ?
+                RETURNING surface_node_id
+                """,
+                (session_id, max_attempts),
+            )
+            rows = await cursor.fetchall()
+            await db.commit()
+
+        dropped = sorted(row[0] for row in rows)
+        if dropped:
+            log.warning(
+                "slot_discovery_nodes_dropped",
+                session_id=session_id,
+                count=len(dropped),
+                max_attempts=max_attempts,
+                surface_node_ids=dropped,
+            )
+        return dropped
+
     # ==================== CANONICAL EDGE OPERATIONS ====================
 
     async def add_or_update_canonical_edge(
@@ -407,7 +610,7 @@ class CanonicalSlotRepository:
 
         REFERENCE: AMBIGUITY RESOLUTION 2026-02-07 for full semantics
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect(self.db_path) as db:
             db.row_factory = aiosqlite.Row
             # Check if edge exists
             cursor = await db.execute(
@@ -483,7 +686,7 @@ class CanonicalSlotRepository:
 
     async def get_canonical_edge(self, edge_id: str) -> Optional[CanonicalEdge]:
         """Get a canonical edge by ID."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect(self.db_path) as db:
             db.row_factory = aiosqlite.Row
             cursor = await db.execute(
                 "SELECT * FROM canonical_edges WHERE id = ?",
@@ -516,7 +719,7 @@ class CanonicalSlotRepository:
         Returns:
             List of CanonicalEdge objects
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect(self.db_path) as db:
             db.row_factory = aiosqlite.Row
             cursor = await db.execute(
                 "SELECT * FROM canonical_edges WHERE session_id = ?",
@@ -554,7 +757,7 @@ class CanonicalSlotRepository:
             List of slot dicts with surface_node_ids:
             {slot_id, slot_name, node_type, support_count, surface_node_ids: [...]}
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect(self.db_path) as db:
             db.row_factory = aiosqlite.Row
             cursor = await db.execute(
                 """
@@ -611,7 +814,7 @@ class CanonicalSlotRepository:
         Note:
             avg_confidence is computed from surface edges in kg_edges table.
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect(self.db_path) as db:
             db.row_factory = aiosqlite.Row
             cursor = await db.execute(
                 """
@@ -16,6 +16,7 @@ import aiosqlite
 import numpy as np
 import structlog
 
+from src.core.tracing import trace_repository
 from src.domain.models.knowledge_graph import (
     KGNode,
     KGEdge,
@@ -26,6 +27,7 @@ from src.domain.models.knowledge_graph import (
 log = structlog.get_logger(__name__)
 
 
+@trace_repository
 class GraphRepository:
     """
     Repository for knowledge graph nodes and edges.
@@ -6,13 +6,16 @@ from typing import Optional, Dict, Any
 
 import aiosqlite
 
+from src.core.tracing import trace_repository
 from src.domain.models.session import Session, SessionState, FocusEntry
 from src.domain.models.utterance import Utterance
+from src.persistence.database import connect
 import structlog
 
 log = structlog.get_logger(__name__)
 
 
+@trace_repository
 class SessionRepository:
     """Repository for session CRUD operations."""
 
@@ -23,7 +26,7 @@ class SessionRepository:
         self, session: Session, config: Optional[Dict[str, Any]] = None
     ) -> Session:
         """Create a new session and populate concept_elements."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect(self.db_path) as db:
             db.row_factory = aiosqlite.Row
             config_json = json.dumps(config or {})
             await db.execute(
@@ -53,7 +56,7 @@ class SessionRepository:
 
     async def get(self, session_id: str) -> Optional[Session]:
         """Get a session by ID."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect(self.db_path) as db:
             db.row_factory = aiosqlite.Row
             cursor = await db.execute(
                 "SELECT * FROM sessions WHERE id = ?", (session_id,)
@@ -65,7 +68,7 @@ class SessionRepository:
 
     async def update_state(self, session_id: str, state: SessionState) -> None:
         """Update session state (computed on-demand, no caching)."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect(self.db_path) as db:
             await db.execute(
                 "UPDATE sessions SET "
                 "turn_count = ?, "
@@ -90,7 +93,7 @@ class SessionRepository:
 
     async def list_active(self) -> list[Session]:
         """List all active sessions."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect(self.db_path) as db:
             db.row_factory = aiosqlite.Row
             cursor = await db.execute(
                 "SELECT * FROM sessions WHERE status = 'active' ORDER BY created_at DESC"
@@ -98,9 +101,18 @@ class SessionRepository:
             rows = await cursor.fetchall()
             return [self._row_to_session(row) for row in rows]
 
+    async def count_active(self) -> int:
+        """Count active sessions."""
+        async with connect(self.db_path) as db:
+            cursor = await db.execute(
+                "SELECT COUNT(*) FROM sessions WHERE status = 'active'"
+            )
+            row = await cursor.fetchone()
+            return row[0]
+
     async def delete(self, session_id: str) -> bool:
         """Delete a session by ID. Returns True if deleted."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect(self.db_path) as db:
             cursor = await db.execute(
                 "DELETE FROM sessions WHERE id = ?", (session_id,)
             )
@@ -110,7 +122,7 @@ class SessionRepository:
     async def get_utterances(self, session_id: str) -> list:
         """Get all utterances for a session."""
 
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect(self.db_path) as db:
             db.row_factory = aiosqlite.Row
             cursor = await db.execute(
                 "SELECT * FROM utterances WHERE session_id = ? ORDER BY turn_number",
@@ -121,7 +133,7 @@ class SessionRepository:
 
     async def get_scoring_history(self, session_id: str) -> list:
         """Get scoring history for a session."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect(self.db_path) as db:
             db.row_factory = aiosqlite.Row
             cursor = await db.execute(
                 "SELECT * FROM scoring_history WHERE session_id = ? ORDER BY turn_number",
@@ -132,7 +144,7 @@ class SessionRepository:
 
     async def get_config(self, session_id: str) -> Dict[str, Any]:
         """Get session configuration."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect(self.db_path) as db:
             db.row_factory = aiosqlite.Row
             cursor = await db.execute(
                 "SELECT config FROM sessions WHERE id = ?", (session_id,)
@@ -154,7 +166,7 @@ class SessionRepository:
             This performs a deep merge at the top level only. Nested keys are
             replaced, not merged recursively.
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect(self.db_path) as db:
             db.row_factory = aiosqlite.Row
             # Get existing config
             cursor = await db.execute(
@@ -193,7 +205,7 @@ class SessionRepository:
         scorer_details: Optional[Dict[str, Any]] = None,
     ) -> None:
         """Save scoring history entry."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect(self.db_path) as db:
             await db.execute(
                 """INSERT INTO scoring_history (
                     id, session_id, turn_number,
@@ -215,7 +227,7 @@ class SessionRepository:
 
     async def get_latest_strategy(self, session_id: str) -> Dict[str, Any]:
         """Get the most recent strategy from scoring_history."""
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect(self.db_path) as db:
             db.row_factory = aiosqlite.Row
             cursor = await db.execute(
                 """SELECT strategy_selected, strategy_reasoning
@@ -244,7 +256,7 @@ class SessionRepository:
         Returns:
             List of strategy IDs in chronological order (oldest first)
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect(self.db_path) as db:
             cursor = await db.execute(
                 """SELECT strategy_selected
                    FROM scoring_history
@@ -269,6 +281,9 @@ class SessionRepository:
     ) -> None:
         """Save LLM-extracted qualitative signals for a turn.
 
+        A record whose signal_id already exists is left unchanged, so replaying
+        a journaled post-turn write is a no-op.
+
         Args:
             signal_id: Unique identifier for this signal record
             session_id: Session ID
@@ -279,9 +294,9 @@ class SessionRepository:
             extraction_latency_ms: Time taken to extract signals
             extraction_errors: List of error messages (if any)
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect(self.db_path) as db:
             await db.execute(
-                """INSERT INTO qualitative_signals (
+                """INSERT OR IGNORE INTO qualitative_signals (
                     id, session_id, turn_number,
                     llm_model, extraction_latency_ms, extraction_errors,
                     uncertainty_signal, reasoning_signal, emotional_signal,
@@ -322,7 +337,7 @@ class SessionRepository:
         Returns:
             Dict mapping turn_number to signal dict with all signal types.
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect(self.db_path) as db:
             db.row_factory = aiosqlite.Row
             cursor = await db.execute(
                 """SELECT
@@ -378,7 +393,7 @@ class SessionRepository:
         Returns:
             JSON string of tracker state, or None if not set
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect(self.db_path) as db:
             db.row_factory = aiosqlite.Row
             cursor = await db.execute(
                 "SELECT node_tracker_state FROM sessions WHERE id = ?",
@@ -399,7 +414,7 @@ class SessionRepository:
             session_id: Session ID to update tracker state for
             tracker_state_json: JSON string of serialized NodeStateTracker
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect(self.db_path) as db:
             await db.execute(
                 "UPDATE sessions SET node_tracker_state = ?, updated_at = datetime('now') "
                 "WHERE id = ?",
@@ -5,9 +5,12 @@ from typing import List
 
 import aiosqlite
 
+from src.core.tracing import trace_repository
 from src.domain.models.utterance import Utterance
+from src.persistence.database import connect
 
 
+@trace_repository
 class UtteranceRepository:
     """Repository for utterance CRUD operations."""
 
@@ -23,7 +26,7 @@ class UtteranceRepository:
         Returns:
             Saved Utterance with database timestamps
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect(self.db_path) as db:
             db.row_factory = aiosqlite.Row
 
             await db.execute(
@@ -60,7 +63,7 @@ class UtteranceRepository:
         Returns:
             List of Utterance objects ordered by turn_number and created_at
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect(self.db_path) as db:
             db.row_factory = aiosqlite.Row
             cursor = await db.execute(
                 """SELECT * FROM utterances
@@ -82,7 +85,7 @@ class UtteranceRepository:
         Returns:
             List of Utterance objects for the specified turn
         """
-        async with aiosqlite.connect(self.db_path) as db:
+        async with connect(self.db_path) as db:
             db.row_factory = aiosqlite.Row
             cursor = await db.execute(
                 """SELECT * FROM utterances
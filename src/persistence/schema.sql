@@ -210,6 +210,24 @@ CREATE TABLE IF NOT EXISTS surface_to_slot_mapping (
 
 CREATE INDEX IF NOT EXISTS idx_surface_mapping_slot ON surface_to_slot_mapping(canonical_slot_id);
 
+-- =============================================================================
+-- Slot Discovery Queue (Dual-Graph Architecture)
+-- Surface nodes whose slot discovery has not completed (e.g. a failed LLM
+-- shard). Drained at the start of the next slot discovery for the session.
+-- =============================================================================
+
+CREATE TABLE IF NOT EXISTS slot_discovery_queue (
+    surface_node_id TEXT PRIMARY KEY REFERENCES kg_nodes(id) ON DELETE CASCADE,
+    session_id TEXT NOT NULL REFERENCES sessions(id) ON DELETE CASCADE,
+    label TEXT NOT NULL,
+    node_type TEXT NOT NULL,
+    enqueued_turn INTEGER NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 1,
+    created_at TEXT NOT NULL DEFAULT (datetime('now'))
+);
+
+CREATE INDEX IF NOT EXISTS idx_slot_discovery_queue_session ON slot_discovery_queue(session_id);
+
 -- =============================================================================
 -- Canonical Edges (Dual-Graph Architecture)
 -- =============================================================================
@@ -299,3 +317,20 @@ CREATE TABLE IF NOT EXISTS qualitative_signals (
 
 CREATE INDEX IF NOT EXISTS idx_qualitative_signals_session ON qualitative_signals(session_id);
 CREATE INDEX IF NOT EXISTS idx_qualitative_signals_turn ON qualitative_signals(session_id, turn_number);
+
+-- =============================================================================
+-- Post-Turn Journal (write-behind crash recovery)
+-- =============================================================================
+-- One row per turn whose post-response writes (system utterance, scoring,
+-- signals, session state, usage metadata) are queued but not yet applied.
+-- Rows are deleted once applied and replayed at startup otherwise.
+
+CREATE TABLE IF NOT EXISTS post_turn_journal (
+    id TEXT PRIMARY KEY,
+    session_id TEXT NOT NULL REFERENCES sessions(id) ON DELETE CASCADE,
+    turn_number INTEGER NOT NULL,
+    writes TEXT NOT NULL,  -- JSON array of {kind, payload}
+    created_at TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_post_turn_journal_session ON post_turn_journal(session_id);
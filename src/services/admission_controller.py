@@ -0,0 +1,209 @@
+"""
+Admission control for turn processing.
+
+Every turn holds a slot from a global in-flight limit
+(settings.max_concurrent_turns) for its whole pipeline run, so bursts queue
+up instead of slowing every turn down together and tripping provider rate
+limits. Turns for the same session are also single-flight: a second turn
+waits for the first, without holding a global slot while it waits.
+
+Waiting is bounded twice. At most settings.max_queued_turns requests may
+wait at once, and each waits at most settings.admission_max_wait_seconds.
+Past either bound the turn is rejected with AdmissionRejectedError, which the
+API returns as 503 with a Retry-After estimated from recent turn durations.
+Under overload, admitted turns keep their normal latency and the excess
+load is shed early, so throughput does not collapse.
+
+The controller is process-level (SessionService is rebuilt per request).
+"""
+
+import asyncio
+import math
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Optional
+
+import structlog
+
+from src.core.config import settings
+from src.core.exceptions import AdmissionRejectedError
+
+log = structlog.get_logger(__name__)
+
+# Smoothing for the wait-time and turn-duration averages
+_EWMA_ALPHA = 0.2
+
+
+@dataclass
+class AdmissionTicket:
+    """An admitted turn; pass back to release() when the turn finishes."""
+
+    session_id: str
+    wait_ms: float
+    admitted_at: float
+
+
+@dataclass
+class _SessionGate:
+    lock: asyncio.Lock
+    users: int = 0  # Holders plus waiters; the gate is dropped at zero
+
+
+class AdmissionController:
+    """Global in-flight limit, per-session single flight, bounded wait queue."""
+
+    def __init__(
+        self,
+        max_in_flight: int,
+        max_queued: int,
+        max_wait_s: float,
+    ):
+        self.max_in_flight = max_in_flight
+        self.max_queued = max_queued
+        self.max_wait_s = max_wait_s
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._sessions: Dict[str, _SessionGate] = {}
+        self.in_flight = 0
+        self.queued = 0
+        self.admitted_total = 0
+        self.rejected_total = 0
+        self.avg_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+        self.avg_turn_ms: Optional[float] = None
+
+    @asynccontextmanager
+    async def admit(self, session_id: str) -> AsyncIterator[AdmissionTicket]:
+        """Hold a turn slot for the duration of the block."""
+        ticket = await self.acquire(session_id)
+        try:
+            yield ticket
+        finally:
+            self.release(ticket)
+
+    def check_capacity(self, session_id: Optional[str] = None) -> None:
+        """Reject immediately if the turn would have to wait and the queue is full.
+
+        Raises:
+            AdmissionRejectedError: If no more requests may queue
+        """
+        gate = self._sessions.get(session_id) if session_id else None
+        must_wait = self._slots.locked() or (gate is not None and gate.lock.locked())
+        if must_wait and self.queued >= self.max_queued:
+            self._reject("queue_full", session_id=session_id)
+
+    async def acquire(self, session_id: str) -> AdmissionTicket:
+        """Wait for the session's lock and a global slot.
+
+        Raises:
+            AdmissionRejectedError: If the queue is full or the wait times out
+        """
+        self.check_capacity(session_id)
+
+        start = time.monotonic()
+        gate = self._sessions.setdefault(session_id, _SessionGate(asyncio.Lock()))
+        gate.users += 1
+        self.queued += 1
+        try:
+            async with asyncio.timeout(self.max_wait_s):
+                await gate.lock.acquire()
+                try:
+                    await self._slots.acquire()
+                except BaseException:
+                    gate.lock.release()
+                    raise
+        except TimeoutError:
+            self._leave(session_id, gate)
+            self._reject("wait_timeout", session_id=session_id)
+        except BaseException:
+            self._leave(session_id, gate)
+            raise
+        finally:
+            self.queued -= 1
+
+        wait_ms = (time.monotonic() - start) * 1000
+        self.in_flight += 1
+        self.admitted_total += 1
+        self.avg_wait_ms += _EWMA_ALPHA * (wait_ms - self.avg_wait_ms)
+        self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+
+        if wait_ms >= 1:
+            log.info(
+                "turn_admitted_after_wait",
+                session_id=session_id,
+                wait_ms=round(wait_ms, 1),
+                in_flight=self.in_flight,
+                queued=self.queued,
+            )
+        return AdmissionTicket(session_id=session_id, wait_ms=wait_ms, admitted_at=time.monotonic())
+
+    def release(self, ticket: AdmissionTicket) -> None:
+        """Free the ticket's slot and session lock."""
+        turn_ms = (time.monotonic() - ticket.admitted_at) * 1000
+        self.avg_turn_ms = (
+            turn_ms
+            if self.avg_turn_ms is None
+            else self.avg_turn_ms + _EWMA_ALPHA * (turn_ms - self.avg_turn_ms)
+        )
+        self.in_flight -= 1
+        self._slots.release()
+
+        gate = self._sessions[ticket.session_id]
+        gate.lock.release()
+        self._leave(ticket.session_id, gate)
+
+    def retry_after_s(self) -> int:
+        """Estimate when a rejected client could be admitted."""
+        avg_turn_s = (self.avg_turn_ms or 1000.0) / 1000
+        backlog = self.queued + self.in_flight
+        return max(1, math.ceil(avg_turn_s * backlog / self.max_in_flight))
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue length, wait times and counters for monitoring."""
+        return {
+            "in_flight": self.in_flight,
+            "queued": self.queued,
+            "max_in_flight": self.max_in_flight,
+            "max_queued": self.max_queued,
+            "admitted_total": self.admitted_total,
+            "rejected_total": self.rejected_total,
+            "avg_wait_ms": round(self.avg_wait_ms, 2),
+            "max_wait_ms": round(self.max_wait_ms, 2),
+            "avg_turn_ms": (round(self.avg_turn_ms, 2) if self.avg_turn_ms is not None else None),
+        }
+
+    def _leave(self, session_id: str, gate: _SessionGate) -> None:
+        gate.users -= 1
+        if gate.users == 0 and self._sessions.get(session_id) is gate:
+            del self._sessions[session_id]
+
+    def _reject(self, reason: str, session_id: Optional[str] = None) -> None:
+        self.rejected_total += 1
+        retry_after = self.retry_after_s()
+        log.warning(
+            "turn_rejected",
+            reason=reason,
+            session_id=session_id,
+            in_flight=self.in_flight,
+            queued=self.queued,
+            retry_after_s=retry_after,
+        )
+        raise AdmissionRejectedError(
+            f"Server at capacity ({reason}); retry in {retry_after}s",
+            retry_after_s=retry_after,
+        )
+
+
+_controller: Optional[AdmissionController] = None
+
+
+def get_admission_controller() -> AdmissionController:
+    """Return the process-wide controller configured from settings."""
+    global _controller
+    if _controller is None:
+        _controller = AdmissionController(
+            max_in_flight=settings.max_concurrent_turns,
+            max_queued=settings.max_queued_turns,
+            max_wait_s=settings.admission_max_wait_seconds,
+        )
+    return _controller
@@ -2,6 +2,7 @@
 Canonical slot discovery service for dual-graph architecture.
 
 Abstracts surface-level KGNodes into stable canonical slots via:
+- Embedding fast path assigning near-exact paraphrases to existing active slots
 - LLM-proposed slot groupings with granular, specific categories (batched per turn)
 - Embedding similarity for merging near-duplicates and grammatical variants
 - Candidate promotion based on support_count thresholds
@@ -11,8 +12,11 @@ Preserves node_type for methodology-aware slot discovery and edge aggregation.
 
 import asyncio
 import json
-from typing import List, Dict
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, List, Dict, Optional, Tuple
 
+import numpy as np
 import structlog
 
 from src.core.config import interview_config
@@ -25,10 +29,142 @@ from src.services.embedding_service import EmbeddingService
 
 log = structlog.get_logger(__name__)
 
-# Max surface nodes to process in a single LLM call to avoid timeouts
-# Remaining nodes will be processed in subsequent turns
+# Max surface nodes in a single LLM call to avoid timeouts; larger turns are
+# split into shards of at most this size
 MAX_SLOT_DISCOVERY_BATCH_SIZE = 8
 
+# Max slot-discovery LLM calls in flight at once for one discovery run
+MAX_CONCURRENT_SLOT_DISCOVERY_CALLS = 3
+
+# Slot discovery attempts after which a queued surface node is dropped rather
+# than retried on every later turn
+MAX_SLOT_DISCOVERY_ATTEMPTS = 3
+
+
+@dataclass
+class SlotDiscoveryStats:
+    """Per-session slot discovery counters for the embedding fast path.
+
+    Attributes:
+        nodes_seen: Surface nodes submitted to slot discovery
+        fast_path_hits: Surface nodes assigned by embedding similarity alone
+        llm_calls: Slot-discovery LLM calls made
+        llm_calls_saved: Turns whose LLM call was skipped entirely
+    """
+
+    nodes_seen: int = 0
+    fast_path_hits: int = 0
+    llm_calls: int = 0
+    llm_calls_saved: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of surface nodes resolved without the LLM."""
+        return self.fast_path_hits / self.nodes_seen if self.nodes_seen else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialize for session metadata."""
+        return {
+            "nodes_seen": self.nodes_seen,
+            "fast_path_hits": self.fast_path_hits,
+            "hit_rate": round(self.hit_rate, 4),
+            "llm_calls": self.llm_calls,
+            "llm_calls_saved": self.llm_calls_saved,
+        }
+
+
+# Process-level counters: session_id -> SlotDiscoveryStats
+# (CanonicalSlotService itself is rebuilt per request)
+_session_stats: Dict[str, SlotDiscoveryStats] = {}
+
+
+def get_slot_discovery_stats(session_id: str) -> Optional[SlotDiscoveryStats]:
+    """Return the slot discovery counters for a session, if any were recorded."""
+    return _session_stats.get(session_id)
+
+
+# (session_id, node_type) -> lock serializing find-or-create, so concurrent
+# discovery runs cannot both create the same slot
+_slot_locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+
+
+def _slot_lock(session_id: str, node_type: str) -> asyncio.Lock:
+    return _slot_locks.setdefault((session_id, node_type), asyncio.Lock())
+
+
+def forget_session(session_id: str) -> None:
+    """Drop a session's counters and slot locks (e.g. when the session ends)."""
+    _session_stats.pop(session_id, None)
+    for key in [key for key in _slot_locks if key[0] == session_id]:
+        del _slot_locks[key]
+
+
+# Max words kept in the process-level lemma cache; least recently used words
+# are evicted first
+MAX_LEMMA_CACHE_SIZE = 10_000
+
+# Process-level lemma cache: word -> lowercase lemma (spaCy model is fixed)
+_lemma_cache: "OrderedDict[str, str]" = OrderedDict()
+
+
+class _SlotIndex:
+    """In-memory embedding matrix over one node_type's active and candidate slots.
+
+    Built once per discovery run and extended as new candidate slots are
+    created, so each proposal is matched with a single matrix-vector product
+    instead of re-reading and re-scoring every slot from the database.
+    """
+
+    def __init__(self, slots: List[CanonicalSlot]):
+        self.slots: List[CanonicalSlot] = []
+        self._rows: List[np.ndarray] = []
+        self._matrix: Optional[np.ndarray] = None
+        for slot in slots:
+            if slot.embedding:
+                self.add(slot, np.frombuffer(slot.embedding, dtype=np.float32))
+
+    def add(self, slot: CanonicalSlot, embedding: np.ndarray) -> None:
+        self.slots.append(slot)
+        self._rows.append(embedding / (np.linalg.norm(embedding) + 1e-8))
+        self._matrix = None
+
+    def best_match(
+        self, embedding: np.ndarray, threshold: float
+    ) -> Optional[Tuple[CanonicalSlot, float]]:
+        """Return the most similar slot at or above threshold, if any."""
+        if not self.slots:
+            return None
+        if self._matrix is None:
+            self._matrix = np.stack(self._rows)
+        query = embedding / (np.linalg.norm(embedding) + 1e-8)
+        similarities = self._matrix @ query
+        best = int(similarities.argmax())
+        similarity = float(similarities[best])
+        if similarity < threshold:
+            return None
+        return self.slots[best], similarity
+
+
+def _shard_groups(groups: Dict[str, List[KGNode]]) -> List[Dict[str, List[KGNode]]]:
+    """Split node groups into LLM-call-sized shards.
+
+    Everything fits in one shard when the total is within
+    MAX_SLOT_DISCOVERY_BATCH_SIZE. Otherwise each node_type gets its own
+    shards of at most that size. Shard order is deterministic (node_type,
+    then input order) so proposals merge in a stable order.
+    """
+    if sum(len(nodes) for nodes in groups.values()) <= MAX_SLOT_DISCOVERY_BATCH_SIZE:
+        return [groups]
+
+    shards: List[Dict[str, List[KGNode]]] = []
+    for node_type in sorted(groups):
+        nodes = groups[node_type]
+        for start in range(0, len(nodes), MAX_SLOT_DISCOVERY_BATCH_SIZE):
+            shards.append(
+                {node_type: nodes[start : start + MAX_SLOT_DISCOVERY_BATCH_SIZE]}
+            )
+    return shards
+
 
 class CanonicalSlotService:
     """LLM-based canonical slot discovery for dual-graph architecture.
@@ -69,11 +205,19 @@ class CanonicalSlotService:
         turn_number: int,
         methodology: str,
     ) -> List[CanonicalSlot]:
-        """Discover canonical slots via a single batched LLM call across all node types.
+        """Discover canonical slots via batched LLM calls across all node types.
 
-        Groups surface nodes by node_type, fetches existing slots per type in
-        parallel, then issues ONE LLM call covering all types. Proposals are
-        processed per type via embedding similarity matching.
+        Adds surface nodes left in the session's slot discovery queue, groups
+        nodes by node_type and fetches existing active slots per type in
+        parallel. Nodes that are near-exact paraphrases of an active slot are
+        mapped directly (embedding fast path). The remainder goes into ONE LLM
+        call covering all types, or, above MAX_SLOT_DISCOVERY_BATCH_SIZE, into
+        per-type shards issued concurrently (at most
+        MAX_CONCURRENT_SLOT_DISCOVERY_CALLS at once). Proposals are merged in
+        shard order and processed via embedding similarity matching.
+
+        Nodes of a shard whose LLM call fails are queued for the next run; the
+        error is raised only if every shard failed.
 
         Args:
             session_id: Session identifier for slot scoping
@@ -87,6 +231,21 @@ class CanonicalSlotService:
         Raises:
             ValueError: If any surface node has empty or missing node_type
         """
+        # Retry nodes left over from earlier runs
+        pending = await self.slot_repo.get_pending_nodes(session_id)
+        pending_ids = [n.id for n in pending]
+        if pending:
+            new_ids = {n.id for n in surface_nodes}
+            surface_nodes = list(surface_nodes) + [
+                n for n in pending if n.id not in new_ids
+            ]
+            log.info(
+                "slot_discovery_queue_drained",
+                session_id=session_id,
+                turn=turn_number,
+                pending=len(pending),
+            )
+
         if not surface_nodes:
             return []
 
@@ -97,63 +256,143 @@ class CanonicalSlotService:
                 raise ValueError(f"Surface node {node.id} has empty node_type")
             groups.setdefault(node.node_type, []).append(node)
 
-        # Limit batch size to avoid LLM timeouts - process remaining nodes in subsequent turns
-        total_nodes = sum(len(nodes) for nodes in groups.values())
-        if total_nodes > MAX_SLOT_DISCOVERY_BATCH_SIZE:
-            log.warning(
-                "slot_discovery_batch_limited",
-                total_nodes=total_nodes,
-                batch_size=MAX_SLOT_DISCOVERY_BATCH_SIZE,
+        stats = _session_stats.setdefault(session_id, SlotDiscoveryStats())
+        stats.nodes_seen += len(surface_nodes)
+
+        # Fetch existing active slots per type concurrently (cheap DB queries)
+        node_types = list(groups.keys())
+        slot_lists = await asyncio.gather(
+            *[self.slot_repo.get_active_slots(session_id, nt) for nt in node_types]
+        )
+        active_slots_per_type = dict(zip(node_types, slot_lists))
+
+        # Embedding fast path: only unmatched nodes need the LLM
+        all_slots, groups = await self._assign_by_similarity(
+            groups, active_slots_per_type, turn_number
+        )
+        fast_path_hits = len(surface_nodes) - sum(len(ns) for ns in groups.values())
+        stats.fast_path_hits += fast_path_hits
+
+        if not groups:
+            stats.llm_calls_saved += 1
+            await self.slot_repo.remove_pending_nodes(pending_ids)
+            log.info(
+                "slot_discovery_llm_skipped",
                 session_id=session_id,
                 turn=turn_number,
+                fast_path_hits=fast_path_hits,
+                session_hit_rate=round(stats.hit_rate, 3),
+                session_llm_calls_saved=stats.llm_calls_saved,
             )
-            # Flatten, truncate, and regroup
-            all_nodes = [node for nodes in groups.values() for node in nodes][
-                :MAX_SLOT_DISCOVERY_BATCH_SIZE
-            ]
-            groups = {}
-            for node in all_nodes:
-                groups.setdefault(node.node_type, []).append(node)
+            return all_slots
 
         # Load schema once for all types
         schema = load_methodology(methodology)
         node_descriptions = schema.get_node_descriptions()
 
-        # Fetch existing active slots per type concurrently (cheap DB queries)
-        node_types = list(groups.keys())
-        slot_lists = await asyncio.gather(
-            *[self.slot_repo.get_active_slots(session_id, nt) for nt in node_types]
-        )
-        existing_slots_per_type = {
-            nt: [s.slot_name for s in slots]
-            for nt, slots in zip(node_types, slot_lists)
-        }
+        # One LLM call per shard, bounded concurrency
+        shards = _shard_groups(groups)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SLOT_DISCOVERY_CALLS)
+
+        async def propose(shard: Dict[str, List[KGNode]]) -> Dict[str, List[Dict]]:
+            existing_slots_per_type = {
+                nt: [s.slot_name for s in active_slots_per_type[nt]] for nt in shard
+            }
+            async with semaphore:
+                return await self._llm_propose_slots_batched(
+                    shard, node_descriptions, existing_slots_per_type
+                )
 
-        # Single batched LLM call for all node types
-        proposals_per_type = await self._llm_propose_slots_batched(
-            groups, node_descriptions, existing_slots_per_type
+        shard_results = await asyncio.gather(
+            *[propose(shard) for shard in shards], return_exceptions=True
         )
+        stats.llm_calls += len(shards)
 
-        # Find or create slots for each type's proposals
-        all_slots: List[CanonicalSlot] = []
-        for node_type, proposals in proposals_per_type.items():
-            valid_node_ids = {n.id for n in groups.get(node_type, [])}
-            for proposal in proposals:
-                # Guard against LLM returning IDs from other types
-                surface_ids = [
-                    nid for nid in proposal["surface_node_ids"] if nid in valid_node_ids
-                ]
-                if not surface_ids:
-                    continue
-                slot = await self._find_or_create_slot(
+        if len(shards) > 1:
+            log.info(
+                "slot_discovery_sharded",
+                session_id=session_id,
+                turn=turn_number,
+                total_nodes=sum(len(nodes) for nodes in groups.values()),
+                shards=len(shards),
+            )
+
+        # Queue nodes of failed shards; fail the turn only if nothing succeeded
+        failed_nodes = [
+            node
+            for shard, result in zip(shards, shard_results)
+            if isinstance(result, BaseException)
+            for nodes in shard.values()
+            for node in nodes
+        ]
+        for result in shard_results:
+            if isinstance(result, BaseException):
+                log.error(
+                    "slot_discovery_shard_failed",
                     session_id=session_id,
-                    node_type=node_type,
-                    proposed_name=proposal["slot_name"],
-                    description=proposal["description"],
-                    surface_node_ids=surface_ids,
-                    turn_number=turn_number,
+                    turn=turn_number,
+                    error=str(result),
+                    error_type=type(result).__name__,
                 )
-                all_slots.append(slot)
+        await self.slot_repo.enqueue_pending_nodes(
+            session_id, failed_nodes, turn_number
+        )
+        if failed_nodes:
+            await self.slot_repo.drop_exhausted_pending_nodes(
+                session_id, MAX_SLOT_DISCOVERY_ATTEMPTS
+            )
+        failed_ids = {n.id for n in failed_nodes}
+        await self.slot_repo.remove_pending_nodes(
+            [nid for nid in pending_ids if nid not in failed_ids]
+        )
+        if all(isinstance(r, BaseException) for r in shard_results):
+            raise shard_results[0]
+
+        # Collect valid proposals in shard order
+        resolved: List[Tuple[str, Dict, List[str]]] = []
+        for shard, proposals_per_type in zip(shards, shard_results):
+            if isinstance(proposals_per_type, BaseException):
+                continue
+            for node_type, proposals in proposals_per_type.items():
+                valid_node_ids = {n.id for n in shard.get(node_type, [])}
+                for proposal in proposals:
+                    # Guard against LLM returning IDs from other types/shards
+                    surface_ids = [
+                        nid
+                        for nid in proposal["surface_node_ids"]
+                        if nid in valid_node_ids
+                    ]
+                    if surface_ids:
+                        resolved.append((node_type, proposal, surface_ids))
+
+        # Lemmatize and embed all proposals in one batch each
+        lemmatized_names = self._lemmatize_names(
+            [proposal["slot_name"] for _, proposal, _ in resolved]
+        )
+        embeddings = await self.embedding_service.encode_batch(
+            [
+                f"{name} :: {proposal['description']}"
+                for name, (_, proposal, _) in zip(lemmatized_names, resolved)
+            ]
+        )
+
+        # Find or create slots, matching against per-type in-memory indexes
+        slot_indexes: Dict[str, _SlotIndex] = {}
+        for (node_type, proposal, surface_ids), name, embedding in zip(
+            resolved, lemmatized_names, embeddings
+        ):
+            slot = await self._find_or_create_slot(
+                session_id=session_id,
+                node_type=node_type,
+                proposed_name=proposal["slot_name"],
+                description=proposal["description"],
+                surface_node_ids=surface_ids,
+                turn_number=turn_number,
+                lemmatized_name=name,
+                embedding=embedding,
+                slot_indexes=slot_indexes,
+            )
+            all_slots.append(slot)
 
         log.info(
             "slots_discovered",
@@ -161,10 +400,98 @@ class CanonicalSlotService:
             turn=turn_number,
             total_slots=len(all_slots),
             per_type={nt: len(ns) for nt, ns in groups.items()},
+            fast_path_hits=fast_path_hits,
+            session_hit_rate=round(stats.hit_rate, 3),
         )
 
         return all_slots
 
+    async def _assign_by_similarity(
+        self,
+        groups: Dict[str, List[KGNode]],
+        active_slots_per_type: Dict[str, List[CanonicalSlot]],
+        turn_number: int,
+    ) -> Tuple[List[CanonicalSlot], Dict[str, List[KGNode]]]:
+        """Map surface nodes that closely match an active slot, without the LLM.
+
+        Embeds all candidate labels in one batch and compares them against the
+        embeddings of active slots of the same node_type in one matrix product
+        per type. Nodes at or above the type's fast-path threshold are mapped
+        to their best slot.
+
+        Args:
+            groups: Map of node_type → surface nodes to resolve
+            active_slots_per_type: Map of node_type → active slots
+            turn_number: Current turn number for mapping provenance
+
+        Returns:
+            Tuple of (slots that received mappings, remaining nodes per type)
+        """
+        dedup = interview_config.deduplication
+        slot_matrices: Dict[str, Tuple[List[CanonicalSlot], np.ndarray]] = {}
+        for node_type in groups:
+            slots = [s for s in active_slots_per_type.get(node_type, []) if s.embedding]
+            if slots:
+                matrix = np.stack(
+                    [np.frombuffer(s.embedding, dtype=np.float32) for s in slots]
+                )
+                norms = np.linalg.norm(matrix, axis=1, keepdims=True) + 1e-8
+                slot_matrices[node_type] = (slots, matrix / norms)
+
+        if not slot_matrices:
+            return [], groups
+
+        candidates = [n for nt in slot_matrices for n in groups[nt]]
+        embeddings = await self.embedding_service.encode_batch(
+            [n.label for n in candidates]
+        )
+        embedding_by_node = {n.id: e for n, e in zip(candidates, embeddings)}
+
+        matched: Dict[str, CanonicalSlot] = {}
+        remaining: Dict[str, List[KGNode]] = {}
+        for node_type, nodes in groups.items():
+            if node_type not in slot_matrices:
+                remaining[node_type] = nodes
+                continue
+
+            slots, matrix = slot_matrices[node_type]
+            threshold = dedup.slot_fast_path_thresholds.get(
+                node_type, dedup.slot_fast_path_threshold
+            )
+            queries = np.stack([embedding_by_node[n.id] for n in nodes])
+            queries = queries / (np.linalg.norm(queries, axis=1, keepdims=True) + 1e-8)
+            similarities = queries @ matrix.T
+            best = similarities.argmax(axis=1)
+
+            for row, node in enumerate(nodes):
+                similarity = float(similarities[row, best[row]])
+                if similarity < threshold:
+                    remaining.setdefault(node_type, []).append(node)
+                    continue
+
+                slot = slots[best[row]]
+                await self.slot_repo.map_surface_to_slot(
+                    surface_node_id=node.id,
+                    slot_id=slot.id,
+                    similarity_score=similarity,
+                    assigned_turn=turn_number,
+                )
+                matched[slot.id] = slot
+                log.debug(
+                    "canonical_slot_discovery",
+                    surface_label=node.label,
+                    matched_slot=slot.slot_name,
+                    similarity=round(similarity, 4),
+                    threshold=threshold,
+                    outcome="fast_path",
+                )
+
+        # Re-read matched slots for updated support_count (already active)
+        refreshed = await asyncio.gather(
+            *[self.slot_repo.get_slot(slot_id) for slot_id in matched]
+        )
+        return [s for s in refreshed if s is not None], remaining
+
     async def _llm_propose_slots_batched(
         self,
         groups: Dict[str, List[KGNode]],
@@ -327,10 +654,31 @@ class CanonicalSlotService:
 
         Bead: 00cw (reduce canonical slot fragmentation)
         """
-        nlp = self.embedding_service.nlp
-        words = name.split("_")
-        lemmas = [nlp(word)[0].lemma_.lower() for word in words]
-        return "_".join(lemmas)
+        return self._lemmatize_names([name])[0]
+
+    def _lemmatize_names(self, names: List[str]) -> List[str]:
+        """Lemmatize several slot names with one spaCy nlp.pipe call.
+
+        Words are lemmatized independently (see _lemmatize_name) and kept in a
+        process-wide LRU cache of MAX_LEMMA_CACHE_SIZE words, so only words not
+        seen recently reach spaCy.
+        """
+        split_names = [name.split("_") for name in names]
+        lemmas: Dict[str, str] = {}
+        misses = []
+        for word in dict.fromkeys(word for words in split_names for word in words):
+            if word in _lemma_cache:
+                _lemma_cache.move_to_end(word)
+                lemmas[word] = _lemma_cache[word]
+            else:
+                misses.append(word)
+        if misses:
+            for word, doc in zip(misses, self.embedding_service.nlp.pipe(misses)):
+                lemmas[word] = _lemma_cache[word] = doc[0].lemma_.lower() if len(doc) else word
+            while len(_lemma_cache) > MAX_LEMMA_CACHE_SIZE:
+                _lemma_cache.popitem(last=False)
+
+        return ["_".join(lemmas[w] for w in words) for words in split_names]
 
     async def _find_or_create_slot(
         self,
@@ -340,14 +688,50 @@ class CanonicalSlotService:
         description: str,
         surface_node_ids: List[str],
         turn_number: int,
+        lemmatized_name: Optional[str] = None,
+        embedding: Optional[np.ndarray] = None,
+        slot_indexes: Optional[Dict[str, _SlotIndex]] = None,
+    ) -> CanonicalSlot:
+        """Find or create a slot while holding the (session, node_type) lock.
+
+        The exact-match check and create_slot are not atomic in the database,
+        so concurrent discovery runs for the same session and node_type are
+        serialized here. See _find_or_create_slot_unlocked for the resolution
+        pipeline.
+        """
+        async with _slot_lock(session_id, node_type):
+            return await self._find_or_create_slot_unlocked(
+                session_id=session_id,
+                node_type=node_type,
+                proposed_name=proposed_name,
+                description=description,
+                surface_node_ids=surface_node_ids,
+                turn_number=turn_number,
+                lemmatized_name=lemmatized_name,
+                embedding=embedding,
+                slot_indexes=slot_indexes,
+            )
+
+    async def _find_or_create_slot_unlocked(
+        self,
+        session_id: str,
+        node_type: str,
+        proposed_name: str,
+        description: str,
+        surface_node_ids: List[str],
+        turn_number: int,
+        lemmatized_name: Optional[str] = None,
+        embedding: Optional[np.ndarray] = None,
+        slot_indexes: Optional[Dict[str, _SlotIndex]] = None,
     ) -> CanonicalSlot:
         """Find existing similar slot or create new candidate via embedding similarity.
 
         Resolution pipeline:
         1. Lemmatize proposed_name to normalize grammatical variants (reduce/reduced)
         2. Check for exact lemmatized match to prevent UNIQUE violations
-        3. If no exact match, search by embedding similarity (active + candidate)
-        4. Merge into best match or create new candidate
+        3. If no exact match, search the node_type's in-memory slot index
+           (active + candidate) by embedding similarity
+        4. Merge into best match or create new candidate (added to the index)
         5. Map all surface nodes to resulting slot
         6. Promote to active if support_count >= canonical_min_support_nodes
 
@@ -358,13 +742,17 @@ class CanonicalSlotService:
             description: LLM-proposed slot description
             surface_node_ids: Surface node IDs to map to this slot
             turn_number: Current turn number for promotion tracking
+            lemmatized_name: Precomputed lemmatized proposed_name (batched by caller)
+            embedding: Precomputed "name :: description" embedding (batched by caller)
+            slot_indexes: Per-node_type slot indexes shared across one discovery run;
+                loaded from the repository on first use for a node_type
 
         Returns:
             Matched existing CanonicalSlot or newly created slot (may be promoted)
         """
         # Lemmatize to normalize grammatical variants
         original_proposed_name = proposed_name
-        proposed_name = self._lemmatize_name(proposed_name)
+        proposed_name = lemmatized_name or self._lemmatize_name(proposed_name)
 
         # Check for exact match first to prevent duplicates
         existing_slot = await self.slot_repo.find_slot_by_name_and_type(
@@ -426,26 +814,27 @@ class CanonicalSlotService:
 
         # No exact match - proceed with similarity search
         # Embed name + description for richer semantic signal (gjb5)
-        embedding = await self.embedding_service.encode(
-            f"{proposed_name} :: {description}"
-        )
+        if embedding is None:
+            embedding = await self.embedding_service.encode(
+                f"{proposed_name} :: {description}"
+            )
 
-        # Find similar existing slots (both statuses)
-        active_matches = await self.slot_repo.find_similar_slots(
-            session_id, node_type, embedding, status="active"
-        )
-        candidate_matches = await self.slot_repo.find_similar_slots(
-            session_id, node_type, embedding, status="candidate"
+        # Match against existing slots (both statuses) in memory
+        if slot_indexes is None:
+            slot_indexes = {}
+        slot_index = slot_indexes.get(node_type)
+        if slot_index is None:
+            slot_index = _SlotIndex(
+                await self.slot_repo.get_matchable_slots(session_id, node_type)
+            )
+            slot_indexes[node_type] = slot_index
+        best_match = slot_index.best_match(
+            embedding, interview_config.deduplication.canonical_similarity_threshold
         )
 
-        # Combine and sort descending by similarity
-        all_matches = active_matches + candidate_matches
-        all_matches.sort(key=lambda x: x[1], reverse=True)
-
-        if all_matches:
+        if best_match is not None:
             # Merge into best match
-            best_slot, best_similarity = all_matches[0]
-            slot = best_slot
+            slot, best_similarity = best_match
 
             # Map each surface node to this slot
             for node_id in surface_node_ids:
@@ -483,6 +872,7 @@ class CanonicalSlotService:
                 first_seen_turn=turn_number,
                 embedding=embedding,
             )
+            slot_index.add(slot, embedding)
 
             # Map surface nodes to the new slot
             for node_id in surface_node_ids:
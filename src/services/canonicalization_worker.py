@@ -0,0 +1,241 @@
+"""
+Background canonicalization worker for dual-graph architecture.
+
+In background canonicalization mode (settings.canonicalization_mode =
+"background"), SlotDiscoveryStage hands each turn's new surface nodes and
+edges to a per-session worker instead of running slot discovery inline.
+The worker processes jobs in turn order and publishes a CanonicalSnapshot
+after each one; StateComputationStage reads the latest completed snapshot,
+tagged with the turn it reflects. This takes the slot-discovery LLM
+round-trip off the response path at the cost of canonical signals lagging
+by up to one turn.
+
+Workers are process-level (SessionService is rebuilt per request) and keyed
+by session_id.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+import structlog
+
+from src.domain.models.canonical_graph import CanonicalGraphState
+from src.domain.models.knowledge_graph import KGNode
+
+if TYPE_CHECKING:
+    from src.services.canonical_graph_service import CanonicalGraphService
+    from src.services.canonical_slot_service import CanonicalSlotService
+    from src.services.graph_service import GraphService
+
+log = structlog.get_logger(__name__)
+
+
+@dataclass
+class CanonicalizationJob:
+    """Surface graph changes from one turn awaiting canonicalization."""
+
+    turn_number: int
+    methodology: str
+    surface_nodes: List[KGNode] = field(default_factory=list)
+    surface_edges: List[Dict[str, Any]] = field(default_factory=list)
+
+
+@dataclass
+class CanonicalSnapshot:
+    """Canonical graph state after canonicalizing up to turn_number."""
+
+    turn_number: int
+    state: CanonicalGraphState
+    completed_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class CanonicalizationWorker:
+    """Per-session worker running slot discovery and edge aggregation off-path.
+
+    Jobs are processed strictly in submission order by a single task, so
+    edge aggregation for a turn always sees that turn's slot mappings.
+    A failed job is logged and its surface nodes that are still unmapped
+    are put on the slot discovery queue, which the next job drains.
+    """
+
+    def __init__(
+        self,
+        session_id: str,
+        slot_service: "CanonicalSlotService",
+        canonical_graph_service: "CanonicalGraphService",
+        graph_service: Optional["GraphService"] = None,
+    ):
+        self.session_id = session_id
+        self.slot_service = slot_service
+        self.canonical_graph_service = canonical_graph_service
+        self.graph_service = graph_service
+        self.latest_snapshot: Optional[CanonicalSnapshot] = None
+        self._queue: asyncio.Queue[CanonicalizationJob] = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+
+    def submit(self, job: CanonicalizationJob) -> None:
+        """Queue a job, starting the worker task if it is not running."""
+        self._queue.put_nowait(job)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+        log.debug(
+            "canonicalization_job_submitted",
+            session_id=self.session_id,
+            turn=job.turn_number,
+            nodes=len(job.surface_nodes),
+            edges=len(job.surface_edges),
+            queued=self._queue.qsize(),
+        )
+
+    async def drain(self) -> None:
+        """Wait until every submitted job has been processed."""
+        await self._queue.join()
+
+    async def close(self) -> None:
+        """Stop the worker task; unprocessed jobs are dropped."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._process(job)
+            except Exception as e:
+                log.error(
+                    "canonicalization_job_failed",
+                    session_id=self.session_id,
+                    turn=job.turn_number,
+                    error=str(e),
+                    error_type=type(e).__name__,
+                    exc_info=True,
+                )
+                try:
+                    await self._requeue_unmapped(job)
+                except Exception as enqueue_error:
+                    log.error(
+                        "canonicalization_requeue_failed",
+                        session_id=self.session_id,
+                        turn=job.turn_number,
+                        error=str(enqueue_error),
+                    )
+            finally:
+                self._queue.task_done()
+
+    async def _requeue_unmapped(self, job: CanonicalizationJob) -> None:
+        """Queue the job's nodes that a failed run left without a slot.
+
+        Nodes mapped before the failure (embedding fast path, successful
+        shards, or a failure in the canonical graph update) are not retried,
+        and nodes discover_slots_for_nodes already queued (failed shards)
+        are not queued a second time.
+        """
+        slot_repo = self.slot_service.slot_repo
+        mapped = await slot_repo.get_mapped_node_ids([n.id for n in job.surface_nodes])
+        pending = {n.id for n in await slot_repo.get_pending_nodes(self.session_id)}
+        unmapped = [n for n in job.surface_nodes if n.id not in mapped and n.id not in pending]
+        if unmapped:
+            await slot_repo.enqueue_pending_nodes(self.session_id, unmapped, job.turn_number)
+        log.info(
+            "canonicalization_nodes_requeued",
+            session_id=self.session_id,
+            turn=job.turn_number,
+            requeued=len(unmapped),
+            already_mapped=len(mapped),
+        )
+
+    async def _process(self, job: CanonicalizationJob) -> None:
+        start = asyncio.get_running_loop().time()
+
+        slots = await self.slot_service.discover_slots_for_nodes(
+            session_id=self.session_id,
+            surface_nodes=job.surface_nodes,
+            turn_number=job.turn_number,
+            methodology=job.methodology,
+        )
+
+        canonical_edges_created = 0
+        if self.graph_service is not None and job.surface_edges:
+            canonical_edges = await self.graph_service.aggregate_surface_edges_to_canonical(
+                session_id=self.session_id,
+                surface_edges=job.surface_edges,
+                turn_number=job.turn_number,
+            )
+            canonical_edges_created = len(canonical_edges)
+
+        state = await self.canonical_graph_service.compute_canonical_state(self.session_id)
+        self.latest_snapshot = CanonicalSnapshot(turn_number=job.turn_number, state=state)
+
+        log.info(
+            "canonicalization_job_complete",
+            session_id=self.session_id,
+            turn=job.turn_number,
+            slots=len(slots),
+            canonical_edges_created=canonical_edges_created,
+            concept_count=state.concept_count,
+            duration_ms=round((asyncio.get_running_loop().time() - start) * 1000, 2),
+        )
+
+
+# Process-level registry: session_id -> worker
+_workers: Dict[str, CanonicalizationWorker] = {}
+
+
+def get_canonicalization_worker(
+    session_id: str,
+    slot_service: "CanonicalSlotService",
+    canonical_graph_service: "CanonicalGraphService",
+    graph_service: Optional["GraphService"] = None,
+) -> CanonicalizationWorker:
+    """Return the session's worker, creating it with the given services if needed."""
+    worker = _workers.get(session_id)
+    if worker is None:
+        worker = CanonicalizationWorker(
+            session_id, slot_service, canonical_graph_service, graph_service
+        )
+        _workers[session_id] = worker
+    return worker
+
+
+def get_latest_canonical_snapshot(session_id: str) -> Optional[CanonicalSnapshot]:
+    """Return the most recent completed canonical snapshot for a session."""
+    worker = _workers.get(session_id)
+    return worker.latest_snapshot if worker is not None else None
+
+
+def canonicalization_queue_depth() -> int:
+    """Return the number of jobs waiting across all session workers."""
+    return sum(worker._queue.qsize() for worker in _workers.values())
+
+
+async def drain_canonicalization_worker(session_id: str) -> None:
+    """Wait for a session's queued jobs, if it has a worker."""
+    worker = _workers.get(session_id)
+    if worker is not None:
+        await worker.drain()
+
+
+async def close_canonicalization_worker(session_id: str) -> None:
+    """Finish a session's queued jobs, then stop and drop its worker (session end)."""
+    worker = _workers.get(session_id)
+    if worker is None:
+        return
+    await worker.drain()
+    await worker.close()
+    _workers.pop(session_id, None)
+
+
+async def shutdown_canonicalization_workers() -> None:
+    """Stop all workers (application shutdown)."""
+    workers = list(_workers.values())
+    _workers.clear()
+    for worker in workers:
+        await worker.close()
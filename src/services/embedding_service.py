@@ -8,16 +8,21 @@ into abstract canonical slots.
 Also provides spaCy model access for lemmatization in CanonicalSlotService.
 """
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import numpy as np
 import structlog
 
+from src.core.metrics import EMBEDDING_BATCH_SIZE
+from src.core.tracing import span
+
 logger = structlog.get_logger(__name__)
 
 EMBEDDING_MODEL = "all-MiniLM-L6-v2"
 SPACY_MODEL = "en_core_web_md"
 
+_batch_size = EMBEDDING_BATCH_SIZE.labels()
+
 
 class EmbeddingService:
     """Text embedding service using sentence-transformers and spaCy for lemmatization.
@@ -115,7 +120,9 @@ class EmbeddingService:
             logger.debug("embedding_cache_hit", text_length=len(text))
             return self._cache[text]
 
-        embedding = self.model.encode(text)
+        with span("embedding.encode_batch", batch_size=1):
+            embedding = self.model.encode(text)
+        _batch_size.observe(1)
 
         self._cache[text] = embedding
 
@@ -127,6 +134,38 @@ class EmbeddingService:
 
         return embedding
 
+    async def encode_batch(self, texts: List[str]) -> List[np.ndarray]:
+        """Encode several texts with a single model call.
+
+        Cached texts are served from the cache; only the misses (deduplicated)
+        are passed to the model, in one batch.
+
+        Args:
+            texts: Input texts to encode
+
+        Returns:
+            Embeddings in the same order as texts
+        """
+        misses = list(dict.fromkeys(t for t in texts if t not in self._cache))
+        if misses:
+            with span(
+                "embedding.encode_batch",
+                batch_size=len(misses),
+                cache_hits=len(texts) - len(misses),
+            ):
+                embeddings = self.model.encode(misses)
+            _batch_size.observe(len(misses))
+            for text, embedding in zip(misses, embeddings):
+                self._cache[text] = embedding
+
+            logger.debug(
+                "embedding_batch_computed",
+                batch_size=len(misses),
+                cache_hits=len(texts) - len(misses),
+            )
+
+        return [self._cache[t] for t in texts]
+
     def clear_cache(self) -> None:
         """Clear the embedding cache.
 
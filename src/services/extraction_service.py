@@ -21,11 +21,12 @@ Dependencies:
 """
 
 import time
-from typing import Optional, List, Dict
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 import structlog
 
 from src.llm.client import LLMClient
+from src.llm.json_stream import JSONArrayStreamParser
 from src.llm.prompts.extraction import (
     get_extraction_system_prompt,
     get_extraction_user_prompt,
@@ -43,6 +44,9 @@ from src.core.schema_loader import load_methodology
 
 log = structlog.get_logger(__name__)
 
+# Awaited with each concept as soon as it arrives in a streamed extraction
+ConceptCallback = Callable[[ExtractedConcept], Awaitable[None]]
+
 
 class ExtractionService:
     """
@@ -117,6 +121,7 @@ class ExtractionService:
         methodology: str,
         context: str = "",
         source_utterance_id: Optional[str] = None,
+        on_concept: Optional[ConceptCallback] = None,
     ) -> ExtractionResult:
         """Extract concepts and relationships from user response text.
 
@@ -133,6 +138,10 @@ class ExtractionService:
                         (e.g., "means_end_chain", "jobs_to_be_done", "critical_incident")
             context: Optional conversational context from previous turns
             source_utterance_id: Source utterance ID for provenance tracking
+            on_concept: Optional callback for incremental extraction. When set,
+                the LLM response is streamed and each valid concept is passed
+                to the callback as soon as its JSON object closes. The returned
+                ExtractionResult is still parsed from the complete response.
 
         Returns:
             ExtractionResult containing:
@@ -175,8 +184,19 @@ class ExtractionService:
         # Skipping for v2 MVP - heuristics are sufficient
 
         # Step 3: Full extraction via LLM
+        on_raw_concept = None
+        if on_concept is not None:
+
+            async def on_raw_concept(raw: Dict[str, Any]) -> None:
+                for concept in self._parse_concepts(
+                    [raw], source_utterance_id or "unknown", schema
+                ):
+                    await on_concept(concept)
+
         try:
-            extraction_data = await self._extract_via_llm(text, context, methodology)
+            extraction_data = await self._extract_via_llm(
+                text, context, methodology, on_raw_concept=on_raw_concept
+            )
         except Exception as e:
             log.error("extraction_llm_error", error=str(e), exc_info=True)
             raise ExtractionError(f"LLM extraction failed: {e}") from e
@@ -267,7 +287,13 @@ class ExtractionService:
 
         return True, None
 
-    async def _extract_via_llm(self, text: str, context: str, methodology: str) -> dict:
+    async def _extract_via_llm(
+        self,
+        text: str,
+        context: str,
+        methodology: str,
+        on_raw_concept: Optional[Callable[[Dict[str, Any]], Awaitable[None]]] = None,
+    ) -> dict:
         """Perform LLM-based extraction with methodology-specific prompts.
 
         Constructs extraction prompts using methodology schema (node types,
@@ -277,6 +303,8 @@ class ExtractionService:
             text: User response text to extract from
             context: Conversational context for implicit relationships
             methodology: Methodology name for prompt construction
+            on_raw_concept: Stream the response and await this with each raw
+                concept dict as it completes (see _stream_extraction)
 
         Returns:
             Parsed extraction data dict with:
@@ -307,26 +335,57 @@ class ExtractionService:
             has_context=bool(context),
         )
 
-        response = await self.llm.complete(
+        request = dict(
             prompt=user_prompt,
             system=system_prompt,
             temperature=0.4,  # Balanced temperature for relationship inference
             max_tokens=4000,  # Increased from 2000 to handle long responses
             response_format={"type": "json_object"},
         )
+        if on_raw_concept is None:
+            content = (await self.llm.complete(**request)).content
+        else:
+            content = await self._stream_extraction(request, on_raw_concept)
 
         try:
-            return parse_extraction_response(response.content)
+            return parse_extraction_response(content)
         except ValueError as e:
             # Log the raw response for debugging JSON parsing errors
             log.error(
                 "extraction_json_parse_failed",
                 error=str(e),
-                response_preview=response.content[:1000],
-                response_length=len(response.content),
+                response_preview=content[:1000],
+                response_length=len(content),
             )
             raise
 
+    async def _stream_extraction(
+        self,
+        request: Dict[str, Any],
+        on_raw_concept: Callable[[Dict[str, Any]], Awaitable[None]],
+    ) -> str:
+        """Stream the extraction response, handing off concepts as they close.
+
+        Args:
+            request: Keyword arguments for LLMClient.stream()
+            on_raw_concept: Awaited with each completed concept dict
+
+        Returns:
+            The complete response text, for the authoritative parse
+        """
+        parser = JSONArrayStreamParser(keys=["concepts"])
+        chunks: List[str] = []
+        streamed = 0
+
+        async for chunk in self.llm.stream(**request):
+            chunks.append(chunk)
+            for _, raw in parser.feed(chunk):
+                streamed += 1
+                await on_raw_concept(raw)
+
+        log.debug("extraction_stream_complete", streamed_concepts=streamed)
+        return "".join(chunks)
+
     def _parse_concepts(
         self,
         raw_concepts: List[dict],
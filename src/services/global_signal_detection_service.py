@@ -3,7 +3,7 @@
 Extracts global signal detection from MethodologyStrategyService for single responsibility.
 """
 
-from typing import TYPE_CHECKING, Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, Iterable
 
 import structlog
 
@@ -15,6 +15,26 @@ if TYPE_CHECKING:
 
 log = structlog.get_logger(__name__)
 
+# Last live LLM signal values per session, reused by degraded pipeline profiles
+# (process-level: services are rebuilt per request)
+_last_llm_signals: Dict[str, Dict[str, Any]] = {}
+
+
+def cached_llm_signals(session_id: str, signal_names: Iterable[str]) -> Dict[str, Any]:
+    """The session's last live LLM signals, neutral values where none were seen."""
+    from src.signals.llm.batch_detector import neutral_signal_value
+
+    cached = _last_llm_signals.get(session_id, {})
+    return {
+        name: cached[name] if name in cached else neutral_signal_value(name)
+        for name in signal_names
+    }
+
+
+def forget_llm_signals(session_id: str) -> None:
+    """Drop a session's cached LLM signals (e.g. when the session ends)."""
+    _last_llm_signals.pop(session_id, None)
+
 
 class GlobalSignalDetectionService:
     """Detects global-level signals from response text and graph state.
@@ -76,11 +96,13 @@ class GlobalSignalDetectionService:
             )
 
         # Detect global signals via methodology's signal detector
-        signal_detector = self.methodology_registry.create_signal_detector(config)
+        # (cached per methodology by the registry, reused across turns)
+        signal_detector = self.methodology_registry.get_signal_detector(config)
 
         # Set up LLM batch detector for LLM signals (response_depth, engagement, etc.)
+        # Only on first use: the detector keeps it for later turns
         llm_signal_names = signal_detector.llm_signal_names
-        if llm_signal_names:
+        if llm_signal_names and not signal_detector.has_llm_detector:
             from src.signals.llm.batch_detector import LLMBatchDetector
             from src.llm.client import get_llm_client
 
@@ -119,9 +141,32 @@ class GlobalSignalDetectionService:
             else 0,
         )
 
+        # Degraded pipeline profile or budget fallback: skip the
+        # signal-scoring LLM call
+        profile = context.pipeline_profile
+        reuse = context.reuse_llm_signals or (
+            profile is not None and profile.cached_llm_signals
+        )
+        reused_llm_signals = None
+        if reuse and llm_signal_names:
+            reused_llm_signals = cached_llm_signals(
+                context.session_id, llm_signal_names
+            )
+            log.debug(
+                "llm_signals_reused",
+                methodology=methodology_name,
+                profile=profile.name if profile is not None else None,
+                budget_fallback=context.reuse_llm_signals,
+                cached=context.session_id in _last_llm_signals,
+            )
+
         try:
             global_signals = await signal_detector.detect(
-                context, graph_state, response_text, question=last_question
+                context,
+                graph_state,
+                response_text,
+                question=last_question,
+                llm_signals=reused_llm_signals,
             )
         except Exception as e:
             log.error(
@@ -133,6 +178,13 @@ class GlobalSignalDetectionService:
             )
             raise
 
+        if reused_llm_signals is None and llm_signal_names:
+            _last_llm_signals[context.session_id] = {
+                name: global_signals[name]
+                for name in llm_signal_names
+                if name in global_signals
+            }
+
         log.debug(
             "global_signals_detected",
             methodology=methodology_name,
@@ -144,9 +196,14 @@ class GlobalSignalDetectionService:
         trend_signal = self._get_global_trend_signal()
 
         try:
+            # A budget fallback rerun must not add this turn's depth twice
             trend_result = await trend_signal.detect(
-                context, graph_state, response_text, current_depth=current_depth
+                context,
+                graph_state,
+                response_text,
+                current_depth=None if context.response_trend_recorded else current_depth,
             )
+            context.response_trend_recorded = True
             global_trend = trend_result.get("llm.global_response_trend", "stable")
             global_signals["llm.global_response_trend"] = global_trend
 
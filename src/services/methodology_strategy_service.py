@@ -19,11 +19,12 @@ Key concepts:
 from typing import Tuple, Optional, TYPE_CHECKING, Any, Dict, Union, Sequence
 import structlog
 
+from src.core.config import settings
 from src.core.exceptions import ConfigurationError, ScoringError
 from src.methodologies import get_registry
 from src.methodologies.scoring import (
     rank_strategies,
-    rank_nodes_for_strategy,
+    rank_nodes_for_strategy_with_stats,
     ScoredCandidate,
 )
 from src.services.global_signal_detection_service import GlobalSignalDetectionService
@@ -272,11 +273,16 @@ class MethodologyStrategyService:
         )
 
         if best_strategy_config.node_binding == "required" and node_signals:
-            ranked_nodes, stage2_decomposition = rank_nodes_for_strategy(
-                best_strategy_config,
-                node_signals,
-                phase_weights=phase_weights,
-                phase_bonuses=phase_bonuses,
+            # Only the top-k nodes are decomposed; full decomposition is a debug flag
+            ranked_nodes, stage2_decomposition, ranking_stats = (
+                rank_nodes_for_strategy_with_stats(
+                    best_strategy_config,
+                    node_signals,
+                    phase_weights=phase_weights,
+                    phase_bonuses=phase_bonuses,
+                    top_k=settings.score_decomposition_top_k,
+                    full_decomposition=settings.full_score_decomposition,
+                )
             )
             if ranked_nodes:
                 focus_node_id = ranked_nodes[0][0]
@@ -285,8 +291,9 @@ class MethodologyStrategyService:
                     methodology=methodology_name,
                     strategy=best_strategy_config.name,
                     node_id=focus_node_id,
-                    node_count=len(ranked_nodes),
+                    node_count=ranking_stats.candidate_count,
                     top3=[(nid, round(sc, 4)) for nid, sc in ranked_nodes[:3]],
+                    ranking_stats=ranking_stats.to_dict(),
                 )
             else:
                 log.error(
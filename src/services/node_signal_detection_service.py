@@ -28,6 +28,11 @@ class NodeSignalDetectionService:
     To add a new node signal: create a NodeSignalDetector subclass with
     signal_name defined, and ensure its module is imported in
     src/signals/__init__.py.
+
+    Detection is incremental: "per_turn" detectors run over every node,
+    while "on_change" detectors run only over nodes in
+    node_tracker.dirty_nodes (plus nodes missing from the cache) and reuse
+    node_tracker.signal_cache for the rest.
     """
 
     async def detect(
@@ -40,6 +45,9 @@ class NodeSignalDetectionService:
         """
         Detect node-level signals for all tracked nodes.
 
+        Refreshes node_tracker.signal_cache and clears the dirty marks that
+        were consumed.
+
         Args:
             context: Pipeline context
             graph_state: Current knowledge graph state
@@ -89,11 +97,28 @@ class NodeSignalDetectionService:
                 "Ensure src/signals/__init__.py is imported before detection."
             )
 
+        dirty_nodes = set(node_tracker.dirty_nodes)
+        signal_cache = node_tracker.signal_cache
+
         # Detect all node signals
         signals_detected_count = 0
+        recomputed_count = 0
         for detector in signal_detectors:
             try:
-                detected = await detector.detect(context, graph_state, response_text)
+                if detector.refresh == "on_change":
+                    cached = signal_cache.setdefault(detector.signal_name, {})
+                    stale = dirty_nodes | (all_states.keys() - cached.keys())
+                    if stale:
+                        detector.restrict_to(stale)
+                        detected = await detector.detect(
+                            context, graph_state, response_text
+                        )
+                        cached.update(detected)
+                    recomputed_count += len(stale)
+                    detected = cached
+                else:
+                    detected = await detector.detect(context, graph_state, response_text)
+                    recomputed_count += len(all_states)
 
                 # Merge results into node_signals
                 detector_count = 0
@@ -127,9 +152,14 @@ class NodeSignalDetectionService:
                     f"that all required data (context, graph_state, node_tracker) is available."
                 ) from e
 
+        node_tracker.clear_dirty(dirty_nodes)
+
         log.debug(
             "node_signals_detected",
             node_count=len(node_signals),
+            dirty_count=len(dirty_nodes),
+            recomputed=recomputed_count,
+            total=len(node_signals) * len(signal_detectors),
         )
 
         return node_signals
@@ -6,7 +6,7 @@ architecture by tracking canonical slots that aggregate surface nodes.
 """
 
 from dataclasses import dataclass, asdict
-from typing import Dict, Optional, TYPE_CHECKING, Any
+from typing import Dict, Iterable, Optional, Set, TYPE_CHECKING, Any
 
 import structlog
 
@@ -52,6 +52,12 @@ class NodeStateTracker:
     - Response quality aggregation
     - Relationship tracking (edges, orphans)
     - Strategy usage patterns
+    - Dirty set and signal cache for incremental node signal detection
+
+    Every mutator marks the nodes whose own state it changed as dirty.
+    NodeSignalDetectionService recomputes "on_change" node signals only for
+    dirty nodes and serves the rest from signal_cache; both are persisted
+    with the tracker so the cache survives across turns.
     """
 
     def __init__(
@@ -73,6 +79,10 @@ class NodeStateTracker:
         self.states: Dict[str, NodeState] = {}
         self.previous_focus: Optional[str] = None
         self.canonical_slot_repo = canonical_slot_repo
+        # Nodes whose state changed since the last node signal detection
+        self.dirty_nodes: Set[str] = set()
+        # signal_name -> {node_id: value} for "on_change" node signals
+        self.signal_cache: Dict[str, Dict[str, Any]] = {}
         self.log = structlog.get_logger(__name__)
 
     async def _resolve_canonical_slot_id(self, surface_node_id: str) -> str:
@@ -140,6 +150,7 @@ class NodeStateTracker:
         )
 
         self.states[node.id] = node_state
+        self.dirty_nodes.add(node.id)
 
         self.log.info(
             "node_registered",
@@ -184,6 +195,10 @@ class NodeStateTracker:
             return
 
         state = self.states[tracking_key]
+        self.dirty_nodes.add(tracking_key)
+        if self.previous_focus is not None:
+            # Loses is_current_focus
+            self.dirty_nodes.add(self.previous_focus)
 
         # Update focus count and timing
         state.focus_count += 1
@@ -202,7 +217,11 @@ class NodeStateTracker:
                 s.turns_since_last_focus = 0
             else:
                 s.turns_since_last_focus += 1
-                s.current_focus_streak = 0
+                if s.current_focus_streak:
+                    s.current_focus_streak = 0
+                    self.dirty_nodes.add(nid)
+            # turns_since_* ticks are read only by "per_turn" signals, so they
+            # don't dirty every node
             s.turns_since_last_yield += 1
 
         # Update strategy usage
@@ -280,6 +299,7 @@ class NodeStateTracker:
             return
 
         state = self.states[tracking_key]
+        self.dirty_nodes.add(tracking_key)
 
         # Update yield metrics
         state.last_yield_turn = turn_number
@@ -336,6 +356,7 @@ class NodeStateTracker:
 
         state = self.states[tracking_key]
         state.all_response_depths.append(response_depth)
+        self.dirty_nodes.add(tracking_key)
 
         self.log.debug(
             "response_signal_appended",
@@ -372,6 +393,7 @@ class NodeStateTracker:
             return
 
         state = self.states[tracking_key]
+        self.dirty_nodes.add(tracking_key)
         state.edge_count_outgoing += outgoing_delta
         state.edge_count_incoming += incoming_delta
 
@@ -414,6 +436,14 @@ class NodeStateTracker:
         """
         return self.states.copy()
 
+    def clear_dirty(self, node_ids: Iterable[str]) -> None:
+        """Clear dirty marks after their signals have been recomputed.
+
+        Args:
+            node_ids: Tracking keys whose cached signal values are now current
+        """
+        self.dirty_nodes.difference_update(node_ids)
+
     def _calculate_node_depth(self, node: KGNode) -> int:
         """Calculate the depth of a node in the knowledge graph.
 
@@ -444,7 +474,8 @@ class NodeStateTracker:
         in subsequent turns to maintain continuity.
 
         Returns:
-            Dictionary with schema_version, previous_focus, and states data
+            Dictionary with schema_version, previous_focus, states data, and
+            the incremental detection dirty set and signal cache
         """
         # Convert each NodeState to a dict, handling Set serialization
         states_dict = {}
@@ -459,6 +490,8 @@ class NodeStateTracker:
             "schema_version": NODE_TRACKER_SCHEMA_VERSION,
             "previous_focus": self.previous_focus,
             "states": states_dict,
+            "dirty_nodes": sorted(self.dirty_nodes),
+            "signal_cache": self.signal_cache,
         }
 
     @classmethod
@@ -501,6 +534,11 @@ class NodeStateTracker:
             # Reconstruct NodeState from dict
             tracker.states[node_id] = NodeState(**state_dict)
 
+        # Incremental detection state (absent in older payloads: the empty
+        # cache makes the next detection a full recompute)
+        tracker.dirty_nodes = set(data.get("dirty_nodes", []))
+        tracker.signal_cache = data.get("signal_cache", {})
+
         return tracker
 
     def is_empty(self) -> bool:
@@ -0,0 +1,160 @@
+"""
+Adaptive pipeline profiles for load shedding.
+
+A pipeline profile (declared under pipeline_profiles in interview_config.yaml)
+says which optional turn work runs: SRL preprocessing, inline slot
+discovery, and the signal-scoring LLM call. Under normal load every turn
+uses the default profile. When the admission queue grows or provider
+latency spikes, sessions switch to the degraded profile, trading some
+signal freshness for bounded tail latency.
+
+Switching has hysteresis. A session degrades as soon as either enter
+threshold is reached, but recovers only once both exit thresholds hold and
+it has run min_dwell_turns degraded turns. Load is global, but each
+session switches at its own turn boundary and keeps its own dwell count.
+
+The selector is process-level (SessionService is rebuilt per request).
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+import structlog
+
+from src.core.config import (
+    PipelineProfileConfig,
+    PipelineProfilesConfig,
+    interview_config,
+)
+from src.llm.client import provider_latency_ratio
+from src.services.admission_controller import get_admission_controller
+
+log = structlog.get_logger(__name__)
+
+
+@dataclass
+class PipelineProfile:
+    """The profile chosen for one turn."""
+
+    name: str
+    config: PipelineProfileConfig
+
+    @property
+    def skip_srl(self) -> bool:
+        return self.config.skip_srl
+
+    @property
+    def defer_slot_discovery(self) -> bool:
+        return self.config.defer_slot_discovery
+
+    @property
+    def cached_llm_signals(self) -> bool:
+        return self.config.llm_signals == "cached"
+
+
+@dataclass
+class LoadSnapshot:
+    """Load indicators the switching thresholds are compared against."""
+
+    queued_turns: int
+    latency_ratio: Optional[float] = None  # None until providers have a baseline
+
+
+@dataclass
+class _SessionProfileState:
+    degraded: bool = False
+    turns_in_profile: int = 0
+
+
+class PipelineProfileSelector:
+    """Pick each session's pipeline profile from current load, with hysteresis."""
+
+    def __init__(self, config: PipelineProfilesConfig):
+        self.config = config
+        self._sessions: Dict[str, _SessionProfileState] = {}
+
+    def select(self, session_id: str, load: Optional[LoadSnapshot] = None) -> PipelineProfile:
+        """Choose the profile for the session's next turn.
+
+        Args:
+            session_id: Session about to run a turn
+            load: Current load (read from the admission controller and
+                provider latency when None)
+
+        Returns:
+            PipelineProfile to run the turn with
+        """
+        if not self.config.adaptive:
+            return self._profile(self.config.default)
+
+        if load is None:
+            load = current_load()
+
+        state = self._sessions.setdefault(session_id, _SessionProfileState())
+        if state.degraded:
+            if self._should_recover(state, load):
+                self._switch(session_id, state, degraded=False, load=load)
+        elif self._should_degrade(load):
+            self._switch(session_id, state, degraded=True, load=load)
+
+        state.turns_in_profile += 1
+        return self._profile(self.config.degraded if state.degraded else self.config.default)
+
+    def forget(self, session_id: str) -> None:
+        """Drop a session's switching state (e.g. when the session ends)."""
+        self._sessions.pop(session_id, None)
+
+    def _should_degrade(self, load: LoadSnapshot) -> bool:
+        switching = self.config.switching
+        return load.queued_turns >= switching.enter_queued_turns or (
+            load.latency_ratio is not None and load.latency_ratio >= switching.enter_latency_ratio
+        )
+
+    def _should_recover(self, state: _SessionProfileState, load: LoadSnapshot) -> bool:
+        switching = self.config.switching
+        return (
+            state.turns_in_profile >= switching.min_dwell_turns
+            and load.queued_turns <= switching.exit_queued_turns
+            and (load.latency_ratio is None or load.latency_ratio <= switching.exit_latency_ratio)
+        )
+
+    def _switch(
+        self,
+        session_id: str,
+        state: _SessionProfileState,
+        degraded: bool,
+        load: LoadSnapshot,
+    ) -> None:
+        state.degraded = degraded
+        state.turns_in_profile = 0
+        log.info(
+            "pipeline_profile_switched",
+            session_id=session_id,
+            profile=self.config.degraded if degraded else self.config.default,
+            queued_turns=load.queued_turns,
+            latency_ratio=(
+                round(load.latency_ratio, 2) if load.latency_ratio is not None else None
+            ),
+        )
+
+    def _profile(self, name: str) -> PipelineProfile:
+        return PipelineProfile(name=name, config=self.config.profiles[name])
+
+
+def current_load() -> LoadSnapshot:
+    """Read the admission queue length and provider latency ratio."""
+    return LoadSnapshot(
+        queued_turns=get_admission_controller().queued,
+        latency_ratio=provider_latency_ratio(),
+    )
+
+
+_selector: Optional[PipelineProfileSelector] = None
+
+
+def get_pipeline_profile_selector() -> PipelineProfileSelector:
+    """Return the process-wide selector configured from interview_config."""
+    global _selector
+    if _selector is None:
+        _selector = PipelineProfileSelector(interview_config.pipeline_profiles)
+    return _selector
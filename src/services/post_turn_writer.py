@@ -0,0 +1,523 @@
+"""
+Write-behind persistence for post-response turn data.
+
+ResponseSavingStage and ScoringPersistenceStage describe their database
+writes as PostTurnWrite records (system utterance, scoring history,
+qualitative and methodology signals, session state with velocity and focus
+history, LLM usage metadata); SessionService adds the GCS upload when the
+interview ends. With settings.enable_write_behind the records are collected
+on PipelineContext.post_turn_writes and handed to a per-session
+PostTurnWriter after the pipeline finishes, so the API returns the next
+question without waiting on them. Without it, each write is applied inline
+as before.
+
+Ordering: each session has one writer task that applies jobs in submission
+order, and SessionService.process_turn drains the session's writer before
+loading context for the next turn, so a turn never reads state older than
+the previous turn's writes.
+
+Failures: a job that fails stops its session's writer. It and every later
+job are held (and stay journaled) instead of being applied out of order;
+drain_post_turn_writes() retries them once and raises PostTurnWriteError
+if they still fail, so the next turn is refused rather than run on stale
+state.
+
+Durability: a job is recorded in the post_turn_journal table before it is
+queued and deleted once every write has been applied. Journal entries left
+behind by a crash (or by a failed job) are replayed in their original
+order at startup by recover_post_turn_journal(). Writes are idempotent
+(fixed record IDs, INSERT OR IGNORE, overwrite-style updates), so
+replaying a partially applied job is safe.
+
+Lifetime: the job for a session's last turn is marked final; once it has
+been applied (including the GCS upload) the writer removes itself from
+the registry.
+"""
+
+import asyncio
+import json
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+from uuid import uuid4
+
+import aiosqlite
+import structlog
+
+from src.core.config import settings
+from src.core.exceptions import PostTurnWriteError
+from src.domain.models.session import SessionState
+from src.persistence.database import connect
+from src.persistence.repositories.session_repo import SessionRepository
+
+log = structlog.get_logger(__name__)
+
+
+@dataclass
+class PostTurnWrite:
+    """A single persistence operation produced by a post-response stage.
+
+    kind selects the handler (see _HANDLERS); payload must be JSON-serializable
+    so the write can be journaled and replayed.
+    """
+
+    kind: str
+    payload: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class PostTurnJob:
+    """All post-response writes for one turn, applied in order.
+
+    final marks the session's last turn; the writer is released after it.
+    """
+
+    session_id: str
+    turn_number: int
+    writes: List[PostTurnWrite] = field(default_factory=list)
+    journal_id: str = field(default_factory=lambda: str(uuid4()))
+    final: bool = False
+
+
+# =============================================================================
+# Write handlers
+# =============================================================================
+
+
+async def _save_system_utterance(payload: Dict[str, Any], session_repo: SessionRepository) -> None:
+    from src.persistence.database import get_db_connection
+
+    db = await get_db_connection()
+    try:
+        await db.execute(
+            """
+            INSERT OR IGNORE INTO utterances
+                (id, session_id, turn_number, speaker, text, created_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (
+                payload["id"],
+                payload["session_id"],
+                payload["turn_number"],
+                "system",
+                payload["text"],
+                payload["created_at"],
+            ),
+        )
+        await db.commit()
+    finally:
+        if str(settings.database_path) != ":memory:":
+            await db.close()
+
+
+async def _save_scoring(payload: Dict[str, Any], session_repo: SessionRepository) -> None:
+    async with connect(str(session_repo.db_path)) as db:
+        await db.execute(
+            """INSERT OR IGNORE INTO scoring_history (
+                id, session_id, turn_number,
+                depth_score, saturation_score,
+                novelty_score, richness_score,
+                strategy_selected, strategy_reasoning, scorer_details
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            (
+                payload["id"],
+                payload["session_id"],
+                payload["turn_number"],
+                payload["depth_score"],
+                payload["saturation_score"],
+                None,  # novelty_score
+                None,  # richness_score
+                payload["strategy"],
+                None,  # strategy_reasoning
+                None,  # scorer_details
+            ),
+        )
+        await db.commit()
+
+
+async def _save_signals(payload: Dict[str, Any], session_repo: SessionRepository) -> None:
+    # Signals are diagnostic only: a failed save must not fail the turn
+    try:
+        await session_repo.save_qualitative_signals(**payload)
+    except Exception as e:
+        log.warning(
+            "failed_to_save_signals",
+            session_id=payload["session_id"],
+            turn_number=payload["turn_number"],
+            llm_model=payload.get("llm_model"),
+            error=str(e),
+            error_type=type(e).__name__,
+        )
+
+
+async def _update_session_state(payload: Dict[str, Any], session_repo: SessionRepository) -> None:
+    await session_repo.update_state(
+        payload["session_id"], SessionState.model_validate(payload["state"])
+    )
+
+
+async def _update_session_metadata(
+    payload: Dict[str, Any], session_repo: SessionRepository
+) -> None:
+    await session_repo.update_metadata(
+        session_id=payload["session_id"], metadata=payload["metadata"]
+    )
+
+
+async def _upload_session_to_gcs(payload: Dict[str, Any], session_repo: SessionRepository) -> None:
+    session_id = payload["session_id"]
+    try:
+        from src.services.export_service import ExportService
+        from src.services.gcs_upload_service import GCSUploadService
+
+        export_service = ExportService(session_repo=session_repo)
+        export_data = await export_service.export_session(session_id, "json")
+
+        gcs_service = GCSUploadService(payload["bucket"])
+        gcs_path = await gcs_service.upload_session(session_id, export_data)
+
+        if gcs_path:
+            log.info("session_uploaded_to_gcs", session_id=session_id, gcs_path=gcs_path)
+    except Exception as e:
+        log.warning(
+            "gcs_upload_failed",
+            session_id=session_id,
+            error=str(e),
+            error_type=type(e).__name__,
+        )
+
+
+_HANDLERS: Dict[str, Callable[[Dict[str, Any], SessionRepository], Awaitable[None]]] = {
+    "system_utterance": _save_system_utterance,
+    "scoring": _save_scoring,
+    "signals": _save_signals,
+    "session_state": _update_session_state,
+    "session_metadata": _update_session_metadata,
+    "gcs_upload": _upload_session_to_gcs,
+}
+
+
+async def apply_post_turn_write(
+    write: PostTurnWrite, session_repo: Optional[SessionRepository] = None
+) -> None:
+    """Apply one write immediately.
+
+    Args:
+        write: Write to apply
+        session_repo: Repository for session tables (defaults to the
+            configured database)
+
+    Raises:
+        ValueError: If write.kind has no handler
+    """
+    handler = _HANDLERS.get(write.kind)
+    if handler is None:
+        raise ValueError(f"Unknown post-turn write kind: {write.kind}")
+    await handler(write.payload, session_repo or SessionRepository(str(settings.database_path)))
+
+
+async def persist_or_defer(
+    writes: Optional[List[PostTurnWrite]],
+    write: PostTurnWrite,
+    session_repo: Optional[SessionRepository] = None,
+) -> None:
+    """Append write to the deferred list, or apply it now when there is none.
+
+    Args:
+        writes: PipelineContext.post_turn_writes (None = persist inline)
+        write: Write produced by a stage
+        session_repo: Repository used for inline application
+    """
+    if writes is not None:
+        writes.append(write)
+    else:
+        await apply_post_turn_write(write, session_repo)
+
+
+# =============================================================================
+# Journal
+# =============================================================================
+
+
+async def _connect() -> aiosqlite.Connection:
+    from src.persistence.database import get_db_connection
+
+    return await get_db_connection()
+
+
+async def _close(db: aiosqlite.Connection) -> None:
+    if str(settings.database_path) != ":memory:":
+        await db.close()
+
+
+async def _journal_job(job: PostTurnJob) -> None:
+    writes = [{"kind": w.kind, "payload": w.payload} for w in job.writes]
+    db = await _connect()
+    try:
+        await db.execute(
+            """INSERT INTO post_turn_journal
+                (id, session_id, turn_number, writes, created_at)
+            VALUES (?, ?, ?, ?, ?)""",
+            (
+                job.journal_id,
+                job.session_id,
+                job.turn_number,
+                json.dumps(writes, default=str),
+                datetime.now(timezone.utc).isoformat(),
+            ),
+        )
+        await db.commit()
+    finally:
+        await _close(db)
+
+
+async def _clear_journal_entry(journal_id: str) -> None:
+    db = await _connect()
+    try:
+        await db.execute("DELETE FROM post_turn_journal WHERE id = ?", (journal_id,))
+        await db.commit()
+    finally:
+        await _close(db)
+
+
+async def _load_journal() -> List[PostTurnJob]:
+    db = await _connect()
+    try:
+        cursor = await db.execute(
+            """SELECT id, session_id, turn_number, writes FROM post_turn_journal
+            ORDER BY created_at, rowid"""
+        )
+        rows = await cursor.fetchall()
+    finally:
+        await _close(db)
+
+    return [
+        PostTurnJob(
+            session_id=row[1],
+            turn_number=row[2],
+            writes=[PostTurnWrite(w["kind"], w["payload"]) for w in json.loads(row[3])],
+            journal_id=row[0],
+        )
+        for row in rows
+    ]
+
+
+# =============================================================================
+# Per-session writer
+# =============================================================================
+
+
+class PostTurnWriter:
+    """Per-session queue applying post-response writes after the response.
+
+    Jobs are applied strictly in submission order by a single task. A job
+    that fails stops the writer: it and all later jobs are held (they stay
+    journaled) until drain() retries them, so a newer turn's writes are
+    never applied before an older turn's.
+    """
+
+    def __init__(self, session_id: str, session_repo: SessionRepository):
+        self.session_id = session_id
+        self.session_repo = session_repo
+        self._queue: asyncio.Queue[PostTurnJob] = asyncio.Queue()
+        self._task: Optional[asyncio.Task] = None
+        # Set when a job fails: the error and the jobs held from that one on
+        self._error: Optional[Exception] = None
+        self._held: List[PostTurnJob] = []
+
+    async def submit(self, job: PostTurnJob, journal: bool = True) -> None:
+        """Journal a job and queue it, starting the worker task if needed.
+
+        While the writer is stopped by a failure the job is journaled and
+        held behind the failed one.
+
+        Args:
+            job: Writes for one turn
+            journal: Record the job before queueing (False when replaying an
+                existing journal entry)
+        """
+        if journal:
+            await _journal_job(job)
+        if self._error is not None:
+            self._held.append(job)
+        else:
+            self._queue.put_nowait(job)
+            if self._task is None or self._task.done():
+                self._task = asyncio.create_task(self._run())
+
+        log.debug(
+            "post_turn_job_submitted",
+            session_id=self.session_id,
+            turn=job.turn_number,
+            writes=[w.kind for w in job.writes],
+            queued=self._queue.qsize() + len(self._held),
+        )
+
+    async def drain(self) -> None:
+        """Wait until every submitted job has been applied.
+
+        A failed job (and the jobs held behind it) is retried once.
+
+        Raises:
+            PostTurnWriteError: If the retry failed too; the failed job and
+                the jobs after it remain held and journaled
+        """
+        await self._queue.join()
+        if self._error is not None:
+            self._resume()
+            await self._queue.join()
+        if self._error is not None:
+            held = self._held[0]
+            raise PostTurnWriteError(
+                f"Post-turn writes for session {self.session_id} turn "
+                f"{held.turn_number} failed: {self._error}"
+            ) from self._error
+
+    async def close(self) -> None:
+        """Stop the worker task; unapplied jobs remain in the journal."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    def _resume(self) -> None:
+        held, self._held, self._error = self._held, [], None
+        log.info(
+            "post_turn_writer_retrying",
+            session_id=self.session_id,
+            turns=[job.turn_number for job in held],
+        )
+        for job in held:
+            self._queue.put_nowait(job)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    def _stop(self, job: PostTurnJob, error: Exception) -> None:
+        """Hold the failed job and everything queued after it."""
+        self._error = error
+        self._held = [job]
+        while not self._queue.empty():
+            self._held.append(self._queue.get_nowait())
+            self._queue.task_done()
+        log.error(
+            "post_turn_job_failed",
+            session_id=self.session_id,
+            turn=job.turn_number,
+            journal_id=job.journal_id,
+            held_jobs=len(self._held),
+            error=str(error),
+            error_type=type(error).__name__,
+            exc_info=True,
+        )
+
+    async def _run(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._process(job)
+            except Exception as e:
+                self._stop(job, e)
+                return
+            finally:
+                self._queue.task_done()
+            if job.final:
+                self._release()
+                return
+
+    def _release(self) -> None:
+        """Drop this writer from the registry after the session's last job."""
+        if _writers.get(self.session_id) is self:
+            del _writers[self.session_id]
+            log.debug("post_turn_writer_released", session_id=self.session_id)
+
+    async def _process(self, job: PostTurnJob) -> None:
+        start = asyncio.get_running_loop().time()
+        for write in job.writes:
+            await apply_post_turn_write(write, self.session_repo)
+        await _clear_journal_entry(job.journal_id)
+
+        log.debug(
+            "post_turn_job_complete",
+            session_id=self.session_id,
+            turn=job.turn_number,
+            duration_ms=round((asyncio.get_running_loop().time() - start) * 1000, 2),
+        )
+
+
+# Process-level registry: session_id -> writer
+_writers: Dict[str, PostTurnWriter] = {}
+
+
+def get_post_turn_writer(session_id: str, session_repo: SessionRepository) -> PostTurnWriter:
+    """Return the session's writer, creating it if needed."""
+    writer = _writers.get(session_id)
+    if writer is None:
+        writer = PostTurnWriter(session_id, session_repo)
+        _writers[session_id] = writer
+    return writer
+
+
+async def drain_post_turn_writes(session_id: str) -> None:
+    """Wait for the session's pending post-response writes, if any."""
+    writer = _writers.get(session_id)
+    if writer is not None:
+        await writer.drain()
+
+
+async def recover_post_turn_journal() -> int:
+    """Replay journal entries left by a previous process (application startup).
+
+    Returns:
+        Number of jobs replayed
+    """
+    jobs = await _load_journal()
+    if not jobs:
+        return 0
+
+    session_repo = SessionRepository(str(settings.database_path))
+    for job in jobs:
+        await get_post_turn_writer(job.session_id, session_repo).submit(job, journal=False)
+
+    failed_sessions = 0
+    for session_id in {job.session_id for job in jobs}:
+        writer = _writers[session_id]
+        try:
+            await writer.drain()
+        except PostTurnWriteError as e:
+            # Keep the writer: the session's next turn retries and surfaces it
+            failed_sessions += 1
+            log.error("post_turn_journal_recovery_failed", session_id=session_id, error=str(e))
+            continue
+        await writer.close()
+        writer._release()
+
+    log.info(
+        "post_turn_journal_recovered",
+        jobs=len(jobs),
+        sessions=len({job.session_id for job in jobs}),
+        failed_sessions=failed_sessions,
+    )
+    return len(jobs)
+
+
+async def shutdown_post_turn_writers(timeout_s: float = 10.0) -> None:
+    """Drain and stop all writers (application shutdown).
+
+    Jobs still pending after timeout_s stay journaled and are replayed on
+    the next startup.
+    """
+    writers = list(_writers.values())
+    _writers.clear()
+    for writer in writers:
+        try:
+            await asyncio.wait_for(writer.drain(), timeout=timeout_s)
+        except asyncio.TimeoutError:
+            log.warning("post_turn_writer_drain_timeout", session_id=writer.session_id)
+        except PostTurnWriteError as e:
+            log.error(
+                "post_turn_writer_shutdown_failed", session_id=writer.session_id, error=str(e)
+            )
+        await writer.close()
@@ -13,7 +13,8 @@ Supports two question types:
 Uses methodology configs for strategy descriptions and topic anchoring.
 """
 
-from typing import Optional, List, Dict, Any
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 import structlog
 
@@ -81,6 +82,7 @@ class QuestionService:
         topic: Optional[str] = None,
         signals: Optional[Dict[str, Any]] = None,
         signal_descriptions: Optional[Dict[str, str]] = None,
+        on_token: Optional[Callable[[str], Awaitable[None]]] = None,
     ) -> str:
         """Generate follow-up question based on strategy, context, and graph state.
 
@@ -99,6 +101,10 @@ class QuestionService:
             topic: Research topic to anchor questions to (prevents drift to abstract philosophy)
             signals: Active signal values for strategy rationale (signal_name -> value)
             signal_descriptions: Signal descriptions for rationale (signal_name -> description)
+            on_token: Optional callback for streamed text chunks. When set the
+                question is generated with llm.stream() and every raw chunk is
+                forwarded as it arrives; the returned question is still the
+                cleaned full text.
 
         Returns:
             Generated question string (cleaned, quoted, with appropriate punctuation)
@@ -152,14 +158,29 @@ class QuestionService:
         effective_temp = 0.7 if settings.enable_question_self_selection else 0.8
 
         try:
-            response = await self.llm.complete(
-                prompt=user_prompt,
-                system=system_prompt,
-                temperature=effective_temp,
-                max_tokens=200,
-            )
-
-            question = format_question(response.content)
+            if on_token is None:
+                response = await self.llm.complete(
+                    prompt=user_prompt,
+                    system=system_prompt,
+                    temperature=effective_temp,
+                    max_tokens=200,
+                )
+                content, latency_ms = response.content, response.latency_ms
+            else:
+                start = time.perf_counter()
+                chunks = []
+                async for chunk in self.llm.stream(
+                    prompt=user_prompt,
+                    system=system_prompt,
+                    temperature=effective_temp,
+                    max_tokens=200,
+                ):
+                    chunks.append(chunk)
+                    await on_token(chunk)
+                content = "".join(chunks)
+                latency_ms = (time.perf_counter() - start) * 1000
+
+            question = format_question(content)
 
             log.info(
                 "question_generated",
@@ -169,7 +190,8 @@ class QuestionService:
                 else "baseline",
                 temperature=effective_temp,
                 question_length=len(question),
-                latency_ms=response.latency_ms,
+                latency_ms=latency_ms,
+                streamed=on_token is not None,
             )
 
             return question
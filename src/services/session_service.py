@@ -7,7 +7,6 @@ and question generation.
 """
 
 import json
-import aiosqlite
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, List, Dict, TYPE_CHECKING
@@ -17,8 +16,13 @@ import structlog
 
 from src.core.config import interview_config, settings
 from src.services.srl_service import SRLService
-from src.services.canonical_slot_service import CanonicalSlotService
+from src.services.canonical_slot_service import (
+    CanonicalSlotService,
+    forget_session as forget_slot_discovery_state,
+)
+from src.services.canonicalization_worker import close_canonicalization_worker
 from src.services.embedding_service import EmbeddingService
+from src.persistence.database import connect
 from src.persistence.repositories.canonical_slot_repo import CanonicalSlotRepository
 from src.core.concept_loader import load_concept
 from src.domain.models.knowledge_graph import GraphState, KGNode
@@ -27,7 +31,21 @@ from src.llm.client import LLMClient
 from src.services.extraction_service import ExtractionService
 from src.services.focus_selection_service import FocusSelectionService
 from src.services.graph_service import GraphService
+from src.services.global_signal_detection_service import forget_llm_signals
+from src.services.pipeline_profile import get_pipeline_profile_selector
+from src.services.post_turn_writer import (
+    PostTurnJob,
+    PostTurnWrite,
+    apply_post_turn_write,
+    drain_post_turn_writes,
+    get_post_turn_writer,
+)
 from src.services.question_service import QuestionService
+from src.services.turn_profiler import (
+    forget_session as forget_profiling_flag,
+    profile_turn,
+    should_profile_turn,
+)
 
 if TYPE_CHECKING:
     pass  # DEPRECATED: Only for type hints
@@ -37,6 +55,7 @@ from src.persistence.repositories.utterance_repo import UtteranceRepository
 from src.services.turn_pipeline import (
     TurnPipeline,
     PipelineContext,
+    TurnEventSink,
     TurnResult as PipelineTurnResult,
 )
 from src.services.turn_pipeline.stages import (
@@ -96,6 +115,8 @@ class SessionService:
         max_turns: Optional[int] = None,
         extraction_llm_client: Optional[LLMClient] = None,
         generation_llm_client: Optional[LLMClient] = None,
+        embedding_service: Optional[EmbeddingService] = None,
+        srl_service: Optional[SRLService] = None,
     ):
         """
         Initialize session service with pipeline.
@@ -110,8 +131,13 @@ class SessionService:
             max_turns: Maximum turns before forcing close (defaults to interview_config.yaml)
             extraction_llm_client: LLM client for extraction (required if extraction_service not provided)
             generation_llm_client: LLM client for question generation (required if question_service not provided)
+            embedding_service: Shared EmbeddingService (creates one per pipeline if None);
+                lets long-lived callers such as batch simulation load models once
+            srl_service: Shared SRLService (creates one per pipeline if None and SRL enabled)
         """
         self.session_repo = session_repo
+        self._embedding_service = embedding_service
+        self._srl_service = srl_service
         self.graph_repo = graph_repo
 
         # Store LLM clients for use in pipeline stages
@@ -182,7 +208,9 @@ class SessionService:
             TurnPipeline configured with 12 stages for turn processing
         """
         # SRL service: lazy-loads spaCy model on first use, None disables gracefully
-        srl_service = SRLService() if settings.enable_srl else None
+        srl_service = (
+            (self._srl_service or SRLService()) if settings.enable_srl else None
+        )
 
         # Canonical slot discovery dependencies (conditionally enabled)
         canonical_slot_repo = None
@@ -191,7 +219,8 @@ class SessionService:
 
         # EmbeddingService: shared between surface dedup and canonical slots
         # Created unconditionally — surface dedup is independent of canonical slots
-        embedding_service = EmbeddingService()  # lazy loads all-MiniLM-L6-v2 + spaCy
+        # lazy loads all-MiniLM-L6-v2 + spaCy
+        embedding_service = self._embedding_service or EmbeddingService()
 
         if settings.enable_canonical_slots:
             from src.llm.client import get_llm_client
@@ -245,6 +274,13 @@ class SessionService:
                     embedding_service=embedding_service,
                 )
 
+        # Background mode moves slot discovery off the response path; strategy
+        # selection then reads the latest completed canonical snapshot
+        background_canonicalization = (
+            canonical_slot_service is not None
+            and settings.canonicalization_mode == "background"
+        )
+
         # Build stage list
         stages = [
             ContextLoadingStage(
@@ -255,6 +291,9 @@ class SessionService:
             SRLPreprocessingStage(srl_service=srl_service),
             ExtractionStage(
                 extraction_service=self.extraction,
+                embedding_service=(
+                    embedding_service if settings.enable_streaming_extraction else None
+                ),
             ),
             GraphUpdateStage(
                 graph_service=self.graph,
@@ -263,7 +302,10 @@ class SessionService:
             # Maps surface nodes to canonical slots via LLM proposal + embedding similarity
             # Also aggregates surface edges to canonical edges
             SlotDiscoveryStage(
-                slot_service=canonical_slot_service, graph_service=self.graph
+                slot_service=canonical_slot_service,
+                graph_service=self.graph,
+                canonical_graph_service=canonical_graph_service,
+                background=background_canonicalization,
             ),
         ]
 
@@ -272,6 +314,7 @@ class SessionService:
             StateComputationStage(
                 graph_service=self.graph,
                 canonical_graph_service=canonical_graph_service,  # None if disabled
+                background_canonicalization=background_canonicalization,
             )
         )
 
@@ -291,12 +334,14 @@ class SessionService:
             ]
         )
 
-        return TurnPipeline(stages=stages)
+        return TurnPipeline(stages=stages, budgets=interview_config.turn_budgets)
 
     async def process_turn(
         self,
         session_id: str,
         user_input: str,
+        event_sink: Optional[TurnEventSink] = None,
+        profile: bool = False,
     ) -> PipelineTurnResult:
         """Process a single interview turn using the pipeline.
 
@@ -314,9 +359,27 @@ class SessionService:
         11. ResponseSavingStage - Save system utterance
         12. ScoringPersistenceStage - Save scoring and update turn count
 
+        With settings.enable_write_behind, the writes of stages 11-12 and the
+        end-of-interview GCS upload are journaled and applied by the
+        session's PostTurnWriter after this method returns. Each turn first
+        waits for the previous turn's writes to finish.
+
+        The turn runs with the pipeline profile chosen by the process-wide
+        PipelineProfileSelector: under load (admission queue or provider
+        latency past the interview_config.yaml thresholds) the degraded
+        profile skips SRL, defers slot discovery and reuses cached LLM
+        signals. The profile used is reported in TurnResult.pipeline_profile.
+
+        With profile=True, or a session created with config profile_turns,
+        the pipeline runs under the turn profiler (src/services/turn_profiler.py),
+        which writes a collapsed-stack profile for the turn.
+
         Args:
             session_id: Session ID
             user_input: User's response text
+            event_sink: Optional receiver for stage-completed and question-token
+                progress events (used by the streaming turn endpoint)
+            profile: Profile this turn (X-Profile-Turn request header)
 
         Returns:
             TurnResult with extraction, graph state, next question, and continuation status
@@ -326,19 +389,30 @@ class SessionService:
         """
         log.info("processing_turn", session_id=session_id, input_length=len(user_input))
 
+        # The previous turn's write-behind must land before context is loaded
+        await drain_post_turn_writes(session_id)
+
         # Load or create NodeStateTracker for this turn
         # If persisted state exists, load it; otherwise create fresh tracker
         node_tracker = await self._get_or_create_node_tracker(session_id)
 
+        profile_selector = get_pipeline_profile_selector()
+
         # Create initial context with node_tracker
         context = PipelineContext(
             session_id=session_id,
             user_input=user_input,
             node_tracker=node_tracker,
+            event_sink=event_sink,
+            post_turn_writes=[] if settings.enable_write_behind else None,
+            pipeline_profile=profile_selector.select(session_id),
         )
 
-        # Execute pipeline
-        result = await self.pipeline.execute(context)
+        # Execute pipeline (under the stack sampler when profiling is on)
+        if await should_profile_turn(session_id, self.session_repo, requested=profile):
+            result = await profile_turn(session_id, self.pipeline.execute(context))
+        else:
+            result = await self.pipeline.execute(context)
 
         # Persist node_tracker state after turn completes
         # This ensures previous_focus and all_response_depths are saved for next turn
@@ -351,38 +425,40 @@ class SessionService:
             strategy=result.strategy_selected,
             should_continue=result.should_continue,
             latency_ms=result.latency_ms,
+            pipeline_profile=result.pipeline_profile,
         )
 
-        # Auto-upload session to GCS when interview ends
-        if not result.should_continue and settings.gcs_bucket:
-            await self._upload_session_to_gcs(session_id)
-
-        return result
-
-    async def _upload_session_to_gcs(self, session_id: str) -> None:
-        """Upload session export to GCS after interview completion."""
-        try:
-            from src.services.gcs_upload_service import GCSUploadService
-            from src.services.export_service import ExportService
-
-            export_service = ExportService(session_repo=self.session_repo)
-            export_data = await export_service.export_session(session_id, "json")
-
-            gcs_service = GCSUploadService(settings.gcs_bucket)
-            gcs_path = await gcs_service.upload_session(session_id, export_data)
+        if not result.should_continue:
+            profile_selector.forget(session_id)
+            forget_llm_signals(session_id)
+            forget_profiling_flag(session_id)
+            # The last turn's canonicalization must finish before its slot
+            # state is released (and before the session is uploaded)
+            await close_canonicalization_worker(session_id)
+            forget_slot_discovery_state(session_id)
 
-            if gcs_path:
-                log.info(
-                    "session_uploaded_to_gcs", session_id=session_id, gcs_path=gcs_path
+        # Auto-upload session to GCS when interview ends (after all writes)
+        if not result.should_continue and settings.gcs_bucket:
+            upload = PostTurnWrite(
+                "gcs_upload", {"session_id": session_id, "bucket": settings.gcs_bucket}
+            )
+            if context.post_turn_writes is None:
+                await apply_post_turn_write(upload, self.session_repo)
+            else:
+                context.post_turn_writes.append(upload)
+
+        if context.post_turn_writes:
+            await get_post_turn_writer(session_id, self.session_repo).submit(
+                PostTurnJob(
+                    session_id=session_id,
+                    turn_number=result.turn_number,
+                    writes=context.post_turn_writes,
+                    final=not result.should_continue,
                 )
-        except Exception as e:
-            log.warning(
-                "gcs_upload_failed",
-                session_id=session_id,
-                error=str(e),
-                error_type=type(e).__name__,
             )
 
+        return result
+
     async def start_session(
         self,
         session_id: str,
@@ -557,6 +633,7 @@ class SessionService:
             status, should_continue, strategy_selected, strategy_reasoning, phase,
             focus_tracing, and canonical_node_count
         """
+        await drain_post_turn_writes(session_id)
         session = await self.session_repo.get(session_id)
         if not session:
             raise ValueError(f"Session {session_id} not found")
@@ -584,7 +661,7 @@ class SessionService:
         # Query canonical node count (active + candidate) if feature is enabled
         canonical_node_count = 0
         if self.canonical_slot_repo is not None:
-            async with aiosqlite.connect(self.canonical_slot_repo.db_path) as _db:
+            async with connect(self.canonical_slot_repo.db_path) as _db:
                 async with _db.execute(
                     "SELECT COUNT(*) FROM canonical_slots WHERE session_id = ?",
                     (session_id,),
@@ -0,0 +1,455 @@
+"""Batch runner for AI-to-AI interview simulations.
+
+Executes a matrix of simulations (concepts × personas × seeds) with bounded
+concurrency for tuning cycles that need hundreds of runs.
+
+Key Design:
+    - One model hub: a single EmbeddingService and SRLService are shared by
+      every run, so sentence-transformers and spaCy load once per batch
+    - One pooled LLM client set (the process-wide shared clients) and one
+      database connection for the whole batch
+    - Each run still gets its own SessionService/SimulationService, since
+      pipeline stages hold per-session state
+    - Results are appended to synthetic_interviews/batches/{batch_id}.jsonl
+      as each run finishes; re-running a batch_id skips runs already
+      recorded as completed (resume after interruption)
+"""
+
+import asyncio
+import json
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Union
+
+import structlog
+
+from src.core.config import settings
+from src.llm.client import LLMClient
+from src.persistence.repositories.graph_repo import GraphRepository
+from src.persistence.repositories.session_repo import SessionRepository
+from src.services.embedding_service import EmbeddingService
+from src.services.session_service import SessionService
+from src.services.simulation_service import SYNTHETIC_OUTPUT_DIR, SimulationService
+from src.services.srl_service import SRLService
+from src.services.synthetic_service import SyntheticService
+
+log = structlog.get_logger(__name__)
+
+# Output directory for batch result files (one JSONL per batch)
+BATCH_OUTPUT_DIR = SYNTHETIC_OUTPUT_DIR / "batches"
+
+DEFAULT_BATCH_CONCURRENCY = 4
+
+
+@dataclass(frozen=True)
+class SimulationRunSpec:
+    """One cell of the simulation matrix."""
+
+    concept_id: str
+    persona_id: str
+    seed: int = 0
+    max_turns: int = SimulationService.DEFAULT_MAX_TURNS
+
+    @property
+    def run_id(self) -> str:
+        """Stable identifier used to resume a batch."""
+        return f"{self.concept_id}__{self.persona_id}__seed{self.seed}"
+
+
+@dataclass
+class SimulationRunRecord:
+    """Outcome of one simulation run, written as one JSONL line."""
+
+    run_id: str
+    concept_id: str
+    persona_id: str
+    seed: int
+    status: str  # completed, failed
+    session_id: Optional[str] = None
+    interview_status: Optional[str] = None
+    total_turns: int = 0
+    duration_ms: float = 0.0
+    mean_turn_ms: float = 0.0
+    output_path: Optional[str] = None
+    error: Optional[str] = None
+    finished_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+@dataclass
+class BatchProgress:
+    """Live progress counters for a batch."""
+
+    batch_id: str
+    total: int = 0
+    completed: int = 0
+    failed: int = 0
+    skipped: int = 0
+    running: int = 0
+    run_durations_ms: List[float] = field(default_factory=list)
+    finished: bool = False
+
+    @property
+    def done(self) -> int:
+        return self.completed + self.failed + self.skipped
+
+    def to_dict(self) -> Dict[str, Any]:
+        durations = sorted(self.run_durations_ms)
+        return {
+            "batch_id": self.batch_id,
+            "total": self.total,
+            "completed": self.completed,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "running": self.running,
+            "finished": self.finished,
+            "mean_run_ms": (round(sum(durations) / len(durations), 1) if durations else None),
+            "p95_run_ms": (
+                round(durations[int(0.95 * (len(durations) - 1))], 1) if durations else None
+            ),
+        }
+
+
+def build_run_matrix(
+    concept_ids: Iterable[str],
+    persona_ids: Iterable[str],
+    seeds: Union[int, Iterable[int]] = 1,
+    max_turns: int = SimulationService.DEFAULT_MAX_TURNS,
+) -> List[SimulationRunSpec]:
+    """Expand concepts × personas × seeds into run specs.
+
+    Args:
+        concept_ids: Concept IDs to simulate
+        persona_ids: Persona IDs for the synthetic respondent
+        seeds: Number of seeds (0..n-1) or explicit seed values
+        max_turns: Maximum turns per run
+
+    Returns:
+        Run specs in concept, persona, seed order
+    """
+    seed_values = list(range(seeds)) if isinstance(seeds, int) else list(seeds)
+    persona_list = list(persona_ids)
+    return [
+        SimulationRunSpec(concept_id, persona_id, seed, max_turns)
+        for concept_id in concept_ids
+        for persona_id in persona_list
+        for seed in seed_values
+    ]
+
+
+def load_completed_run_ids(results_path: Path) -> Set[str]:
+    """Return run IDs already recorded as completed in a batch results file."""
+    if not results_path.exists():
+        return set()
+
+    completed: Set[str] = set()
+    with open(results_path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # Partial line from an interrupted write
+                continue
+            if record.get("status") == "completed":
+                completed.add(record["run_id"])
+    return completed
+
+
+class SimulationBatchRunner:
+    """Runs a simulation matrix with bounded concurrency and shared resources.
+
+    Construct with shared repositories, LLM clients and models, then call
+    run(). Progress is available on .progress while the batch runs.
+    """
+
+    def __init__(
+        self,
+        session_repo: SessionRepository,
+        graph_repo: GraphRepository,
+        extraction_llm_client: LLMClient,
+        generation_llm_client: LLMClient,
+        batch_id: Optional[str] = None,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+        embedding_service: Optional[EmbeddingService] = None,
+        srl_service: Optional[SRLService] = None,
+        results_path: Optional[Path] = None,
+        on_progress: Optional[Callable[[BatchProgress], None]] = None,
+    ):
+        """Initialize batch runner.
+
+        Args:
+            session_repo: Session repository shared by all runs
+            graph_repo: Graph repository (single DB connection) shared by all runs
+            extraction_llm_client: Shared extraction LLM client
+            generation_llm_client: Shared generation client (interviewer and respondent)
+            batch_id: Batch identifier; reuse an existing one to resume
+            concurrency: Maximum simulations in flight
+            embedding_service: Shared embedding models (creates one if None)
+            srl_service: Shared SRL model (creates one if None and SRL enabled)
+            results_path: JSONL results file (default: batches/{batch_id}.jsonl)
+            on_progress: Called after every finished run
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+
+        self.batch_id = batch_id or datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+        self.session_repo = session_repo
+        self.graph_repo = graph_repo
+        self.extraction_llm_client = extraction_llm_client
+        self.generation_llm_client = generation_llm_client
+        self.concurrency = concurrency
+        self.embedding_service = embedding_service or EmbeddingService()
+        self.srl_service = srl_service or (SRLService() if settings.enable_srl else None)
+        self.results_path = results_path or BATCH_OUTPUT_DIR / f"{self.batch_id}.jsonl"
+        self.on_progress = on_progress
+        self.progress = BatchProgress(batch_id=self.batch_id)
+        self._write_lock = asyncio.Lock()
+
+    async def run(self, specs: List[SimulationRunSpec]) -> List[SimulationRunRecord]:
+        """Run all specs not yet completed in this batch's results file.
+
+        Args:
+            specs: Run matrix (see build_run_matrix)
+
+        Returns:
+            Records for the runs executed by this call (skipped runs excluded)
+        """
+        completed = load_completed_run_ids(self.results_path)
+        pending = [s for s in specs if s.run_id not in completed]
+
+        self.progress.total = len(specs)
+        self.progress.skipped = len(specs) - len(pending)
+        self.results_path.parent.mkdir(parents=True, exist_ok=True)
+        self._terminate_partial_line()
+
+        log.info(
+            "simulation_batch_started",
+            batch_id=self.batch_id,
+            total=len(specs),
+            pending=len(pending),
+            skipped=self.progress.skipped,
+            concurrency=self.concurrency,
+            results_path=str(self.results_path),
+        )
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        batch_start = time.perf_counter()
+
+        async def bounded(spec: SimulationRunSpec) -> SimulationRunRecord:
+            async with semaphore:
+                return await self._run_one(spec)
+
+        try:
+            records = await asyncio.gather(*[bounded(spec) for spec in pending])
+        finally:
+            self.progress.finished = True
+
+        log.info(
+            "simulation_batch_completed",
+            batch_id=self.batch_id,
+            duration_s=round(time.perf_counter() - batch_start, 1),
+            **{k: v for k, v in self.progress.to_dict().items() if k != "batch_id"},
+        )
+        return list(records)
+
+    def _terminate_partial_line(self) -> None:
+        """End a partial last line left by an interrupted write, so new
+        records start on their own line."""
+        if not self.results_path.exists() or self.results_path.stat().st_size == 0:
+            return
+        with open(self.results_path, "rb+") as f:
+            f.seek(-1, 2)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+
+    async def _run_one(self, spec: SimulationRunSpec) -> SimulationRunRecord:
+        """Run one simulation and append its record to the results file."""
+        self.progress.running += 1
+        start = time.perf_counter()
+        try:
+            simulation = SimulationService(
+                session_service=SessionService(
+                    session_repo=self.session_repo,
+                    graph_repo=self.graph_repo,
+                    extraction_llm_client=self.extraction_llm_client,
+                    generation_llm_client=self.generation_llm_client,
+                    embedding_service=self.embedding_service,
+                    srl_service=self.srl_service,
+                ),
+                synthetic_service=SyntheticService(
+                    llm_client=self.generation_llm_client, seed=spec.seed
+                ),
+            )
+            result = await simulation.simulate_interview(
+                concept_id=spec.concept_id,
+                persona_id=spec.persona_id,
+                max_turns=spec.max_turns,
+                session_id=str(uuid.uuid4()),
+                run_label=f"seed{spec.seed}",
+            )
+            duration_ms = (time.perf_counter() - start) * 1000
+            record = SimulationRunRecord(
+                run_id=spec.run_id,
+                concept_id=spec.concept_id,
+                persona_id=spec.persona_id,
+                seed=spec.seed,
+                status="completed",
+                session_id=result.session_id,
+                interview_status=result.status,
+                total_turns=result.total_turns,
+                duration_ms=round(duration_ms, 1),
+                mean_turn_ms=round(duration_ms / max(result.total_turns, 1), 1),
+                output_path=result.output_path,
+            )
+        except Exception as e:
+            log.error(
+                "simulation_run_failed",
+                batch_id=self.batch_id,
+                run_id=spec.run_id,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+            record = SimulationRunRecord(
+                run_id=spec.run_id,
+                concept_id=spec.concept_id,
+                persona_id=spec.persona_id,
+                seed=spec.seed,
+                status="failed",
+                duration_ms=round((time.perf_counter() - start) * 1000, 1),
+                error=f"{type(e).__name__}: {e}",
+            )
+        finally:
+            self.progress.running -= 1
+
+        await self._append(record)
+        return record
+
+    async def _append(self, record: SimulationRunRecord) -> None:
+        """Append a record to the results file and update progress."""
+        async with self._write_lock:
+            with open(self.results_path, "a") as f:
+                f.write(json.dumps(record.to_dict()) + "\n")
+
+        if record.status == "completed":
+            self.progress.completed += 1
+        else:
+            self.progress.failed += 1
+        self.progress.run_durations_ms.append(record.duration_ms)
+
+        log.info(
+            "simulation_batch_progress",
+            batch_id=self.batch_id,
+            run_id=record.run_id,
+            status=record.status,
+            duration_ms=record.duration_ms,
+            done=self.progress.done,
+            total=self.progress.total,
+        )
+        if self.on_progress is not None:
+            self.on_progress(self.progress)
+
+
+# Process-level registry of batches started through the API
+_batches: Dict[str, SimulationBatchRunner] = {}
+_batch_tasks: Dict[str, "asyncio.Task[List[SimulationRunRecord]]"] = {}
+
+
+async def run_simulation_batch(
+    specs: List[SimulationRunSpec],
+    batch_id: Optional[str] = None,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    on_progress: Optional[Callable[[BatchProgress], None]] = None,
+    runner_ready: Optional[Callable[[SimulationBatchRunner], None]] = None,
+) -> List[SimulationRunRecord]:
+    """Run a batch with one DB connection and the process-wide LLM clients.
+
+    Args:
+        specs: Run matrix
+        batch_id: Batch identifier; reuse to resume
+        concurrency: Maximum simulations in flight
+        on_progress: Called after every finished run
+        runner_ready: Called with the runner before any run starts
+
+    Returns:
+        Records for the runs executed by this call
+    """
+    from src.api.dependencies import (
+        get_shared_extraction_client,
+        get_shared_generation_client,
+    )
+    from src.persistence.database import get_db_connection
+
+    db = await get_db_connection()
+    try:
+        runner = SimulationBatchRunner(
+            session_repo=SessionRepository(str(settings.database_path)),
+            graph_repo=GraphRepository(db),
+            extraction_llm_client=get_shared_extraction_client(),
+            generation_llm_client=get_shared_generation_client(),
+            batch_id=batch_id,
+            concurrency=concurrency,
+            on_progress=on_progress,
+        )
+        if runner_ready is not None:
+            runner_ready(runner)
+        return await runner.run(specs)
+    finally:
+        # The shared :memory: connection must stay open for the process
+        if str(settings.database_path) != ":memory:":
+            await db.close()
+
+
+def start_simulation_batch(
+    specs: List[SimulationRunSpec],
+    batch_id: Optional[str] = None,
+    concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+) -> str:
+    """Start a batch as a background task (API job) and return its batch_id.
+
+    Raises:
+        ValueError: If a batch with this ID is already running
+    """
+    batch_id = batch_id or datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+    task = _batch_tasks.get(batch_id)
+    if task is not None and not task.done():
+        raise ValueError(f"Batch {batch_id} is already running")
+
+    def register(runner: SimulationBatchRunner) -> None:
+        _batches[batch_id] = runner
+
+    _batch_tasks[batch_id] = asyncio.create_task(
+        run_simulation_batch(
+            specs, batch_id=batch_id, concurrency=concurrency, runner_ready=register
+        )
+    )
+    return batch_id
+
+
+def get_batch_status(batch_id: str) -> Optional[Dict[str, Any]]:
+    """Return progress for a batch started via start_simulation_batch."""
+    task = _batch_tasks.get(batch_id)
+    if task is None:
+        return None
+
+    runner = _batches.get(batch_id)
+    status: Dict[str, Any] = runner.progress.to_dict() if runner else {"batch_id": batch_id}
+    if not task.done():
+        status["state"] = "running"
+    elif task.cancelled():
+        status["state"] = "cancelled"
+    elif task.exception() is not None:
+        status["state"] = "failed"
+        status["error"] = str(task.exception())
+    else:
+        status["state"] = "finished"
+    if runner:
+        status["results_path"] = str(runner.results_path)
+    return status
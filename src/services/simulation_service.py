@@ -16,7 +16,6 @@ Key Design:
     - Session service controls max_turns (NOT synthetic service)
 """
 
-import asyncio
 import json
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -105,6 +104,9 @@ class SimulationResult:
     canonical_slots: List[Dict[str, Any]] = field(default_factory=list)
     canonical_edges: List[Dict[str, Any]] = field(default_factory=list)
 
+    # Path of the saved JSON transcript (set after saving)
+    output_path: Optional[str] = None
+
 
 class SimulationService:
     """Service for AI-to-AI interview simulation.
@@ -142,6 +144,7 @@ class SimulationService:
         persona_id: str = DEFAULT_PERSONA,
         max_turns: int = DEFAULT_MAX_TURNS,
         session_id: Optional[str] = None,
+        run_label: Optional[str] = None,
     ) -> SimulationResult:
         """Simulate a complete AI-to-AI interview.
 
@@ -150,6 +153,8 @@ class SimulationService:
             persona_id: Persona ID for synthetic respondent
             max_turns: Maximum turns before forcing stop (controlled by SessionService)
             session_id: Optional session ID (generates new if None)
+            run_label: Optional suffix for the saved JSON filename, keeping
+                concurrent runs of the same concept/persona apart
 
         Returns:
             SimulationResult with complete transcript, graph diagnostics, and metadata
@@ -248,10 +253,8 @@ class SimulationService:
                 ),
             )
             turns.append(turn_result)
-
-            # Rate limit pacing: small delay between turns to avoid hitting
-            # Kimi rate limits (simulation runs faster than human-paced interviews)
-            await asyncio.sleep(0.5)
+            # No fixed pacing between turns: LLM clients wait on the shared
+            # per-provider rate limiter, so simulations run at the safe maximum
 
         # NEW: Fetch graph data for diagnostics (after loop, before result creation)
         (
@@ -298,7 +301,8 @@ class SimulationService:
         )
 
         # Automatically save to JSON
-        await self._save_simulation_result(result)
+        filepath = await self._save_simulation_result(result, run_label=run_label)
+        result.output_path = str(filepath)
 
         return result
 
@@ -626,11 +630,14 @@ class SimulationService:
         config = {"max_turns": max_turns}
         await self.session.session_repo.create(session, config)
 
-    async def _save_simulation_result(self, result: SimulationResult) -> Path:
+    async def _save_simulation_result(
+        self, result: SimulationResult, run_label: Optional[str] = None
+    ) -> Path:
         """Save simulation result to JSON file in synthetic_interviews/.
 
         Args:
             result: SimulationResult to save
+            run_label: Optional filename suffix (e.g., batch run seed)
 
         Returns:
             Path to saved file
@@ -640,7 +647,8 @@ class SimulationService:
 
         # Generate filename: {timestamp}_{concept_id}_{persona_id}.json
         timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-        filename = f"{timestamp}_{result.concept_id}_{result.persona_id}.json"
+        stem = f"{timestamp}_{result.concept_id}_{result.persona_id}"
+        filename = f"{stem}_{run_label}.json" if run_label else f"{stem}.json"
         filepath = SYNTHETIC_OUTPUT_DIR / filename
 
         # Convert dataclass to dict, handling nested dataclasses
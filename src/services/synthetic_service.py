@@ -34,17 +34,20 @@ class SyntheticService:
         self,
         llm_client: Optional[LLMClient] = None,
         deflection_chance: float = 0.2,
+        seed: Optional[int] = None,
     ):
         """Initialize synthetic service.
 
         Args:
             llm_client: LLM client for generating responses (creates default if None)
             deflection_chance: Probability of using deflection prompts (0.0-1.0)
+            seed: Seed for the deflection draw, making repeated runs reproducible
         """
         if llm_client is None:
             llm_client = get_llm_client("question_generation")
         self.llm_client = llm_client
         self.deflection_chance = deflection_chance
+        self._rng = random.Random(seed)
 
     async def generate_response(
         self,
@@ -84,7 +87,7 @@ class SyntheticService:
 
         # Determine whether to use deflection
         if use_deflection is None:
-            use_deflection = random.random() < self.deflection_chance
+            use_deflection = self._rng.random() < self.deflection_chance
 
         # Build prompts
         system_prompt = (
@@ -7,6 +7,7 @@ breaking up the monolithic SessionService.process_turn() method into testable st
 
 from .base import TurnStage
 from .context import PipelineContext
+from .events import TurnEvent, TurnEventSink
 from .pipeline import TurnPipeline
 from .result import TurnResult
 
@@ -15,4 +16,6 @@ __all__ = [
     "PipelineContext",
     "TurnPipeline",
     "TurnResult",
+    "TurnEvent",
+    "TurnEventSink",
 ]
@@ -6,7 +6,7 @@ process() method to perform their specific operation on the turn context.
 """
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
     from .context import PipelineContext
@@ -18,6 +18,11 @@ class TurnStage(ABC):
 
     Each stage must implement the process() method which takes a PipelineContext,
     performs its operation, updates the context, and returns the modified context.
+
+    Stages with optional slow work may also implement fallback(). TurnPipeline
+    then cancels process() once the stage's latency budget (turn_budgets in
+    interview_config.yaml) runs out and calls fallback() instead; stages
+    without a fallback run to completion and only have the overrun reported.
     """
 
     @abstractmethod
@@ -37,3 +42,20 @@ class TurnStage(ABC):
     def stage_name(self) -> str:
         """Return the stage name for logging."""
         return self.__class__.__name__
+
+    async def fallback(self, context: "PipelineContext") -> Optional["PipelineContext"]:
+        """
+        Produce this stage's output cheaply after process() overran its budget.
+
+        Args:
+            context: Turn context as left by the cancelled process() call
+
+        Returns:
+            Modified context, or None if the stage has no fallback
+        """
+        return None
+
+    @property
+    def has_fallback(self) -> bool:
+        """Whether the stage overrides fallback() (and so can be cut short)."""
+        return type(self).fallback is not TurnStage.fallback
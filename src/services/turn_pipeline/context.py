@@ -35,10 +35,13 @@ from src.domain.models.pipeline_contracts import (
     ResponseSavingOutput,
     ScoringPersistenceOutput,
 )
+from .events import TurnEvent, TurnEventSink
 
 if TYPE_CHECKING:
     from src.domain.models.canonical_graph import CanonicalGraphState
     from src.services.node_state_tracker import NodeStateTracker
+    from src.services.pipeline_profile import PipelineProfile
+    from src.services.post_turn_writer import PostTurnWrite
 
 
 @dataclass
@@ -78,6 +81,25 @@ class PipelineContext:
     # =============================================================================
     node_tracker: Optional["NodeStateTracker"] = None
 
+    # Progress events for streaming clients (None = blocking turn, no events)
+    event_sink: Optional[TurnEventSink] = None
+
+    # Write-behind: post-response stages append their writes here for the
+    # session's PostTurnWriter (None = stages persist inline)
+    post_turn_writes: Optional[List["PostTurnWrite"]] = None
+
+    # Load-shedding profile chosen for this turn (None = run every stage fully)
+    pipeline_profile: Optional["PipelineProfile"] = None
+
+    # Set by StrategySelectionStage.fallback: reuse the session's last LLM
+    # signals instead of calling the signal-scoring LLM
+    reuse_llm_signals: bool = False
+
+    # Per-turn strategy selection side effects already applied, so a budget
+    # fallback rerun of StrategySelectionStage does not repeat them
+    response_depth_recorded: bool = False
+    response_trend_recorded: bool = False
+
     # =============================================================================
     # Stage Outputs (Contracts)
     # =============================================================================
@@ -544,3 +566,19 @@ class PipelineContext:
 
     # Legacy fields kept for extreme backward compatibility (will be removed)
     stage_timings: Dict[str, float] = field(default_factory=dict)
+    # Per-signal-detector durations in ms (inside StrategySelectionStage)
+    signal_timings: Dict[str, float] = field(default_factory=dict)
+
+    # Latency budgets (TurnPipeline): stages that fell back after running out
+    # of budget, and {stage: {budget_ms, elapsed_ms, fallback}} per overrun
+    stage_fallbacks: List[str] = field(default_factory=list)
+    budget_overruns: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+
+    async def emit(self, event: str, **data: Any) -> None:
+        """Send a progress event to the event sink, if one is attached."""
+        if self.event_sink is not None:
+            await self.event_sink(TurnEvent(event=event, data=data))
+
+    async def emit_question_token(self, text: str) -> None:
+        """Forward a streamed chunk of the next question."""
+        await self.emit("question_token", text=text)
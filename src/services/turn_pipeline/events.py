@@ -0,0 +1,23 @@
+"""
+Turn progress events for streaming clients.
+
+TurnPipeline emits a "stage_completed" event after every stage and
+QuestionGenerationStage forwards "question_token" events while the next
+question streams from the LLM. Events are delivered to
+PipelineContext.event_sink; without a sink (the blocking POST /turns path)
+nothing is emitted and the question is generated with a plain completion.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict
+
+
+@dataclass
+class TurnEvent:
+    """A single progress event emitted while a turn is processed."""
+
+    event: str  # "stage_completed" | "question_token"
+    data: Dict[str, Any] = field(default_factory=dict)
+
+
+TurnEventSink = Callable[[TurnEvent], Awaitable[None]]
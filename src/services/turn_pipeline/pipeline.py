@@ -6,18 +6,25 @@ building. Provides main entry point for turn processing through the
 interview system's 12-stage pipeline.
 """
 
+import asyncio
 import time
-from typing import List
+from typing import List, Optional
 
 import structlog
 
-from src.llm.client import set_llm_session_id
+from src.core.config import TurnBudgetsConfig
+from src.core.exceptions import LLMTimeoutError
+from src.core.metrics import STAGE_DURATION, TURN_DURATION
+from src.core.tracing import span
+from src.llm.client import reset_llm_deadline, set_llm_deadline, set_llm_session_id
 from .base import TurnStage
 from .context import PipelineContext
 from .result import TurnResult
 
 log = structlog.get_logger(__name__)
 
+_turn_duration = TURN_DURATION.labels()
+
 
 class TurnPipeline:
     """
@@ -26,17 +33,37 @@ class TurnPipeline:
     Executes pipeline stages with timing tracking, error handling, and
     stage contract outputs. Builds TurnResult from context contracts
     for API response serialization.
+
+    With budgets, the turn deadline bounds every LLM call made by the
+    stages, a stage that declares a fallback is cut short when its budget
+    (or the turn deadline) runs out, and every overrun is reported in
+    TurnResult.budget_overruns.
     """
 
-    def __init__(self, stages: List[TurnStage]):
+    def __init__(
+        self,
+        stages: List[TurnStage],
+        budgets: Optional[TurnBudgetsConfig] = None,
+    ):
         """
         Initialize pipeline with ordered list of stages.
 
         Args:
             stages: Ordered list of TurnStage instances to execute sequentially
+            budgets: Turn deadline and per-stage latency budgets (None = unbounded)
         """
         self.stages = stages
+        self.budgets = budgets or TurnBudgetsConfig()
         self.logger = log
+        self._stage_metrics = {
+            stage.stage_name: STAGE_DURATION.labels(stage.stage_name)
+            for stage in stages
+        }
+
+        stage_names = {stage.stage_name for stage in stages}
+        unknown = sorted(set(self.budgets.stages) - stage_names)
+        if unknown:
+            log.warning("unknown_stage_budgets", stages=unknown)
 
     async def execute(self, context: PipelineContext) -> TurnResult:
         """
@@ -56,7 +83,21 @@ class TurnPipeline:
         Raises:
             Exception: If any stage fails (error logged before re-raising)
         """
+        with span("pipeline.turn", session_id=context.session_id) as turn_span:
+            result = await self._execute(context)
+            if turn_span is not None:
+                turn_span.set_attribute("turn_number", result.turn_number)
+                turn_span.set_attribute("stage_fallbacks", len(context.stage_fallbacks))
+            return result
+
+    async def _execute(self, context: PipelineContext) -> TurnResult:
+        """Run the stages (see execute) inside the turn span."""
         start_time = time.perf_counter()
+        turn_deadline = (
+            time.monotonic() + self.budgets.turn_deadline_ms / 1000
+            if self.budgets.turn_deadline_ms is not None
+            else None
+        )
 
         # Set session_id context for LLM usage tracking
         set_llm_session_id(context.session_id)
@@ -67,7 +108,7 @@ class TurnPipeline:
             num_stages=len(self.stages),
         )
 
-        for stage in self.stages:
+        for index, stage in enumerate(self.stages, start=1):
             stage_start = time.perf_counter()
 
             try:
@@ -77,16 +118,35 @@ class TurnPipeline:
                     session_id=context.session_id,
                 )
 
-                context = await stage.process(context)
+                with span(
+                    f"stage.{stage.stage_name}",
+                    stage=stage.stage_name,
+                    session_id=context.session_id,
+                ) as stage_span:
+                    context = await self._run_stage(stage, context, turn_deadline)
+                    if stage_span is not None:
+                        stage_span.set_attribute(
+                            "fallback", stage.stage_name in context.stage_fallbacks
+                        )
 
                 stage_elapsed = (time.perf_counter() - stage_start) * 1000
                 context.stage_timings[stage.stage_name] = stage_elapsed
+                self._observe_stage(stage, stage_elapsed)
+                self._check_budget(stage, context, stage_elapsed)
 
                 self.logger.info(
                     "stage_completed",
                     stage_name=stage.stage_name,
                     duration_ms=round(stage_elapsed, 2),
                 )
+                await context.emit(
+                    "stage_completed",
+                    stage=stage.stage_name,
+                    index=index,
+                    total=len(self.stages),
+                    duration_ms=round(stage_elapsed, 2),
+                    fallback=stage.stage_name in context.stage_fallbacks,
+                )
 
             except Exception as e:
                 self.logger.error(
@@ -97,7 +157,9 @@ class TurnPipeline:
                 )
                 raise
 
-        latency_ms = int((time.perf_counter() - start_time) * 1000)
+        turn_elapsed = time.perf_counter() - start_time
+        _turn_duration.observe(turn_elapsed)
+        latency_ms = int(turn_elapsed * 1000)
 
         self.logger.info(
             "pipeline_completed",
@@ -109,6 +171,90 @@ class TurnPipeline:
 
         return self._build_result(context, latency_ms)
 
+    def _observe_stage(self, stage: TurnStage, elapsed_ms: float) -> None:
+        """Record stage latency, resolving the metric child if stages changed."""
+        child = self._stage_metrics.get(stage.stage_name)
+        if child is None:
+            child = self._stage_metrics[stage.stage_name] = STAGE_DURATION.labels(
+                stage.stage_name
+            )
+        child.observe(elapsed_ms / 1000)
+
+    async def _run_stage(
+        self,
+        stage: TurnStage,
+        context: PipelineContext,
+        turn_deadline: Optional[float],
+    ) -> PipelineContext:
+        """Run one stage under its budget, falling back if it is cut short.
+
+        LLM calls made by the stage never wait past its deadline: the stage
+        budget for stages with a fallback, otherwise the turn deadline. The
+        fallback runs with that (expired) deadline still set, so any LLM call
+        it makes fails at once, and is bounded by budgets.fallback_ms.
+        """
+        deadline = turn_deadline
+        budget_ms = self.budgets.stages.get(stage.stage_name)
+        if stage.has_fallback and budget_ms is not None:
+            stage_deadline = time.monotonic() + budget_ms / 1000
+            deadline = min(stage_deadline, deadline or stage_deadline)
+
+        token = set_llm_deadline(deadline)
+        try:
+            if deadline is None or not stage.has_fallback:
+                return await stage.process(context)
+
+            try:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise TimeoutError
+                async with asyncio.timeout(remaining):
+                    return await stage.process(context)
+            except (TimeoutError, LLMTimeoutError):
+                # LLM timeouts are only budget overruns once the deadline passed
+                if time.monotonic() < deadline:
+                    raise
+                self.logger.warning(
+                    "stage_budget_fallback",
+                    stage_name=stage.stage_name,
+                    session_id=context.session_id,
+                    budget_ms=budget_ms,
+                )
+                context.stage_fallbacks.append(stage.stage_name)
+                async with asyncio.timeout(self.budgets.fallback_ms / 1000):
+                    fallback_context = await stage.fallback(context)
+                if fallback_context is None:
+                    raise RuntimeError(
+                        f"{stage.stage_name} declares a fallback but fallback() "
+                        "returned no context"
+                    )
+                return fallback_context
+        finally:
+            reset_llm_deadline(token)
+
+    def _check_budget(
+        self, stage: TurnStage, context: PipelineContext, elapsed_ms: float
+    ) -> None:
+        """Record the stage in context.budget_overruns if it exceeded its budget."""
+        budget_ms = self.budgets.stages.get(stage.stage_name)
+        fallback = stage.stage_name in context.stage_fallbacks
+        if not fallback and (budget_ms is None or elapsed_ms <= budget_ms):
+            return
+
+        context.budget_overruns[stage.stage_name] = {
+            "budget_ms": budget_ms,
+            "elapsed_ms": round(elapsed_ms, 2),
+            "fallback": fallback,
+        }
+        self.logger.warning(
+            "stage_over_budget",
+            stage_name=stage.stage_name,
+            session_id=context.session_id,
+            budget_ms=budget_ms,
+            elapsed_ms=round(elapsed_ms, 2),
+            fallback=fallback,
+        )
+
     def _build_result(self, context: PipelineContext, latency_ms: int) -> TurnResult:
         """
         Build TurnResult from stage contract outputs.
@@ -227,6 +373,11 @@ class TurnPipeline:
                 "metrics": {
                     "max_depth": cg_state.max_depth,
                 },
+                "reflects_turn": (
+                    context.state_computation_output.canonical_state_turn
+                    if context.state_computation_output
+                    else None
+                ),
             }
 
             # Build graph_comparison metrics
@@ -295,4 +446,14 @@ class TurnPipeline:
             saturation_metrics=saturation_metrics,
             node_signals=context.node_signals,
             score_decomposition=context.score_decomposition,
+            stage_timings={
+                name: round(ms, 2) for name, ms in context.stage_timings.items()
+            },
+            signal_timings={
+                name: round(ms, 2) for name, ms in context.signal_timings.items()
+            },
+            pipeline_profile=(
+                context.pipeline_profile.name if context.pipeline_profile else None
+            ),
+            budget_overruns=dict(context.budget_overruns),
         )
@@ -57,3 +57,11 @@ class TurnResult:
     node_signals: Optional[Dict[str, Dict[str, Any]]] = None
     # Per-candidate score decomposition from joint scoring (simulation-only)
     score_decomposition: Optional[List[Any]] = None
+    # Per-stage durations in ms from TurnPipeline
+    stage_timings: Dict[str, float] = field(default_factory=dict)
+    # Per-signal-detector durations in ms (part of StrategySelectionStage)
+    signal_timings: Dict[str, float] = field(default_factory=dict)
+    # Pipeline profile the turn ran with (e.g. "full", or "lean" under load)
+    pipeline_profile: Optional[str] = None
+    # Stages over their latency budget: {stage: {budget_ms, elapsed_ms, fallback}}
+    budget_overruns: Dict[str, Dict[str, Any]] = field(default_factory=dict)
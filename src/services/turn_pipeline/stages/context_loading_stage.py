@@ -15,6 +15,7 @@ import structlog
 
 from ..base import TurnStage
 from src.domain.models.pipeline_contracts import ContextLoadingOutput
+from src.persistence.database import connect
 from src.persistence.repositories.session_repo import SessionRepository
 from src.services.graph_service import GraphService
 
@@ -69,7 +70,7 @@ class ContextLoadingStage(TurnStage):
         from src.core.config import interview_config
 
         max_turns = interview_config.session.max_turns
-        async with aiosqlite.connect(str(self.session_repo.db_path)) as db:
+        async with connect(str(self.session_repo.db_path)) as db:
             db.row_factory = aiosqlite.Row
             cursor = await db.execute(
                 "SELECT config FROM sessions WHERE id = ?", (context.session_id,)
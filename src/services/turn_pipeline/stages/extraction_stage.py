@@ -4,17 +4,27 @@ Stage 3: Extract concepts and relationships.
 Uses ExtractionService to extract knowledge from user input, producing
 concepts and relationships that will be added to the knowledge graph.
 Outputs ExtractionOutput contract for downstream stages.
+
+With an EmbeddingService, the extraction response is streamed and each
+concept's embedding is computed as soon as the concept arrives, so
+GraphUpdateStage's surface dedup finds it cached instead of encoding after
+the full response. Graph writes still happen in GraphUpdateStage, in
+extraction order, so the resulting graph matches the buffered path.
 """
 
+from typing import Optional
+
 import structlog
 
 from ..base import TurnStage
 from ..context import PipelineContext
 from src.core.exceptions import ConfigurationError
+from src.domain.models.extraction import ExtractedConcept
 from src.domain.models.pipeline_contracts import (
     ExtractionOutput,
     SrlPreprocessingOutput,
 )
+from src.services.embedding_service import EmbeddingService
 from src.services.extraction_service import ExtractionService
 
 log = structlog.get_logger(__name__)
@@ -27,14 +37,21 @@ class ExtractionStage(TurnStage):
     Populates PipelineContext.extraction.
     """
 
-    def __init__(self, extraction_service: ExtractionService):
+    def __init__(
+        self,
+        extraction_service: ExtractionService,
+        embedding_service: Optional[EmbeddingService] = None,
+    ):
         """
         Initialize stage.
 
         Args:
             extraction_service: ExtractionService instance
+            embedding_service: Optional EmbeddingService shared with GraphService;
+                enables streaming extraction with embedding prefetch
         """
         self.extraction = extraction_service
+        self.embedding_service = embedding_service
 
     async def process(self, context: "PipelineContext") -> "PipelineContext":
         """
@@ -96,6 +113,7 @@ class ExtractionStage(TurnStage):
             methodology=context.methodology,
             context=extraction_context,
             source_utterance_id=source_utterance_id,
+            on_concept=self._prefetch_embedding if self.embedding_service else None,
         )
 
         # Create contract output (single source of truth)
@@ -115,6 +133,23 @@ class ExtractionStage(TurnStage):
 
         return context
 
+    async def _prefetch_embedding(self, concept: ExtractedConcept) -> None:
+        """
+        Warm the embedding cache for a concept while extraction streams.
+
+        Failures are logged and ignored: GraphUpdateStage encodes the concept
+        again and surfaces any real error there.
+
+        Args:
+            concept: Concept parsed from the partial extraction response
+        """
+        try:
+            await self.embedding_service.encode(concept.text)
+        except Exception as e:
+            log.warning(
+                "concept_embedding_prefetch_failed", text=concept.text, error=str(e)
+            )
+
     def _format_context_for_extraction(self, context: "PipelineContext") -> str:
         """
         Format context for extraction prompt.
@@ -11,6 +11,7 @@ import structlog
 
 from ..base import TurnStage
 from src.domain.models.pipeline_contracts import QuestionGenerationOutput
+from src.methodologies import get_registry
 from src.services.question_service import QuestionService
 
 
@@ -18,6 +19,11 @@ if TYPE_CHECKING:
     from ..context import PipelineContext
 log = structlog.get_logger(__name__)
 
+CLOSING_MESSAGE = "Thank you for sharing your thoughts with me today. This has been very helpful."
+
+# Used when the selected strategy declares no fallback_question
+DEFAULT_FALLBACK_QUESTION = "Could you tell me more about {focus}?"
+
 
 class QuestionGenerationStage(TurnStage):
     """
@@ -79,9 +85,12 @@ class QuestionGenerationStage(TurnStage):
                 recent_nodes=context.recent_nodes,
                 strategy=strategy,
                 topic=context.concept_name,  # Anchor questions to research topic
+                # Stream tokens only when a client is listening for them
+                on_token=context.emit_question_token if context.event_sink else None,
             )
         else:
-            next_question = "Thank you for sharing your thoughts with me today. This has been very helpful."
+            next_question = CLOSING_MESSAGE
+            await context.emit_question_token(next_question)
 
         # Create contract output (single source of truth)
         # No need to set individual fields - they're derived from the contract
@@ -102,3 +111,54 @@ class QuestionGenerationStage(TurnStage):
         )
 
         return context
+
+    async def fallback(self, context: "PipelineContext") -> "PipelineContext":
+        """Use the strategy's template question after a budget overrun.
+
+        The template is the strategy's fallback_question from the methodology
+        YAML (DEFAULT_FALLBACK_QUESTION if it has none), with "{focus}"
+        replaced by the focus concept or, failing that, the research topic.
+        On the final turn the standard closing message is used.
+        """
+        selection = context.strategy_selection_output
+        continuation = context.continuation_output
+        if selection is None or continuation is None:
+            raise RuntimeError(
+                "Pipeline contract violation: QuestionGenerationStage (Stage 8) requires "
+                "StrategySelectionStage (Stage 6) and ContinuationStage (Stage 7) "
+                "to complete first."
+            )
+
+        strategy = selection.strategy
+        methodology_config = get_registry().get_methodology(context.methodology)
+        strategy_config = next(
+            (s for s in methodology_config.strategies if s.name == strategy),
+            None,
+        )
+        template = (
+            strategy_config.fallback_question
+            if strategy_config and strategy_config.fallback_question
+            else DEFAULT_FALLBACK_QUESTION
+        )
+        focus = continuation.focus_concept or context.concept_name
+        if context.should_continue:
+            next_question = template.replace("{focus}", focus)
+        else:
+            # A closing-question strategy ran out of time on the final turn
+            next_question = CLOSING_MESSAGE
+        await context.emit_question_token(next_question)
+
+        log.warning(
+            "question_generation_fallback",
+            session_id=context.session_id,
+            strategy=strategy,
+            reason="budget_exceeded",
+        )
+
+        context.question_generation_output = QuestionGenerationOutput(
+            question=next_question,
+            strategy=strategy,
+            focus=selection.focus,
+            has_llm_fallback=True,
+        )
+        return context
@@ -2,7 +2,8 @@
 Stage 9: Save system response.
 
 Persists system utterance to the database. Outputs
-ResponseSavingOutput contract.
+ResponseSavingOutput contract. With write-behind enabled the insert is
+deferred to the session's PostTurnWriter (see post_turn_writer).
 """
 
 from typing import TYPE_CHECKING
@@ -14,6 +15,7 @@ import structlog
 
 from ..base import TurnStage
 from src.domain.models.pipeline_contracts import ResponseSavingOutput
+from src.services.post_turn_writer import PostTurnWrite, persist_or_defer
 
 
 if TYPE_CHECKING:
@@ -42,31 +44,24 @@ class ResponseSavingStage(TurnStage):
         Returns:
             Modified context with system_utterance set
         """
-        from src.persistence.database import get_db_connection
         from src.domain.models.utterance import Utterance
 
         utterance_id = str(uuid4())
         now = datetime.utcnow().isoformat()
 
-        db = await get_db_connection()
-        try:
-            await db.execute(
-                """
-                INSERT INTO utterances (id, session_id, turn_number, speaker, text, created_at)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    utterance_id,
-                    context.session_id,
-                    context.turn_number,
-                    "system",
-                    context.next_question,
-                    now,
-                ),
-            )
-            await db.commit()
-        finally:
-            await db.close()
+        await persist_or_defer(
+            context.post_turn_writes,
+            PostTurnWrite(
+                "system_utterance",
+                {
+                    "id": utterance_id,
+                    "session_id": context.session_id,
+                    "turn_number": context.turn_number,
+                    "text": context.next_question,
+                    "created_at": now,
+                },
+            ),
+        )
 
         # Create contract output (single source of truth)
         # No need to set individual fields - they're derived from the contract
@@ -2,19 +2,21 @@
 Stage 10: Persist scoring data and update session state.
 
 Saves scoring results and updates turn count. Outputs
-ScoringPersistenceOutput contract.
+ScoringPersistenceOutput contract. With write-behind enabled the writes are
+deferred to the session's PostTurnWriter (see post_turn_writer); the values
+written are still computed here, on the response path.
 """
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import uuid
-import aiosqlite
 
 import structlog
 
 from ..base import TurnStage
 from src.domain.models.pipeline_contracts import ScoringPersistenceOutput
 from src.persistence.repositories.session_repo import SessionRepository
+from src.services.post_turn_writer import PostTurnWrite, persist_or_defer
 
 
 if TYPE_CHECKING:
@@ -64,6 +66,7 @@ class ScoringPersistenceStage(TurnStage):
             strategy=context.strategy,
             depth_score=depth_score,
             saturation_score=saturation_score,
+            writes=context.post_turn_writes,
         )
 
         # Save qualitative signals if available
@@ -109,33 +112,27 @@ class ScoringPersistenceStage(TurnStage):
         strategy: str,
         depth_score: float,
         saturation_score: float,
+        writes: Optional[List[PostTurnWrite]] = None,
     ):
         """Save scoring data to scoring_history table."""
-        scoring_id = str(uuid.uuid4())
-
-        async with aiosqlite.connect(str(self.session_repo.db_path)) as db:
-            # Save to scoring_history
-            await db.execute(
-                """INSERT INTO scoring_history (
-                    id, session_id, turn_number,
-                    depth_score, saturation_score,
-                    novelty_score, richness_score,
-                    strategy_selected, strategy_reasoning, scorer_details
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-                (
-                    scoring_id,
-                    session_id,
-                    turn_number,
-                    depth_score,
-                    saturation_score,
-                    None,  # novelty_score
-                    None,  # richness_score
-                    strategy,
-                    None,  # strategy_reasoning
-                    None,  # scorer_details
-                ),
-            )
-            await db.commit()
+        await self._persist(
+            writes,
+            "scoring",
+            {
+                "id": str(uuid.uuid4()),
+                "session_id": session_id,
+                "turn_number": turn_number,
+                "depth_score": depth_score,
+                "saturation_score": saturation_score,
+                "strategy": strategy,
+            },
+        )
+
+    async def _persist(
+        self, writes: Optional[List[PostTurnWrite]], kind: str, payload: Dict[str, Any]
+    ) -> None:
+        """Apply a write now, or defer it when write-behind is enabled."""
+        await persist_or_defer(writes, PostTurnWrite(kind, payload), self.session_repo)
 
     async def _save_qualitative_signals(self, context: "PipelineContext") -> None:
         """Save LLM-extracted qualitative signals from graph_state.
@@ -178,31 +175,26 @@ class ScoringPersistenceStage(TurnStage):
                     signals[signal_type] = {"data": signal}
 
         if signals:  # Only save if we have at least one signal
-            signal_id = str(uuid.uuid4())
-            try:
-                await self.session_repo.save_qualitative_signals(
-                    signal_id=signal_id,
-                    session_id=context.session_id,
-                    turn_number=context.turn_number,
-                    signals=signals,
-                    llm_model=llm_model,
-                    extraction_latency_ms=extraction_latency_ms,
-                    extraction_errors=extraction_errors,
-                )
-                log.debug(
-                    "qualitative_signals_saved",
-                    session_id=context.session_id,
-                    turn_number=context.turn_number,
-                    signal_types=list(signals.keys()),
-                )
-            except Exception as e:
-                log.warning(
-                    "failed_to_save_qualitative_signals",
-                    session_id=context.session_id,
-                    turn_number=context.turn_number,
-                    error=str(e),
-                    error_type=type(e).__name__,
-                )
+            # Save failures are logged, not raised (signals are diagnostic)
+            await self._persist(
+                context.post_turn_writes,
+                "signals",
+                {
+                    "signal_id": str(uuid.uuid4()),
+                    "session_id": context.session_id,
+                    "turn_number": context.turn_number,
+                    "signals": signals,
+                    "llm_model": llm_model,
+                    "extraction_latency_ms": extraction_latency_ms,
+                    "extraction_errors": extraction_errors,
+                },
+            )
+            log.debug(
+                "qualitative_signals_saved",
+                session_id=context.session_id,
+                turn_number=context.turn_number,
+                signal_types=list(signals.keys()),
+            )
 
     async def _save_methodology_signals(self, context: "PipelineContext") -> None:
         """Save methodology-based signals from strategy_selection_output.
@@ -217,40 +209,34 @@ class ScoringPersistenceStage(TurnStage):
 
         # Convert methodology signals to format compatible with qualitative_signals table
         # We're reusing the qualitative_signals table for simplicity
-        signal_id = str(uuid.uuid4())
-        try:
-            # Flatten signals for storage
-            # Format: {"graph": {...}, "llm": {...}, "temporal": {...}, "meta": {...}}
-            flattened_signals = {}
-            for pool_name, pool_signals in context.signals.items():
-                if isinstance(pool_signals, dict):
-                    flattened_signals[pool_name] = pool_signals
-                else:
-                    flattened_signals[pool_name] = {"value": pool_signals}
-
-            await self.session_repo.save_qualitative_signals(
-                signal_id=signal_id,
-                session_id=context.session_id,
-                turn_number=context.turn_number,
-                signals=flattened_signals,
-                llm_model="methodology_signals",
-                extraction_latency_ms=0,
-                extraction_errors=[],
-            )
-            log.debug(
-                "methodology_signals_saved",
-                session_id=context.session_id,
-                turn_number=context.turn_number,
-                signal_pools=list(context.signals.keys()),
-            )
-        except Exception as e:
-            log.warning(
-                "failed_to_save_methodology_signals",
-                session_id=context.session_id,
-                turn_number=context.turn_number,
-                error=str(e),
-                error_type=type(e).__name__,
-            )
+        # Flatten signals for storage
+        # Format: {"graph": {...}, "llm": {...}, "temporal": {...}, "meta": {...}}
+        flattened_signals = {}
+        for pool_name, pool_signals in context.signals.items():
+            if isinstance(pool_signals, dict):
+                flattened_signals[pool_name] = pool_signals
+            else:
+                flattened_signals[pool_name] = {"value": pool_signals}
+
+        await self._persist(
+            context.post_turn_writes,
+            "signals",
+            {
+                "signal_id": str(uuid.uuid4()),
+                "session_id": context.session_id,
+                "turn_number": context.turn_number,
+                "signals": flattened_signals,
+                "llm_model": "methodology_signals",
+                "extraction_latency_ms": 0,
+                "extraction_errors": [],
+            },
+        )
+        log.debug(
+            "methodology_signals_saved",
+            session_id=context.session_id,
+            turn_number=context.turn_number,
+            signal_pools=list(context.signals.keys()),
+        )
 
     async def _update_turn_count(self, context: "PipelineContext") -> None:
         """Update session turn count, velocity state, and focus history.
@@ -346,15 +332,24 @@ class ScoringPersistenceStage(TurnStage):
             # Focus history for tracing strategy-node decisions
             focus_history=updated_history,
         )
-        await self.session_repo.update_state(context.session_id, updated_state)
+        await self._persist(
+            context.post_turn_writes,
+            "session_state",
+            {
+                "session_id": context.session_id,
+                "state": updated_state.model_dump(mode="json"),
+            },
+        )
 
     async def _persist_llm_usage(self, context: "PipelineContext") -> None:
         """
         Persist LLM token usage and costs to session metadata.
 
         Aggregates usage from TokenUsageService and saves to
-        session.config["metadata"]["llm_usage"].
+        session.config["metadata"]["llm_usage"], together with the slot
+        discovery fast-path counters under ["metadata"]["slot_discovery"].
         """
+        from src.services.canonical_slot_service import get_slot_discovery_stats
         from src.services.token_usage_service import get_token_usage_service
 
         token_service = get_token_usage_service()
@@ -362,12 +357,16 @@ class ScoringPersistenceStage(TurnStage):
 
         if usage_data:
             # Build metadata structure
-            metadata = {"metadata": {"llm_usage": usage_data}}
+            metadata: Dict[str, Any] = {"metadata": {"llm_usage": usage_data}}
+            slot_stats = get_slot_discovery_stats(context.session_id)
+            if slot_stats is not None:
+                metadata["metadata"]["slot_discovery"] = slot_stats.to_dict()
 
             # Persist to session config
-            await self.session_repo.update_metadata(
-                session_id=context.session_id,
-                metadata=metadata,
+            await self._persist(
+                context.post_turn_writes,
+                "session_metadata",
+                {"session_id": context.session_id, "metadata": metadata},
             )
 
             log.debug(
@@ -4,17 +4,29 @@ Slot Discovery Stage (Stage 4.5) - Dual-Graph Architecture.
 Discovers or updates canonical slots for newly added surface nodes.
 Maps surface KGNodes to abstract canonical slots via LLM proposal and
 embedding similarity matching. Also aggregates surface edges to canonical edges.
+
+In background canonicalization mode, or when the turn's pipeline profile
+defers slot discovery (degraded under load), the work is handed to the
+session's CanonicalizationWorker and this stage returns immediately.
 """
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 import structlog
 
 from ..base import TurnStage
-from src.domain.models.pipeline_contracts import SlotDiscoveryOutput
+from src.domain.models.knowledge_graph import KGNode
+from src.domain.models.pipeline_contracts import GraphUpdateOutput, SlotDiscoveryOutput
+from src.services.canonical_slot_service import get_slot_discovery_stats
+from src.services.canonicalization_worker import (
+    CanonicalizationJob,
+    drain_canonicalization_worker,
+    get_canonicalization_worker,
+)
 
 if TYPE_CHECKING:
     from ..context import PipelineContext
+    from src.services.canonical_graph_service import CanonicalGraphService
     from src.services.canonical_slot_service import CanonicalSlotService
     from src.services.graph_service import GraphService
 
@@ -41,6 +53,8 @@ class SlotDiscoveryStage(TurnStage):
         self,
         slot_service: Optional["CanonicalSlotService"] = None,
         graph_service: Optional["GraphService"] = None,
+        canonical_graph_service: Optional["CanonicalGraphService"] = None,
+        background: bool = False,
     ):
         """
         Initialize slot discovery stage.
@@ -48,6 +62,10 @@ class SlotDiscoveryStage(TurnStage):
         Args:
             slot_service: CanonicalSlotService for slot discovery and mapping, or None to disable feature
             graph_service: Optional GraphService for edge aggregation to canonical graph
+            canonical_graph_service: CanonicalGraphService used by the background
+                worker to publish canonical snapshots (background mode only)
+            background: Submit work to the session's CanonicalizationWorker
+                instead of running it inline
 
         Note:
             Both slot_service and graph_service are optional. If slot_service is None,
@@ -55,6 +73,8 @@ class SlotDiscoveryStage(TurnStage):
         """
         self.slot_service = slot_service
         self.graph_service = graph_service
+        self.canonical_graph_service = canonical_graph_service
+        self.background = background and canonical_graph_service is not None
 
     async def process(self, context: "PipelineContext") -> "PipelineContext":
         """
@@ -70,6 +90,8 @@ class SlotDiscoveryStage(TurnStage):
                 - slots_created: int (new slots this turn)
                 - slots_updated: int (existing slots with new mappings)
                 - mappings_created: int (surface nodes mapped)
+                - fast_path_hit_rate: float (session embedding fast-path share)
+                - llm_calls_saved: int (session LLM calls skipped)
                 - timestamp: datetime
 
         SIDE EFFECTS:
@@ -77,7 +99,8 @@ class SlotDiscoveryStage(TurnStage):
             - INSERT surface_to_slot_mapping (node mappings)
             - UPDATE canonical_slots.support_count (increment for matched)
             - Possible: UPDATE canonical_slots.status='active' (promotion)
-            - LLM call for slot proposal (uses generation client)
+            - LLM call for slot proposal (uses generation client), skipped when
+              every node is resolved by the embedding fast path
 
         ERROR HANDLING (fail-fast):
             - No nodes_added: skip LLM call, return SlotDiscoveryOutput with zeros
@@ -94,12 +117,7 @@ class SlotDiscoveryStage(TurnStage):
             RuntimeError: If graph_update_output is None (contract violation)
         """
         # CONTRACT VALIDATION: graph_update_output must exist
-        if context.graph_update_output is None:
-            raise RuntimeError(
-                "Pipeline contract violation: SlotDiscoveryStage (4.5) requires "
-                "GraphUpdateStage (4) to complete first. "
-                f"Session: {context.session_id}"
-            )
+        self._require_graph_update_output(context)
 
         # If feature is disabled, set empty output and return gracefully
         if self.slot_service is None:
@@ -111,6 +129,13 @@ class SlotDiscoveryStage(TurnStage):
             )
             return context
 
+        if self.background or self._deferred_by_profile(context):
+            return self._submit_background(context)
+
+        # Turns deferred by a degraded profile must land before inline work,
+        # so slots and canonical edges are still built in turn order
+        await drain_canonicalization_worker(context.session_id)
+
         surface_nodes = context.graph_update_output.nodes_added
 
         # GRACEFUL SKIP: No new nodes - return zeros without LLM call
@@ -198,10 +223,122 @@ class SlotDiscoveryStage(TurnStage):
             )
 
         # Set contract output
+        stats = get_slot_discovery_stats(context.session_id)
         context.slot_discovery_output = SlotDiscoveryOutput(
             slots_created=slots_created,
             slots_updated=slots_updated,
             mappings_created=mappings_created,
+            fast_path_hit_rate=stats.hit_rate if stats else 0.0,
+            llm_calls_saved=stats.llm_calls_saved if stats else 0,
+        )
+
+        return context
+
+    @property
+    def has_fallback(self) -> bool:
+        """Budget overruns are deferred to the canonicalization worker.
+
+        Without slot discovery or a canonical graph service there is no
+        worker to hand the turn to, so the stage runs to completion.
+        """
+        return self.slot_service is not None and self.canonical_graph_service is not None
+
+    async def fallback(self, context: "PipelineContext") -> "PipelineContext":
+        """Defer slot discovery to the background worker after a budget overrun.
+
+        The turn is handed to the session's CanonicalizationWorker, as in
+        background mode, so the canonical graph catches up by the next turn.
+        The cancelled attempt may already have mapped some nodes (the
+        embedding fast path writes mappings before the LLM call); only the
+        nodes still without a mapping are handed over. All surface edges
+        are, since canonical edges are deduplicated by surface edge ID.
+        """
+        graph_update = self._require_graph_update_output(context)
+        slot_service = self._require_background_services(context)
+        mapped = await slot_service.slot_repo.get_mapped_node_ids(
+            [node.id for node in graph_update.nodes_added]
+        )
+        unmapped = [node for node in graph_update.nodes_added if node.id not in mapped]
+        log.warning(
+            "slot_discovery_deferred",
+            session_id=context.session_id,
+            turn=context.turn_number,
+            reason="budget_exceeded",
+            deferred_nodes=len(unmapped),
+            already_mapped=len(mapped),
+            deferred_edges=len(graph_update.edges_added),
+        )
+        return self._submit_background(context, surface_nodes=unmapped)
+
+    def _require_graph_update_output(self, context: "PipelineContext") -> GraphUpdateOutput:
+        if context.graph_update_output is None:
+            raise RuntimeError(
+                "Pipeline contract violation: SlotDiscoveryStage (4.5) requires "
+                "GraphUpdateStage (4) to complete first. "
+                f"Session: {context.session_id}"
+            )
+        return context.graph_update_output
+
+    def _deferred_by_profile(self, context: "PipelineContext") -> bool:
+        """Whether the turn's pipeline profile moves slot discovery off-path."""
+        return (
+            context.pipeline_profile is not None
+            and context.pipeline_profile.defer_slot_discovery
+            and self.canonical_graph_service is not None
         )
 
+    def _require_background_services(self, context: "PipelineContext") -> "CanonicalSlotService":
+        if self.slot_service is None or self.canonical_graph_service is None:
+            raise RuntimeError(
+                "SlotDiscoveryStage needs slot_service and canonical_graph_service "
+                "to hand work to the canonicalization worker. "
+                f"Session: {context.session_id}"
+            )
+        return self.slot_service
+
+    def _submit_background(
+        self,
+        context: "PipelineContext",
+        surface_nodes: Optional[List[KGNode]] = None,
+    ) -> "PipelineContext":
+        """Hand this turn's surface changes to the session's background worker.
+
+        surface_nodes overrides the turn's nodes_added (e.g. to leave out
+        nodes that are already mapped). Counts in SlotDiscoveryOutput stay at
+        zero since the work has not run yet; the session-level fast-path
+        stats reflect completed jobs.
+        """
+        slot_service = self._require_background_services(context)
+        graph_update = self._require_graph_update_output(context)
+
+        if surface_nodes is None:
+            surface_nodes = graph_update.nodes_added
+        surface_edges = graph_update.edges_added
+        if surface_nodes or surface_edges:
+            worker = get_canonicalization_worker(
+                context.session_id,
+                slot_service=slot_service,
+                canonical_graph_service=self.canonical_graph_service,
+                graph_service=self.graph_service,
+            )
+            worker.submit(
+                CanonicalizationJob(
+                    turn_number=context.turn_number,
+                    methodology=context.methodology,
+                    surface_nodes=list(surface_nodes),
+                    surface_edges=list(surface_edges),
+                )
+            )
+        else:
+            log.debug(
+                "slot_discovery_skipped",
+                session_id=context.session_id,
+                reason="no_nodes_added",
+            )
+
+        stats = get_slot_discovery_stats(context.session_id)
+        context.slot_discovery_output = SlotDiscoveryOutput(
+            fast_path_hit_rate=stats.hit_rate if stats else 0.0,
+            llm_calls_saved=stats.llm_calls_saved if stats else 0,
+        )
         return context
@@ -26,8 +26,9 @@ class SRLPreprocessingStage(TurnStage):
     """
     Extract linguistic structure to guide extraction.
 
-    If srl_service is None (feature disabled), this stage skips gracefully
-    by setting an empty SrlPreprocessingOutput.
+    If srl_service is None (feature disabled), or the turn's pipeline profile
+    skips SRL, this stage skips gracefully by setting an empty
+    SrlPreprocessingOutput.
     """
 
     def __init__(self, srl_service: Optional["SRLService"] = None):
@@ -67,6 +68,17 @@ class SRLPreprocessingStage(TurnStage):
             )
             return context
 
+        # Degraded pipeline profile under load: drop the optional SRL hints
+        if context.pipeline_profile is not None and context.pipeline_profile.skip_srl:
+            context.srl_preprocessing_output = SrlPreprocessingOutput()
+            log.debug(
+                "srl_preprocessing_skipped",
+                session_id=context.session_id,
+                reason="pipeline_profile",
+                profile=context.pipeline_profile.name,
+            )
+            return context
+
         # Get interviewer question from recent utterances (last system utterance)
         interviewer_question: Optional[str] = None
         for utt in reversed(context.recent_utterances):
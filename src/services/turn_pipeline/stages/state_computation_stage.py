@@ -4,7 +4,8 @@ Stage 5: Compute graph state and saturation metrics.
 Refreshes graph state after graph updates, computes saturation metrics for
 interview continuation decisions, and tracks computation timestamp for
 freshness validation. Optionally computes canonical graph state for
-dual-graph architecture.
+dual-graph architecture, either inline or from the latest snapshot published
+by the background canonicalization worker.
 """
 
 from dataclasses import dataclass
@@ -16,6 +17,7 @@ import structlog
 from ..base import TurnStage
 from src.domain.models.pipeline_contracts import StateComputationOutput
 from src.domain.models.knowledge_graph import SaturationMetrics, GraphState
+from src.services.canonicalization_worker import get_latest_canonical_snapshot
 from src.services.graph_service import GraphService
 
 
@@ -67,6 +69,7 @@ class StateComputationStage(TurnStage):
         self,
         graph_service: GraphService,
         canonical_graph_service: Optional["CanonicalGraphService"] = None,
+        background_canonicalization: bool = False,
     ):
         """Initialize state computation stage.
 
@@ -74,9 +77,14 @@ class StateComputationStage(TurnStage):
             graph_service: GraphService instance for surface graph state computation
             canonical_graph_service: Optional service for canonical graph state in dual-graph architecture.
                 When provided, computes aggregated canonical state alongside surface state.
+            background_canonicalization: Read canonical state from the latest
+                background worker snapshot instead of computing it inline
         """
         self.graph = graph_service
         self.canonical_graph_service = canonical_graph_service
+        self.background_canonicalization = (
+            background_canonicalization and canonical_graph_service is not None
+        )
         # Session-scoped saturation tracking (persists across turns)
         self._saturation_tracking: Dict[str, _SaturationTrackingState] = {}
 
@@ -114,13 +122,27 @@ class StateComputationStage(TurnStage):
 
         # Compute canonical graph state (optional, for dual-graph architecture)
         canonical_graph_state = None
-        if self.canonical_graph_service is not None:
+        canonical_state_turn = None
+        if self.background_canonicalization:
+            snapshot = get_latest_canonical_snapshot(context.session_id)
+            if snapshot is not None:
+                canonical_graph_state = snapshot.state
+                canonical_state_turn = snapshot.turn_number
+            log.debug(
+                "canonical_snapshot_used",
+                session_id=context.session_id,
+                turn=context.turn_number,
+                snapshot_turn=canonical_state_turn,
+            )
+        elif self.canonical_graph_service is not None:
             canonical_graph_state = (
                 await self.canonical_graph_service.compute_canonical_state(
                     context.session_id
                 )
             )
+            canonical_state_turn = context.turn_number
 
+        if canonical_graph_state is not None:
             # Log surface vs canonical node counts with reduction percentage
             surface_count = graph_state.node_count if graph_state else 0
             canonical_count = canonical_graph_state.concept_count
@@ -152,6 +174,7 @@ class StateComputationStage(TurnStage):
             computed_at=computed_at,
             saturation_metrics=saturation,
             canonical_graph_state=canonical_graph_state,
+            canonical_state_turn=canonical_state_turn,
         )
 
         log.debug(
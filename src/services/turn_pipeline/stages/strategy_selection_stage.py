@@ -169,6 +169,33 @@ class StrategySelectionStage(TurnStage):
 
         return context
 
+    async def fallback(self, context: "PipelineContext") -> "PipelineContext":
+        """Select again without the signal-scoring LLM call after a budget overrun.
+
+        The rerun uses the session's last live LLM signals (neutral values if
+        none); if the cancelled attempt's LLM call had already returned,
+        those are this turn's signals and are reused rather than requested
+        again. Graph and node signals are recomputed for this turn. The
+        pipeline bounds the rerun by turn_budgets.fallback_ms.
+
+        The cancelled attempt may have stopped at any await, so state it
+        mutates must tolerate the rerun:
+        - response depth appended to the previous focus node and the global
+          response trend history: applied once per turn, guarded by
+          context.response_depth_recorded / response_trend_recorded
+        - node_tracker.update_focus and graph_state.add_strategy_used: their
+          mutations come after an attempt's last await, so a cancelled
+          attempt never applies them
+        - strategy_selection_output: set only when an attempt completes
+        """
+        log.warning(
+            "strategy_selection_reusing_llm_signals",
+            session_id=context.session_id,
+            reason="budget_exceeded",
+        )
+        context.reuse_llm_signals = True
+        return await self.process(context)
+
     async def _select_strategy_and_node(
         self,
         context: "PipelineContext",
@@ -232,13 +259,19 @@ class StrategySelectionStage(TurnStage):
             if context.node_tracker
             else None,
         )
-        if signals and context.node_tracker and context.node_tracker.previous_focus:
+        if (
+            signals
+            and context.node_tracker
+            and context.node_tracker.previous_focus
+            and not context.response_depth_recorded
+        ):
             response_depth = signals.get("llm.response_depth")
             if response_depth:
                 await context.node_tracker.append_response_signal(
                     context.node_tracker.previous_focus,
                     response_depth,
                 )
+                context.response_depth_recorded = True
                 log.info(
                     "response_depth_appended_to_node",
                     node_id=context.node_tracker.previous_focus,
@@ -0,0 +1,201 @@
+"""
+Opt-in per-turn profiling.
+
+A turn is profiled when the request carries an X-Profile-Turn header or the
+session was created with config {"profile_turns": true}. The turn's
+TurnPipeline.execute runs under a sampling profiler: a thread samples the
+event loop thread's stack every settings.turn_profile_interval_ms and
+counts collapsed stacks. The result is written to
+<turn_profile_dir>/<session_id>/turn_<NNNN>.collapsed in the collapsed
+stack format read by flamegraph.pl and speedscope.
+
+Samples are attributed by call chain, since other sessions' turns share
+the event loop:
+- stacks that pass through this turn's execute() are rooted at "turn"
+- the loop waiting in select() (e.g. on an LLM response) is "[idle]"
+- anything else the loop runs meanwhile (other turns, background
+  workers) is "[other]"
+
+When profiling is off, the cost per turn is a dict lookup; a session's
+config flag is read from the database once per process and cached.
+"""
+
+import asyncio
+import sys
+import threading
+from collections import Counter
+from pathlib import Path
+from types import CodeType, FrameType
+from typing import Any, Awaitable, Dict, List, Optional, Tuple, TypeVar
+
+import structlog
+
+from src.core.config import settings
+from src.persistence.repositories.session_repo import SessionRepository
+
+log = structlog.get_logger(__name__)
+
+T = TypeVar("T")
+
+PROFILE_SUFFIX = ".collapsed"
+
+_IDLE = ("[idle]",)
+_OTHER = "[other]"
+
+# session_id -> profile_turns flag from the session config
+_session_flags: Dict[str, bool] = {}
+
+
+async def should_profile_turn(
+    session_id: str, session_repo: SessionRepository, requested: bool = False
+) -> bool:
+    """Return True if this turn should be profiled.
+
+    Args:
+        session_id: Session running the turn
+        session_repo: Used to read the session config on first use
+        requested: The request asked for profiling (X-Profile-Turn header)
+    """
+    if not settings.enable_turn_profiling:
+        return False
+    if requested:
+        return True
+    flag = _session_flags.get(session_id)
+    if flag is None:
+        config = await session_repo.get_config(session_id)
+        flag = _session_flags[session_id] = bool(config.get("profile_turns"))
+    return flag
+
+
+def forget_session(session_id: str) -> None:
+    """Drop a session's cached profiling flag (e.g. when the session ends)."""
+    _session_flags.pop(session_id, None)
+
+
+class StackSampler:
+    """Samples one thread's Python stack from a background thread."""
+
+    def __init__(self, thread_id: int, root_frame: FrameType, interval_s: float):
+        self.thread_id = thread_id
+        self.root_frame = root_frame
+        self.interval_s = interval_s
+        self.samples: Counter = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="turn-profiler", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_s):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.samples[self._stack_key(frame)] += 1
+
+    def _stack_key(self, frame: FrameType) -> Tuple[Any, ...]:
+        """Codes from outermost to innermost, classified as turn/idle/other."""
+        if frame.f_code.co_name == "select" and "selectors" in frame.f_code.co_filename:
+            return _IDLE
+
+        codes: List[Any] = []
+        current: Optional[FrameType] = frame
+        while current is not None:
+            if current is self.root_frame:
+                codes.append("turn")
+                return tuple(reversed(codes))
+            codes.append(current.f_code)
+            current = current.f_back
+        codes.append(_OTHER)
+        return tuple(reversed(codes))
+
+
+def render_collapsed(samples: Counter) -> str:
+    """Format samples as collapsed stacks ("frame;frame;frame count")."""
+    lines = [
+        f"{';'.join(_frame_label(code) for code in stack)} {count}"
+        for stack, count in samples.most_common()
+    ]
+    return "\n".join(lines) + "\n" if lines else ""
+
+
+def _frame_label(code: Any) -> str:
+    if not isinstance(code, CodeType):
+        return code
+    path = Path(code.co_filename)
+    try:
+        path = path.relative_to(Path.cwd())
+    except ValueError:
+        pass
+    return f"{code.co_qualname} ({path}:{code.co_firstlineno})".replace(";", ",")
+
+
+async def profile_turn(session_id: str, execute: Awaitable[T]) -> T:
+    """Await a TurnPipeline.execute() coroutine under the stack sampler.
+
+    The profile is written once the turn finishes (successfully or not),
+    keyed by the turn number from the result (or "failed").
+    """
+    sampler = StackSampler(
+        thread_id=threading.get_ident(),
+        root_frame=execute.cr_frame,  # type: ignore[attr-defined]
+        interval_s=settings.turn_profile_interval_ms / 1000,
+    )
+    sampler.start()
+    result = None
+    try:
+        result = await execute
+        return result
+    finally:
+        sampler.stop()
+        turn_number = getattr(result, "turn_number", None)
+        path = profile_path(session_id, turn_number)
+        await asyncio.to_thread(_write_profile, path, render_collapsed(sampler.samples))
+        log.info(
+            "turn_profile_written",
+            session_id=session_id,
+            turn_number=turn_number,
+            samples=sum(sampler.samples.values()),
+            path=str(path),
+        )
+
+
+def profile_path(session_id: str, turn_number: Optional[int]) -> Path:
+    """Artifact path for a session's turn (turn_failed when unknown)."""
+    name = f"turn_{turn_number:04d}" if turn_number is not None else "turn_failed"
+    return _session_dir(session_id) / f"{name}{PROFILE_SUFFIX}"
+
+
+def list_profiles(session_id: str) -> List[Dict[str, Any]]:
+    """Describe the stored profiles for a session, oldest turn first."""
+    directory = _session_dir(session_id)
+    if not directory.is_dir():
+        return []
+    profiles = []
+    for path in sorted(directory.glob(f"turn_*{PROFILE_SUFFIX}")):
+        suffix = path.stem.removeprefix("turn_")
+        text = path.read_text(encoding="utf-8")
+        profiles.append(
+            {
+                "turn_number": int(suffix) if suffix.isdigit() else None,
+                "file": path.name,
+                "samples": sum(int(line.rsplit(" ", 1)[1]) for line in text.splitlines() if line),
+                "size_bytes": path.stat().st_size,
+            }
+        )
+    return profiles
+
+
+def _session_dir(session_id: str) -> Path:
+    # Session ids come from URLs; never let one escape the profile directory
+    if not session_id or Path(session_id).name != session_id or session_id in (".", ".."):
+        raise ValueError(f"Invalid session id: {session_id!r}")
+    return Path(settings.turn_profile_dir) / session_id
+
+
+def _write_profile(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
@@ -4,7 +4,7 @@ Node-level signals are derived from NodeStateTracker and computed
 per node. These signals enable joint strategy-node scoring.
 """
 
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, ClassVar, Iterable, Literal, Optional
 
 from src.signals.signal_base import SignalDetector
 from src.domain.models.node_state import NodeState
@@ -37,6 +37,13 @@ class NodeSignalDetector(SignalDetector):
         node_tracker: NodeStateTracker instance for accessing node states (always set)
         signal_name: Namespaced signal name (e.g., "graph.node.exhausted")
         requires_node_tracker: Marker for node-level signals (class attribute)
+        refresh: Incremental refresh policy (class attribute):
+            - "per_turn": value depends on turn-relative or external state
+              (turns_since_*, context signals, canonical mappings) and is
+              recomputed for every node each turn
+            - "on_change": value depends only on the node's own tracked state
+              and previous_focus; recomputed only for nodes the tracker marked
+              dirty, served from the tracker's signal cache otherwise
     """
 
     # Override parent's optional type with non-optional for node-level signals
@@ -45,6 +52,23 @@ class NodeSignalDetector(SignalDetector):
     # All node-level signals require NodeStateTracker
     requires_node_tracker: bool = True  # type: ignore[misc]
 
+    # Safe default: recompute everything unless a detector opts in
+    refresh: ClassVar[Literal["per_turn", "on_change"]] = "per_turn"
+
+    # Node IDs this instance is restricted to (None = all tracked nodes)
+    _node_scope: Optional[frozenset[str]] = None
+
+    def restrict_to(self, node_ids: Iterable[str]) -> None:
+        """Limit detection to a subset of tracked nodes.
+
+        Used by NodeSignalDetectionService to recompute "on_change" signals
+        only for dirty nodes.
+
+        Args:
+            node_ids: Tracking keys of the nodes to detect
+        """
+        self._node_scope = frozenset(node_ids)
+
     async def _get_node_state(self, node_id: str) -> Optional[NodeState]:
         """Get NodeState for a node.
 
@@ -75,10 +99,17 @@ class NodeSignalDetector(SignalDetector):
     def _get_all_node_states(self) -> dict[str, NodeState]:
         """Get all tracked node states.
 
+        Honors restrict_to(): when a scope is set, only those nodes are returned.
+
         Returns:
             Dictionary mapping node_id to NodeState
         """
-        return self.node_tracker.get_all_states()
+        if self._node_scope is None:
+            return self.node_tracker.get_all_states()
+        states = self.node_tracker.states
+        return {
+            node_id: states[node_id] for node_id in self._node_scope if node_id in states
+        }
 
     def _calculate_shallow_ratio(
         self, state: NodeState, recent_count: int = 3
@@ -251,10 +251,11 @@ class NodeFocusStreakSignal(NodeSignalDetector):
 
     Namespaced signal: graph.node.focus_streak
     Cost: low (reads from NodeStateTracker state)
-    Refresh: per_turn (recomputed each turn after state updates)
+    Refresh: on_change (recomputed when focus changes)
     """
 
     signal_name = "graph.node.focus_streak"
+    refresh = "on_change"
     description = "Current focus streak category: none (0), low (1), medium (2-3), high (4+). Indicates persistent focus on a node."
 
     async def detect(self, context, graph_state, response_text):  # noqa: ARG001
@@ -311,10 +312,11 @@ class NodeIsCurrentFocusSignal(NodeSignalDetector):
 
     Namespaced signal: graph.node.is_current_focus
     Cost: low (reads from NodeStateTracker.previous_focus)
-    Refresh: per_turn (recomputed each turn after state updates)
+    Refresh: on_change (recomputed when focus changes)
     """
 
     signal_name = "graph.node.is_current_focus"
+    refresh = "on_change"
     description = "Whether this node is the current focus. True for focused node, False for others."
 
     async def detect(self, context, graph_state, response_text):  # noqa: ARG001
@@ -416,10 +418,11 @@ class NodeIsOrphanSignal(NodeSignalDetector):
 
     Namespaced signal: graph.node.is_orphan
     Cost: low (reads from NodeStateTracker state)
-    Refresh: per_turn (recomputed each turn after state updates)
+    Refresh: on_change (recomputed when edge counts change)
     """
 
     signal_name = "graph.node.is_orphan"
+    refresh = "on_change"
     description = (
         "Whether node is an orphan (no edges). True if isolated, False if connected."
     )
@@ -457,10 +460,11 @@ class NodeEdgeCountSignal(NodeSignalDetector):
 
     Namespaced signal: graph.node.edge_count
     Cost: low (reads from NodeStateTracker state)
-    Refresh: per_turn (recomputed each turn after state updates)
+    Refresh: on_change (recomputed when edge counts change)
     """
 
     signal_name = "graph.node.edge_count"
+    refresh = "on_change"
     description = "Total number of edges (incoming + outgoing) connected to this node. Higher values indicate more connected concepts."
 
     async def detect(self, context, graph_state, response_text):  # noqa: ARG001
@@ -496,10 +500,11 @@ class NodeHasOutgoingSignal(NodeSignalDetector):
 
     Namespaced signal: graph.node.has_outgoing
     Cost: low (reads from NodeStateTracker state)
-    Refresh: per_turn (recomputed each turn after state updates)
+    Refresh: on_change (recomputed when edge counts change)
     """
 
     signal_name = "graph.node.has_outgoing"
+    refresh = "on_change"
     description = "Whether node has outgoing edges. True if node has been explored and has connections, False otherwise."
 
     async def detect(self, context, graph_state, response_text):  # noqa: ARG001
@@ -600,10 +605,11 @@ class NodeFocusCountSignal(NodeSignalDetector):
 
     Namespaced signal: graph.node.focus_count
     Cost: low (reads from NodeStateTracker state)
-    Refresh: per_turn
+    Refresh: on_change (recomputed when focus changes)
     """
 
     signal_name = "graph.node.focus_count"
+    refresh = "on_change"
     description = "Cumulative total times this node has been selected as focus across the entire interview. Never resets."
 
     async def detect(self, context, graph_state, response_text):  # noqa: ARG001
@@ -6,6 +6,8 @@ one API call to Kimi K2.5 (via scoring LLM client).
 
 import json
 import logging
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type
 
@@ -18,11 +20,116 @@ if TYPE_CHECKING:
 log = logging.getLogger(__name__)
 
 
+# Directory holding high_level.md, signals.md and output_example.json
+PROMPTS_DIR = Path(__file__).parent / "prompts"
+
+# Signals reported as categories rather than normalized [0, 1] scores
+CATEGORICAL_SIGNALS = {"llm.response_depth"}  # Add others as needed
+
+
+def neutral_signal_value(signal_name: str) -> Any:
+    """Normalized value of a mid-scale score (3 of 5) for an LLM signal.
+
+    Used in place of a detected value when the signal-scoring call is skipped.
+    """
+    return "moderate" if signal_name in CATEGORICAL_SIGNALS else 0.5
+
+
+@dataclass(frozen=True)
+class _PromptTemplates:
+    """Parsed prompt files shared by all LLMBatchDetector instances."""
+
+    high_level_prompt: str
+    signal_rubrics: Dict[str, str]
+    output_example: Dict[str, Any]
+
+
+def _read_template(prompts_dir: Path, template_name: str) -> str:
+    """Read a prompt template file.
+
+    Args:
+        prompts_dir: Directory containing prompt templates
+        template_name: Name of template file (e.g., "signals.md")
+
+    Returns:
+        Template content as string
+    """
+    template_path = prompts_dir / template_name
+    if not template_path.exists():
+        raise FileNotFoundError(f"Prompt template not found: {template_path}")
+
+    with open(template_path) as f:
+        return f.read()
+
+
+def _parse_signal_rubrics(content: str) -> Dict[str, str]:
+    """Parse signals.md content into rubric sections.
+
+    Returns:
+        Dictionary mapping signal key to its rubric content
+        e.g., {"response_depth": "## response_depth\\n1=...", ...}
+    """
+    # Parse by signal sections (signal_name: description at column 0)
+    # signals.md uses indentation-based structure:
+    #   response_depth: How much elaboration...   <- header (no indent)
+    #       1 = Minimal or single-word answer     <- content (indented)
+    rubrics: Dict[str, List[str]] = {}
+    current_signal = None
+
+    for line in content.split("\n"):
+        stripped = line.strip()
+        # Signal header: starts at column 0, contains ":", not a comment
+        if (
+            line
+            and not line[0].isspace()
+            and ":" in stripped
+            and not stripped.startswith("#")
+        ):
+            current_signal = stripped.split(":")[0].strip().lower()
+            # Include the description after the colon as first line of rubric
+            description = ":".join(stripped.split(":")[1:]).strip()
+            rubrics[current_signal] = [description] if description else []
+        elif current_signal and stripped and not stripped.startswith("#"):
+            rubrics[current_signal].append(stripped)
+
+    # Join rubric content
+    return {signal: "\n".join(lines) for signal, lines in rubrics.items()}
+
+
+@lru_cache(maxsize=None)
+def _load_prompt_templates(prompts_dir: Path) -> _PromptTemplates:
+    """Read and parse all prompt files once per process.
+
+    Cleared by LLMBatchDetector.clear_prompt_cache() on config reload.
+    """
+    signals_md_path = prompts_dir / "signals.md"
+    if not signals_md_path.exists():
+        raise FileNotFoundError(f"Signals rubric not found: {signals_md_path}")
+    example_path = prompts_dir / "output_example.json"
+    if not example_path.exists():
+        raise FileNotFoundError(f"Output example not found: {example_path}")
+
+    with open(example_path) as f:
+        output_example = json.load(f)
+
+    log.debug("LLM signal prompts loaded from %s", prompts_dir)
+
+    return _PromptTemplates(
+        high_level_prompt=_read_template(prompts_dir, "high_level.md"),
+        signal_rubrics=_parse_signal_rubrics(_read_template(prompts_dir, "signals.md")),
+        output_example=output_example,
+    )
+
+
 class LLMBatchDetector:
     """Orchestrates batch LLM signal detection.
 
     Loads high_level.md base prompt, injects signal-specific rubrics
     from signals.md, and makes a single API call.
+
+    Prompt files are read and parsed once per process, and the static
+    rubric/output-format section is rendered once per signal set, so a
+    detector can be reused across turns without file I/O.
     """
 
     def __init__(self, llm_client: LLMClient):
@@ -33,92 +140,28 @@ class LLMBatchDetector:
         """
         self.llm_client = llm_client
 
-        # Load prompts
-        self._high_level_prompt = self._load_high_level_prompt()
-        self._signal_rubrics = self._load_signal_rubrics()
-        self._output_example = self._load_output_example()
+        # Load prompts (cached per process)
+        templates = _load_prompt_templates(self._prompts_dir)
+        self._high_level_prompt = templates.high_level_prompt
+        self._signal_rubrics = templates.signal_rubrics
+        self._output_example = templates.output_example
 
-        log.debug(
-            "LLMBatchDetector initialized with prompts from %s", self._prompts_dir
-        )
+        # Rendered rubric + output-format sections keyed by rubric key tuple
+        self._static_sections: Dict[Optional[tuple], str] = {}
 
     @property
     def _prompts_dir(self) -> Path:
         """Path to prompts directory."""
-        return Path(__file__).parent / "prompts"
-
-    def _load_high_level_prompt(self) -> str:
-        """Load high_level.md base prompt template."""
-        return self._load_template("high_level.md")
-
-    def _load_template(self, template_name: str) -> str:
-        """Load a prompt template file.
+        return PROMPTS_DIR
 
-        Args:
-            template_name: Name of template file (e.g., "signals.md")
-
-        Returns:
-            Template content as string
-        """
-        template_path = self._prompts_dir / template_name
-        if not template_path.exists():
-            raise FileNotFoundError(f"Prompt template not found: {template_path}")
-
-        with open(template_path) as f:
-            return f.read()
-
-    def _load_signal_rubrics(self) -> Dict[str, str]:
-        """Parse signals.md to extract rubric sections.
-
-        Returns:
-            Dictionary mapping signal key to its rubric content
-            e.g., {"response_depth": "## response_depth\\n1=...", ...}
-        """
-        signals_md_path = self._prompts_dir / "signals.md"
-        if not signals_md_path.exists():
-            raise FileNotFoundError(f"Signals rubric not found: {signals_md_path}")
-
-        with open(signals_md_path) as f:
-            content = f.read()
-
-        # Parse by signal sections (signal_name: description at column 0)
-        # signals.md uses indentation-based structure:
-        #   response_depth: How much elaboration...   <- header (no indent)
-        #       1 = Minimal or single-word answer     <- content (indented)
-        rubrics: Dict[str, List[str]] = {}
-        current_signal = None
-
-        for line in content.split("\n"):
-            stripped = line.strip()
-            # Signal header: starts at column 0, contains ":", not a comment
-            if (
-                line
-                and not line[0].isspace()
-                and ":" in stripped
-                and not stripped.startswith("#")
-            ):
-                current_signal = stripped.split(":")[0].strip().lower()
-                # Include the description after the colon as first line of rubric
-                description = ":".join(stripped.split(":")[1:]).strip()
-                rubrics[current_signal] = [description] if description else []
-            elif current_signal and stripped and not stripped.startswith("#"):
-                rubrics[current_signal].append(stripped)
-
-        # Join rubric content
-        return {signal: "\n".join(lines) for signal, lines in rubrics.items()}
-
-    def _load_output_example(self) -> Dict[str, Any]:
-        """Load output_example.json to show expected format.
+    @staticmethod
+    def clear_prompt_cache() -> None:
+        """Drop cached prompt files so the next detector re-reads them.
 
-        Returns:
-            Dictionary with signal examples
+        Existing detectors keep the prompts they were built with; callers
+        reloading config should also drop cached detectors.
         """
-        example_path = self._prompts_dir / "output_example.json"
-        if not example_path.exists():
-            raise FileNotFoundError(f"Output example not found: {example_path}")
-
-        with open(example_path) as f:
-            return json.load(f)
+        _load_prompt_templates.cache_clear()
 
     def _build_prompt(
         self,
@@ -143,6 +186,27 @@ class LLMBatchDetector:
             else (question or "N/A"),
         )
 
+        return prompt + self._static_section(signal_classes)
+
+    def _static_section(self, signal_classes: Optional[List[Type]] = None) -> str:
+        """Return the rubric and output-format section for a signal set.
+
+        The section depends only on which signals are requested, so it is
+        rendered once per signal set and reused on every turn.
+
+        Args:
+            signal_classes: List of signal classes to include (for rubric_key mapping)
+        """
+        cache_key = (
+            tuple(getattr(cls, "_rubric_key", None) for cls in signal_classes)
+            if signal_classes
+            else None
+        )
+        section = self._static_sections.get(cache_key)
+        if section is not None:
+            return section
+
+        section = ""
         # Inject signal rubrics for specified signal classes using rubric_key
         # (non-namespaced key for LLM communication)
         rubrics = self._signal_rubrics
@@ -150,18 +214,19 @@ class LLMBatchDetector:
             for signal_cls in signal_classes:
                 rubric_key = getattr(signal_cls, "_rubric_key", None)
                 if rubric_key and rubric_key in rubrics:
-                    prompt += f"\n\n## {rubric_key.replace('_', ' ').title()}\n"
-                    prompt += rubrics[rubric_key]
+                    section += f"\n\n## {rubric_key.replace('_', ' ').title()}\n"
+                    section += rubrics[rubric_key]
         else:
             # Fallback: use all rubrics (legacy behavior)
             for signal_key, rubric_content in rubrics.items():
-                prompt += f"\n\n## {signal_key.replace('llm.', '').title().replace('_', ' ')}\n"
-                prompt += rubric_content
+                section += f"\n\n## {signal_key.replace('llm.', '').title().replace('_', ' ')}\n"
+                section += rubric_content
 
         # Add output format instructions
-        prompt += "\n\n" + self._output_format_instructions(signal_classes)
+        section += "\n\n" + self._output_format_instructions(signal_classes)
 
-        return prompt
+        self._static_sections[cache_key] = section
+        return section
 
     def _output_format_instructions(
         self, signal_classes: Optional[List[Type]] = None
@@ -322,8 +387,6 @@ The rationale field should briefly justify the score in one sentence (max 20 wor
             # Normalize based on signal type
             # Categorical signals: keep as string categories
             # Continuous signals: normalize to [0, 1]
-            CATEGORICAL_SIGNALS = {"llm.response_depth"}  # Add others as needed
-
             if signal_name in CATEGORICAL_SIGNALS:
                 # Map 1-5 to categorical strings for downstream compatibility
                 score_to_category = {
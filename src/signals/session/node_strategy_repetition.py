@@ -20,9 +20,11 @@ class NodeStrategyRepetitionSignal(NodeSignalDetector):
     - high: 5+ consecutive times
 
     Namespaced signal: technique.node.strategy_repetition
+    Refresh: on_change (recomputed when focus changes)
     """
 
     signal_name = "technique.node.strategy_repetition"
+    refresh = "on_change"
 
     async def detect(self, context, graph_state, response_text):
         """Detect strategy repetition for all nodes.
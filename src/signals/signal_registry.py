@@ -7,6 +7,9 @@ Now includes LLM-aware signal detection that batches LLM signals
 into a single Kimi K2.5 API call.
 """
 
+import asyncio
+import time
+
 import structlog
 from typing import Any, List, Optional, Set, TYPE_CHECKING
 
@@ -23,6 +26,17 @@ if TYPE_CHECKING:
 
 log = structlog.get_logger(__name__)
 
+# Key for the LLM batch call in PipelineContext.signal_timings (other entries
+# are keyed by signal name)
+LLM_BATCH_TIMING_KEY = "llm_batch"
+
+
+class _ContextWithSignals:
+    """Minimal context exposing already-detected signals to dependent detectors."""
+
+    def __init__(self, signals_dict: dict[str, Any]):
+        self.signals = signals_dict
+
 
 class ComposedSignalDetector:
     """Composed signal detector from YAML config.
@@ -35,6 +49,10 @@ class ComposedSignalDetector:
 
     Now includes special handling for LLM signals to batch
     them into a single API call via LLMBatchDetector.
+
+    Non-LLM detectors are grouped into dependency levels; detectors within
+    a level run concurrently, and the LLM batch call runs alongside all
+    levels since no non-LLM detector depends on an LLM signal.
     """
 
     def __init__(
@@ -78,6 +96,9 @@ class ComposedSignalDetector:
             detector = signal_class(node_tracker=node_tracker)
             self.non_llm_detectors.append(detector)
 
+        # Independent detectors grouped by dependency depth
+        self.detector_levels = self._build_detector_levels(self.non_llm_detectors)
+
         # LLM detector will be set separately via set_llm_detector()
         self._llm_detector: Optional[LLMBatchDetector] = None
         self.llm_signal_names = llm_signal_names
@@ -85,6 +106,59 @@ class ComposedSignalDetector:
         # Combine all detectors (will be set after LLM detector is configured)
         self.detectors: List[SignalDetector] = []
 
+    @staticmethod
+    def _build_detector_levels(
+        detectors: List[SignalDetector],
+    ) -> List[List[SignalDetector]]:
+        """Group detectors into levels that can each run concurrently.
+
+        A dependency is provided by the detector whose signal_name equals it
+        or prefixes it (e.g. "graph.chain_completion" provides
+        "graph.chain_completion.ratio"). Dependencies outside the set are
+        ignored. Order within a level follows the input order.
+
+        Args:
+            detectors: Non-LLM detector instances
+
+        Returns:
+            Levels of detectors; every detector's providers are in earlier levels
+
+        Raises:
+            ValueError: If the dependencies are circular
+        """
+        names = [d.signal_name for d in detectors]
+
+        def provider(dep: str) -> Optional[str]:
+            for name in names:
+                if dep == name or dep.startswith(name + "."):
+                    return name
+            return None
+
+        requires = {
+            d.signal_name: {
+                p
+                for p in map(provider, d.dependencies)
+                if p is not None and p != d.signal_name
+            }
+            for d in detectors
+        }
+
+        levels: List[List[SignalDetector]] = []
+        done: Set[str] = set()
+        remaining = list(detectors)
+        while remaining:
+            ready = [d for d in remaining if requires[d.signal_name] <= done]
+            if not ready:
+                cycle = [d.signal_name for d in remaining]
+                raise ValueError(
+                    f"Circular dependency detected in signals: {cycle}. "
+                    f"Check signal dependencies and break the cycle."
+                )
+            levels.append(ready)
+            done.update(d.signal_name for d in ready)
+            remaining = [d for d in remaining if d.signal_name not in done]
+        return levels
+
     @staticmethod
     def _is_llm_signal(signal_name: str) -> bool:
         """Check if a signal name is an LLM signal."""
@@ -104,6 +178,11 @@ class ComposedSignalDetector:
             f"LLM signals: {sorted(self.llm_signal_names)}"
         )
 
+    @property
+    def has_llm_detector(self) -> bool:
+        """Whether an LLM batch detector has been attached."""
+        return self._llm_detector is not None
+
     @classmethod
     def get_known_signal_names(cls) -> Set[str]:
         """Return set of all registered signal names."""
@@ -119,14 +198,21 @@ class ComposedSignalDetector:
         graph_state: Any,
         response_text: str,
         question: str | None = None,
+        llm_signals: Optional[dict[str, Any]] = None,
     ) -> dict[str, Any]:
-        """Detect all signals in dependency order.
+        """Detect all signals, level by level, overlapping the LLM batch call.
+
+        Per-detector durations are recorded in context.signal_timings under
+        the signal name (and "llm_batch") when available. They are kept out
+        of stage_timings because they overlap the enclosing stage's time.
 
         Args:
             context: Pipeline context
             graph_state: Current knowledge graph state
             response_text: User's response text
             question: The question that prompted this response (for LLM scoring context)
+            llm_signals: Values to report for the LLM signals instead of making
+                the batch call (degraded pipeline profile)
 
         Returns:
             Dictionary of all detected signals
@@ -135,70 +221,122 @@ class ComposedSignalDetector:
             ScorerFailureError: If any signal detector fails
         """
         all_signals: dict[str, Any] = {}
+        timings: dict[str, float] = {}
+
+        llm_task: Optional[asyncio.Task] = None
+        if llm_signals is not None:
+            all_signals.update(
+                {k: v for k, v in llm_signals.items() if k in self.llm_signal_names}
+            )
+        elif self.llm_signal_names and self._llm_detector:
+            llm_task = asyncio.create_task(
+                self._detect_llm_signals(response_text, question, timings)
+            )
 
-        # Detect non-LLM signals using individual calls
-        for detector in self.non_llm_detectors:
-            signal_name = detector.signal_name
-            if signal_name not in self.llm_signal_names:
-                # For signals with dependencies, provide context with previous signals
-                if detector.dependencies:
-
-                    class _ContextWithSignals:
-                        def __init__(self, signals_dict):
-                            self.signals = signals_dict
-
-                    detect_context = _ContextWithSignals(all_signals)
-                else:
-                    detect_context = context
-
-                try:
-                    signals = await detector.detect(
-                        detect_context, graph_state, response_text
-                    )
-                    all_signals.update(signals)
-                except Exception as e:
-                    log.error(
-                        "signal_detector_failed",
-                        signal_name=signal_name,
-                        error=str(e),
-                        exc_info=True,
+        try:
+            for level in self.detector_levels:
+                # Dependents only see signals from earlier levels, which
+                # holds all of their in-set dependencies
+                level_results = await asyncio.gather(
+                    *(
+                        self._run_detector(
+                            detector,
+                            context,
+                            graph_state,
+                            response_text,
+                            all_signals,
+                            timings,
+                        )
+                        for detector in level
                     )
-                    raise ScorerFailureError(
-                        f"Signal detector '{signal_name}' failed: {e}"
-                    ) from e
-
-        # Detect LLM signals using batch detector
-        if self.llm_signal_names and self._llm_detector:
-            try:
-                # Get LLM signal classes from registry for batch detection
-                from src.signals.llm.decorator import _registered_llm_signals
-
-                llm_signal_classes = [
-                    _registered_llm_signals[name]
-                    for name in self.llm_signal_names
-                    if name in _registered_llm_signals
-                ]
-
-                log.debug(
-                    f"Batching {len(self.llm_signal_names)} LLM signals: "
-                    f"{sorted(self.llm_signal_names)}"
-                )
-
-                # Batch all LLM signals in one call
-                llm_signals = await self._llm_detector.detect(
-                    response_text=response_text,
-                    question=question,
-                    signal_classes=llm_signal_classes,
                 )
+                for signals in level_results:
+                    all_signals.update(signals)
 
-                # Merge LLM signal results into all_signals
-                all_signals.update(llm_signals)
+            if llm_task is not None:
+                all_signals.update(await llm_task)
+        except BaseException:
+            if llm_task is not None and not llm_task.done():
+                llm_task.cancel()
+            raise
+        finally:
+            signal_timings = getattr(context, "signal_timings", None)
+            if isinstance(signal_timings, dict):
+                signal_timings.update(timings)
 
-                log.info(f"LLM batch detection complete: {llm_signals}")
+        return all_signals
 
-            except Exception as e:
-                log.error(f"LLM batch detection failed: {e}", exc_info=True)
-                # Re-raise as ScorerFailureError to maintain consistent error handling
-                raise ScorerFailureError(f"LLM signal detection failed: {e}") from e
+    async def _run_detector(
+        self,
+        detector: SignalDetector,
+        context: "PipelineContext",
+        graph_state: Any,
+        response_text: str,
+        all_signals: dict[str, Any],
+        timings: dict[str, float],
+    ) -> dict[str, Any]:
+        """Run one non-LLM detector, timing it and wrapping failures."""
+        signal_name = detector.signal_name
+        # For signals with dependencies, provide context with previous signals
+        if detector.dependencies:
+            detect_context: Any = _ContextWithSignals(all_signals)
+        else:
+            detect_context = context
+
+        start = time.perf_counter()
+        try:
+            return await detector.detect(detect_context, graph_state, response_text)
+        except Exception as e:
+            log.error(
+                "signal_detector_failed",
+                signal_name=signal_name,
+                error=str(e),
+                exc_info=True,
+            )
+            raise ScorerFailureError(
+                f"Signal detector '{signal_name}' failed: {e}"
+            ) from e
+        finally:
+            timings[signal_name] = (
+                time.perf_counter() - start
+            ) * 1000
+
+    async def _detect_llm_signals(
+        self,
+        response_text: str,
+        question: str | None,
+        timings: dict[str, float],
+    ) -> dict[str, Any]:
+        """Run the batched LLM signal call, timing it and wrapping failures."""
+        start = time.perf_counter()
+        try:
+            # Get LLM signal classes from registry for batch detection
+            from src.signals.llm.decorator import _registered_llm_signals
 
-        return all_signals
+            llm_signal_classes = [
+                _registered_llm_signals[name]
+                for name in self.llm_signal_names
+                if name in _registered_llm_signals
+            ]
+
+            log.debug(
+                f"Batching {len(self.llm_signal_names)} LLM signals: "
+                f"{sorted(self.llm_signal_names)}"
+            )
+
+            # Batch all LLM signals in one call
+            llm_signals = await self._llm_detector.detect(  # type: ignore[union-attr]
+                response_text=response_text,
+                question=question,
+                signal_classes=llm_signal_classes,
+            )
+
+            log.info(f"LLM batch detection complete: {llm_signals}")
+            return llm_signals
+
+        except Exception as e:
+            log.error(f"LLM batch detection failed: {e}", exc_info=True)
+            # Re-raise as ScorerFailureError to maintain consistent error handling
+            raise ScorerFailureError(f"LLM signal detection failed: {e}") from e
+        finally:
+            timings[LLM_BATCH_TIMING_KEY] = (time.perf_counter() - start) * 1000
@@ -0,0 +1,24 @@
+"""Shared fixtures for LLM client tests."""
+
+import httpx
+import pytest
+
+from src.llm.fake_provider import FakeProviderConfig, create_fake_provider_app
+
+
+@pytest.fixture
+def route_to_fake(monkeypatch):
+    """Send the clients' httpx traffic to an in-process fake provider."""
+    real_client = httpx.AsyncClient
+
+    def install(config=None):
+        app = create_fake_provider_app(config or FakeProviderConfig(latency="none"))
+        transport = httpx.ASGITransport(app=app)
+        monkeypatch.setattr(
+            httpx,
+            "AsyncClient",
+            lambda **kwargs: real_client(transport=transport, **kwargs),
+        )
+        return app
+
+    return install
@@ -0,0 +1,91 @@
+"""Tests for LLM record/replay cassettes."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.core.exceptions import LLMCassetteMissError
+from src.llm.cassette import (
+    CassetteStore,
+    LatencyModel,
+    RecordingLLMClient,
+    ReplayLLMClient,
+    cassette_key,
+)
+from src.llm.client import LLMResponse
+
+
+def _inner_client(*contents):
+    inner = MagicMock()
+    inner.complete = AsyncMock(
+        side_effect=[
+            LLMResponse(
+                content=content,
+                model="m",
+                usage={"input_tokens": 10, "output_tokens": 5},
+                latency_ms=812.34,
+            )
+            for content in contents
+        ]
+    )
+    return inner
+
+
+def test_key_ignores_whitespace_and_uuids():
+    a = cassette_key("extraction", "m", "Node 3f2b8c1a-0d4e-4f6a-9b7c-1a2b3c4d5e6f:\n  hi")
+    b = cassette_key("extraction", "m", "Node 9a8b7c6d-5e4f-4a3b-8c2d-1e0f9a8b7c6d: hi")
+
+    assert a == b
+    assert a != cassette_key("extraction", "m", "Node: hello")
+    assert a != cassette_key("question_generation", "m", "Node: hi")
+
+
+@pytest.mark.asyncio
+async def test_record_then_replay_round_trip(tmp_path):
+    path = tmp_path / "cassette.jsonl"
+    recorder = RecordingLLMClient(
+        _inner_client("first", "second"),
+        client_type="extraction",
+        model="m",
+        store=CassetteStore(path),
+    )
+    await recorder.complete(prompt="same prompt", system="sys")
+    await recorder.complete(prompt="same prompt", system="sys")
+
+    # An empty store is still the one written to (not the default cassette)
+    assert len(path.read_text().splitlines()) == 2
+
+    replay = ReplayLLMClient(
+        client_type="extraction",
+        model="m",
+        store=CassetteStore(path),  # fresh store reads from disk
+        latency=LatencyModel("none"),
+    )
+    contents = [
+        (await replay.complete(prompt="same  prompt", system="sys")).content for _ in range(3)
+    ]
+
+    assert contents == ["first", "second", "first"]
+
+
+@pytest.mark.asyncio
+async def test_replay_miss_raises(tmp_path):
+    replay = ReplayLLMClient(
+        client_type="extraction",
+        model="m",
+        store=CassetteStore(tmp_path / "empty.jsonl"),
+        latency=LatencyModel("none"),
+    )
+
+    with pytest.raises(LLMCassetteMissError):
+        await replay.complete(prompt="never recorded")
+
+
+def test_latency_models():
+    assert LatencyModel("recorded").sample_ms(812.3) == 812.3
+    assert LatencyModel("fixed:25").sample_ms(812.3) == 25
+    samples = [LatencyModel("normal:100,10").sample_ms(0) for _ in range(2)]
+    assert samples[0] == samples[1]  # seeded
+    assert LatencyModel("lognormal:200,0.3").sample_ms(0) > 0
+    with pytest.raises(ValueError):
+        LatencyModel("normal:100")
@@ -0,0 +1,130 @@
+"""Tests for the local fake LLM provider, driven through the real clients."""
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.exceptions import LLMRateLimitError
+from src.core.schema_loader import load_methodology
+from src.domain.models.knowledge_graph import KGNode
+from src.llm.client import AnthropicClient, KimiClient
+from src.llm.fake_provider import FakeProviderConfig
+from src.llm.prompts.extraction import (
+    get_extraction_system_prompt,
+    get_extraction_user_prompt,
+    parse_extraction_response,
+)
+from src.services.canonical_slot_service import CanonicalSlotService
+from src.signals.llm.batch_detector import LLMBatchDetector
+from src.signals.llm.signals import depth, engagement  # noqa: F401  (registers)
+
+BASE_URL = "http://fake-llm/v1"
+
+
+def _anthropic(client_type="extraction", model="fake-anthropic"):
+    return AnthropicClient(
+        model=model,
+        temperature=0.3,
+        max_tokens=1024,
+        timeout=10.0,
+        client_type=client_type,
+        api_key="fake",
+        base_url=BASE_URL,
+    )
+
+
+def _kimi(client_type="signal_scoring", model="fake-kimi"):
+    return KimiClient(
+        model=model,
+        temperature=0.3,
+        max_tokens=1024,
+        timeout=10.0,
+        client_type=client_type,
+        api_key="fake",
+        base_url=BASE_URL,
+    )
+
+
+@pytest.mark.asyncio
+async def test_extraction_output_matches_methodology(route_to_fake):
+    route_to_fake()
+    system = get_extraction_system_prompt("means_end_chain")
+    user = get_extraction_user_prompt(
+        "I like the noise cancelling because it helps me focus at work"
+    )
+
+    response = await _anthropic().complete(
+        prompt=user, system=system, response_format={"type": "json_object"}
+    )
+    data = parse_extraction_response(response.content)
+
+    schema = load_methodology("means_end_chain")
+    valid_types = set(schema.get_node_descriptions())
+    assert data["concepts"]
+    assert {c["node_type"] for c in data["concepts"]} <= valid_types
+    assert len(data["relationships"]) == len(data["concepts"]) - 1
+    assert response.usage["input_tokens"] > 0
+
+
+@pytest.mark.asyncio
+async def test_slot_discovery_output_parses(route_to_fake):
+    route_to_fake()
+    service = CanonicalSlotService(
+        llm_client=_kimi("slot_scoring"),
+        slot_repo=MagicMock(),
+        embedding_service=MagicMock(),
+    )
+    nodes = [
+        KGNode(id=f"n{i}", session_id="s", label=label, node_type="attribute")
+        for i, label in enumerate(["noise cancelling", "noise cancelling mode"])
+    ]
+
+    proposals = await service._llm_propose_slots_batched(
+        {"attribute": nodes}, {"attribute": "product features"}, {}
+    )
+
+    assert proposals["attribute"] == [
+        {
+            "slot_name": "noise_cancelling",
+            "description": "Concepts about noise cancelling",
+            "surface_node_ids": ["n0", "n1"],
+        }
+    ]
+
+
+@pytest.mark.asyncio
+async def test_signal_scores_cover_requested_signals(route_to_fake):
+    route_to_fake()
+    detector = LLMBatchDetector(_kimi())
+
+    signals = await detector.detect(
+        "It matters because I travel a lot", question="Why does that matter?"
+    )
+
+    assert signals
+    assert all(isinstance(v, str) or 0.0 <= v <= 1.0 for v in signals.values()), signals
+
+
+@pytest.mark.asyncio
+async def test_question_generation_returns_plain_text(route_to_fake):
+    route_to_fake()
+
+    response = await _kimi("question_generation").complete(
+        prompt="The respondent talked about battery life.",
+        system="You are an interviewer.",
+    )
+
+    assert response.content.endswith("?")
+    with pytest.raises(json.JSONDecodeError):
+        json.loads(response.content)
+
+
+@pytest.mark.asyncio
+async def test_injected_rate_limits_surface_as_429(route_to_fake):
+    app = route_to_fake(FakeProviderConfig(latency="none", rate_limit_rate=1.0, retry_after_s=0.01))
+
+    with pytest.raises(LLMRateLimitError):
+        await _anthropic(model="fake-429").complete(prompt="hello")
+
+    assert app.state.stats["rate_limited"] == 2  # initial attempt + 1 retry
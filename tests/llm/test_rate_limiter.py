@@ -0,0 +1,117 @@
+"""Tests for the shared per-provider/model LLM rate limiter."""
+
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from src.llm.client import (
+    KimiClient,
+    ProviderRateLimiter,
+    _parse_reset_seconds,
+    get_rate_limiter,
+)
+
+
+def test_parse_reset_formats():
+    assert _parse_reset_seconds("2") == 2.0
+    assert _parse_reset_seconds("1m30s") == 90.0
+    assert _parse_reset_seconds("250ms") == 0.25
+    future = (datetime.now(timezone.utc) + timedelta(seconds=30)).isoformat()
+    assert 28 < _parse_reset_seconds(future) <= 30
+    assert _parse_reset_seconds("soon") is None
+
+
+def test_limiters_are_shared_per_provider_and_model():
+    assert get_rate_limiter("kimi", "m-shared") is get_rate_limiter("kimi", "m-shared")
+    assert get_rate_limiter("kimi", "m-shared") is not get_rate_limiter("kimi", "m-other")
+
+
+@pytest.mark.asyncio
+async def test_acquire_waits_for_refill_and_reports_delay():
+    limiter = ProviderRateLimiter("test/refill", requests_per_minute=6000)
+    limiter.requests.available = 0  # bucket drained; refills 100/s
+
+    delay = await limiter.acquire()
+
+    assert 0.005 < delay < 0.5
+    assert limiter.stats()["acquired"] == 1
+
+
+@pytest.mark.asyncio
+async def test_token_budget_limits_large_requests():
+    limiter = ProviderRateLimiter("test/tokens", tokens_per_minute=60000)
+
+    assert await limiter.acquire(estimated_tokens=60000) == pytest.approx(0, abs=0.01)
+    limiter.record_usage(estimated_tokens=60000, actual_tokens=59000)
+
+    # 1000 tokens refunded; a 1000-token request goes straight through
+    assert await limiter.acquire(estimated_tokens=1000) == pytest.approx(0, abs=0.01)
+
+
+def test_learns_limits_from_anthropic_headers():
+    limiter = ProviderRateLimiter("test/anthropic")
+    reset = (datetime.now(timezone.utc) + timedelta(seconds=5)).isoformat()
+
+    limiter.update_from_headers(
+        {
+            "anthropic-ratelimit-requests-limit": "50",
+            "anthropic-ratelimit-requests-remaining": "0",
+            "anthropic-ratelimit-requests-reset": reset,
+        }
+    )
+
+    assert limiter.requests.per_minute == 50
+    assert limiter.requests.available == 0
+    assert 3 < limiter.paused_until - time.monotonic() <= 5
+
+
+def test_learns_limits_from_openai_headers():
+    limiter = ProviderRateLimiter("test/openai")
+
+    limiter.update_from_headers(
+        {
+            "x-ratelimit-limit-tokens": "64000",
+            "x-ratelimit-remaining-tokens": "1200",
+            "x-ratelimit-reset-tokens": "1m",
+        }
+    )
+
+    assert limiter.tokens.per_minute == 64000
+    assert limiter.tokens.available == 1200
+    assert limiter.paused_until == 0.0
+
+
+@pytest.mark.asyncio
+async def test_429_retry_after_pauses_limiter_and_retries():
+    client = KimiClient(
+        model="rate-limit-test-model",
+        temperature=0.3,
+        max_tokens=100,
+        timeout=10.0,
+        client_type="slot_scoring",
+        api_key="test-key",
+    )
+    request = httpx.Request("POST", "https://test")
+    responses = [
+        httpx.Response(429, headers={"retry-after": "0.05"}, request=request),
+        httpx.Response(
+            200,
+            json={
+                "choices": [{"message": {"content": "ok"}}],
+                "usage": {"prompt_tokens": 1, "completion_tokens": 1},
+            },
+            request=request,
+        ),
+    ]
+
+    async def mock_post(url, headers=None, json=None):
+        return responses.pop(0)
+
+    with patch("httpx.AsyncClient.post", side_effect=mock_post):
+        response = await client.complete(prompt="test")
+
+    assert response.content == "ok"
+    assert response.queue_delay_ms >= 40
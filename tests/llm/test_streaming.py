@@ -0,0 +1,96 @@
+"""Tests for LLMClient.stream() on the Anthropic and OpenAI-compatible clients."""
+
+import json
+
+import pytest
+
+from src.core.exceptions import LLMRateLimitError
+from src.llm.client import AnthropicClient, KimiClient
+from src.llm.fake_provider import FakeProviderConfig
+from src.services.token_usage_service import get_token_usage_service
+
+BASE_URL = "http://fake-llm/v1"
+NO_DELAY = FakeProviderConfig(latency="none", stream_chunk_ms=0)
+QUESTION_SYSTEM = "Generate the next interview question."
+QUESTION_PROMPT = "Ask a follow-up question about weekday dinners."
+
+
+def _client(cls, model):
+    return cls(
+        model=model,
+        temperature=0.3,
+        max_tokens=256,
+        timeout=10.0,
+        client_type="question_generation",
+        api_key="fake",
+        base_url=BASE_URL,
+    )
+
+
+def _usage(session_id, model):
+    return get_token_usage_service().get_session_usage(session_id)[model]["question_generation"]
+
+
+@pytest.mark.parametrize(
+    "cls,model",
+    [(AnthropicClient, "claude-sonnet-4-6"), (KimiClient, "kimi-k2-0905-preview")],
+)
+async def test_stream_matches_complete_and_records_usage(route_to_fake, cls, model):
+    route_to_fake(NO_DELAY)
+    client = _client(cls, model)
+
+    complete = await client.complete(prompt=QUESTION_PROMPT, system=QUESTION_SYSTEM)
+    chunks = [
+        chunk
+        async for chunk in client.stream(
+            prompt=QUESTION_PROMPT, system=QUESTION_SYSTEM, session_id="stream-s1"
+        )
+    ]
+
+    usage = _usage("stream-s1", model)
+    assert len(chunks) > 1
+    assert "".join(chunks) == complete.content
+    assert usage["input_tokens"] == complete.usage["input_tokens"]
+    assert usage["output_tokens"] == complete.usage["output_tokens"]
+
+
+async def test_anthropic_stream_yields_tool_input_json(route_to_fake):
+    route_to_fake(NO_DELAY)
+    client = _client(AnthropicClient, "fake-stream-json")
+
+    chunks = [
+        chunk
+        async for chunk in client.stream(
+            prompt="Return JSON.", response_format={"type": "json_object"}
+        )
+    ]
+    complete = await client.complete(prompt="Return JSON.", response_format={"type": "json_object"})
+
+    assert json.loads("".join(chunks)) == json.loads(complete.content)
+
+
+async def test_cancelled_stream_records_partial_usage(route_to_fake):
+    route_to_fake(NO_DELAY)
+    model = "kimi-k2-0905-preview"
+    client = _client(KimiClient, model)
+    complete = await client.complete(prompt=QUESTION_PROMPT, system=QUESTION_SYSTEM)
+
+    stream = client.stream(prompt=QUESTION_PROMPT, system=QUESTION_SYSTEM, session_id="stream-s2")
+    first = await stream.__anext__()
+    await stream.aclose()
+
+    # Usage arrives in the final chunk, so both counts are estimates here
+    usage = _usage("stream-s2", model)
+    assert first and complete.content.startswith(first)
+    assert usage["input_tokens"] > 0
+    assert 1 <= usage["output_tokens"] < complete.usage["output_tokens"]
+
+
+async def test_stream_retries_rate_limits_before_first_delta(route_to_fake):
+    app = route_to_fake(FakeProviderConfig(latency="none", rate_limit_rate=1.0, retry_after_s=0.01))
+
+    with pytest.raises(LLMRateLimitError):
+        async for _ in _client(AnthropicClient, "fake-stream-429").stream("hello"):
+            pass
+
+    assert app.state.stats["rate_limited"] == 2  # initial attempt + 1 retry
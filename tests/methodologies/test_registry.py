@@ -79,3 +79,41 @@ strategies:
         assert config.strategies[0].focus_mode == "recent_node"
         assert config.strategies[1].focus_mode == "summary"
         assert config.strategies[2].focus_mode == "recent_node"  # default
+
+
+class TestRegistryDetectorCache:
+    """Test per-methodology signal detector caching and invalidation."""
+
+    YAML = """\
+method:
+  name: test_method
+  description: test
+signals:
+  graph: [graph.node_count]
+strategies:
+  - name: strategy_a
+    description: test
+    signal_weights: {}
+"""
+
+    def test_signal_detector_reused_across_calls(self, tmp_path):
+        (tmp_path / "test_method.yaml").write_text(self.YAML)
+        registry = MethodologyRegistry(config_dir=tmp_path)
+        config = registry.get_methodology("test_method")
+
+        first = registry.get_signal_detector(config)
+        second = registry.get_signal_detector(registry.get_methodology("test_method"))
+        assert first is second
+
+    def test_invalidate_drops_config_and_detector(self, tmp_path):
+        config_file = tmp_path / "test_method.yaml"
+        config_file.write_text(self.YAML)
+        registry = MethodologyRegistry(config_dir=tmp_path)
+        detector = registry.get_signal_detector(registry.get_methodology("test_method"))
+
+        config_file.write_text(self.YAML.replace("description: test\nsignals", "description: reloaded\nsignals"))
+        registry.invalidate("test_method")
+
+        config = registry.get_methodology("test_method")
+        assert config.description == "reloaded"
+        assert registry.get_signal_detector(config) is not detector
@@ -7,9 +7,12 @@ from src.methodologies.scoring import (
     score_strategy,
     rank_strategies,
     rank_strategy_node_pairs,
+    rank_strategy_node_pairs_with_stats,
     partition_signal_weights,
     rank_nodes_for_strategy,
+    rank_nodes_for_strategy_with_stats,
     ScoredCandidate,
+    RankingStats,
 )
 from src.methodologies.registry import StrategyConfig
 
@@ -398,6 +401,78 @@ class TestRankStrategyNodePairs:
         assert len(candidate.signal_contributions) == 2
 
 
+class TestTopKRanking:
+    """Tests for heap-based top-k ranking with lazy decomposition."""
+
+    @staticmethod
+    def _node_signals(n):
+        return {f"node_{i}": {"graph.node.exhaustion_score": (i % 7) / 7} for i in range(n)}
+
+    def test_top_k_limits_ranked_and_decomposition(self):
+        strategy = StrategyConfig(
+            name="deepen",
+            description="Deepen",
+            signal_weights={"graph.node.exhaustion_score": -1.0},
+        )
+        ranked, candidates, stats = rank_nodes_for_strategy_with_stats(
+            strategy, self._node_signals(50), top_k=5
+        )
+        assert len(ranked) == 5
+        assert len(candidates) == 5
+        assert isinstance(stats, RankingStats)
+        assert stats.candidate_count == 50
+        assert stats.decomposed_count == 5
+        assert [c.rank for c in candidates] == [1, 2, 3, 4, 5]
+        assert candidates[0].selected is True
+        assert not any(c.selected for c in candidates[1:])
+
+    def test_top_k_matches_full_sort_order_including_ties(self):
+        strategy = StrategyConfig(
+            name="deepen",
+            description="Deepen",
+            signal_weights={"graph.node.exhaustion_score": -1.0},
+        )
+        node_signals = self._node_signals(30)
+        full, _ = rank_nodes_for_strategy(strategy, node_signals, top_k=None)
+        top, _ = rank_nodes_for_strategy(strategy, node_signals, top_k=8)
+        assert top == full[:8]
+        assert len(full) == 30
+
+    def test_full_decomposition_flag_overrides_top_k(self):
+        strategies = [
+            StrategyConfig(name="a", description="A", signal_weights={"x": 1.0}),
+            StrategyConfig(name="b", description="B", signal_weights={"x": 0.5}),
+        ]
+        node_signals = {f"n{i}": {"x": i / 10} for i in range(10)}
+        ranked, decomposition, stats = rank_strategy_node_pairs_with_stats(
+            strategies,
+            {},
+            node_signals,
+            top_k=3,
+            full_decomposition=True,
+        )
+        assert len(ranked) == 20
+        assert len(decomposition) == 20
+        assert stats.decomposed_count == 20
+        assert stats.max_score == pytest.approx(0.9)
+        assert stats.min_score == pytest.approx(0.0)
+        assert stats.mean_score == pytest.approx((4.5 + 2.25) / 20)
+
+    def test_pairs_decomposition_matches_ranked_scores(self):
+        strategies = [
+            StrategyConfig(name="a", description="A", signal_weights={"x": 1.0}),
+        ]
+        node_signals = {f"n{i}": {"x": i / 10} for i in range(10)}
+        ranked, decomposition = rank_strategy_node_pairs(
+            strategies, {}, node_signals, phase_bonuses={"a": 0.1}, top_k=2
+        )
+        assert [nid for _, nid, _ in ranked] == ["n9", "n8"]
+        assert [c.node_id for c in decomposition] == ["n9", "n8"]
+        assert decomposition[0].final_score == pytest.approx(ranked[0][2])
+        assert decomposition[0].phase_bonus == 0.1
+        assert len(decomposition[0].signal_contributions) == 1
+
+
 class TestLLMSignalThresholdsIntegration:
     """Integration tests for LLM signal threshold binning."""
 
@@ -0,0 +1,60 @@
+"""Tests for surface-to-slot mapping and the slot discovery queue in CanonicalSlotRepository."""
+
+import aiosqlite
+
+from src.domain.models.knowledge_graph import KGNode
+from src.persistence.repositories.canonical_slot_repo import CanonicalSlotRepository
+
+
+async def test_remapping_a_node_to_the_same_slot_counts_support_once(test_db):
+    repo = CanonicalSlotRepository(str(test_db))
+    slot = await repo.create_slot(
+        session_id="s1",
+        slot_name="creamy_texture",
+        description="Texture",
+        node_type="attribute",
+        first_seen_turn=1,
+    )
+    other = await repo.create_slot(
+        session_id="s1",
+        slot_name="price",
+        description="Price",
+        node_type="attribute",
+        first_seen_turn=1,
+    )
+
+    assert await repo.map_surface_to_slot("n1", slot.id, 0.95, 1)
+    # A budget fallback or worker retry maps the same node again
+    assert not await repo.map_surface_to_slot("n1", slot.id, 0.95, 2)
+    assert (await repo.get_slot(slot.id)).support_count == slot.support_count + 1
+
+    assert await repo.map_surface_to_slot("n1", other.id, 0.9, 2)
+    assert (await repo.get_mapping_for_node("n1")).canonical_slot_id == other.id
+    assert await repo.get_mapped_node_ids(["n1", "n2"]) == {"n1"}
+
+
+async def test_nodes_that_keep_failing_discovery_are_dropped_from_the_queue(test_db):
+    repo = CanonicalSlotRepository(str(test_db))
+    async with aiosqlite.connect(test_db) as db:
+        await db.execute(
+            "INSERT INTO sessions (id, methodology, concept_id, concept_name) "
+            "VALUES ('s1', 'means_end_chain', 'c1', 'Oat milk')"
+        )
+        await db.executemany(
+            "INSERT INTO kg_nodes (id, session_id, label, node_type) "
+            "VALUES (?, 's1', ?, 'attribute')",
+            [("n1", "creamy"), ("n2", "cheap")],
+        )
+        await db.commit()
+    n1, n2 = (
+        KGNode(id=nid, session_id="s1", label=label, node_type="attribute")
+        for nid, label in [("n1", "creamy"), ("n2", "cheap")]
+    )
+
+    await repo.enqueue_pending_nodes("s1", [n1], 1)
+    await repo.enqueue_pending_nodes("s1", [n1, n2], 2)
+    assert await repo.drop_exhausted_pending_nodes("s1", max_attempts=3) == []
+
+    await repo.enqueue_pending_nodes("s1", [n1, n2], 3)
+    assert await repo.drop_exhausted_pending_nodes("s1", max_attempts=3) == ["n1"]
+    assert [n.id for n in await repo.get_pending_nodes("s1")] == ["n2"]
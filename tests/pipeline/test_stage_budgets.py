@@ -0,0 +1,267 @@
+"""Tests for per-stage latency budgets, fallbacks and the turn deadline."""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.core.config import TurnBudgetsConfig
+from src.core.exceptions import LLMTimeoutError
+from src.domain.models.canonical_graph import CanonicalGraphState
+from src.domain.models.knowledge_graph import DepthMetrics, GraphState, KGNode
+from src.domain.models.pipeline_contracts import (
+    ContextLoadingOutput,
+    ContinuationOutput,
+    GraphUpdateOutput,
+    StateComputationOutput,
+    StrategySelectionOutput,
+)
+from src.llm import client as llm_client
+from src.services.canonicalization_worker import (
+    drain_canonicalization_worker,
+    shutdown_canonicalization_workers,
+)
+from src.services.turn_pipeline import PipelineContext, TurnPipeline
+from src.services.turn_pipeline.base import TurnStage
+from src.services.turn_pipeline.stages import (
+    QuestionGenerationStage,
+    SlotDiscoveryStage,
+    StrategySelectionStage,
+)
+
+
+class SlowStage(TurnStage):
+    """Sleeps, recording the LLM timeout it would be allowed."""
+
+    def __init__(self, delay_s: float):
+        self.delay_s = delay_s
+        self.llm_timeout = None
+        self.finished = False
+
+    async def process(self, context):
+        self.llm_timeout = llm_client._deadline_timeout(30.0)
+        await asyncio.sleep(self.delay_s)
+        self.finished = True
+        return context
+
+
+class SlowStageWithFallback(SlowStage):
+    async def fallback(self, context):
+        context.user_input = "fallback"
+        return context
+
+
+def _pipeline(turn_stages, **budgets) -> TurnPipeline:
+    return TurnPipeline(stages=turn_stages, budgets=TurnBudgetsConfig(**budgets))
+
+
+async def _run(pipeline: TurnPipeline, context: PipelineContext, deadline=None):
+    """Run each stage as TurnPipeline.execute does, without building a result."""
+    for stage in pipeline.stages:
+        start = time.perf_counter()
+        context = await pipeline._run_stage(stage, context, deadline)
+        pipeline._check_budget(stage, context, (time.perf_counter() - start) * 1000)
+    return context
+
+
+async def test_stage_with_fallback_is_cut_short_at_budget():
+    stage = SlowStageWithFallback(delay_s=1.0)
+    pipeline = _pipeline([stage], stages={"SlowStageWithFallback": 20})
+
+    context = await _run(pipeline, PipelineContext(session_id="s1", user_input="hi"))
+
+    assert not stage.finished
+    assert stage.llm_timeout <= 0.02
+    assert context.user_input == "fallback"
+    overrun = context.budget_overruns["SlowStageWithFallback"]
+    assert overrun["fallback"] is True and overrun["budget_ms"] == 20
+
+
+async def test_stage_without_fallback_runs_over_and_is_reported():
+    stage = SlowStage(delay_s=0.03)
+    pipeline = _pipeline([stage], stages={"SlowStage": 1})
+
+    context = await _run(pipeline, PipelineContext(session_id="s1", user_input="hi"))
+
+    assert stage.finished
+    overrun = context.budget_overruns["SlowStage"]
+    assert overrun["fallback"] is False and overrun["elapsed_ms"] > 1
+
+
+async def test_turn_deadline_bounds_llm_calls_and_triggers_fallbacks():
+    unbudgeted = SlowStage(delay_s=0.0)
+    late = SlowStageWithFallback(delay_s=0.0)
+    pipeline = _pipeline([unbudgeted, late], turn_deadline_ms=5000)
+    context = PipelineContext(session_id="s1", user_input="hi")
+
+    await _run(pipeline, context, deadline=time.monotonic() + 5)
+    assert 4 < unbudgeted.llm_timeout <= 5
+
+    # Once the turn deadline has passed, stages with a fallback skip straight to it
+    pipeline.stages = [late]
+    context = await _run(pipeline, context, deadline=time.monotonic() - 1)
+    assert context.stage_fallbacks == ["SlowStageWithFallback"]
+    assert context.budget_overruns["SlowStageWithFallback"]["budget_ms"] is None
+
+
+async def test_expired_deadline_fails_llm_call_before_sending():
+    token = llm_client.set_llm_deadline(time.monotonic() - 1)
+    try:
+        with pytest.raises(LLMTimeoutError):
+            llm_client._deadline_timeout(30.0)
+    finally:
+        llm_client.reset_llm_deadline(token)
+
+    assert llm_client._deadline_timeout(30.0) == 30.0
+
+
+async def test_question_generation_falls_back_to_strategy_template():
+    async def slow_question(**kwargs):
+        await asyncio.sleep(1)
+        return "unused"
+
+    question_service = MagicMock()
+    question_service.generate_question = slow_question
+    stage = QuestionGenerationStage(question_service=question_service)
+    pipeline = _pipeline([stage], stages={"QuestionGenerationStage": 10})
+
+    context = PipelineContext(session_id="s1", user_input="I like oat milk")
+    context.context_loading_output = ContextLoadingOutput(
+        methodology="means_end_chain",
+        concept_id="oat-milk",
+        concept_name="Oat Milk",
+        turn_number=2,
+        mode="exploratory",
+        max_turns=10,
+    )
+    context.strategy_selection_output = StrategySelectionOutput(strategy="deepen")
+    context.continuation_output = ContinuationOutput(
+        should_continue=True, focus_concept="creamy texture", turns_remaining=8
+    )
+
+    context = await _run(pipeline, context)
+
+    output = context.question_generation_output
+    assert output.question == "Why does creamy texture matter to you?"
+    assert output.has_llm_fallback is True
+    assert context.budget_overruns["QuestionGenerationStage"]["fallback"] is True
+
+
+async def test_slot_discovery_defers_nodes_and_edges_to_worker():
+    attempts = []
+
+    async def discover(**kwargs):
+        attempts.append([node.id for node in kwargs["surface_nodes"]])
+        if len(attempts) == 1:
+            await asyncio.sleep(1)  # the inline attempt overruns its budget
+        return []
+
+    slot_service = MagicMock()
+    slot_service.discover_slots_for_nodes = discover
+    # The cancelled attempt had already mapped "a" via the embedding fast path
+    slot_service.slot_repo.get_mapped_node_ids = AsyncMock(return_value={"a"})
+    graph_service = MagicMock()
+    graph_service.aggregate_surface_edges_to_canonical = AsyncMock(return_value=[])
+    canonical_graph_service = MagicMock()
+    canonical_graph_service.compute_canonical_state = AsyncMock(
+        return_value=CanonicalGraphState(
+            concept_count=1, edge_count=0, orphan_count=0, max_depth=0, avg_support=1.0
+        )
+    )
+    stage = SlotDiscoveryStage(slot_service, graph_service, canonical_graph_service)
+    pipeline = _pipeline([stage], stages={"SlotDiscoveryStage": 10})
+
+    context = PipelineContext(session_id="slot-fallback", user_input="hi")
+    context.context_loading_output = ContextLoadingOutput(
+        methodology="means_end_chain",
+        concept_id="oat-milk",
+        concept_name="Oat Milk",
+        turn_number=2,
+        mode="exploratory",
+        max_turns=10,
+    )
+    edge = {"id": "e1", "source_node_id": "a", "target_node_id": "b"}
+    context.graph_update_output = GraphUpdateOutput(
+        nodes_added=[
+            KGNode(id=node_id, session_id="slot-fallback", label=node_id, node_type="attribute")
+            for node_id in ("a", "b")
+        ],
+        edges_added=[edge],
+    )
+
+    try:
+        context = await _run(pipeline, context)
+        await drain_canonicalization_worker("slot-fallback")
+    finally:
+        await shutdown_canonicalization_workers()
+
+    assert context.stage_fallbacks == ["SlotDiscoveryStage"]
+    assert attempts == [["a", "b"], ["b"]]
+    graph_service.aggregate_surface_edges_to_canonical.assert_awaited_once_with(
+        session_id="slot-fallback", surface_edges=[edge], turn_number=2
+    )
+
+
+async def test_strategy_selection_rerun_does_not_repeat_applied_side_effects():
+    selections = []
+
+    async def select(context, graph_state, response_text):
+        selections.append(context.reuse_llm_signals)
+        return "deepen", "n1", [("deepen", 1.0)], {"llm.response_depth": "deep"}, {}, []
+
+    focus_updates = []
+
+    async def update_focus(**kwargs):
+        focus_updates.append(kwargs)
+        if len(focus_updates) == 1:
+            await asyncio.sleep(1)  # cut short after the response depth was appended
+
+    node_tracker = MagicMock(previous_focus="n0", update_focus=update_focus)
+    node_tracker.append_response_signal = AsyncMock()
+    stage = StrategySelectionStage()
+    stage.methodology_strategy.select_strategy_and_focus = select
+    pipeline = _pipeline([stage], stages={"StrategySelectionStage": 20})
+
+    context = PipelineContext(session_id="s1", user_input="hi", node_tracker=node_tracker)
+    context.context_loading_output = ContextLoadingOutput(
+        methodology="means_end_chain",
+        concept_id="oat-milk",
+        concept_name="Oat Milk",
+        turn_number=2,
+        mode="exploratory",
+        max_turns=10,
+    )
+    context.state_computation_output = StateComputationOutput(
+        graph_state=GraphState(
+            node_count=1,
+            edge_count=0,
+            depth_metrics=DepthMetrics(max_depth=0, avg_depth=0.0),
+            turn_count=2,
+        ),
+        computed_at=datetime.now(timezone.utc),
+    )
+
+    context = await _run(pipeline, context)
+
+    assert context.stage_fallbacks == ["StrategySelectionStage"]
+    assert selections == [False, True]
+    node_tracker.append_response_signal.assert_awaited_once_with("n0", "deep")
+    assert len(focus_updates) == 2
+    assert list(context.graph_state.strategy_history) == ["deepen"]
+    assert context.strategy_selection_output.strategy == "deepen"
+
+
+async def test_fallback_is_bounded():
+    class HangingFallback(SlowStage):
+        async def fallback(self, context):
+            await asyncio.sleep(1)
+            return context
+
+    pipeline = _pipeline(
+        [HangingFallback(delay_s=1.0)], stages={"HangingFallback": 10}, fallback_ms=20
+    )
+
+    with pytest.raises(TimeoutError):
+        await _run(pipeline, PipelineContext(session_id="s1", user_input="hi"))
@@ -0,0 +1,112 @@
+"""Tests for turn admission control (in-flight limit, single flight, queue)."""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from fastapi.responses import Response
+
+from src.api.routes import sessions
+from src.api.schemas import TurnRequest
+from src.core.exceptions import AdmissionRejectedError
+from src.services import admission_controller
+from src.services.admission_controller import AdmissionController
+
+
+async def _hold(controller, session_id, release: asyncio.Event, admitted: list):
+    async with controller.admit(session_id):
+        admitted.append(session_id)
+        await release.wait()
+
+
+async def _settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def test_global_limit_queues_excess_turns():
+    controller = AdmissionController(max_in_flight=2, max_queued=4, max_wait_s=5)
+    release, admitted = asyncio.Event(), []
+
+    tasks = [asyncio.create_task(_hold(controller, f"s{i}", release, admitted)) for i in range(3)]
+    await _settle()
+
+    assert admitted == ["s0", "s1"]
+    assert controller.stats()["in_flight"] == 2
+    assert controller.stats()["queued"] == 1
+
+    release.set()
+    await asyncio.gather(*tasks)
+    stats = controller.stats()
+    assert admitted == ["s0", "s1", "s2"]
+    assert stats["in_flight"] == 0 and stats["queued"] == 0
+    assert stats["admitted_total"] == 3 and stats["max_wait_ms"] > 0
+
+
+async def test_same_session_turns_are_single_flight():
+    controller = AdmissionController(max_in_flight=4, max_queued=4, max_wait_s=5)
+    release, admitted = asyncio.Event(), []
+
+    first = asyncio.create_task(_hold(controller, "s1", release, admitted))
+    second = asyncio.create_task(_hold(controller, "s1", release, admitted))
+    other = asyncio.create_task(_hold(controller, "s2", release, admitted))
+    await _settle()
+
+    # Slots are free, but the second s1 turn waits for the first
+    assert admitted == ["s1", "s2"]
+    assert controller.stats()["queued"] == 1
+
+    release.set()
+    await asyncio.gather(first, second, other)
+    assert admitted == ["s1", "s2", "s1"]
+
+
+async def test_full_queue_rejects_with_retry_after():
+    controller = AdmissionController(max_in_flight=1, max_queued=1, max_wait_s=5)
+    release, admitted = asyncio.Event(), []
+    holder = asyncio.create_task(_hold(controller, "s1", release, admitted))
+    waiter = asyncio.create_task(_hold(controller, "s2", release, admitted))
+    await _settle()
+
+    with pytest.raises(AdmissionRejectedError) as exc:
+        await controller.acquire("s3")
+
+    assert exc.value.retry_after_s >= 1
+    assert controller.stats()["rejected_total"] == 1
+    release.set()
+    await asyncio.gather(holder, waiter)
+
+
+async def test_wait_timeout_rejects_and_frees_queue_position():
+    controller = AdmissionController(max_in_flight=1, max_queued=4, max_wait_s=0.01)
+    release, admitted = asyncio.Event(), []
+    holder = asyncio.create_task(_hold(controller, "s1", release, admitted))
+    await _settle()
+
+    with pytest.raises(AdmissionRejectedError, match="wait_timeout"):
+        await controller.acquire("s2")
+
+    assert controller.stats()["queued"] == 0
+    release.set()
+    await holder
+    # The timed-out session can be admitted once capacity returns
+    async with controller.admit("s2"):
+        assert controller.stats()["in_flight"] == 1
+
+
+async def test_route_returns_503_with_retry_after(monkeypatch):
+    controller = AdmissionController(max_in_flight=1, max_queued=0, max_wait_s=5)
+    monkeypatch.setattr(admission_controller, "_controller", controller)
+    release, admitted = asyncio.Event(), []
+    holder = asyncio.create_task(_hold(controller, "busy", release, admitted))
+    await _settle()
+
+    with pytest.raises(HTTPException) as exc:
+        await sessions.process_turn(
+            "s1", TurnRequest(text="I like oat milk"), Response(), None, None, False
+        )
+
+    assert exc.value.status_code == 503
+    assert int(exc.value.headers["Retry-After"]) >= 1
+    release.set()
+    await holder
@@ -0,0 +1,312 @@
+"""Tests for CanonicalSlotService slot discovery: embedding fast path and sharding."""
+
+import json
+from collections import OrderedDict
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from src.domain.models.canonical_graph import CanonicalSlot
+from src.domain.models.knowledge_graph import KGNode
+from src.services import canonical_slot_service as slot_module
+from src.services.canonical_slot_service import (
+    CanonicalSlotService,
+    forget_session,
+    get_slot_discovery_stats,
+)
+
+VECTORS = {
+    "less bloating": np.array([1.0, 0.0, 0.0], dtype=np.float32),
+    "no bloating": np.array([0.99, 0.05, 0.0], dtype=np.float32),
+    "creamy texture": np.array([0.0, 0.0, 1.0], dtype=np.float32),
+}
+
+
+def _slot(slot_id: str, vector: np.ndarray) -> CanonicalSlot:
+    return CanonicalSlot(
+        id=slot_id,
+        session_id="s1",
+        slot_name="reduce_bloating",
+        description="Less bloating after drinking",
+        node_type="attribute",
+        status="active",
+        support_count=2,
+        first_seen_turn=1,
+        embedding=vector.tobytes(),
+    )
+
+
+def _node(node_id: str, label: str, node_type: str = "attribute") -> KGNode:
+    return KGNode(id=node_id, session_id="s1", label=label, node_type=node_type)
+
+
+def _groupings_response(prompt: str) -> MagicMock:
+    """Fake LLM response giving each prompted node its own slot."""
+    proposals: dict[str, list] = {}
+    node_type = None
+    for line in prompt.splitlines():
+        if line.startswith("### ") and "(" in line:
+            node_type = line[4:].split(" ")[0]
+        elif line.startswith("- ") and node_type:
+            node_id = line[2:].split(":")[0]
+            proposals.setdefault(node_type, []).append(
+                {"slot_name": node_id, "description": "", "surface_node_ids": [node_id]}
+            )
+    return MagicMock(
+        content=json.dumps(
+            {"groupings": {nt: {"proposed_slots": p} for nt, p in proposals.items()}}
+        )
+    )
+
+
+async def _complete(**kwargs):
+    return _groupings_response(kwargs["prompt"])
+
+
+class _FakeNLP:
+    """Stands in for spaCy: strips a trailing "d"/"s" as the lemma."""
+
+    def __init__(self):
+        self.pipe_calls: list[list[str]] = []
+
+    def pipe(self, words):
+        words = list(words)
+        self.pipe_calls.append(words)
+        return [[MagicMock(lemma_=w.rstrip("ds"))] for w in words]
+
+
+@pytest.fixture
+def service():
+    slot = _slot("slot-1", VECTORS["less bloating"])
+    slot_repo = MagicMock()
+    slot_repo.get_active_slots = AsyncMock(return_value=[slot])
+    slot_repo.map_surface_to_slot = AsyncMock()
+    slot_repo.get_slot = AsyncMock(return_value=slot)
+    slot_repo.get_pending_nodes = AsyncMock(return_value=[])
+    slot_repo.enqueue_pending_nodes = AsyncMock()
+    slot_repo.remove_pending_nodes = AsyncMock()
+    slot_repo.drop_exhausted_pending_nodes = AsyncMock(return_value=[])
+
+    embedding_service = MagicMock()
+    embedding_service.encode_batch = AsyncMock(
+        side_effect=lambda texts: [VECTORS.get(t, np.ones(3, dtype=np.float32)) for t in texts]
+    )
+    embedding_service.nlp = _FakeNLP()
+
+    llm = MagicMock()
+    llm.complete = AsyncMock()
+    return CanonicalSlotService(llm, slot_repo, embedding_service)
+
+
+@pytest.mark.asyncio
+async def test_fast_path_skips_llm_when_all_nodes_match(service):
+    slots = await service.discover_slots_for_nodes(
+        session_id="fast-all",
+        surface_nodes=[_node("n1", "no bloating")],
+        turn_number=3,
+        methodology="means_end_chain",
+    )
+
+    assert [s.id for s in slots] == ["slot-1"]
+    service.llm.complete.assert_not_called()
+    service.slot_repo.map_surface_to_slot.assert_awaited_once()
+    assert service.slot_repo.map_surface_to_slot.await_args.kwargs["slot_id"] == "slot-1"
+
+    stats = get_slot_discovery_stats("fast-all")
+    assert stats.to_dict() == {
+        "nodes_seen": 1,
+        "fast_path_hits": 1,
+        "hit_rate": 1.0,
+        "llm_calls": 0,
+        "llm_calls_saved": 1,
+    }
+
+    # Process-level state is released when the session ends
+    slot_module._slot_lock("fast-all", "attribute")
+    forget_session("fast-all")
+    assert get_slot_discovery_stats("fast-all") is None
+    assert ("fast-all", "attribute") not in slot_module._slot_locks
+
+
+@pytest.mark.asyncio
+async def test_only_unmatched_nodes_reach_llm(service):
+    service.llm.complete.return_value = MagicMock(
+        content=json.dumps(
+            {
+                "groupings": {
+                    "attribute": {
+                        "proposed_slots": [
+                            {
+                                "slot_name": "creamy_texture",
+                                "description": "Texture",
+                                "surface_node_ids": ["n2"],
+                            }
+                        ]
+                    }
+                }
+            }
+        )
+    )
+    service._find_or_create_slot = AsyncMock(
+        return_value=_slot("slot-2", VECTORS["creamy texture"])
+    )
+
+    await service.discover_slots_for_nodes(
+        session_id="fast-partial",
+        surface_nodes=[_node("n1", "no bloating"), _node("n2", "creamy texture")],
+        turn_number=3,
+        methodology="means_end_chain",
+    )
+
+    prompt = service.llm.complete.await_args.kwargs["prompt"]
+    assert "n2: creamy texture" in prompt
+    assert "n1: no bloating" not in prompt
+    assert service._find_or_create_slot.await_args.kwargs["surface_node_ids"] == ["n2"]
+
+    stats = get_slot_discovery_stats("fast-partial")
+    assert (stats.fast_path_hits, stats.llm_calls, stats.llm_calls_saved) == (1, 1, 0)
+
+
+@pytest.mark.asyncio
+async def test_large_turn_is_sharded_instead_of_truncated(service):
+    """Every node is proposed; shards are per node_type and merged in order."""
+    service.slot_repo.get_active_slots = AsyncMock(return_value=[])
+    service.llm.complete = AsyncMock(side_effect=_complete)
+    service._find_or_create_slot = AsyncMock(
+        side_effect=lambda **kw: _slot(kw["proposed_name"], VECTORS["less bloating"])
+    )
+
+    nodes = [_node(f"a{i}", f"label {i}") for i in range(10)] + [
+        _node(f"c{i}", f"label {i}", node_type="functional_consequence") for i in range(3)
+    ]
+    await service.discover_slots_for_nodes(
+        session_id="sharded",
+        surface_nodes=nodes,
+        turn_number=2,
+        methodology="means_end_chain",
+    )
+
+    assert service.llm.complete.await_count == 3
+    merged = [
+        call.kwargs["surface_node_ids"][0] for call in service._find_or_create_slot.await_args_list
+    ]
+    assert merged == [f"a{i}" for i in range(10)] + ["c0", "c1", "c2"]
+    service.slot_repo.enqueue_pending_nodes.assert_awaited_once_with("sharded", [], 2)
+
+
+@pytest.mark.asyncio
+async def test_failed_shard_nodes_are_queued_and_retried(service):
+    service.slot_repo.get_active_slots = AsyncMock(return_value=[])
+
+    async def complete(**kwargs):
+        if "functional_consequence" in kwargs["prompt"].split("## Concepts")[1]:
+            raise TimeoutError("slow shard")
+        return await _complete(**kwargs)
+
+    service.llm.complete = AsyncMock(side_effect=complete)
+    service._find_or_create_slot = AsyncMock(
+        side_effect=lambda **kw: _slot(kw["proposed_name"], VECTORS["less bloating"])
+    )
+    failed = [_node(f"c{i}", f"label {i}", node_type="functional_consequence") for i in range(3)]
+    nodes = [_node(f"a{i}", f"label {i}") for i in range(8)] + failed
+
+    await service.discover_slots_for_nodes(
+        session_id="queued",
+        surface_nodes=nodes,
+        turn_number=2,
+        methodology="means_end_chain",
+    )
+    service.slot_repo.enqueue_pending_nodes.assert_awaited_once_with("queued", failed, 2)
+    service.slot_repo.drop_exhausted_pending_nodes.assert_awaited_once_with(
+        "queued", slot_module.MAX_SLOT_DISCOVERY_ATTEMPTS
+    )
+
+    # Next run drains the queue even without new nodes
+    service.llm.complete = AsyncMock(side_effect=_complete)
+    service.slot_repo.get_pending_nodes = AsyncMock(return_value=failed)
+    await service.discover_slots_for_nodes(
+        session_id="queued",
+        surface_nodes=[],
+        turn_number=3,
+        methodology="means_end_chain",
+    )
+    service.slot_repo.remove_pending_nodes.assert_awaited_with(["c0", "c1", "c2"])
+
+
+def test_lemma_cache_evicts_least_recently_used_words(service, monkeypatch):
+    monkeypatch.setattr(slot_module, "_lemma_cache", OrderedDict())
+    monkeypatch.setattr(slot_module, "MAX_LEMMA_CACHE_SIZE", 3)
+
+    assert service._lemmatize_names(["reduced_bloats"]) == ["reduce_bloat"]
+    assert service._lemmatize_name("reduced") == "reduce"  # hit refreshes "reduced"
+    assert service._lemmatize_name("creamy_drinks") == "creamy_drink"
+
+    assert list(slot_module._lemma_cache) == ["reduced", "creamy", "drinks"]
+    assert service.embedding_service.nlp.pipe_calls == [
+        ["reduced", "bloats"],
+        ["creamy", "drinks"],
+    ]
+
+
+@pytest.mark.asyncio
+async def test_proposals_lemmatized_and_embedded_in_one_batch(service, monkeypatch):
+    """One nlp.pipe call, one encode_batch call, and in-memory merging."""
+    monkeypatch.setattr(slot_module, "_lemma_cache", OrderedDict())
+    proposal_vectors = {
+        "reduce_bloat :: Less bloating": np.array([0.0, 1.0, 0.0], dtype=np.float32),
+        "reduce_bloat :: No bloating": np.array([0.0, 1.0, 0.0], dtype=np.float32),
+        "creamy :: Texture": np.array([0.0, 0.0, 1.0], dtype=np.float32),
+    }
+    service.embedding_service.encode_batch = AsyncMock(
+        side_effect=lambda texts: [proposal_vectors[t] for t in texts]
+    )
+    service.slot_repo.get_active_slots = AsyncMock(return_value=[])
+    service.slot_repo.get_matchable_slots = AsyncMock(return_value=[])
+    service.slot_repo.find_slot_by_name_and_type = AsyncMock(return_value=None)
+    created = _slot("slot-new", proposal_vectors["reduce_bloat :: Less bloating"])
+    service.slot_repo.create_slot = AsyncMock(return_value=created)
+    service.slot_repo.get_slot = AsyncMock(return_value=created)
+    service.llm.complete.return_value = MagicMock(
+        content=json.dumps(
+            {
+                "groupings": {
+                    "attribute": {
+                        "proposed_slots": [
+                            {
+                                "slot_name": "reduced_bloats",
+                                "description": "Less bloating",
+                                "surface_node_ids": ["n1"],
+                            },
+                            {
+                                "slot_name": "reduce_bloat",
+                                "description": "No bloating",
+                                "surface_node_ids": ["n2"],
+                            },
+                        ]
+                    }
+                }
+            }
+        )
+    )
+
+    await service.discover_slots_for_nodes(
+        session_id="batched",
+        surface_nodes=[_node("n1", "no bloating"), _node("n2", "less bloating")],
+        turn_number=1,
+        methodology="means_end_chain",
+    )
+
+    assert service.embedding_service.nlp.pipe_calls == [["reduced", "bloats", "reduce", "bloat"]]
+    service.embedding_service.encode_batch.assert_awaited_once_with(
+        ["reduce_bloat :: Less bloating", "reduce_bloat :: No bloating"]
+    )
+    # Second proposal merges into the slot created by the first, via the index
+    service.slot_repo.get_matchable_slots.assert_awaited_once_with("batched", "attribute")
+    service.slot_repo.create_slot.assert_awaited_once()
+    mapped = service.slot_repo.map_surface_to_slot.await_args_list
+    assert [call.kwargs["slot_id"] for call in mapped] == ["slot-new", "slot-new"]
+
+    # Cached words never reach spaCy again
+    assert service._lemmatize_names(["reduce_bloat"]) == ["reduce_bloat"]
+    assert len(service.embedding_service.nlp.pipe_calls) == 1
@@ -0,0 +1,104 @@
+"""Tests for the background canonicalization worker."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.domain.models.canonical_graph import CanonicalGraphState
+from src.domain.models.knowledge_graph import KGNode
+from src.services.canonicalization_worker import (
+    CanonicalizationJob,
+    _workers,
+    close_canonicalization_worker,
+    get_canonicalization_worker,
+    get_latest_canonical_snapshot,
+    shutdown_canonicalization_workers,
+)
+
+
+def _node(node_id: str) -> KGNode:
+    return KGNode(id=node_id, session_id="s1", label=node_id, node_type="attribute")
+
+
+@pytest.fixture
+async def services():
+    slot_service = MagicMock()
+    slot_service.discover_slots_for_nodes = AsyncMock(return_value=[])
+    slot_service.slot_repo.enqueue_pending_nodes = AsyncMock()
+
+    canonical_graph_service = MagicMock()
+    canonical_graph_service.compute_canonical_state = AsyncMock(
+        side_effect=lambda session_id: CanonicalGraphState(
+            concept_count=slot_service.discover_slots_for_nodes.await_count,
+            edge_count=0,
+            orphan_count=0,
+            max_depth=0,
+            avg_support=1.0,
+        )
+    )
+
+    graph_service = MagicMock()
+    graph_service.aggregate_surface_edges_to_canonical = AsyncMock(return_value=[])
+
+    yield slot_service, canonical_graph_service, graph_service
+    await shutdown_canonicalization_workers()
+
+
+@pytest.mark.asyncio
+async def test_jobs_processed_in_order_and_snapshot_tagged(services):
+    slot_service, canonical_graph_service, graph_service = services
+    worker = get_canonicalization_worker(
+        "bg-order", slot_service, canonical_graph_service, graph_service
+    )
+    assert get_latest_canonical_snapshot("bg-order") is None
+
+    worker.submit(CanonicalizationJob(1, "means_end_chain", [_node("a")]))
+    worker.submit(CanonicalizationJob(2, "means_end_chain", [_node("b")], [{"id": "e1"}]))
+    await worker.drain()
+
+    turns = [
+        call.kwargs["turn_number"] for call in slot_service.discover_slots_for_nodes.await_args_list
+    ]
+    assert turns == [1, 2]
+    graph_service.aggregate_surface_edges_to_canonical.assert_awaited_once()
+
+    snapshot = get_latest_canonical_snapshot("bg-order")
+    assert snapshot.turn_number == 2
+    assert snapshot.state.concept_count == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_job_requeues_only_unmapped_nodes_and_keeps_worker_alive(services):
+    slot_service, canonical_graph_service, graph_service = services
+    slot_service.discover_slots_for_nodes = AsyncMock(side_effect=[TimeoutError("slow"), []])
+    # "a" was mapped by the fast path, "b" already queued by a failed shard
+    slot_service.slot_repo.get_mapped_node_ids = AsyncMock(return_value={"a"})
+    slot_service.slot_repo.get_pending_nodes = AsyncMock(return_value=[_node("b")])
+    worker = get_canonicalization_worker(
+        "bg-fail", slot_service, canonical_graph_service, graph_service
+    )
+
+    worker.submit(CanonicalizationJob(1, "means_end_chain", [_node("a"), _node("b"), _node("c")]))
+    worker.submit(CanonicalizationJob(2, "means_end_chain", [_node("d")]))
+    await worker.drain()
+
+    slot_service.slot_repo.enqueue_pending_nodes.assert_awaited_once()
+    session_id, nodes, turn = slot_service.slot_repo.enqueue_pending_nodes.await_args.args
+    assert (session_id, [n.id for n in nodes], turn) == ("bg-fail", ["c"], 1)
+    assert get_latest_canonical_snapshot("bg-fail").turn_number == 2
+
+
+@pytest.mark.asyncio
+async def test_close_finishes_queued_jobs_and_drops_worker(services):
+    slot_service, canonical_graph_service, graph_service = services
+    worker = get_canonicalization_worker(
+        "bg-close", slot_service, canonical_graph_service, graph_service
+    )
+    worker.submit(CanonicalizationJob(1, "means_end_chain", [_node("a")]))
+    worker.submit(CanonicalizationJob(2, "means_end_chain", [_node("b")]))
+
+    await close_canonicalization_worker("bg-close")
+
+    assert slot_service.discover_slots_for_nodes.await_count == 2
+    assert "bg-close" not in _workers
+    assert worker._task is None
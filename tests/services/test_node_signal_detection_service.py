@@ -96,3 +96,97 @@ async def test_detect_raises_on_empty_registry(monkeypatch):
             response_text="test",
             node_tracker=mock_node_tracker,
         )
+
+
+# =============================================================================
+# Incremental detection (dirty tracking + signal cache)
+# =============================================================================
+
+
+async def _make_tracker(node_ids):
+    from src.domain.models.knowledge_graph import KGNode
+    from src.services.node_state_tracker import NodeStateTracker
+
+    tracker = NodeStateTracker()
+    for node_id in node_ids:
+        await tracker.register_node(
+            KGNode(id=node_id, session_id="s1", label=node_id, node_type="attribute"),
+            turn_number=1,
+        )
+    return tracker
+
+
+def _make_context(turn_number: int):
+    context = MagicMock()
+    context.turn_number = turn_number
+    context.signals = {}
+    return context
+
+
+@pytest.mark.asyncio
+async def test_incremental_detect_matches_full_recompute(node_signal_service):
+    """Cached on_change values must equal a from-scratch detection."""
+    from src.services.node_state_tracker import NodeStateTracker
+
+    tracker = await _make_tracker(["a", "b", "c"])
+    await node_signal_service.detect(_make_context(1), None, "", tracker)
+    assert tracker.dirty_nodes == set()
+
+    await tracker.update_focus("a", turn_number=1, strategy="deepen")
+    await tracker.update_edge_counts("b", outgoing_delta=1, incoming_delta=0)
+    await node_signal_service.detect(_make_context(2), None, "", tracker)
+    await tracker.update_focus("c", turn_number=2, strategy="explore")
+
+    incremental = await node_signal_service.detect(_make_context(3), None, "", tracker)
+
+    fresh = NodeStateTracker.from_dict(tracker.to_dict())
+    fresh.signal_cache = {}
+    full = await node_signal_service.detect(_make_context(3), None, "", fresh)
+
+    assert incremental == full
+    assert incremental["a"]["graph.node.is_current_focus"] is False
+    assert incremental["a"]["graph.node.focus_streak"] == "none"
+    assert incremental["c"]["graph.node.is_current_focus"] is True
+    assert incremental["b"]["graph.node.has_outgoing"] is True
+
+
+@pytest.mark.asyncio
+async def test_incremental_detect_recomputes_only_dirty_nodes(
+    node_signal_service, monkeypatch
+):
+    """on_change detectors are scoped to dirty nodes once the cache is warm."""
+    from src.signals.graph.node_signals import NodeEdgeCountSignal
+
+    scopes = []
+    original = NodeEdgeCountSignal.restrict_to
+
+    def spy(self, node_ids):
+        scopes.append(set(node_ids))
+        original(self, node_ids)
+
+    monkeypatch.setattr(NodeEdgeCountSignal, "restrict_to", spy)
+
+    tracker = await _make_tracker(["a", "b", "c"])
+    await node_signal_service.detect(_make_context(1), None, "", tracker)
+    await tracker.update_edge_counts("b", outgoing_delta=1, incoming_delta=1)
+    result = await node_signal_service.detect(_make_context(2), None, "", tracker)
+    await node_signal_service.detect(_make_context(3), None, "", tracker)
+
+    assert scopes == [{"a", "b", "c"}, {"b"}]
+    assert result["b"]["graph.node.edge_count"] == 2
+    assert result["a"]["graph.node.edge_count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_signal_cache_survives_serialization(node_signal_service):
+    """Dirty set and signal cache round-trip through to_dict/from_dict."""
+    from src.services.node_state_tracker import NodeStateTracker
+
+    tracker = await _make_tracker(["a", "b"])
+    await node_signal_service.detect(_make_context(1), None, "", tracker)
+    await tracker.update_focus("a", turn_number=1, strategy="deepen")
+
+    restored = NodeStateTracker.from_dict(tracker.to_dict())
+
+    assert restored.dirty_nodes == {"a"}
+    assert restored.signal_cache == tracker.signal_cache
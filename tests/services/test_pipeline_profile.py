@@ -0,0 +1,125 @@
+"""Tests for adaptive pipeline profiles (load-based switching and lean stages)."""
+
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from src.core.config import PipelineProfilesConfig
+from src.domain.models.pipeline_contracts import UtteranceSavingOutput
+from src.domain.models.utterance import Utterance
+from src.llm.client import ProviderRateLimiter
+from src.services import global_signal_detection_service
+from src.services.global_signal_detection_service import cached_llm_signals
+from src.services.pipeline_profile import LoadSnapshot, PipelineProfileSelector
+from src.services.turn_pipeline import PipelineContext
+from src.services.turn_pipeline.stages import SRLPreprocessingStage
+from src.signals.signal_registry import ComposedSignalDetector
+
+IDLE = LoadSnapshot(queued_turns=0)
+BUSY = LoadSnapshot(queued_turns=4)
+MODERATE = LoadSnapshot(queued_turns=2)  # Between exit and enter thresholds
+
+
+def _selector(**config) -> PipelineProfileSelector:
+    return PipelineProfileSelector(PipelineProfilesConfig(**config))
+
+
+def test_queue_growth_degrades_and_dwell_prevents_flapping():
+    selector = _selector()
+
+    names = [
+        selector.select("s1", load).name for load in (IDLE, BUSY, IDLE, IDLE, MODERATE, IDLE, IDLE)
+    ]
+
+    # Degraded for min_dwell_turns (3) even though load dropped, then held
+    # while the queue sat between the exit and enter thresholds
+    assert names == ["full", "lean", "lean", "lean", "lean", "full", "full"]
+
+
+def test_latency_spike_degrades_until_ratio_recovers():
+    selector = _selector(switching={"min_dwell_turns": 1})
+    spike = LoadSnapshot(queued_turns=0, latency_ratio=2.5)
+    elevated = LoadSnapshot(queued_turns=0, latency_ratio=1.6)
+    recovered = LoadSnapshot(queued_turns=0, latency_ratio=1.1)
+
+    names = [selector.select("s1", load).name for load in (spike, elevated, elevated, recovered)]
+
+    assert names == ["lean", "lean", "lean", "full"]
+    # Sessions switch independently: a new session starts on the default
+    assert selector.select("s2", IDLE).name == "full"
+
+
+def test_non_adaptive_config_always_uses_default():
+    selector = _selector(adaptive=False)
+
+    profile = selector.select("s1", BUSY)
+
+    assert profile.name == "full"
+    assert not profile.skip_srl and not profile.cached_llm_signals
+
+
+async def test_lean_profile_skips_srl():
+    srl_service = MagicMock()
+    context = PipelineContext(
+        session_id="s1",
+        user_input="I like oat milk",
+        pipeline_profile=_selector().select("s1", BUSY),
+    )
+    context.utterance_saving_output = UtteranceSavingOutput(
+        turn_number=1,
+        user_utterance_id="u1",
+        user_utterance=Utterance(
+            id="u1",
+            session_id="s1",
+            turn_number=1,
+            speaker="user",
+            text="I like oat milk",
+            created_at=datetime.now(timezone.utc),
+        ),
+    )
+
+    await SRLPreprocessingStage(srl_service=srl_service).process(context)
+
+    srl_service.analyze.assert_not_called()
+    assert context.srl_preprocessing_output.discourse_relations == []
+
+
+async def test_cached_llm_signals_replace_the_batch_call(monkeypatch):
+    monkeypatch.setattr(
+        global_signal_detection_service,
+        "_last_llm_signals",
+        {"s1": {"llm.response_depth": "deep"}},
+    )
+    llm_detector = MagicMock()
+    detector = ComposedSignalDetector(
+        signal_names=["graph.node_count", "llm.response_depth", "llm.certainty"]
+    )
+    detector.set_llm_detector(llm_detector)
+
+    reused = cached_llm_signals("s1", detector.llm_signal_names)
+    signals = await detector.detect(
+        SimpleNamespace(stage_timings={}),
+        SimpleNamespace(node_count=3, edge_count=2),
+        "text",
+        llm_signals=reused,
+    )
+
+    llm_detector.detect.assert_not_called()
+    # Unseen signals fall back to the neutral mid-scale value
+    assert signals == {
+        "graph.node_count": 3,
+        "llm.response_depth": "deep",
+        "llm.certainty": 0.5,
+    }
+
+
+def test_provider_latency_ratio_tracks_spikes():
+    limiter = ProviderRateLimiter("fake/model")
+    for _ in range(20):
+        limiter.record_latency(100.0)
+    assert limiter.latency_ratio() == 1.0
+
+    for _ in range(5):
+        limiter.record_latency(400.0)
+
+    assert limiter.latency_ratio() > 2.0
@@ -0,0 +1,208 @@
+"""Tests for write-behind post-response persistence and its journal."""
+
+from datetime import datetime, timezone
+
+import aiosqlite
+import pytest
+
+from src.core.exceptions import PostTurnWriteError
+from src.domain.models.pipeline_contracts import (
+    ContextLoadingOutput,
+    QuestionGenerationOutput,
+)
+from src.domain.models.session import Session, SessionState
+from src.services import post_turn_writer
+from src.services.post_turn_writer import (
+    PostTurnJob,
+    PostTurnWrite,
+    drain_post_turn_writes,
+    get_post_turn_writer,
+    recover_post_turn_journal,
+)
+from src.services.turn_pipeline import PipelineContext
+from src.services.turn_pipeline.stages import ResponseSavingStage
+
+
+@pytest.fixture(autouse=True)
+async def _reset_writers():
+    yield
+    await post_turn_writer.shutdown_post_turn_writers()
+
+
+def _state(turn_count: int) -> SessionState:
+    return SessionState(
+        methodology="means_end_chain",
+        concept_id="test-concept",
+        concept_name="Test Product",
+        turn_count=turn_count,
+    )
+
+
+async def _create_session(session_repo, session_id: str) -> None:
+    now = datetime.now(timezone.utc)
+    await session_repo.create(
+        Session(
+            id=session_id,
+            methodology="means_end_chain",
+            concept_id="test-concept",
+            concept_name="Test Product",
+            created_at=now,
+            updated_at=now,
+            state=_state(0),
+        )
+    )
+
+
+def _turn_job(session_id: str, turn: int) -> PostTurnJob:
+    return PostTurnJob(
+        session_id=session_id,
+        turn_number=turn,
+        writes=[
+            PostTurnWrite(
+                "system_utterance",
+                {
+                    "id": f"{session_id}-u{turn}",
+                    "session_id": session_id,
+                    "turn_number": turn,
+                    "text": f"Question {turn}?",
+                    "created_at": datetime.now(timezone.utc).isoformat(),
+                },
+            ),
+            PostTurnWrite(
+                "session_state",
+                {
+                    "session_id": session_id,
+                    "state": _state(turn).model_dump(mode="json"),
+                },
+            ),
+        ],
+    )
+
+
+async def _journal_count(db_path) -> int:
+    async with aiosqlite.connect(str(db_path)) as db:
+        cursor = await db.execute("SELECT COUNT(*) FROM post_turn_journal")
+        return (await cursor.fetchone())[0]
+
+
+async def test_jobs_apply_in_order_and_clear_journal(test_db, session_repo):
+    await _create_session(session_repo, "s1")
+    writer = get_post_turn_writer("s1", session_repo)
+
+    await writer.submit(_turn_job("s1", 1))
+    await writer.submit(_turn_job("s1", 2))
+    await drain_post_turn_writes("s1")
+
+    session = await session_repo.get("s1")
+    utterances = await session_repo.get_utterances("s1")
+    assert session.state.turn_count == 2
+    assert [u.text for u in utterances] == ["Question 1?", "Question 2?"]
+    assert await _journal_count(test_db) == 0
+
+
+async def test_recovery_replays_journal_idempotently(test_db, session_repo):
+    await _create_session(session_repo, "s2")
+    job = _turn_job("s2", 1)
+    # Crash after the first write was applied but before the job finished
+    await post_turn_writer._journal_job(job)
+    await post_turn_writer.apply_post_turn_write(job.writes[0], session_repo)
+
+    assert await recover_post_turn_journal() == 1
+
+    session = await session_repo.get("s2")
+    assert session.state.turn_count == 1
+    assert len(await session_repo.get_utterances("s2")) == 1
+    assert await _journal_count(test_db) == 0
+    assert await recover_post_turn_journal() == 0
+
+
+async def test_replayed_signals_write_keeps_one_record(test_db, session_repo, monkeypatch):
+    await _create_session(session_repo, "s5")
+    write = PostTurnWrite(
+        "signals",
+        {
+            "signal_id": "s5-sig1",
+            "session_id": "s5",
+            "turn_number": 1,
+            "signals": {"uncertainty": {"level": "low"}},
+            "llm_model": "test-model",
+        },
+    )
+    warnings = []
+    monkeypatch.setattr(post_turn_writer.log, "warning", lambda event, **kw: warnings.append(event))
+
+    await post_turn_writer.apply_post_turn_write(write, session_repo)
+    await post_turn_writer.apply_post_turn_write(write, session_repo)
+
+    async with aiosqlite.connect(str(test_db)) as db:
+        cursor = await db.execute(
+            "SELECT COUNT(*) FROM qualitative_signals WHERE session_id = 's5'"
+        )
+        assert (await cursor.fetchone())[0] == 1
+    assert warnings == []
+
+
+async def test_failed_job_holds_later_jobs_and_replays_in_order(test_db, session_repo, monkeypatch):
+    await _create_session(session_repo, "s3")
+    attempts = []
+
+    async def flaky(payload, repo):
+        attempts.append(payload)
+        if len(attempts) <= 2:
+            raise OSError("disk full")
+
+    monkeypatch.setitem(post_turn_writer._HANDLERS, "flaky", flaky)
+    writer = get_post_turn_writer("s3", session_repo)
+    first = _turn_job("s3", 1)
+    first.writes.append(PostTurnWrite("flaky"))
+
+    await writer.submit(first)
+    await writer.submit(_turn_job("s3", 2))
+    # The failure reaches the next turn (after one retry) instead of being skipped
+    with pytest.raises(PostTurnWriteError):
+        await drain_post_turn_writes("s3")
+
+    assert (await session_repo.get("s3")).state.turn_count == 1
+    assert await _journal_count(test_db) == 2
+
+    # Restart: turn 1 is replayed before turn 2, so turn 2's state wins
+    post_turn_writer._writers.clear()
+    assert await recover_post_turn_journal() == 2
+
+    assert (await session_repo.get("s3")).state.turn_count == 2
+    assert await _journal_count(test_db) == 0
+    assert "s3" not in post_turn_writer._writers
+
+
+async def test_writer_is_released_after_final_job(test_db, session_repo):
+    await _create_session(session_repo, "s5")
+    writer = get_post_turn_writer("s5", session_repo)
+    final = _turn_job("s5", 3)
+    final.final = True
+
+    await writer.submit(final)
+    await writer.drain()
+
+    assert (await session_repo.get("s5")).state.turn_count == 3
+    assert "s5" not in post_turn_writer._writers
+
+
+async def test_response_saving_stage_defers_when_write_behind(test_db, session_repo):
+    await _create_session(session_repo, "s4")
+    context = PipelineContext(session_id="s4", user_input="hi", post_turn_writes=[])
+    context.context_loading_output = ContextLoadingOutput(
+        methodology="means_end_chain",
+        concept_id="test-concept",
+        concept_name="Test Product",
+        turn_number=1,
+        mode="exploratory",
+        max_turns=10,
+    )
+    context.question_generation_output = QuestionGenerationOutput(
+        question="Why?", strategy="deepen"
+    )
+
+    await ResponseSavingStage().process(context)
+
+    assert [w.kind for w in context.post_turn_writes] == ["system_utterance"]
+    assert await session_repo.get_utterances("s4") == []
@@ -0,0 +1,117 @@
+"""Tests for the simulation batch runner: matrix, concurrency, resume."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.services import simulation_batch_service as batch_module
+from src.services.simulation_batch_service import (
+    SimulationBatchRunner,
+    build_run_matrix,
+    load_completed_run_ids,
+)
+
+
+class _FakeSimulationService:
+    in_flight = 0
+    max_in_flight = 0
+
+    def __init__(self, session_service, synthetic_service):
+        self.seed = synthetic_service.seed
+
+    async def simulate_interview(self, concept_id, persona_id, **kwargs):
+        cls = _FakeSimulationService
+        cls.in_flight += 1
+        cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        await asyncio.sleep(0.01)
+        cls.in_flight -= 1
+        if persona_id == "broken":
+            raise RuntimeError("llm down")
+        return SimpleNamespace(
+            session_id=kwargs["session_id"],
+            status="completed",
+            total_turns=4,
+            output_path=f"{concept_id}_{persona_id}_{kwargs['run_label']}.json",
+        )
+
+
+@pytest.fixture
+def runner_factory(monkeypatch, tmp_path):
+    _FakeSimulationService.in_flight = 0
+    _FakeSimulationService.max_in_flight = 0
+    monkeypatch.setattr(batch_module, "SessionService", MagicMock())
+    monkeypatch.setattr(batch_module, "SimulationService", _FakeSimulationService)
+    monkeypatch.setattr(
+        batch_module,
+        "SyntheticService",
+        lambda llm_client, seed: SimpleNamespace(seed=seed),
+    )
+
+    def make(concurrency=2):
+        return SimulationBatchRunner(
+            session_repo=MagicMock(),
+            graph_repo=MagicMock(),
+            extraction_llm_client=MagicMock(),
+            generation_llm_client=MagicMock(),
+            batch_id="test",
+            concurrency=concurrency,
+            embedding_service=MagicMock(),
+            srl_service=MagicMock(),
+            results_path=tmp_path / "test.jsonl",
+        )
+
+    return make
+
+
+def test_build_run_matrix_expands_all_combinations():
+    specs = build_run_matrix(["c1", "c2"], ["p1", "p2"], seeds=2, max_turns=5)
+
+    assert len(specs) == 8
+    assert specs[0].run_id == "c1__p1__seed0"
+    assert specs[-1].run_id == "c2__p2__seed1"
+    assert {s.max_turns for s in specs} == {5}
+
+
+@pytest.mark.asyncio
+async def test_runs_are_bounded_and_written_incrementally(runner_factory):
+    runner = runner_factory(concurrency=2)
+    specs = build_run_matrix(["c1"], ["p1", "broken"], seeds=3)
+
+    records = await runner.run(specs)
+
+    assert _FakeSimulationService.max_in_flight == 2
+    assert sorted(r.status for r in records) == ["completed"] * 3 + ["failed"] * 3
+    lines = runner.results_path.read_text().splitlines()
+    assert len(lines) == 6
+    assert json.loads(lines[0])["duration_ms"] > 0
+    assert runner.progress.to_dict()["completed"] == 3
+    assert runner.progress.to_dict()["failed"] == 3
+    assert runner.progress.finished
+
+
+@pytest.mark.asyncio
+async def test_resume_skips_completed_runs(runner_factory):
+    specs = build_run_matrix(["c1"], ["p1", "broken"], seeds=2)
+    await runner_factory().run(specs)
+    assert load_completed_run_ids(runner_factory().results_path) == {
+        "c1__p1__seed0",
+        "c1__p1__seed1",
+    }
+
+    # Interrupted write leaves a partial line; it is ignored on resume
+    with open(runner_factory().results_path, "a") as f:
+        f.write('{"run_id": "c1__bro')
+
+    resumed = runner_factory()
+    records = await resumed.run(specs)
+
+    assert sorted(r.run_id for r in records) == [
+        "c1__broken__seed0",
+        "c1__broken__seed1",
+    ]
+    assert resumed.progress.skipped == 2
+    lines = resumed.results_path.read_text().splitlines()
+    assert {json.loads(line)["run_id"] for line in lines[-2:]} == {r.run_id for r in records}
@@ -0,0 +1,95 @@
+"""Tests for incremental extraction over a streamed LLM response."""
+
+import json
+
+import pytest
+
+from src.llm.client import LLMClient, LLMResponse
+from src.llm.json_stream import JSONArrayStreamParser
+from src.services.extraction_service import ExtractionService
+
+RESPONSE = json.dumps(
+    {
+        "concepts": [
+            {
+                "text": "creamy {oat} milk",
+                "node_type": "attribute",
+                "confidence": 0.9,
+                "source_quote": 'I said "creamy", really',
+                "properties": {"tags": ["a", {"b": 1}]},
+            },
+            {"text": "not a real type", "node_type": "bogus"},
+            {
+                "text": "feels indulgent",
+                "node_type": "psychosocial_consequence",
+                "confidence": 0.7,
+            },
+        ],
+        "relationships": [
+            {
+                "source_text": "creamy {oat} milk",
+                "target_text": "feels indulgent",
+                "relationship_type": "leads_to",
+                "confidence": 0.8,
+            }
+        ],
+    }
+)
+ANSWER = "I like creamy oat milk because it feels indulgent in the morning"
+
+
+class _ChunkedClient(LLMClient):
+    """Client that streams RESPONSE in fixed-size chunks."""
+
+    def __init__(self, chunk_size: int):
+        self.chunk_size = chunk_size
+
+    async def complete(self, prompt, system=None, **kwargs):
+        return LLMResponse(content=RESPONSE, model="fake")
+
+    async def stream(self, prompt, system=None, **kwargs):
+        for i in range(0, len(RESPONSE), self.chunk_size):
+            yield RESPONSE[i : i + self.chunk_size]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, len(RESPONSE)])
+def test_parser_emits_each_concept_once_regardless_of_chunking(chunk_size):
+    parser = JSONArrayStreamParser(keys=["concepts"])
+    emitted = []
+    for i in range(0, len(RESPONSE), chunk_size):
+        emitted.extend(parser.feed(RESPONSE[i : i + chunk_size]))
+
+    assert emitted == [("concepts", c) for c in json.loads(RESPONSE)["concepts"]]
+
+
+def test_parser_emits_concept_before_response_completes():
+    parser = JSONArrayStreamParser()
+    cutoff = RESPONSE.index('{"text": "not a real type"')
+
+    assert [key for key, _ in parser.feed(RESPONSE[:cutoff])] == ["concepts"]
+    assert [key for key, _ in parser.feed(RESPONSE[cutoff:])] == [
+        "concepts",
+        "concepts",
+        "relationships",
+    ]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7])
+async def test_streamed_extraction_matches_buffered(chunk_size):
+    streamed = []
+
+    async def on_concept(concept):
+        streamed.append(concept.text)
+
+    buffered = await ExtractionService(_ChunkedClient(chunk_size)).extract(
+        ANSWER, "means_end_chain", source_utterance_id="u1"
+    )
+    incremental = await ExtractionService(_ChunkedClient(chunk_size)).extract(
+        ANSWER, "means_end_chain", source_utterance_id="u1", on_concept=on_concept
+    )
+
+    # Invalid node types are filtered before the callback, as in the final parse
+    assert streamed == ["creamy {oat} milk", "feels indulgent"]
+    assert incremental.concepts == buffered.concepts
+    assert incremental.relationships == buffered.relationships
+    assert len(incremental.relationships) == 1
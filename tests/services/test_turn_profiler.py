@@ -0,0 +1,99 @@
+"""Tests for opt-in per-turn profiling and the admin profile endpoints."""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import HTTPException
+
+from src.api.routes import admin
+from src.core.config import settings
+from src.services import turn_profiler
+from src.services.turn_pipeline import PipelineContext
+from src.services.turn_pipeline.base import TurnStage
+from src.services.turn_profiler import profile_turn, should_profile_turn
+
+
+def _burn(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+class BusyStage(TurnStage):
+    async def process(self, context):
+        _burn(0.05)
+        await asyncio.sleep(0.02)
+        _burn(0.05)
+        return context
+
+
+async def _unrelated_work():
+    await asyncio.sleep(0.01)
+    _burn(0.03)
+
+
+async def _execute(context):
+    """Stand-in for TurnPipeline.execute returning a result with turn_number."""
+    await BusyStage().process(context)
+    return MagicMock(turn_number=3)
+
+
+@pytest.fixture
+def profile_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "turn_profile_dir", tmp_path)
+    monkeypatch.setattr(settings, "turn_profile_interval_ms", 1.0)
+    return tmp_path
+
+
+async def test_profile_attributes_samples_to_the_turn(profile_dir):
+    other = asyncio.create_task(_unrelated_work())
+    context = PipelineContext(session_id="s1", user_input="hi")
+
+    result = await profile_turn("s1", _execute(context))
+    await other
+
+    assert result.turn_number == 3
+    lines = (profile_dir / "s1" / "turn_0003.collapsed").read_text().splitlines()
+    stacks = {line.rsplit(" ", 1)[0]: int(line.rsplit(" ", 1)[1]) for line in lines}
+
+    turn_burn = [s for s in stacks if s.startswith("turn;") and "_burn" in s]
+    assert turn_burn and all("BusyStage.process" in s for s in turn_burn)
+    # The concurrent task's work is not attributed to the turn
+    assert any(s.startswith("[other]") and "_unrelated_work" in s for s in stacks)
+    assert not any("_unrelated_work" in s for s in stacks if s.startswith("turn"))
+
+
+async def test_session_flag_is_read_once_and_header_overrides(monkeypatch):
+    monkeypatch.setattr(settings, "enable_turn_profiling", True)
+    monkeypatch.setattr(turn_profiler, "_session_flags", {})
+    repo = MagicMock()
+    repo.get_config = AsyncMock(return_value={"profile_turns": False})
+
+    assert not await should_profile_turn("s1", repo)
+    assert not await should_profile_turn("s1", repo)
+    assert await should_profile_turn("s1", repo, requested=True)
+    repo.get_config.assert_awaited_once()
+
+    monkeypatch.setattr(settings, "enable_turn_profiling", False)
+    assert not await should_profile_turn("s1", repo, requested=True)
+
+
+async def test_admin_endpoints_serve_stored_profiles(profile_dir):
+    context = PipelineContext(session_id="s1", user_input="hi")
+    await profile_turn("s1", _execute(context))
+
+    listing = await admin.list_turn_profiles("s1")
+    profile = await admin.get_turn_profile("s1", 3)
+
+    assert [p.turn_number for p in listing] == [3]
+    assert listing[0].samples > 0
+    assert profile.body.decode().startswith(("turn;", "[idle]", "[other]"))
+
+    with pytest.raises(HTTPException) as missing:
+        await admin.get_turn_profile("s1", 4)
+    assert missing.value.status_code == 404
+    with pytest.raises(HTTPException) as invalid:
+        await admin.list_turn_profiles("..")
+    assert invalid.value.status_code == 400
@@ -0,0 +1,108 @@
+"""Tests for streamed turn progress: pipeline events, question tokens, SSE."""
+
+import json
+
+import pytest
+
+from src.api.routes import sessions
+from src.llm.client import LLMClient, LLMResponse
+from src.services.question_service import QuestionService
+from src.services.turn_pipeline import PipelineContext, TurnPipeline, TurnStage
+from src.services.turn_pipeline.result import TurnResult
+
+
+class _NoopStage(TurnStage):
+    async def process(self, context):
+        return context
+
+
+class _SecondStage(_NoopStage):
+    pass
+
+
+class _ChunkedClient(LLMClient):
+    """Client whose stream() yields the question in three chunks."""
+
+    async def complete(self, prompt, system=None, **kwargs):
+        return LLMResponse(content="What matters most?", model="fake")
+
+    async def stream(self, prompt, system=None, **kwargs):
+        for chunk in ["What ", "matters ", "most?"]:
+            yield chunk
+
+
+def _parse_sse(frames):
+    events = []
+    for frame in frames:
+        event_line, data_line = frame.strip().split("\n")
+        events.append((event_line[len("event: ") :], json.loads(data_line[6:])))
+    return events
+
+
+async def test_pipeline_emits_stage_completed_events_in_order():
+    events = []
+
+    async def sink(event):
+        events.append(event)
+
+    context = PipelineContext(session_id="s1", user_input="hi", event_sink=sink)
+    pipeline = TurnPipeline(stages=[_NoopStage(), _SecondStage()])
+    # No StrategySelectionStage, so building the result fails after the stages
+    with pytest.raises(RuntimeError):
+        await pipeline.execute(context)
+
+    assert [e.event for e in events] == ["stage_completed", "stage_completed"]
+    assert [e.data["stage"] for e in events] == ["_NoopStage", "_SecondStage"]
+    assert events[1].data["index"] == 2 and events[1].data["total"] == 2
+
+
+async def test_question_service_forwards_streamed_tokens():
+    tokens = []
+
+    async def on_token(text):
+        tokens.append(text)
+
+    service = QuestionService(llm_client=_ChunkedClient())
+    question = await service.generate_question(focus_concept="x", on_token=on_token)
+
+    assert tokens == ["What ", "matters ", "most?"]
+    assert question == "What matters most?"
+
+
+async def test_default_stream_yields_full_completion():
+    chunks = [c async for c in LLMClient.stream(_ChunkedClient(), prompt="p")]
+    assert chunks == ["What matters most?"]
+
+
+async def test_sse_stream_emits_stages_tokens_then_result(monkeypatch):
+    async def fake_run(session_id, user_input, queue, profile=False):
+        await queue.put(sessions.TurnEvent("stage_completed", {"stage": "A", "duration_ms": 1.0}))
+        await queue.put(sessions.TurnEvent("question_token", {"text": "Why?"}))
+        return TurnResult(
+            turn_number=2,
+            extracted={"concepts": [], "relationships": []},
+            graph_state={"node_count": 1, "edge_count": 0},
+            scoring={"depth": 0.0, "saturation": 0.0},
+            strategy_selected="deepen",
+            next_question="Why?",
+            should_continue=True,
+        )
+
+    monkeypatch.setattr(sessions, "_run_streamed_turn", fake_run)
+    frames = [f async for f in sessions._stream_turn_events("s1", "hello")]
+    events = _parse_sse(frames)
+
+    assert [name for name, _ in events] == ["stage", "token", "result"]
+    assert events[1][1] == {"text": "Why?"}
+    assert events[2][1]["next_question"] == "Why?"
+    assert events[2][1]["turn_number"] == 2
+
+
+async def test_sse_stream_reports_errors_as_event(monkeypatch):
+    async def failing_run(session_id, user_input, queue, profile=False):
+        raise ValueError("Session s1 not found")
+
+    monkeypatch.setattr(sessions, "_run_streamed_turn", failing_run)
+    frames = [f async for f in sessions._stream_turn_events("s1", "hello")]
+
+    assert _parse_sse(frames) == [("error", {"status": 404, "detail": "Session s1 not found"})]
@@ -0,0 +1,95 @@
+"""Tests for level-based concurrent detection in ComposedSignalDetector."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.core.exceptions import ScorerFailureError
+from src.signals.signal_registry import (
+    LLM_BATCH_TIMING_KEY,
+    ComposedSignalDetector,
+)
+
+
+def _graph_state():
+    return SimpleNamespace(node_count=3, edge_count=2, max_depth=2)
+
+
+class TestDetectorLevels:
+    def test_independent_detectors_share_one_level(self):
+        detector = ComposedSignalDetector(signal_names=["graph.node_count", "graph.edge_count"])
+
+        assert [[d.signal_name for d in level] for level in detector.detector_levels] == [
+            ["graph.node_count", "graph.edge_count"]
+        ]
+
+    def test_prefix_dependency_runs_in_later_level(self):
+        """meta.interview_progress depends on graph.chain_completion.ratio."""
+        detector = ComposedSignalDetector(
+            signal_names=[
+                "meta.interview_progress",
+                "graph.chain_completion",
+                "graph.max_depth",
+            ]
+        )
+
+        assert [[d.signal_name for d in level] for level in detector.detector_levels] == [
+            ["graph.chain_completion", "graph.max_depth"],
+            ["meta.interview_progress"],
+        ]
+
+
+class TestConcurrentDetect:
+    @pytest.mark.asyncio
+    async def test_llm_batch_overlaps_non_llm_detectors(self):
+        """A non-LLM detector can finish only once the LLM call has started."""
+        llm_started = asyncio.Event()
+
+        class FakeLLMDetector:
+            async def detect(self, response_text, question, signal_classes):
+                llm_started.set()
+                return {"llm.response_depth": "deep"}
+
+        detector = ComposedSignalDetector(signal_names=["graph.node_count", "llm.response_depth"])
+        detector.set_llm_detector(FakeLLMDetector())
+
+        node_count = detector.non_llm_detectors[0]
+        original = node_count.detect
+
+        async def waits_for_llm(*args):
+            await asyncio.wait_for(llm_started.wait(), timeout=1)
+            return await original(*args)
+
+        node_count.detect = waits_for_llm
+
+        context = SimpleNamespace(stage_timings={}, signal_timings={})
+        signals = await detector.detect(context, _graph_state(), "text")
+
+        assert signals == {"graph.node_count": 3, "llm.response_depth": "deep"}
+        assert "graph.node_count" in context.signal_timings
+        assert LLM_BATCH_TIMING_KEY in context.signal_timings
+        # Detector timings overlap the stage, so they stay out of stage_timings
+        assert context.stage_timings == {}
+
+    @pytest.mark.asyncio
+    async def test_detector_failure_cancels_llm_batch(self):
+        cancelled = asyncio.Event()
+
+        class SlowLLMDetector:
+            async def detect(self, response_text, question, signal_classes):
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.set()
+                    raise
+
+        detector = ComposedSignalDetector(signal_names=["graph.node_count", "llm.response_depth"])
+        detector.set_llm_detector(SlowLLMDetector())
+        detector.non_llm_detectors[0].detect = MagicMock(side_effect=RuntimeError("boom"))
+
+        with pytest.raises(ScorerFailureError, match="graph.node_count"):
+            await detector.detect(SimpleNamespace(), _graph_state(), "text")
+
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
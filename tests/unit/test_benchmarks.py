@@ -0,0 +1,49 @@
+"""Tests for the micro-benchmark runner and baseline comparison."""
+
+from benchmarks.cases import CASES
+from benchmarks.runner import (
+    BenchmarkResult,
+    BenchmarkRun,
+    compare,
+    format_report,
+    run_benchmarks,
+)
+
+
+def _run(*medians):
+    return BenchmarkRun(
+        results=[
+            BenchmarkResult(case=case, size=10, iterations=5, median_ms=ms, p95_ms=ms, min_ms=ms)
+            for case, ms in medians
+        ]
+    )
+
+
+def test_compare_flags_regressions_above_threshold_and_noise_floor():
+    baseline = _run(("slow", 10.0), ("tiny", 0.002), ("steady", 5.0))
+    current = _run(("slow", 14.0), ("tiny", 0.004), ("steady", 5.5), ("new", 1.0))
+
+    comparisons = {c.case: c for c in compare(current, baseline, threshold=0.25)}
+
+    assert comparisons["slow"].regression
+    assert comparisons["slow"].ratio == 1.4
+    # 2x slower but within the noise floor
+    assert not comparisons["tiny"].regression
+    assert not comparisons["steady"].regression
+    assert comparisons["new"].baseline_ms is None
+    assert not comparisons["new"].regression
+    assert "1 regression(s) in 4 results" in format_report(list(comparisons.values()))
+
+
+def test_run_round_trips_through_json_dict():
+    run = _run(("a", 1.0))
+    run.meta = {"python": "3.11"}
+    assert BenchmarkRun.from_dict(run.to_dict()) == run
+
+
+async def test_all_cases_run_at_smallest_size():
+    run = await run_benchmarks(sizes=[10], min_time_s=0)
+
+    assert {r.case for r in run.results} == set(CASES)
+    assert all(r.iterations >= 5 and r.median_ms >= 0 for r in run.results)
+    assert run.meta["python"]
@@ -0,0 +1,117 @@
+"""Tests for Idempotency-Key handling on turn submission."""
+
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+from fastapi.responses import Response
+
+from src.api import idempotency
+from src.api.idempotency import (
+    IdempotencyKeyConflictError,
+    IdempotencyStore,
+    request_fingerprint,
+)
+from src.api.routes import sessions
+from src.api.schemas import TurnRequest
+from src.services.turn_pipeline.result import TurnResult
+
+
+def _counting_work(result="done", delay=0.0, error=None):
+    calls = []
+
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        if error is not None:
+            raise error
+        return result
+
+    return work, calls
+
+
+async def test_concurrent_requests_share_one_run():
+    store = IdempotencyStore(ttl_s=60)
+    work, calls = _counting_work(delay=0.01)
+    fp = request_fingerprint("hello")
+
+    results = await asyncio.gather(*(store.run("s1", "k1", fp, work) for _ in range(3)))
+
+    assert len(calls) == 1
+    assert [r for r, _ in results] == ["done"] * 3
+    assert [replayed for _, replayed in results] == [False, True, True]
+
+
+async def test_completed_result_replays_until_ttl_expires(monkeypatch):
+    store = IdempotencyStore(ttl_s=60)
+    work, calls = _counting_work()
+    fp = request_fingerprint("hello")
+
+    assert await store.run("s1", "k1", fp, work) == ("done", False)
+    assert await store.run("s1", "k1", fp, work) == ("done", True)
+    # Same key in another session is a different logical request
+    assert await store.run("s2", "k1", fp, work) == ("done", False)
+
+    now = idempotency.time.monotonic()
+    monkeypatch.setattr(idempotency.time, "monotonic", lambda: now + 61)
+    assert await store.run("s1", "k1", fp, work) == ("done", False)
+    assert len(calls) == 3
+
+
+async def test_key_reuse_with_different_body_conflicts():
+    store = IdempotencyStore(ttl_s=60)
+    work, _ = _counting_work()
+    await store.run("s1", "k1", request_fingerprint("hello"), work)
+
+    with pytest.raises(IdempotencyKeyConflictError):
+        await store.run("s1", "k1", request_fingerprint("goodbye"), work)
+
+
+async def test_failures_are_not_cached():
+    store = IdempotencyStore(ttl_s=60)
+    failing, _ = _counting_work(error=ValueError("boom"))
+    fp = request_fingerprint("hello")
+
+    with pytest.raises(ValueError):
+        await store.run("s1", "k1", fp, failing)
+
+    work, calls = _counting_work()
+    assert await store.run("s1", "k1", fp, work) == ("done", False)
+    assert len(calls) == 1
+
+
+async def test_route_replays_cached_turn_response(monkeypatch):
+    monkeypatch.setattr(idempotency, "_store", IdempotencyStore(ttl_s=60))
+    calls = []
+    injected = object()
+
+    async def fake_turn(session_id, user_input, event_sink=None, profile=False, service=None):
+        assert service is injected
+        calls.append(user_input)
+        return TurnResult(
+            turn_number=3,
+            extracted={"concepts": [], "relationships": []},
+            graph_state={"node_count": 2, "edge_count": 1},
+            scoring={"depth": 0.0, "saturation": 0.0},
+            strategy_selected="deepen",
+            next_question="Why does that matter?",
+            should_continue=True,
+        )
+
+    monkeypatch.setattr(sessions, "_run_detached_turn", fake_turn)
+    request = TurnRequest(text="Because it is creamy")
+
+    first, retry = Response(), Response()
+    original = await sessions.process_turn("s1", request, first, injected, "key-1", False)
+    replay = await sessions.process_turn("s1", request, retry, injected, "key-1", False)
+
+    assert calls == ["Because it is creamy"]
+    assert replay == original
+    assert "idempotent-replayed" not in first.headers
+    assert retry.headers["Idempotent-Replayed"] == "true"
+
+    with pytest.raises(HTTPException) as exc:
+        await sessions.process_turn(
+            "s1", TurnRequest(text="Something else"), Response(), None, "key-1", False
+        )
+    assert exc.value.status_code == 422
@@ -0,0 +1,76 @@
+"""Tests for the HTTP load generator (against a stub API client)."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from ui.api_client import SessionInfo
+from ui.load_generator import (
+    LoadGenerator,
+    LoadTestConfig,
+    classify_error,
+    percentile,
+)
+
+
+class _StubAPIClient:
+    """Async API stub: sessions end after 3 turns; session 1 hits a lock."""
+
+    def __init__(self):
+        self.turns = {}
+
+    async def create_session_async(self, concept_id, methodology):
+        session_id = f"s{len(self.turns)}"
+        self.turns[session_id] = 0
+        return SessionInfo(id=session_id, concept_id=concept_id, status="active")
+
+    async def start_session_async(self, session_id):
+        return "What comes to mind?"
+
+    async def submit_turn_async(self, session_id, user_input):
+        await asyncio.sleep(0.001)
+        self.turns[session_id] += 1
+        if session_id == "s1" and self.turns[session_id] == 2:
+            request = httpx.Request("POST", "http://api/turns")
+            response = httpx.Response(
+                500,
+                json={"detail": "Turn processing failed: database is locked"},
+                request=request,
+            )
+            raise httpx.HTTPStatusError("500", request=request, response=response)
+        return {
+            "latency_ms": 40,
+            "stage_timings": {"ExtractionStage": 30.0, "GraphUpdateStage": 5.0},
+            "should_continue": self.turns[session_id] < 3,
+        }
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([], 95) is None
+
+
+def test_classify_error():
+    request = httpx.Request("POST", "http://api")
+    response = httpx.Response(503, text="busy", request=request)
+    error = httpx.HTTPStatusError("503", request=request, response=response)
+    assert classify_error(error) == "http_503"
+    assert classify_error(httpx.ReadTimeout("slow")) == "timeout"
+
+
+@pytest.mark.asyncio
+async def test_sessions_run_to_completion_and_report():
+    config = LoadTestConfig(sessions=3, turns_per_session=5, think_time_s=0, ramp_up_s=0)
+    report = await LoadGenerator(config, client=_StubAPIClient()).run()
+    data = report.to_dict()
+
+    assert data["sessions_completed"] == 2
+    assert data["turns_ok"] == 7  # 3 + 1 + 3
+    assert data["turns_failed"] == 1
+    assert data["sqlite_lock_errors"] == 1
+    assert data["server_turn_latency"]["p99_ms"] == 40
+    assert data["stages"]["ExtractionStage"]["mean_ms"] == 30.0
+    assert "SQLite lock errors: 1" in report.format()
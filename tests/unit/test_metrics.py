@@ -0,0 +1,96 @@
+"""Tests for Prometheus metrics recording and the /metrics endpoint."""
+
+from src.api.routes import metrics as metrics_route
+from src.core.metrics import (
+    DB_CONNECTION_OPEN,
+    STAGE_DURATION,
+    Counter,
+    Gauge,
+    Histogram,
+    LLMCallMetrics,
+    MetricsRegistry,
+)
+from src.services.turn_pipeline import PipelineContext, TurnPipeline
+from src.services.turn_pipeline.base import TurnStage
+
+
+class NoopStage(TurnStage):
+    async def process(self, context):
+        return context
+
+
+def test_histogram_renders_cumulative_buckets():
+    registry = MetricsRegistry()
+    histogram = registry.register(
+        Histogram("op_seconds", "Operation latency.", ["op"], buckets=(0.1, 1.0))
+    )
+    child = histogram.labels("read")
+    for value in (0.05, 0.1, 0.5, 3.0):
+        child.observe(value)
+
+    lines = registry.render().splitlines()
+
+    assert lines[:2] == ["# HELP op_seconds Operation latency.", "# TYPE op_seconds histogram"]
+    assert 'op_seconds_bucket{op="read",le="0.1"} 2' in lines
+    assert 'op_seconds_bucket{op="read",le="1.0"} 3' in lines
+    assert 'op_seconds_bucket{op="read",le="+Inf"} 4' in lines
+    assert 'op_seconds_count{op="read"} 4' in lines
+    assert 'op_seconds_sum{op="read"} 3.65' in lines
+
+
+def test_children_are_created_once_and_labels_escaped():
+    registry = MetricsRegistry()
+    counter = registry.register(Counter("events_total", "Events.", ["kind"]))
+    gauge = registry.register(Gauge("depth", "Depth."))
+    gauge.set_function(lambda: 7)
+
+    assert counter.labels('say "hi"') is counter.labels('say "hi"')
+    counter.labels('say "hi"').inc(2)
+
+    text = registry.render()
+    assert 'events_total{kind="say \\"hi\\""} 2.0' in text
+    assert "depth 7" in text
+
+
+def test_llm_call_metrics_count_tokens_by_direction():
+    calls = LLMCallMetrics("fake", "test_metrics")
+    before = calls.duration.count
+
+    calls.observe(250.0, input_tokens=100, output_tokens=20)
+
+    assert calls.duration.count == before + 1
+    assert LLMCallMetrics("fake", "test_metrics").input_tokens.value >= 100
+    assert calls.output_tokens.value >= 20
+
+
+async def test_pipeline_records_stage_latency_and_endpoint_serves_it(monkeypatch):
+    class MetricsProbeStage(NoopStage):
+        pass
+
+    class FakeRepo:
+        async def count_active(self):
+            return 3
+
+    monkeypatch.setattr(metrics_route, "get_session_repository", FakeRepo)
+    stage = MetricsProbeStage()
+    pipeline = TurnPipeline(stages=[stage])
+    context = PipelineContext(session_id="s1", user_input="hi")
+
+    await pipeline._run_stage(stage, context, None)
+    pipeline._observe_stage(stage, 12.0)
+    response = await metrics_route.metrics()
+
+    assert STAGE_DURATION.labels("MetricsProbeStage").count == 1
+    body = response.body.decode()
+    assert 'interview_stage_duration_seconds_count{stage="MetricsProbeStage"} 1' in body
+    assert "interview_active_sessions 3" in body
+    assert response.media_type.startswith("text/plain; version=0.0.4")
+
+
+async def test_repository_connections_record_connection_open(session_repo):
+    opens = DB_CONNECTION_OPEN.labels()
+    before = opens.count
+
+    await session_repo.get("missing")
+
+    assert opens.count == before + 1
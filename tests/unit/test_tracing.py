@@ -0,0 +1,124 @@
+"""Tests for tracing spans and their OTLP/JSON export."""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from src.core import tracing
+from src.core.tracing import FileSpanExporter, Tracer, span, trace_repository
+from src.llm.client import AnthropicClient
+
+
+class RecordingExporter:
+    def __init__(self):
+        self.spans = []
+
+    async def export(self, spans):
+        self.spans.extend(spans)
+
+
+@pytest.fixture
+def exporter(monkeypatch):
+    exporter = RecordingExporter()
+    monkeypatch.setattr(tracing, "_tracer", Tracer(exporter))
+    return exporter
+
+
+async def _flushed(exporter):
+    await tracing.get_tracer().flush()
+    return {s.name: s for s in exporter.spans}
+
+
+async def test_concurrent_tasks_nest_under_the_current_span(exporter):
+    async def stage(name, delay):
+        with span(name):
+            await asyncio.sleep(delay)
+
+    with span("pipeline.turn") as turn:
+        await asyncio.gather(stage("stage.a", 0.02), stage("stage.b", 0.01))
+
+    spans = await _flushed(exporter)
+    a, b = spans["stage.a"], spans["stage.b"]
+    assert a.parent_span_id == b.parent_span_id == turn.span_id
+    assert a.trace_id == b.trace_id == turn.trace_id
+    # Overlap is visible in the recorded timings
+    assert b.start_ns < a.end_ns and a.start_ns < b.end_ns
+
+
+async def test_errors_are_recorded_and_repository_methods_traced(exporter):
+    @trace_repository
+    class FakeRepository:
+        async def get(self, key):
+            raise KeyError(key)
+
+        def _helper(self):
+            return "untraced"
+
+    with pytest.raises(KeyError):
+        await FakeRepository().get("missing")
+
+    spans = await _flushed(exporter)
+    failed = spans["db.FakeRepository.get"]
+    assert failed.status == "ERROR" and "KeyError" in failed.status_message
+    assert FakeRepository()._helper() == "untraced"
+
+
+async def test_each_llm_attempt_gets_a_span(exporter):
+    client = AnthropicClient(
+        model="test-model",
+        temperature=0.3,
+        max_tokens=100,
+        timeout=10.0,
+        client_type="extraction",
+        api_key="test-key",
+    )
+    responses = [
+        httpx.TimeoutException("slow"),
+        httpx.Response(
+            status_code=200,
+            json={
+                "content": [{"type": "text", "text": "ok"}],
+                "usage": {"input_tokens": 5, "output_tokens": 2},
+            },
+            request=httpx.Request("POST", "https://test"),
+        ),
+    ]
+
+    async def mock_post(url, headers=None, json=None):
+        result = responses.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    with patch("httpx.AsyncClient.post", side_effect=mock_post), patch("asyncio.sleep"):
+        await client.complete(prompt="hi")
+
+    await tracing.get_tracer().flush()
+    attempts = [s for s in exporter.spans if s.name == "llm.attempt"]
+    assert [s.attributes["attempt"] for s in attempts] == [1, 2]
+    assert [s.status for s in attempts] == ["ERROR", "UNSET"]
+    assert attempts[0].attributes["client_type"] == "extraction"
+
+
+async def test_file_exporter_writes_otlp_json(tmp_path):
+    tracer = Tracer(FileSpanExporter(tmp_path / "traces.jsonl"))
+    with patch.object(tracing, "_tracer", tracer):
+        with span("embedding.encode_batch", batch_size=3):
+            pass
+    await tracer.shutdown()
+
+    batch = json.loads((tmp_path / "traces.jsonl").read_text().splitlines()[0])
+    otlp_span = batch["resourceSpans"][0]["scopeSpans"][0]["spans"][0]
+    assert otlp_span["name"] == "embedding.encode_batch"
+    assert len(otlp_span["traceId"]) == 32 and len(otlp_span["spanId"]) == 16
+    assert otlp_span["attributes"] == [{"key": "batch_size", "value": {"intValue": "3"}}]
+
+
+def test_disabled_tracing_yields_no_span(monkeypatch):
+    monkeypatch.setattr(tracing, "_tracer", Tracer(exporter=None))
+
+    with span("anything") as disabled:
+        assert disabled is None
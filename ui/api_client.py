@@ -14,7 +14,8 @@ Supports both synchronous and asynchronous usage patterns:
 See ADR-001: docs/adr/001-sync-async-dual-api.md
 """
 
-from typing import Optional, Dict, Any, List
+import json
+from typing import Optional, Dict, Any, List, AsyncIterator, Tuple
 from dataclasses import dataclass
 
 import httpx
@@ -305,6 +306,35 @@ class APIClient:
             response.raise_for_status()
             return response.json()
 
+    async def stream_turn_async(
+        self,
+        session_id: str,
+        user_input: str,
+    ) -> AsyncIterator[Tuple[str, Dict[str, Any]]]:
+        """Submit a turn and iterate its Server-Sent Events (asynchronous).
+
+        Args:
+            session_id: Session identifier
+            user_input: User's response text
+
+        Yields:
+            (event, data) pairs: "stage", "token", then "result" (the turn
+            result) or "error"
+        """
+        async with httpx.AsyncClient(timeout=self.timeout) as client:
+            async with client.stream(
+                "POST",
+                f"{self.base_url}/sessions/{session_id}/turns/stream",
+                json={"text": user_input},
+            ) as response:
+                response.raise_for_status()
+                event = "message"
+                async for line in response.aiter_lines():
+                    if line.startswith("event: "):
+                        event = line[len("event: ") :]
+                    elif line.startswith("data: "):
+                        yield event, json.loads(line[len("data: ") :])
+
     async def get_session_status_async(self, session_id: str) -> Dict[str, Any]:
         """Get current session status (asynchronous).
 
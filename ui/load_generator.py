@@ -0,0 +1,308 @@
+# ui/load_generator.py
+"""HTTP load generator for concurrent, human-paced interview sessions.
+
+Drives M sessions against a running API through APIClient's async methods
+(POST /sessions, /sessions/{id}/start, /sessions/{id}/turns), pausing a
+sampled think-time before each answer. Answers are generated locally so
+the only LLM traffic is the server's own; run the server against the fake
+provider (scripts/run_fake_llm_server.py) or LLM_CASSETTE_MODE=replay.
+
+Usage:
+    report = await run_load_test(LoadTestConfig(sessions=50, turns_per_session=8))
+    print(report.format())
+
+See scripts/load_test.py for the CLI.
+"""
+
+import asyncio
+import math
+import random
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+
+from ui.api_client import APIClient
+
+_ANSWER_TEMPLATES = [
+    "I mostly care about {a} because it gives me {b}.",
+    "Honestly, {a} matters to me. It means {b} and less hassle.",
+    "For me it's about {a}. That leads to {b}, which I value.",
+    "I guess {a}? It helps with {b}.",
+    "Not sure, maybe {a}.",
+]
+_ANSWER_VOCAB = [
+    "comfort", "reliability", "saving time", "peace of mind", "good value",
+    "feeling in control", "easy setup", "better focus", "less stress",
+    "sound quality", "battery life", "a healthy routine", "planning ahead",
+]  # fmt: skip
+
+
+@dataclass
+class LoadTestConfig:
+    """Load test parameters.
+
+    Attributes:
+        base_url: API base URL
+        concept_id: Concept for every session
+        methodology: Interview methodology
+        sessions: Number of sessions (M) to run concurrently
+        turns_per_session: Answers submitted per session (fewer if it ends)
+        think_time_s: Median respondent think-time before each answer
+        think_time_sigma: Lognormal spread of think-time (0 = constant)
+        ramp_up_s: Session starts are spread evenly over this window
+        timeout_s: Per-request timeout
+        seed: Seed for think-times and answers
+    """
+
+    base_url: str = "http://localhost:8000"
+    concept_id: str = "meal_planning_jtbd_v2"
+    methodology: str = "jobs_to_be_done_v2"
+    sessions: int = 10
+    turns_per_session: int = 6
+    think_time_s: float = 8.0
+    think_time_sigma: float = 0.5
+    ramp_up_s: float = 10.0
+    timeout_s: float = 120.0
+    seed: int = 0
+
+
+@dataclass
+class RequestSample:
+    """One timed API request."""
+
+    kind: str  # "create", "start", "turn"
+    session_index: int
+    latency_ms: float
+    ok: bool
+    error: Optional[str] = None  # error category when not ok
+    server_latency_ms: Optional[int] = None
+    stage_timings: Dict[str, float] = field(default_factory=dict)
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile (None for no values)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def classify_error(exc: Exception) -> str:
+    """Bucket a failed request; SQLite lock errors are reported separately."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        if "database is locked" in exc.response.text.lower():
+            return "sqlite_locked"
+        return f"http_{exc.response.status_code}"
+    if isinstance(exc, httpx.TimeoutException):
+        return "timeout"
+    if isinstance(exc, httpx.TransportError):
+        return "transport"
+    return type(exc).__name__
+
+
+@dataclass
+class LoadTestReport:
+    """Aggregated results of a load test run."""
+
+    config: LoadTestConfig
+    samples: List[RequestSample]
+    duration_s: float
+    sessions_completed: int
+
+    def _latencies(self, kind: str) -> List[float]:
+        return [s.latency_ms for s in self.samples if s.kind == kind and s.ok]
+
+    def stage_breakdown(self) -> Dict[str, Dict[str, float]]:
+        """Per-stage mean/p50/p95 (ms) from successful turns' stage_timings."""
+        by_stage: Dict[str, List[float]] = defaultdict(list)
+        for sample in self.samples:
+            for stage, ms in sample.stage_timings.items():
+                by_stage[stage].append(ms)
+        return {
+            stage: {
+                "mean_ms": round(sum(values) / len(values), 1),
+                "p50_ms": round(percentile(values, 50), 1),
+                "p95_ms": round(percentile(values, 95), 1),
+            }
+            for stage, values in by_stage.items()
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        turns = self._latencies("turn")
+        errors = Counter(s.error for s in self.samples if not s.ok)
+        server = [
+            s.server_latency_ms
+            for s in self.samples
+            if s.kind == "turn" and s.ok and s.server_latency_ms is not None
+        ]
+
+        def _pcts(values: List[float]) -> Dict[str, Optional[float]]:
+            return {
+                f"p{p}_ms": None if not values else round(percentile(values, p), 1)
+                for p in (50, 95, 99)
+            }
+
+        return {
+            "sessions": self.config.sessions,
+            "sessions_completed": self.sessions_completed,
+            "duration_s": round(self.duration_s, 2),
+            "turns_ok": len(turns),
+            "turns_failed": sum(1 for s in self.samples if s.kind == "turn" and not s.ok),
+            "throughput_turns_per_s": (
+                round(len(turns) / self.duration_s, 3) if self.duration_s else 0.0
+            ),
+            "turn_latency": _pcts(turns),
+            "server_turn_latency": _pcts(server),
+            "start_latency": _pcts(self._latencies("start")),
+            "create_latency": _pcts(self._latencies("create")),
+            "sqlite_lock_errors": errors.get("sqlite_locked", 0),
+            "errors": dict(errors),
+            "stages": self.stage_breakdown(),
+        }
+
+    def format(self) -> str:
+        """Human-readable report."""
+        data = self.to_dict()
+        lines = [
+            f"Sessions: {data['sessions_completed']}/{data['sessions']} completed "
+            f"in {data['duration_s']}s",
+            f"Turns: {data['turns_ok']} ok, {data['turns_failed']} failed "
+            f"({data['throughput_turns_per_s']} turns/s)",
+        ]
+        for label, key in (
+            ("Turn latency (client)", "turn_latency"),
+            ("Turn latency (server)", "server_turn_latency"),
+            ("Start latency", "start_latency"),
+        ):
+            pcts = data[key]
+            lines.append(
+                f"{label}: p50={pcts['p50_ms']} p95={pcts['p95_ms']} " f"p99={pcts['p99_ms']} ms"
+            )
+        lines.append(f"SQLite lock errors: {data['sqlite_lock_errors']}")
+        if data["errors"]:
+            lines.append(f"Errors: {data['errors']}")
+        if data["stages"]:
+            lines.append("Stage breakdown (mean / p50 / p95 ms):")
+            for stage, stats in sorted(
+                data["stages"].items(), key=lambda item: -item[1]["mean_ms"]
+            ):
+                lines.append(
+                    f"  {stage:<40} {stats['mean_ms']:>9} {stats['p50_ms']:>9} "
+                    f"{stats['p95_ms']:>9}"
+                )
+        return "\n".join(lines)
+
+
+class LoadGenerator:
+    """Runs concurrent interview sessions and collects request samples."""
+
+    def __init__(
+        self,
+        config: LoadTestConfig,
+        client: Optional[APIClient] = None,
+        on_sample: Optional[Callable[[RequestSample], None]] = None,
+    ):
+        self.config = config
+        self.client = client or APIClient(config.base_url, timeout=config.timeout_s)
+        self.on_sample = on_sample
+        self.samples: List[RequestSample] = []
+        self.sessions_completed = 0
+
+    def _think_time(self, rng: random.Random) -> float:
+        if self.config.think_time_s <= 0:
+            return 0.0
+        if self.config.think_time_sigma <= 0:
+            return self.config.think_time_s
+        return self.config.think_time_s * rng.lognormvariate(0.0, self.config.think_time_sigma)
+
+    @staticmethod
+    def _answer(rng: random.Random) -> str:
+        a, b = rng.sample(_ANSWER_VOCAB, 2)
+        return rng.choice(_ANSWER_TEMPLATES).format(a=a, b=b)
+
+    def _record(self, sample: RequestSample) -> None:
+        self.samples.append(sample)
+        if self.on_sample:
+            self.on_sample(sample)
+
+    async def _timed(self, kind: str, index: int, call) -> Optional[Any]:
+        """Await a request, recording latency or the error category."""
+        start = time.perf_counter()
+        try:
+            result = await call
+        except Exception as e:
+            self._record(
+                RequestSample(
+                    kind=kind,
+                    session_index=index,
+                    latency_ms=(time.perf_counter() - start) * 1000,
+                    ok=False,
+                    error=classify_error(e),
+                )
+            )
+            return None
+
+        sample = RequestSample(
+            kind=kind,
+            session_index=index,
+            latency_ms=(time.perf_counter() - start) * 1000,
+            ok=True,
+        )
+        if kind == "turn":
+            sample.server_latency_ms = result.get("latency_ms")
+            sample.stage_timings = result.get("stage_timings") or {}
+        self._record(sample)
+        return result
+
+    async def _run_session(self, index: int) -> None:
+        config = self.config
+        rng = random.Random(f"{config.seed}:{index}")
+        if config.sessions > 1:
+            await asyncio.sleep(config.ramp_up_s * index / config.sessions)
+
+        session = await self._timed(
+            "create",
+            index,
+            self.client.create_session_async(
+                concept_id=config.concept_id, methodology=config.methodology
+            ),
+        )
+        if session is None:
+            return
+        if await self._timed("start", index, self.client.start_session_async(session.id)) is None:
+            return
+
+        for _ in range(config.turns_per_session):
+            await asyncio.sleep(self._think_time(rng))
+            result = await self._timed(
+                "turn",
+                index,
+                self.client.submit_turn_async(session.id, self._answer(rng)),
+            )
+            if result is None:
+                return
+            if not result.get("should_continue", True):
+                break
+        self.sessions_completed += 1
+
+    async def run(self) -> LoadTestReport:
+        start = time.perf_counter()
+        await asyncio.gather(*(self._run_session(i) for i in range(self.config.sessions)))
+        return LoadTestReport(
+            config=self.config,
+            samples=self.samples,
+            duration_s=time.perf_counter() - start,
+            sessions_completed=self.sessions_completed,
+        )
+
+
+async def run_load_test(
+    config: LoadTestConfig,
+    on_sample: Optional[Callable[[RequestSample], None]] = None,
+) -> LoadTestReport:
+    """Run a load test and return its report."""
+    return await LoadGenerator(config, on_sample=on_sample).run()